@@ -10,7 +10,7 @@ from fastapi import HTTPException, status
 from admin.services.storage_service import StorageService
 from config import get_mapbox_token
 from core.date_utils import ensure_utc
-from core.mapping.factory import clear_local_provider_cache, get_geocoder
+from core.mapping.factory import get_geocoder, notify_mapping_settings_changed
 from core.serialization import serialize_utc_datetime
 from core.service_config import clear_config_cache, get_service_config
 from db.manager import db_manager
@@ -145,8 +145,8 @@ class AdminService:
         clear_config_cache()
         if router_settings_changed:
             clear_router_cache()
-        if local_client_settings_changed:
-            clear_local_provider_cache()
+        if router_settings_changed or local_client_settings_changed:
+            await notify_mapping_settings_changed()
         # Repopulate this process immediately; others refresh within the
         # settings cache TTL.
         await get_service_config(force_refresh=True)
@@ -5,14 +5,19 @@ import logging
 from fastapi import APIRouter, HTTPException, Request, status
 
 from analytics.services.dashboard_service import DashboardService
-from core.cache import cached
+from core.cache import TRIPS_CACHE_TAG, cached
 from core.trip_query_spec import TripQuerySpec
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@cached("driving_insights", ttl_seconds=300)
+@cached(
+    "driving_insights",
+    ttl_seconds=300,
+    tags=(TRIPS_CACHE_TAG,),
+    stale_ttl_seconds=300,
+)
 async def _driving_insights_cached(query: dict, include_movement: bool = True):
     return await DashboardService.get_driving_insights(
         query,
@@ -20,7 +25,12 @@ async def _driving_insights_cached(query: dict, include_movement: bool = True):
     )
 
 
-@cached("metrics", ttl_seconds=300)
+@cached(
+    "metrics",
+    ttl_seconds=300,
+    tags=(TRIPS_CACHE_TAG,),
+    stale_ttl_seconds=300,
+)
 async def _metrics_cached(query: dict):
     return await DashboardService.get_metrics(query)
 
@@ -8,19 +8,29 @@ from analytics.services.drilldown_service import DrilldownService
 from analytics.services.time_analytics_service import TimeAnalyticsService
 from analytics.services.trip_analytics_service import TripAnalyticsService
 from core.api import api_route
-from core.cache import cached
+from core.cache import TRIPS_CACHE_TAG, cached
 from core.trip_query_spec import TripQuerySpec
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@cached("trip_analytics", ttl_seconds=600)
+@cached(
+    "trip_analytics",
+    ttl_seconds=600,
+    tags=(TRIPS_CACHE_TAG,),
+    stale_ttl_seconds=600,
+)
 async def _trip_analytics_cached(query: dict):
     return await TripAnalyticsService.get_trip_analytics(query)
 
 
-@cached("driver_behavior", ttl_seconds=600)
+@cached(
+    "driver_behavior",
+    ttl_seconds=600,
+    tags=(TRIPS_CACHE_TAG,),
+    stale_ttl_seconds=600,
+)
 async def _driver_behavior_cached(query: dict):
     return await TripAnalyticsService.get_driver_behavior_analytics(query)
 
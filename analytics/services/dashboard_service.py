@@ -4,7 +4,11 @@ import logging
 from typing import Any
 
 from analytics.services.mobility_insights_service import MobilityInsightsService
-from core.math_utils import calculate_circular_average_hour
+from analytics.services.trip_rollup_service import TripRollupService
+from core.math_utils import (
+    calculate_circular_average_hour,
+    circular_average_hour_from_components,
+)
 from core.trip_source_policy import enforce_bouncie_source
 from db.aggregation import aggregate_to_list
 from db.aggregation_utils import (
@@ -172,8 +176,15 @@ class DashboardService:
             },
         ]
 
-        # Use aggregation helper
-        trips_result = await aggregate_to_list(Trip, pipeline)
+        rollup_rows = await TripRollupService.rows_for_query(query)
+        if rollup_rows is not None:
+            trips_result = (
+                [DashboardService._insight_totals_from_rollups(rollup_rows)]
+                if rollup_rows
+                else []
+            )
+        else:
+            trips_result = await aggregate_to_list(Trip, pipeline)
 
         # Full destination distribution used by concentration/entropy metrics.
         pipeline_top_destinations = [
@@ -611,6 +622,13 @@ class DashboardService:
         """
         query = enforce_bouncie_source(query)
 
+        rollup_rows = await TripRollupService.rows_for_query(query)
+        if rollup_rows is not None:
+            metrics, avg_local_hour = DashboardService._metrics_from_rollups(
+                rollup_rows,
+            )
+            return DashboardService._format_metrics(metrics, avg_local_hour)
+
         start_tz_expr = get_mongo_tz_expr("startTime")
 
         pipeline = [
@@ -809,8 +827,92 @@ class DashboardService:
         ]
 
         results = await aggregate_to_list(Trip, pipeline)
-
         if not results:
+            return DashboardService._format_metrics({}, None)
+
+        metrics = results[0]
+
+        # Each value is already the trip's local wall-clock time. Circular
+        # averaging keeps late-night starts adjacent to early-morning starts.
+        start_hours_local = [
+            float(value)
+            for value in metrics.get("start_hours_local", [])
+            if isinstance(value, int | float)
+        ]
+        avg_local_hour = (
+            calculate_circular_average_hour(start_hours_local)
+            if start_hours_local
+            else None
+        )
+        return DashboardService._format_metrics(metrics, avg_local_hour)
+
+    @staticmethod
+    def _insight_totals_from_rollups(rows: list[dict[str, Any]]) -> dict[str, Any]:
+        """Combine daily rollup rows into the insights totals group."""
+
+        def total(field: str) -> float:
+            return sum(float(row.get(field) or 0) for row in rows)
+
+        def largest(field: str) -> float | None:
+            values = [row[field] for row in rows if row.get(field) is not None]
+            return max(values, default=None)
+
+        return {
+            "total_trips": int(total("trip_count")),
+            "total_distance": total("distance_total"),
+            "total_fuel_consumed": total("fuel_total"),
+            "fuel_consumed_for_mpg": total("fuel_for_mpg"),
+            "fuel_distance": total("fuel_distance"),
+            "fuel_trip_count": int(total("fuel_trip_count")),
+            "max_speed": largest("max_speed"),
+            "total_idle_duration": total("idle_seconds"),
+            "longest_trip_distance": largest("distance_max"),
+        }
+
+    @staticmethod
+    def _metrics_from_rollups(
+        rows: list[dict[str, Any]],
+    ) -> tuple[dict[str, Any], float | None]:
+        """Combine daily rollup rows into the ``get_metrics`` aggregate shape."""
+        total_trips = sum(int(row.get("trip_count") or 0) for row in rows)
+        if not total_trips:
+            return {}, None
+
+        total_distance = sum(float(row.get("distance_total") or 0) for row in rows)
+        distance_count = sum(int(row.get("distance_count") or 0) for row in rows)
+        paired_distance = sum(float(row.get("paired_distance") or 0) for row in rows)
+        paired_seconds = sum(
+            float(row.get("paired_duration_seconds") or 0) for row in rows
+        )
+        speeds = [row["max_speed"] for row in rows if row.get("max_speed") is not None]
+        metrics = {
+            "total_trips": total_trips,
+            "total_distance": total_distance,
+            "avg_distance": total_distance / distance_count if distance_count else 0.0,
+            "max_speed": max(speeds, default=0.0),
+            "total_duration_seconds": sum(
+                float(row.get("duration_seconds") or 0) for row in rows
+            ),
+            "avg_speed": (
+                paired_distance / (paired_seconds / 3600.0)
+                if paired_seconds > 0
+                else 0.0
+            ),
+        }
+        avg_local_hour = circular_average_hour_from_components(
+            sum(float(row.get("start_hour_sin") or 0) for row in rows),
+            sum(float(row.get("start_hour_cos") or 0) for row in rows),
+            sum(int(row.get("start_hour_count") or 0) for row in rows),
+        )
+        return metrics, avg_local_hour
+
+    @staticmethod
+    def _format_metrics(
+        metrics: dict[str, Any],
+        avg_local_hour: float | None,
+    ) -> dict[str, Any]:
+        """Render aggregate metrics into the dashboard's display strings."""
+        if not metrics:
             return {
                 "total_trips": 0,
                 "total_distance": "0.00",
@@ -821,30 +923,20 @@ class DashboardService:
                 "max_speed": "0.00",
             }
 
-        metrics = results[0]
         total_trips = metrics.get("total_trips", 0)
 
-        # Each value is already the trip's local wall-clock time. Circular
-        # averaging keeps late-night starts adjacent to early-morning starts.
-        start_hours_local = [
-            float(value)
-            for value in metrics.get("start_hours_local", [])
-            if isinstance(value, int | float)
-        ]
         avg_start_time_str = "--:--"
-        if start_hours_local:
-            avg_local_hour = calculate_circular_average_hour(start_hours_local)
-            if avg_local_hour is not None:
-                total_minutes = round(avg_local_hour * 60) % (24 * 60)
-                local_hour = total_minutes // 60
-                local_minute = total_minutes % 60
-
-                am_pm = "AM" if local_hour < 12 else "PM"
-                display_hour = local_hour % 12
-                if display_hour == 0:
-                    display_hour = 12
-
-                avg_start_time_str = f"{display_hour:02d}:{local_minute:02d} {am_pm}"
+        if avg_local_hour is not None:
+            total_minutes = round(avg_local_hour * 60) % (24 * 60)
+            local_hour = total_minutes // 60
+            local_minute = total_minutes % 60
+
+            am_pm = "AM" if local_hour < 12 else "PM"
+            display_hour = local_hour % 12
+            if display_hour == 0:
+                display_hour = 12
+
+            avg_start_time_str = f"{display_hour:02d}:{local_minute:02d} {am_pm}"
 
         # Total drive time across every trip in the filtered range.
         total_duration_seconds = metrics.get("total_duration_seconds", 0.0)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import time
 from collections import defaultdict
 from contextlib import suppress
@@ -11,8 +12,11 @@ from datetime import UTC, datetime
 from typing import Any
 
 import h3
+import numpy as np
+import shapely
 from beanie import PydanticObjectId
-from shapely.geometry import LineString
+from shapely import STRtree
+from shapely.geometry import LineString, shape
 from shapely.ops import transform
 
 from core.mapping.factory import get_geocoder
@@ -25,7 +29,8 @@ from core.spatial import (
 )
 from core.trip_source_policy import enforce_bouncie_source
 from db.aggregation import aggregate_to_list
-from db.models import H3StreetLabelCache, Trip, TripMobilityProfile
+from db.bulk import bulk_write_updates
+from db.models import H3StreetLabelCache, Street, Trip, TripMobilityProfile
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +45,22 @@ MAX_HEX_STREET_LOOKUPS = 160
 MAX_SEGMENT_LABEL_LOOKUPS = 20
 MAX_PATH_TRIPS_FOR_RENDER = 1200
 MAX_PATHS_PER_ENTITY = 220
+STREET_LABEL_GEOCODE_CONCURRENCY = 8
+STREET_LABEL_LOCAL_CHUNK = 100
+# Trips per worker-thread call when computing profiles for a sync batch, and
+# how many of those calls run at once.
+PROFILE_COMPUTE_CHUNK = 50
+PROFILE_COMPUTE_CONCURRENCY = 4
+
+_SYNC_TRIP_PROJECTION = {
+    "_id": 1,
+    "transactionId": 1,
+    "imei": 1,
+    "startTime": 1,
+    "endTime": 1,
+    "matchedGps": 1,
+    "gps": 1,
+}
 
 from core.constants import METERS_TO_MILES  # noqa: E402
 
@@ -131,6 +152,45 @@ def _append_path_segment(
     paths.append(cleaned)
 
 
+def _nearest_street_labels(
+    polygons: dict[str, list[list[float]]],
+    streets: list[dict[str, Any]],
+) -> dict[str, str]:
+    """Name of the street nearest each cell center among those crossing it."""
+    names: list[str] = []
+    geoms = []
+    for doc in streets:
+        name = _normalize_street_name(doc.get("street_name"))
+        if not name:
+            continue
+        try:
+            geom = shape(doc.get("geometry") or {})
+        except Exception:
+            continue
+        if geom.is_empty:
+            continue
+        names.append(name)
+        geoms.append(geom)
+    if not geoms:
+        return {}
+
+    # Scale longitude so planar distances rank like ground distances.
+    mean_lat = float(np.mean([ring[0][1] for ring in polygons.values()]))
+    scale = np.array([max(math.cos(math.radians(mean_lat)), 0.01), 1.0])
+    scaled = shapely.transform(np.asarray(geoms, dtype=object), lambda xy: xy * scale)
+    tree = STRtree(scaled)
+
+    labels: dict[str, str] = {}
+    for cell_id, ring in polygons.items():
+        cell = shapely.transform(shapely.Polygon(ring), lambda xy: xy * scale)
+        hits = tree.query(cell, predicate="intersects")
+        if len(hits) == 0:
+            continue
+        distances = shapely.distance(scaled[hits], cell.centroid)
+        labels[cell_id] = names[int(hits[int(np.argmin(distances))])]
+    return labels
+
+
 def _entity_has_paths(item: dict[str, Any]) -> bool:
     paths = item.get("paths")
     return isinstance(paths, list) and any(
@@ -270,18 +330,6 @@ class MobilityInsightsService:
         )
         return cell_counts, segment_counts, total_distance_m * METERS_TO_MILES
 
-    @classmethod
-    async def _set_trip_synced(
-        cls,
-        trip_id: PydanticObjectId,
-        synced_at: datetime,
-    ) -> None:
-        trip = await Trip.get(trip_id)
-        if not trip:
-            return
-        trip.mobility_synced_at = synced_at
-        await trip.save()
-
     @staticmethod
     def _profile_identity_query(
         trip_id: PydanticObjectId | None,
@@ -301,6 +349,169 @@ class MobilityInsightsService:
             clauses.append({"trip_id": trip_id})
         return {"$or": clauses} if clauses else {"_id": None}
 
+    @classmethod
+    def _compute_profiles(
+        cls,
+        trips: list[dict[str, Any]],
+    ) -> list[tuple[dict[str, Any], dict[str, Any] | None]]:
+        """
+        Build profile fields for raw trip documents; CPU-bound, thread-safe.
+
+        Trips without usable geometry pair with ``None``. Trips whose
+        computation fails are logged and left out, so they stay unsynced.
+        """
+        results: list[tuple[dict[str, Any], dict[str, Any] | None]] = []
+        for trip in trips:
+            try:
+                lines, geometry_source = cls._select_trip_geometry(trip)
+                if not lines:
+                    results.append((trip, None))
+                    continue
+                cell_counts, segment_counts, total_distance_miles = (
+                    cls._build_trip_stats(
+                        lines,
+                        resolution=H3_RESOLUTION,
+                        spacing_m=H3_SAMPLE_SPACING_M,
+                    )
+                )
+            except Exception:
+                logger.exception(
+                    "Failed syncing mobility profile for trip %s",
+                    trip.get("transactionId"),
+                )
+                continue
+            results.append(
+                (
+                    trip,
+                    {
+                        "trip_id": trip["_id"],
+                        "transaction_id": (
+                            (trip.get("transactionId") or "").strip() or None
+                        ),
+                        "imei": trip.get("imei"),
+                        "start_time": trip.get("startTime"),
+                        "end_time": trip.get("endTime"),
+                        "h3_resolution": H3_RESOLUTION,
+                        "sample_spacing_m": H3_SAMPLE_SPACING_M,
+                        "source_geometry": geometry_source or "gps",
+                        "total_distance_miles": round(total_distance_miles, 4),
+                        "cell_counts": cell_counts,
+                        "segment_counts": segment_counts,
+                    },
+                ),
+            )
+        return results
+
+    @classmethod
+    async def _write_profiles(
+        cls,
+        computed: list[tuple[dict[str, Any], dict[str, Any] | None]],
+        synced_at: datetime,
+    ) -> None:
+        """
+        Persist computed profiles for a batch with bulk writes.
+
+        Each trip keeps one profile, matched by transaction or ObjectId and
+        re-pointed at the trip's current ObjectId; surplus profiles from
+        earlier imports of the same transaction are removed first so the
+        survivor cannot collide with them on the unique trip_id index.
+        """
+        if not computed:
+            return
+        collection = TripMobilityProfile.get_pymongo_collection()
+        trip_ids = [trip["_id"] for trip, _ in computed]
+        transaction_ids = [
+            fields["transaction_id"]
+            for _, fields in computed
+            if fields and fields["transaction_id"]
+        ]
+        by_trip: dict[Any, list[dict[str, Any]]] = defaultdict(list)
+        by_transaction: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        clauses: list[dict[str, Any]] = [{"trip_id": {"$in": trip_ids}}]
+        if transaction_ids:
+            clauses.append({"transaction_id": {"$in": transaction_ids}})
+        async for existing in collection.find(
+            {"$or": clauses},
+            {"_id": 1, "trip_id": 1, "transaction_id": 1},
+        ):
+            by_trip[existing.get("trip_id")].append(existing)
+            if existing.get("transaction_id"):
+                by_transaction[existing["transaction_id"]].append(existing)
+
+        claimed: set[Any] = set()
+        doomed: list[Any] = []
+        upserts: list[tuple[dict[str, Any], dict[str, Any], bool]] = []
+        for trip, fields in computed:
+            trip_id = trip["_id"]
+            transaction_id = (trip.get("transactionId") or "").strip() or None
+            matches: dict[Any, dict[str, Any]] = {}
+            for candidate in [
+                *by_transaction.get(transaction_id or "", []),
+                *by_trip.get(trip_id, []),
+            ]:
+                if candidate["_id"] not in claimed:
+                    matches[candidate["_id"]] = candidate
+            ordered = sorted(
+                matches.values(),
+                key=lambda candidate, current=trip_id: (
+                    candidate.get("trip_id") != current
+                ),
+            )
+            claimed.update(matches)
+            if fields is None:
+                doomed.extend(matches)
+                continue
+            doomed.extend(candidate["_id"] for candidate in ordered[1:])
+            update = {"$set": {**fields, "updated_at": synced_at}}
+            if ordered:
+                upserts.append(({"_id": ordered[0]["_id"]}, update, False))
+            else:
+                upserts.append(({"trip_id": trip_id}, update, True))
+
+        if doomed:
+            await collection.delete_many({"_id": {"$in": doomed}})
+        if not upserts:
+            return
+        await bulk_write_updates(collection, upserts)
+
+    @classmethod
+    async def _sync_trip_documents(cls, trips: list[dict[str, Any]]) -> int:
+        """
+        Compute and store profiles for projected trip documents.
+
+        H3 sampling runs in worker threads, a chunk of trips per call with a
+        bounded number in flight, so the event loop stays responsive. Returns
+        how many trips were marked synced.
+        """
+        if not trips:
+            return 0
+        semaphore = asyncio.Semaphore(PROFILE_COMPUTE_CONCURRENCY)
+
+        async def compute(
+            chunk: list[dict[str, Any]],
+        ) -> list[tuple[dict[str, Any], dict[str, Any] | None]]:
+            async with semaphore:
+                return await asyncio.to_thread(cls._compute_profiles, chunk)
+
+        chunks = [
+            trips[start : start + PROFILE_COMPUTE_CHUNK]
+            for start in range(0, len(trips), PROFILE_COMPUTE_CHUNK)
+        ]
+        computed = [
+            item
+            for part in await asyncio.gather(*(compute(chunk) for chunk in chunks))
+            for item in part
+        ]
+        synced_at = datetime.now(UTC)
+        await cls._write_profiles(computed, synced_at)
+        synced_ids = [trip["_id"] for trip, _ in computed]
+        if synced_ids:
+            await Trip.get_pymongo_collection().update_many(
+                {"_id": {"$in": synced_ids}},
+                {"$set": {"mobility_synced_at": synced_at}},
+            )
+        return len(synced_ids)
+
     @classmethod
     async def sync_trip(cls, trip: Trip) -> bool:
         """Compute and persist one trip's H3 traversal profile."""
@@ -308,63 +519,18 @@ class MobilityInsightsService:
             return False
 
         trip_data = trip.model_dump()
-        lines, geometry_source = cls._select_trip_geometry(trip_data)
-        synced_at = datetime.now(UTC)
-        transaction_id = (trip.transactionId or "").strip() or None
-        identity = cls._profile_identity_query(trip.id, transaction_id)
-
-        if not lines:
-            await TripMobilityProfile.find(identity).delete()
-            await cls._set_trip_synced(trip.id, synced_at)
+        trip_data["_id"] = trip.id
+        computed = cls._compute_profiles([trip_data])
+        if not computed:
+            # Already logged; the trip stays unsynced for the next sweep.
             return False
-
-        cell_counts, segment_counts, total_distance_miles = cls._build_trip_stats(
-            lines,
-            resolution=H3_RESOLUTION,
-            spacing_m=H3_SAMPLE_SPACING_M,
+        synced_at = datetime.now(UTC)
+        await cls._write_profiles(computed, synced_at)
+        await Trip.get_pymongo_collection().update_one(
+            {"_id": trip.id},
+            {"$set": {"mobility_synced_at": synced_at}},
         )
-
-        # A transaction may still carry profiles from earlier ObjectIds.
-        # Keep one and drop the rest, otherwise re-pointing the survivor at
-        # this trip would collide with a sibling on the unique trip_id index.
-        matches = await TripMobilityProfile.find(identity).to_list()
-        matches.sort(key=lambda candidate: candidate.trip_id != trip.id)
-        profile = matches[0] if matches else None
-        if len(matches) > 1:
-            await TripMobilityProfile.find(
-                {"_id": {"$in": [stale.id for stale in matches[1:]]}},
-            ).delete()
-
-        if profile is None:
-            profile = TripMobilityProfile(
-                trip_id=trip.id,
-                transaction_id=transaction_id,
-                imei=trip.imei,
-                start_time=trip.startTime,
-                end_time=trip.endTime,
-            )
-
-        # Re-point the surviving profile at the trip's current ObjectId.
-        profile.trip_id = trip.id
-        profile.transaction_id = transaction_id
-        profile.imei = trip.imei
-        profile.start_time = trip.startTime
-        profile.end_time = trip.endTime
-        profile.h3_resolution = H3_RESOLUTION
-        profile.sample_spacing_m = H3_SAMPLE_SPACING_M
-        profile.source_geometry = geometry_source or "gps"
-        profile.total_distance_miles = round(total_distance_miles, 4)
-        profile.cell_counts = cell_counts
-        profile.segment_counts = segment_counts
-        profile.updated_at = synced_at
-
-        if profile.id is None:
-            await profile.insert()
-        else:
-            await profile.save()
-
-        await cls._set_trip_synced(trip.id, synced_at)
-        return True
+        return computed[0][1] is not None
 
     @classmethod
     async def remove_trip(
@@ -537,29 +703,29 @@ class MobilityInsightsService:
         )
         unsynced_query = _combine_query(base_query, {"mobility_synced_at": None})
 
-        pending_before = await Trip.find(unsynced_query).count()
-        if pending_before <= 0:
+        collection = Trip.get_pymongo_collection()
+        trips = [
+            trip
+            async for trip in collection.find(
+                unsynced_query,
+                _SYNC_TRIP_PROJECTION,
+                sort=[("startTime", 1)],
+                limit=limit,
+            )
+        ]
+        if not trips:
             return 0, 0
 
-        trips = (
-            await Trip.find(unsynced_query)
-            .sort([("startTime", 1)])
-            .limit(limit)
-            .to_list()
-        )
-        synced = 0
-        for trip in trips:
-            try:
-                await cls.sync_trip(trip)
-                synced += 1
-            except Exception:
-                logger.exception(
-                    "Failed syncing mobility profile for trip %s",
-                    trip.transactionId,
-                )
+        try:
+            synced = await cls._sync_trip_documents(trips)
+        except Exception:
+            logger.exception("Failed syncing mobility profiles for a trip batch")
+            synced = 0
 
-        pending_after = max(0, pending_before - synced)
-        return synced, pending_after
+        # A short batch drained the backlog; only a full one needs a count.
+        if len(trips) < limit:
+            return synced, len(trips) - synced
+        return synced, await collection.count_documents(unsynced_query)
 
     @classmethod
     async def _street_name_for_cell(
@@ -645,23 +811,6 @@ class MobilityInsightsService:
         if not ranked_cells:
             return []
 
-        geocoder = await cls._resolve_street_lookup_geocoder()
-        semaphore = asyncio.Semaphore(8)
-
-        async def resolve_street_name(cell_id: str) -> str | None:
-            if street_names_by_cell is not None:
-                resolved = _normalize_street_name(street_names_by_cell.get(cell_id))
-                if resolved:
-                    return resolved
-            async with semaphore:
-                street = await cls._street_name_for_cell(
-                    cell_id,
-                    resolution=resolution,
-                    geocoder=geocoder,
-                    resolve_geocoder=False,
-                )
-                return _normalize_street_name(street)
-
         candidate_cells = [
             str(cell.get("hex") or "") for cell in ranked_cells if cell.get("hex")
         ]
@@ -674,13 +823,11 @@ class MobilityInsightsService:
             if not _normalize_street_name((street_names_by_cell or {}).get(cell_id))
         ]
         if missing_labels:
-            resolved_pairs = await asyncio.gather(
-                *(resolve_street_name(cell_id) for cell_id in missing_labels),
+            resolved = await cls._resolve_street_names_for_cells(
+                missing_labels,
+                resolution=resolution,
             )
-            if street_names_by_cell is None:
-                street_names_by_cell = {}
-            for idx, cell_id in enumerate(missing_labels):
-                street_names_by_cell[cell_id] = resolved_pairs[idx]
+            street_names_by_cell = {**(street_names_by_cell or {}), **resolved}
 
         start_time = time.perf_counter()
         trip_query = _combine_query(
@@ -799,23 +946,135 @@ class MobilityInsightsService:
         if not ordered_unique:
             return {}
 
-        geocoder = await cls._resolve_street_lookup_geocoder()
-        semaphore = asyncio.Semaphore(8)
+        # Cached labels first, then the locally stored coverage streets; only
+        # cells outside every coverage area reach the reverse geocoder.
+        labels = await cls._cached_street_labels(ordered_unique)
+        missing = [cell_id for cell_id in ordered_unique if cell_id not in labels]
+        if missing:
+            local = await cls._local_street_labels(missing, resolution=resolution)
+            labels.update(local)
+            missing = [cell_id for cell_id in missing if cell_id not in local]
+
+        if missing:
+            geocoder = await cls._resolve_street_lookup_geocoder()
+            semaphore = asyncio.Semaphore(STREET_LABEL_GEOCODE_CONCURRENCY)
+
+            async def resolve(cell_id: str) -> tuple[str, str | None]:
+                async with semaphore:
+                    street = await cls._street_name_for_cell(
+                        cell_id,
+                        resolution=resolution,
+                        geocoder=geocoder,
+                        resolve_geocoder=False,
+                    )
+                    return cell_id, street
 
-        async def resolve(cell_id: str) -> tuple[str, str | None]:
-            async with semaphore:
-                street = await cls._street_name_for_cell(
-                    cell_id,
-                    resolution=resolution,
-                    geocoder=geocoder,
-                    resolve_geocoder=False,
-                )
-                return cell_id, _normalize_street_name(street)
+            labels.update(
+                await asyncio.gather(*(resolve(cell_id) for cell_id in missing)),
+            )
 
-        resolved_pairs = await asyncio.gather(
-            *(resolve(cell_id) for cell_id in ordered_unique),
+        return {
+            cell_id: _normalize_street_name(labels.get(cell_id))
+            for cell_id in ordered_unique
+        }
+
+    @staticmethod
+    async def _cached_street_labels(cells: list[str]) -> dict[str, str | None]:
+        """Cached labels for ``cells`` from one lookup; touches their use time."""
+        collection = H3StreetLabelCache.get_pymongo_collection()
+        labels: dict[str, str | None] = {}
+        cursor = collection.find(
+            {"h3_cell": {"$in": cells}},
+            {"_id": 0, "h3_cell": 1, "street_name": 1},
         )
-        return dict(resolved_pairs)
+        async for doc in cursor:
+            labels[str(doc["h3_cell"])] = doc.get("street_name")
+        if labels:
+            with suppress(Exception):
+                await collection.update_many(
+                    {"h3_cell": {"$in": list(labels)}},
+                    {"$set": {"last_used_at": datetime.now(UTC)}},
+                )
+        return labels
+
+    @staticmethod
+    async def _local_street_labels(
+        cells: list[str],
+        *,
+        resolution: int,
+    ) -> dict[str, str]:
+        """
+        Label cells from coverage ``Street`` segments crossing them.
+
+        Cells are sent to Mongo in chunks as one MultiPolygon ``$geoIntersects``
+        query; each cell then takes the name of the segment nearest its
+        center. Resolved labels are written to ``H3StreetLabelCache`` so the
+        next lookup is a cache hit.
+        """
+        labels: dict[str, str] = {}
+        try:
+            collection = Street.get_pymongo_collection()
+        except Exception:
+            return labels
+
+        for offset in range(0, len(cells), STREET_LABEL_LOCAL_CHUNK):
+            chunk = cells[offset : offset + STREET_LABEL_LOCAL_CHUNK]
+            polygons: dict[str, list[list[float]]] = {}
+            for cell_id in chunk:
+                try:
+                    ring = [[lng, lat] for lat, lng in h3.cell_to_boundary(cell_id)]
+                except Exception:
+                    continue
+                polygons[cell_id] = [*ring, ring[0]]
+            if not polygons:
+                continue
+
+            try:
+                cursor = collection.find(
+                    {
+                        "street_name": {"$nin": [None, ""]},
+                        "geometry": {
+                            "$geoIntersects": {
+                                "$geometry": {
+                                    "type": "MultiPolygon",
+                                    "coordinates": [
+                                        [ring] for ring in polygons.values()
+                                    ],
+                                },
+                            },
+                        },
+                    },
+                    {"_id": 0, "street_name": 1, "geometry": 1},
+                )
+                streets = [doc async for doc in cursor]
+            except Exception:
+                logger.debug("Local street label lookup failed", exc_info=True)
+                continue
+            labels.update(
+                await asyncio.to_thread(_nearest_street_labels, polygons, streets),
+            )
+
+        if labels:
+            now = datetime.now(UTC)
+            docs = [
+                {
+                    "h3_cell": cell_id,
+                    "resolution": resolution,
+                    "street_name": name,
+                    "normalized_street_name": name.casefold(),
+                    "display_name": None,
+                    "source": "coverage_streets",
+                    "fetched_at": now,
+                    "last_used_at": now,
+                }
+                for cell_id, name in labels.items()
+            ]
+            with suppress(Exception):
+                await H3StreetLabelCache.get_pymongo_collection().insert_many(
+                    docs,
+                    ordered=False,
+                )
+        return labels
 
     @classmethod
     async def _build_entity_paths(
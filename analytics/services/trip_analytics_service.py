@@ -3,6 +3,7 @@
 import logging
 from typing import Any
 
+from analytics.services.trip_rollup_service import TripRollupService
 from core.trip_source_policy import enforce_bouncie_source
 from db.aggregation import aggregate_to_list
 from db.aggregation_utils import (
@@ -31,23 +32,25 @@ class TripAnalyticsService:
             Dictionary containing daily distances, time distribution, and weekday distribution
         """
         query = enforce_bouncie_source(query)
-        tz_expr = get_mongo_tz_expr()
-
-        pipeline = [
-            {"$match": query},
-            {
-                "$group": {
-                    "_id": build_trip_time_group_id(
-                        date_field="startTime",
-                        tz_expr=tz_expr,
-                    ),
-                    "totalDistance": {"$sum": "$distance"},
-                    "tripCount": {"$sum": 1},
+        rollup_rows = await TripRollupService.rows_for_query(query)
+        if rollup_rows is not None:
+            results = TripAnalyticsService._time_groups_from_rollups(rollup_rows)
+        else:
+            tz_expr = get_mongo_tz_expr()
+            pipeline = [
+                {"$match": query},
+                {
+                    "$group": {
+                        "_id": build_trip_time_group_id(
+                            date_field="startTime",
+                            tz_expr=tz_expr,
+                        ),
+                        "totalDistance": {"$sum": "$distance"},
+                        "tripCount": {"$sum": 1},
+                    },
                 },
-            },
-        ]
-
-        results = await aggregate_to_list(Trip, pipeline)
+            ]
+            results = await aggregate_to_list(Trip, pipeline)
 
         # Organize data by different dimensions
         daily_list = TripAnalyticsService._organize_daily_data(results)
@@ -62,6 +65,40 @@ class TripAnalyticsService:
             "time_heatmap": time_heatmap,
         }
 
+    @staticmethod
+    def _time_groups_from_rollups(
+        rows: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Expand daily rollup rows into date/hour/dayOfWeek group results.
+
+        Produces the same shape as the Trip ``$group`` stage (``dayOfWeek``
+        uses MongoDB's 1=Sunday convention) so the organizers are shared.
+        """
+        results = []
+        for row in rows:
+            hour_trips = row.get("hour_trips") or []
+            hour_distance = row.get("hour_distance") or []
+            for hour, count in enumerate(hour_trips):
+                if not count:
+                    continue
+                results.append(
+                    {
+                        "_id": {
+                            "date": row["day"],
+                            "hour": hour,
+                            "dayOfWeek": int(row.get("weekday") or 0) + 1,
+                        },
+                        "totalDistance": (
+                            float(hour_distance[hour])
+                            if hour < len(hour_distance)
+                            else 0.0
+                        ),
+                        "tripCount": int(count),
+                    },
+                )
+        return results
+
     @staticmethod
     def _organize_daily_data(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
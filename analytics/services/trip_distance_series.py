@@ -0,0 +1,338 @@
+"""
+Per-vehicle cumulative trip distance series for interval distance lookups.
+
+``TripDistanceSeries`` keeps one row per active, valid Bouncie trip with the
+vehicle's running distance total through that trip, ordered by trip end time.
+The prorated distance driven up to an instant is then the cumulative value of
+the last trip that ended by then plus the elapsed share of the trip in
+progress, and the distance over an interval is the difference of two such
+lookups. Trip writers keep the series current through
+``TripRollupService.refresh_for_trips``; until the initial build has run,
+callers fall back to scanning the Trip collection.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from core.date_utils import parse_timestamp
+from core.trip_source_policy import BOUNCIE_SOURCE
+from db.bulk import bulk_write_updates
+from db.models import Trip, TripDistanceSeries, TripRollupState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+TRIP_DISTANCE_SERIES_VERSION = 1
+TRIP_DISTANCE_SERIES_STATE_ID = "trip_distance_series"
+_SCAN_BATCH_SIZE = 1000
+
+_TRIP_PROJECTION = {
+    "_id": 0,
+    "transactionId": 1,
+    "imei": 1,
+    "source": 1,
+    "startTime": 1,
+    "endTime": 1,
+    "distance": 1,
+    "invalid": 1,
+    "inactive": 1,
+}
+_SERIES_PROJECTION = {
+    "_id": 0,
+    "transactionId": 1,
+    "imei": 1,
+    "start_time": 1,
+    "end_time": 1,
+    "distance": 1,
+    "cumulative_distance": 1,
+}
+_SORT_ASC = [("end_time", 1), ("transactionId", 1)]
+_SORT_DESC = [("end_time", -1), ("transactionId", -1)]
+
+
+def _as_utc(value: Any) -> datetime | None:
+    if value is None:
+        return None
+    parsed = value if isinstance(value, datetime) else parse_timestamp(value)
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def _series_entry(trip: dict[str, Any]) -> dict[str, Any] | None:
+    """Series row for a trip document, or ``None`` if it adds no distance."""
+    if trip.get("source") != BOUNCIE_SOURCE:
+        return None
+    if trip.get("invalid") is True or trip.get("inactive") is True:
+        return None
+    start = _as_utc(trip.get("startTime"))
+    end = _as_utc(trip.get("endTime"))
+    distance = trip.get("distance")
+    if start is None or end is None or end <= start:
+        return None
+    try:
+        distance = float(distance)
+    except (TypeError, ValueError):
+        return None
+    if not distance > 0:
+        return None
+    return {
+        "transactionId": trip.get("transactionId"),
+        "imei": trip.get("imei"),
+        "start_time": start,
+        "end_time": end,
+        "distance": distance,
+    }
+
+
+def _sort_key(entry: dict[str, Any]) -> tuple[datetime, str]:
+    return _as_utc(entry["end_time"]), str(entry["transactionId"])
+
+
+class TripDistanceSeriesService:
+    """Maintain and read the per-vehicle cumulative distance series."""
+
+    @staticmethod
+    async def _recompute_from(imei: str | None, since: datetime) -> int:
+        """Rewrite cumulative totals for ``imei`` rows ending at or after ``since``."""
+        collection = TripDistanceSeries.get_pymongo_collection()
+        previous = await collection.find_one(
+            {"imei": imei, "end_time": {"$lt": since}},
+            _SERIES_PROJECTION,
+            sort=_SORT_DESC,
+        )
+        running = float(previous["cumulative_distance"]) if previous else 0.0
+
+        updates: list[tuple[dict[str, Any], dict[str, Any], bool]] = []
+        cursor = collection.find(
+            {"imei": imei, "end_time": {"$gte": since}},
+            _SERIES_PROJECTION,
+            batch_size=_SCAN_BATCH_SIZE,
+        ).sort(_SORT_ASC)
+        async for row in cursor:
+            running += float(row.get("distance") or 0.0)
+            if row.get("cumulative_distance") != running:
+                updates.append(
+                    (
+                        {"transactionId": row["transactionId"]},
+                        {"$set": {"cumulative_distance": running}},
+                        False,
+                    ),
+                )
+        await bulk_write_updates(collection, updates)
+        return len(updates)
+
+    @staticmethod
+    async def refresh_transactions(transaction_ids: Iterable[str | None]) -> int:
+        """
+        Re-sync series rows for the given trips from the Trip collection.
+
+        Inserted, edited, invalidated and deleted trips are all handled by
+        comparing the stored row with the trip's current state, then
+        recomputing each affected vehicle's totals from the earliest change.
+        """
+        ids = sorted({tx for tx in transaction_ids if tx})
+        if not ids:
+            return 0
+
+        series = TripDistanceSeries.get_pymongo_collection()
+        current = {
+            trip["transactionId"]: trip
+            async for trip in Trip.get_pymongo_collection().find(
+                {"transactionId": {"$in": ids}},
+                _TRIP_PROJECTION,
+            )
+        }
+        stored = {
+            row["transactionId"]: row
+            async for row in series.find(
+                {"transactionId": {"$in": ids}},
+                _SERIES_PROJECTION,
+            )
+        }
+
+        upserts: list[tuple[dict[str, Any], dict[str, Any], bool]] = []
+        removed: list[str] = []
+        # Earliest end time touched per vehicle; later totals must be redone.
+        dirty: dict[str | None, datetime] = {}
+
+        def _mark(imei: str | None, end_time: Any) -> None:
+            end = _as_utc(end_time)
+            if end is not None and (imei not in dirty or end < dirty[imei]):
+                dirty[imei] = end
+
+        for tx in ids:
+            trip = current.get(tx)
+            entry = _series_entry(trip) if trip is not None else None
+            old = stored.get(tx)
+            if old is not None:
+                unchanged = entry is not None and all(
+                    _as_utc(old.get(k)) == entry[k]
+                    if k.endswith("_time")
+                    else old.get(k) == entry[k]
+                    for k in ("imei", "start_time", "end_time", "distance")
+                )
+                if unchanged:
+                    continue
+                _mark(old.get("imei"), old.get("end_time"))
+            if entry is None:
+                if old is not None:
+                    removed.append(tx)
+                continue
+            _mark(entry["imei"], entry["end_time"])
+            upserts.append(({"transactionId": tx}, {"$set": entry}, True))
+
+        if removed:
+            await series.delete_many({"transactionId": {"$in": removed}})
+        await bulk_write_updates(series, upserts)
+        for imei, since in dirty.items():
+            await TripDistanceSeriesService._recompute_from(imei, since)
+        return len(upserts) + len(removed)
+
+    @staticmethod
+    async def refresh_for_trips(trips: Iterable[Any]) -> int:
+        """Refresh series rows for trip documents; failures are only logged."""
+        transaction_ids = [
+            trip.get("transactionId")
+            if isinstance(trip, dict)
+            else getattr(trip, "transactionId", None)
+            for trip in trips
+        ]
+        try:
+            return await TripDistanceSeriesService.refresh_transactions(
+                transaction_ids,
+            )
+        except Exception:
+            logger.warning("Failed to refresh trip distance series", exc_info=True)
+            return 0
+
+    @staticmethod
+    async def rebuild() -> dict[str, int]:
+        """Rebuild every vehicle's series from one Trip scan and mark it ready."""
+        by_imei: dict[str | None, list[dict[str, Any]]] = defaultdict(list)
+        cursor = Trip.get_pymongo_collection().find(
+            {
+                "source": BOUNCIE_SOURCE,
+                "invalid": {"$ne": True},
+                "inactive": {"$ne": True},
+                "endTime": {"$ne": None},
+            },
+            _TRIP_PROJECTION,
+            batch_size=_SCAN_BATCH_SIZE,
+        )
+        async for trip in cursor:
+            entry = _series_entry(trip)
+            if entry is not None:
+                by_imei[entry["imei"]].append(entry)
+
+        rows: list[dict[str, Any]] = []
+        for entries in by_imei.values():
+            running = 0.0
+            for entry in sorted(entries, key=_sort_key):
+                running += entry["distance"]
+                rows.append({**entry, "cumulative_distance": running})
+
+        # Readers fall back to the Trip scan while the rows are replaced; a
+        # failed rebuild leaves the marker cleared so the next run retries.
+        await TripRollupState.get_pymongo_collection().delete_one(
+            {"_id": TRIP_DISTANCE_SERIES_STATE_ID},
+        )
+        series = TripDistanceSeries.get_pymongo_collection()
+        await series.delete_many({})
+        if rows:
+            await series.insert_many(rows)
+
+        state = TripRollupState(
+            id=TRIP_DISTANCE_SERIES_STATE_ID,
+            version=TRIP_DISTANCE_SERIES_VERSION,
+            built_at=datetime.now(UTC),
+            trip_count=len(rows),
+            row_count=len(rows),
+        )
+        await state.save()
+        logger.info(
+            "Rebuilt trip distance series for %d vehicles from %d trips",
+            len(by_imei),
+            len(rows),
+        )
+        return {"vehicles": len(by_imei), "rows": len(rows)}
+
+    @staticmethod
+    async def is_ready() -> bool:
+        state = await TripRollupState.get(TRIP_DISTANCE_SERIES_STATE_ID)
+        return state is not None and state.version == TRIP_DISTANCE_SERIES_VERSION
+
+    @staticmethod
+    async def ensure_built() -> bool:
+        """Run the initial (or version-bump) full build; True if one ran."""
+        if await TripDistanceSeriesService.is_ready():
+            return False
+        await TripDistanceSeriesService.rebuild()
+        return True
+
+    @staticmethod
+    async def distance_at(imei: str, when: datetime) -> float:
+        """
+        Prorated distance the vehicle drove up to ``when``.
+
+        Uses the last trip that ended by ``when`` and the first one ending
+        after it. Trips of one vehicle do not overlap, so at most one trip is
+        in progress at any instant.
+        """
+        when = _as_utc(when)
+        collection = TripDistanceSeries.get_pymongo_collection()
+        previous = await collection.find_one(
+            {"imei": imei, "end_time": {"$lte": when}},
+            _SERIES_PROJECTION,
+            sort=_SORT_DESC,
+        )
+        total = float(previous["cumulative_distance"]) if previous else 0.0
+
+        in_progress = await collection.find_one(
+            {"imei": imei, "end_time": {"$gt": when}},
+            _SERIES_PROJECTION,
+            sort=_SORT_ASC,
+        )
+        if in_progress is not None:
+            start = _as_utc(in_progress["start_time"])
+            end = _as_utc(in_progress["end_time"])
+            if start < when:
+                share = (when - start).total_seconds() / (end - start).total_seconds()
+                total += float(in_progress["distance"]) * share
+        return total
+
+    @staticmethod
+    async def distance_between(
+        imei: str,
+        start_time: datetime,
+        end_time: datetime,
+    ) -> float | None:
+        """
+        Prorated distance driven between two instants.
+
+        Returns ``None`` when the series has not been built or cannot be read,
+        so callers can fall back to scanning trips.
+        """
+        try:
+            if not await TripDistanceSeriesService.is_ready():
+                return None
+            start_total = await TripDistanceSeriesService.distance_at(imei, start_time)
+            end_total = await TripDistanceSeriesService.distance_at(imei, end_time)
+        except Exception:
+            logger.warning("Trip distance series read failed", exc_info=True)
+            return None
+        return max(end_total - start_total, 0.0)
+
+
+__all__ = [
+    "TRIP_DISTANCE_SERIES_VERSION",
+    "TripDistanceSeriesService",
+]
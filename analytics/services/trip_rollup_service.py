@@ -0,0 +1,455 @@
+"""
+Materialized daily trip rollups for dashboard and trip analytics.
+
+Each ``TripDailyRollup`` row holds the totals of one vehicle's active, valid
+Bouncie trips that started on one local calendar day. Trip writers refresh the
+affected (imei, day) rows through :class:`TripRollupService`, and a full build
+marks the collection ready via ``TripRollupState``. Until that marker exists,
+or when a query filters on anything other than the date range and vehicle,
+callers fall back to aggregating the Trip collection directly.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from analytics.services.trip_distance_series import TripDistanceSeriesService
+from core.date_utils import parse_timestamp
+from core.trip_source_policy import BOUNCIE_SOURCE
+from db.aggregation_utils import get_mongo_tz_expr
+from db.models import Trip, TripDailyRollup, TripRollupState
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+logger = logging.getLogger(__name__)
+
+TRIP_ROLLUP_VERSION = 1
+ROLLUP_SPEED_BUCKET_MPH = 10
+ROLLUP_SPEED_BUCKETS = 11  # 0-9, 10-19, ..., 90-99, 100+
+# Widest UTC offset in use; a local day can start this far from UTC midnight.
+_MAX_UTC_OFFSET = timedelta(hours=14)
+_SCAN_BATCH_SIZE = 1000
+
+_TRIP_PROJECTION = {
+    "_id": 0,
+    "imei": 1,
+    "startTime": 1,
+    "endTime": 1,
+    "startTimeZone": 1,
+    "distance": 1,
+    "fuelConsumed": 1,
+    "maxSpeed": 1,
+    "totalIdleDuration": 1,
+    "invalid": 1,
+    "inactive": 1,
+}
+
+# Mirrors the cases of ``get_mongo_tz_expr`` / ``build_mongo_tz_valid_expr``.
+_COMPACT_OFFSET_RE = re.compile(r"^[+-][0-9]{4}$")
+_OFFSET_RE = re.compile(r"^[+-][0-9]{2}:[0-9]{2}$")
+_VALID_OFFSET_RE = re.compile(r"^[+-](?:[01][0-9]|2[0-3]):?[0-5][0-9]$")
+_IANA_RE = re.compile(r"^[a-zA-Z_]+(?:/[a-zA-Z0-9_+\-]+)+$")
+
+RollupKey = tuple[str | None, str]
+
+
+@dataclass(frozen=True, slots=True)
+class RollupScope:
+    """Date window and vehicle a rollup-backed query covers."""
+
+    imei: str | None = None
+    start_day: str | None = None
+    end_day: str | None = None
+
+
+def _resolve_timezone(value: Any) -> tuple[timezone | ZoneInfo, bool]:
+    """Timezone used to bucket a trip plus whether the stored value is valid."""
+    if value in (None, "", "0000"):
+        return UTC, False
+    text = str(value)
+    if text in {"UTC", "GMT"}:
+        return UTC, True
+    if _COMPACT_OFFSET_RE.match(text):
+        text = f"{text[:3]}:{text[3:]}"
+    if _OFFSET_RE.match(text):
+        sign = -1 if text[0] == "-" else 1
+        offset = timedelta(hours=int(text[1:3]), minutes=int(text[4:6]))
+        return timezone(sign * offset), bool(_VALID_OFFSET_RE.match(text))
+    if _IANA_RE.match(text):
+        try:
+            return ZoneInfo(text), True
+        except (ZoneInfoNotFoundError, ValueError):
+            return UTC, False
+    return UTC, False
+
+
+def _as_utc(value: Any) -> datetime | None:
+    if value is None:
+        return None
+    parsed = value if isinstance(value, datetime) else parse_timestamp(value)
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def _non_negative(value: Any) -> float | None:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    if math.isnan(number) or number < 0:
+        return None
+    return number
+
+
+def _field(trip: Any, name: str) -> Any:
+    if isinstance(trip, dict):
+        return trip.get(name)
+    return getattr(trip, name, None)
+
+
+def _counts_toward_rollups(trip: Any) -> bool:
+    return _field(trip, "invalid") is not True and _field(trip, "inactive") is not True
+
+
+def trip_rollup_key(trip: Any) -> RollupKey | None:
+    """(imei, local start day) row a trip document belongs to."""
+    start = _as_utc(_field(trip, "startTime"))
+    if start is None:
+        return None
+    tz, _ = _resolve_timezone(_field(trip, "startTimeZone"))
+    return _field(trip, "imei"), start.astimezone(tz).date().isoformat()
+
+
+def _empty_row(key: RollupKey) -> dict[str, Any]:
+    imei, day = key
+    return {
+        "imei": imei,
+        "day": day,
+        # isoweekday: Monday=1..Sunday=7 -> 0=Sunday..6=Saturday.
+        "weekday": date.fromisoformat(day).isoweekday() % 7,
+        "trip_count": 0,
+        "distance_total": 0.0,
+        "distance_count": 0,
+        "distance_max": None,
+        "duration_seconds": 0.0,
+        "paired_distance": 0.0,
+        "paired_duration_seconds": 0.0,
+        "fuel_total": 0.0,
+        "fuel_for_mpg": 0.0,
+        "fuel_distance": 0.0,
+        "fuel_trip_count": 0,
+        "idle_seconds": 0.0,
+        "max_speed": None,
+        "start_hour_count": 0,
+        "start_hour_sin": 0.0,
+        "start_hour_cos": 0.0,
+        "hour_trips": [0] * 24,
+        "hour_distance": [0.0] * 24,
+        "speed_histogram": [0] * ROLLUP_SPEED_BUCKETS,
+    }
+
+
+def _accumulate(rows: dict[RollupKey, dict[str, Any]], trip: Any) -> None:
+    """Fold one trip into its day row, following the pipelines' coercions."""
+    start = _as_utc(_field(trip, "startTime"))
+    if start is None:
+        return
+    tz, tz_valid = _resolve_timezone(_field(trip, "startTimeZone"))
+    local = start.astimezone(tz)
+    key = (_field(trip, "imei"), local.date().isoformat())
+    row = rows.get(key)
+    if row is None:
+        row = rows[key] = _empty_row(key)
+
+    distance = _non_negative(_field(trip, "distance"))
+    fuel = _non_negative(_field(trip, "fuelConsumed"))
+    max_speed = _non_negative(_field(trip, "maxSpeed"))
+    idle = _non_negative(_field(trip, "totalIdleDuration"))
+    end = _as_utc(_field(trip, "endTime"))
+    duration = (end - start).total_seconds() if end is not None and start < end else 0
+
+    row["trip_count"] += 1
+    row["hour_trips"][local.hour] += 1
+    if distance is not None:
+        row["distance_total"] += distance
+        row["distance_count"] += 1
+        row["distance_max"] = max(row["distance_max"] or 0.0, distance)
+        row["hour_distance"][local.hour] += distance
+        if duration > 0:
+            row["paired_distance"] += distance
+            row["paired_duration_seconds"] += duration
+        if fuel is not None and fuel > 0:
+            row["fuel_for_mpg"] += fuel
+            row["fuel_distance"] += distance
+            row["fuel_trip_count"] += 1
+    if fuel is not None:
+        row["fuel_total"] += fuel
+    if idle is not None:
+        row["idle_seconds"] += idle
+    row["duration_seconds"] += duration
+    if max_speed is not None:
+        row["max_speed"] = max(row["max_speed"] or 0.0, max_speed)
+        bucket = min(
+            int(max_speed // ROLLUP_SPEED_BUCKET_MPH), ROLLUP_SPEED_BUCKETS - 1
+        )
+        row["speed_histogram"][bucket] += 1
+    if tz_valid:
+        angle = (local.hour + local.minute / 60.0 + local.second / 3600.0) / 24.0
+        row["start_hour_count"] += 1
+        row["start_hour_sin"] += math.sin(angle * 2 * math.pi)
+        row["start_hour_cos"] += math.cos(angle * 2 * math.pi)
+
+
+def _day_bounds_utc(first_day: str, last_day: str) -> tuple[datetime, datetime]:
+    start = datetime.fromisoformat(first_day).replace(tzinfo=UTC)
+    end = datetime.fromisoformat(last_day).replace(tzinfo=UTC) + timedelta(days=1)
+    return start - _MAX_UTC_OFFSET, end + _MAX_UTC_OFFSET
+
+
+def _calendar_date_expr() -> dict[str, Any]:
+    return {
+        "$dateToString": {
+            "format": "%Y-%m-%d",
+            "date": "$startTime",
+            "timezone": get_mongo_tz_expr("startTime"),
+        },
+    }
+
+
+def rollup_scope_from_query(query: Mapping[str, Any]) -> RollupScope | None:
+    """
+    Recognize queries that daily rollups can answer exactly.
+
+    That is the shape ``TripQuerySpec.to_mongo_query`` produces for the
+    default visibility filters: source, ``invalid``/``inactive`` excluded, an
+    optional IMEI and an optional local calendar date range.
+    """
+    allowed = {"source", "invalid", "inactive", "imei", "$expr"}
+    if not set(query) <= allowed:
+        return None
+    if query.get("source") != BOUNCIE_SOURCE:
+        return None
+    if query.get("invalid") != {"$ne": True}:
+        return None
+    if query.get("inactive") != {"$ne": True}:
+        return None
+    imei = query.get("imei")
+    if imei is not None and not isinstance(imei, str):
+        return None
+
+    start_day = end_day = None
+    expr = query.get("$expr")
+    if expr is not None:
+        if not isinstance(expr, dict) or len(expr) != 1:
+            return None
+        clauses = expr.get("$and", [expr])
+        if not isinstance(clauses, list):
+            return None
+        date_expr = _calendar_date_expr()
+        for clause in clauses:
+            if not isinstance(clause, dict) or len(clause) != 1:
+                return None
+            ((op, args),) = clause.items()
+            if (
+                op not in {"$gte", "$lte"}
+                or not isinstance(args, list)
+                or len(args) != 2
+                or args[0] != date_expr
+                or not isinstance(args[1], str)
+            ):
+                return None
+            if op == "$gte":
+                start_day = args[1]
+            else:
+                end_day = args[1]
+    return RollupScope(imei=imei, start_day=start_day, end_day=end_day)
+
+
+class TripRollupService:
+    """Maintain and read ``TripDailyRollup`` rows."""
+
+    @staticmethod
+    async def refresh_keys(keys: Iterable[RollupKey | None]) -> int:
+        """Recompute the given (imei, day) rows from the Trip collection."""
+        by_imei: dict[str | None, set[str]] = defaultdict(set)
+        for key in keys:
+            if key is not None:
+                by_imei[key[0]].add(key[1])
+        if not by_imei:
+            return 0
+
+        collection = Trip.get_pymongo_collection()
+        rollups = TripDailyRollup.get_pymongo_collection()
+        now = datetime.now(UTC)
+        written = 0
+        for imei, days in by_imei.items():
+            window_start, window_end = _day_bounds_utc(min(days), max(days))
+            rows: dict[RollupKey, dict[str, Any]] = {}
+            cursor = collection.find(
+                {
+                    "source": BOUNCIE_SOURCE,
+                    "imei": imei,
+                    "startTime": {"$gte": window_start, "$lt": window_end},
+                },
+                _TRIP_PROJECTION,
+                batch_size=_SCAN_BATCH_SIZE,
+            )
+            async for trip in cursor:
+                if _counts_toward_rollups(trip):
+                    _accumulate(rows, trip)
+
+            for day in days:
+                row = rows.get((imei, day))
+                selector = {"imei": imei, "day": day}
+                if row is None:
+                    await rollups.delete_one(selector)
+                    continue
+                row["updated_at"] = now
+                await rollups.replace_one(selector, row, upsert=True)
+                written += 1
+        return written
+
+    @staticmethod
+    async def refresh_for_trips(
+        trips: Iterable[Any],
+        *,
+        previous_keys: Iterable[RollupKey | None] = (),
+    ) -> int:
+        """
+        Refresh the rows touched by inserted, updated or deleted trips.
+
+        ``previous_keys`` carries the rows trips belonged to before an edit
+        moved their start time or vehicle. The per-vehicle distance series is
+        refreshed alongside. Failures are logged, not raised, so a rollup
+        problem never fails the trip write itself.
+        """
+        trips = list(trips)
+        await TripDistanceSeriesService.refresh_for_trips(trips)
+        keys = {trip_rollup_key(trip) for trip in trips}
+        keys.update(previous_keys)
+        try:
+            return await TripRollupService.refresh_keys(keys)
+        except Exception:
+            logger.warning("Failed to refresh daily trip rollups", exc_info=True)
+            return 0
+
+    @staticmethod
+    async def rebuild() -> dict[str, int]:
+        """
+        Rebuild every row from a single Trip scan and mark rollups ready.
+
+        The ready marker is cleared before the old rows are dropped and only
+        written back once the new rows are in.
+        """
+        rows: dict[RollupKey, dict[str, Any]] = {}
+        trip_count = 0
+        cursor = Trip.get_pymongo_collection().find(
+            {
+                "source": BOUNCIE_SOURCE,
+                "invalid": {"$ne": True},
+                "inactive": {"$ne": True},
+                "startTime": {"$ne": None},
+            },
+            _TRIP_PROJECTION,
+            batch_size=_SCAN_BATCH_SIZE,
+        )
+        async for trip in cursor:
+            trip_count += 1
+            _accumulate(rows, trip)
+
+        now = datetime.now(UTC)
+        # Readers fall back to the Trip pipeline while the rows are replaced;
+        # a failed rebuild leaves the marker cleared so the next run retries.
+        await TripRollupState.get_pymongo_collection().delete_one(
+            {"_id": "trip_daily"},
+        )
+        rollups = TripDailyRollup.get_pymongo_collection()
+        await rollups.delete_many({})
+        if rows:
+            await rollups.insert_many(
+                [{**row, "updated_at": now} for row in rows.values()],
+            )
+
+        state = TripRollupState(
+            version=TRIP_ROLLUP_VERSION,
+            built_at=now,
+            trip_count=trip_count,
+            row_count=len(rows),
+        )
+        await state.save()
+        logger.info(
+            "Rebuilt %d daily trip rollups from %d trips",
+            len(rows),
+            trip_count,
+        )
+        return {"trips": trip_count, "rows": len(rows)}
+
+    @staticmethod
+    async def is_ready() -> bool:
+        state = await TripRollupState.get("trip_daily")
+        return state is not None and state.version == TRIP_ROLLUP_VERSION
+
+    @staticmethod
+    async def ensure_built() -> bool:
+        """Run the initial (or version-bump) full build; True if one ran."""
+        if await TripRollupService.is_ready():
+            return False
+        await TripRollupService.rebuild()
+        return True
+
+    @staticmethod
+    async def rows_for_query(
+        query: Mapping[str, Any],
+    ) -> list[dict[str, Any]] | None:
+        """
+        Rollup rows answering ``query``, or ``None`` to use the Trip pipeline.
+
+        ``None`` means the query shape is not covered, the initial build has
+        not run yet, or the rollup read failed.
+        """
+        scope = rollup_scope_from_query(query)
+        if scope is None:
+            return None
+        try:
+            if not await TripRollupService.is_ready():
+                return None
+            match: dict[str, Any] = {}
+            if scope.imei is not None:
+                match["imei"] = scope.imei
+            day_range: dict[str, str] = {}
+            if scope.start_day:
+                day_range["$gte"] = scope.start_day
+            if scope.end_day:
+                day_range["$lte"] = scope.end_day
+            if day_range:
+                match["day"] = day_range
+            cursor = TripDailyRollup.get_pymongo_collection().find(
+                match,
+                {"_id": 0},
+                batch_size=_SCAN_BATCH_SIZE,
+            )
+            return [row async for row in cursor]
+        except Exception:
+            logger.warning("Daily trip rollup read failed", exc_info=True)
+            return None
+
+
+__all__ = [
+    "ROLLUP_SPEED_BUCKETS",
+    "TRIP_ROLLUP_VERSION",
+    "RollupScope",
+    "TripRollupService",
+    "rollup_scope_from_query",
+    "trip_rollup_key",
+]
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import itertools
 import json
 import math
 import re
@@ -10,6 +12,7 @@ from datetime import UTC, datetime, timedelta, timezone
 from typing import Annotated, Any
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
+import numpy as np
 from beanie import PydanticObjectId
 from fastapi import APIRouter, HTTPException, Query, Request, status
 from pydantic import BaseModel
@@ -33,9 +36,8 @@ from trips.serialization import TripSerializer
 from trips.services.trip_cost_service import TripCostService
 from trips.services.trip_map_geometry import (
     TRIP_MAP_PATH_VERSION,
-    bbox_for_coords,
     build_encoded_path_metadata,
-    encode_polyline6,
+    encode_polyline6_batch,
     materialized_path_is_current,
     merge_bboxes,
 )
@@ -126,84 +128,162 @@ def simplify_line_meters(
     if tolerance_m <= 0 or len(coords) <= 2:
         return coords
 
-    origin_lon, origin_lat = coords[0]
-    origin_lat_rad = math.radians(origin_lat)
-
-    xy = [
-        _project_to_local_xy(lon, lat, origin_lon, origin_lat, origin_lat_rad)
-        for lon, lat in coords
-    ]
-
-    keep = {0, len(coords) - 1}
-    _rdp_indices(xy, 0, len(coords) - 1, tolerance_m, keep)
-
-    indices = sorted(keep)
-    if len(indices) < 2:
-        return [coords[0], coords[-1]]
-    return [coords[index] for index in indices]
-
-
-def _project_to_local_xy(
-    lon: float,
-    lat: float,
-    origin_lon: float,
-    origin_lat: float,
-    origin_lat_rad: float,
-) -> tuple[float, float]:
-    lon_delta = math.radians(lon - origin_lon)
-    lat_delta = math.radians(lat - origin_lat)
-    x = lon_delta * math.cos(origin_lat_rad) * _EARTH_RADIUS_M
-    y = lat_delta * _EARTH_RADIUS_M
-    return x, y
-
-
-def _rdp_indices(
-    points: list[tuple[float, float]],
-    start: int,
-    end: int,
-    tolerance: float,
-    keep: set[int],
-) -> None:
-    if end <= start + 1:
-        return
-
-    x1, y1 = points[start]
-    x2, y2 = points[end]
-
-    max_distance = -1.0
-    max_index = -1
+    points = np.asarray(coords, dtype=float)
+    lengths = np.array([len(points)])
+    keep = _rdp_keep_mask(_project_to_local_xy(points, lengths), lengths, tolerance_m)
+    return [coords[index] for index in np.flatnonzero(keep)]
 
-    for idx in range(start + 1, end):
-        distance = _distance_to_segment(points[idx], (x1, y1), (x2, y2))
-        if distance > max_distance:
-            max_distance = distance
-            max_index = idx
-
-    if max_distance > tolerance and max_index > start:
-        keep.add(max_index)
-        _rdp_indices(points, start, max_index, tolerance, keep)
-        _rdp_indices(points, max_index, end, tolerance, keep)
 
+def _project_to_local_xy(points: np.ndarray, line_lengths: np.ndarray) -> np.ndarray:
+    """Equirectangular meters, each line relative to its own first point."""
+    line_starts = np.cumsum(line_lengths) - line_lengths
+    origins = np.repeat(
+        points[line_starts[line_lengths > 0], :2],
+        line_lengths[line_lengths > 0],
+        axis=0,
+    )
+    xy = np.empty((len(points), 2))
+    xy[:, 0] = (
+        np.radians(points[:, 0] - origins[:, 0])
+        * np.cos(np.radians(origins[:, 1]))
+        * _EARTH_RADIUS_M
+    )
+    xy[:, 1] = np.radians(points[:, 1] - origins[:, 1]) * _EARTH_RADIUS_M
+    return xy
 
-def _distance_to_segment(
-    point: tuple[float, float],
-    start: tuple[float, float],
-    end: tuple[float, float],
-) -> float:
-    px, py = point
-    x1, y1 = start
-    x2, y2 = end
 
-    dx = x2 - x1
-    dy = y2 - y1
-    if dx == 0 and dy == 0:
-        return math.hypot(px - x1, py - y1)
+def _rdp_keep_mask(
+    xy: np.ndarray,
+    line_lengths: np.ndarray,
+    tolerance: float,
+) -> np.ndarray:
+    """
+    Ramer-Douglas-Peucker keep mask for many lines stored back to back.
+
+    Every open span of every line is processed in the same step: the
+    point-to-chord distances of all interior points are computed at once and
+    reduced per span. Split points and tie-breaking (the first farthest
+    point wins) match the classic recursive formulation.
+    """
+    keep = np.zeros(len(xy), dtype=bool)
+    line_ends = np.cumsum(line_lengths) - 1
+    line_starts = line_ends - line_lengths + 1
+    present = line_lengths > 0
+    keep[line_starts[present]] = True
+    keep[line_ends[present]] = True
+
+    span_start = line_starts[line_lengths > 2]
+    span_end = line_ends[line_lengths > 2]
+    while len(span_start):
+        inner = span_end - span_start - 1
+        open_spans = inner > 0
+        span_start = span_start[open_spans]
+        span_end = span_end[open_spans]
+        inner = inner[open_spans]
+        if not len(span_start):
+            break
+
+        offsets = np.cumsum(inner) - inner
+        owner = np.repeat(np.arange(len(span_start)), inner)
+        rank = np.arange(len(owner)) - offsets[owner]
+        index = span_start[owner] + 1 + rank
+
+        x1 = xy[span_start, 0][owner]
+        y1 = xy[span_start, 1][owner]
+        dx = (xy[span_end, 0] - xy[span_start, 0])[owner]
+        dy = (xy[span_end, 1] - xy[span_start, 1])[owner]
+        px = xy[index, 0]
+        py = xy[index, 1]
+        denom = dx * dx + dy * dy
+        t = np.divide(
+            (px - x1) * dx + (py - y1) * dy,
+            denom,
+            out=np.zeros_like(denom),
+            where=denom > 0,
+        )
+        t = np.clip(t, 0.0, 1.0)
+        distances = np.hypot(px - (x1 + t * dx), py - (y1 + t * dy))
+
+        max_distance = np.maximum.reduceat(distances, offsets)
+        first_max = np.minimum.reduceat(
+            np.where(
+                distances == max_distance[owner],
+                np.arange(len(owner)),
+                len(owner),
+            ),
+            offsets,
+        )
+        split_spans = max_distance > tolerance
+        split = index[first_max[split_spans]]
+        keep[split] = True
+        span_start, span_end = (
+            np.concatenate((span_start[split_spans], split)),
+            np.concatenate((split, span_end[split_spans])),
+        )
+    return keep
+
+
+def _build_coverage_features(
+    streets: list[Any],
+    status_for: Any,
+) -> tuple[list[CoverageMapFeature], list[list[float]]]:
+    """
+    Encode coverage street features with every line processed as one batch.
+
+    CPU-bound, so callers run it off the event loop.
+    """
+    rows: list[tuple[Any, str]] = []
+    lines: list[list[list[float]]] = []
+    for street in streets:
+        segment_status = status_for(street)
+        if segment_status is None:
+            continue
+        coords = flatten_line_coordinates(street.geometry)
+        if len(coords) < 2:
+            continue
+        rows.append((street, segment_status))
+        lines.append(coords)
+    if not rows:
+        return [], []
+
+    lengths = np.array([len(line) for line in lines], dtype=np.int64)
+    points = np.fromiter(
+        itertools.chain.from_iterable(itertools.chain.from_iterable(lines)),
+        dtype=float,
+        count=2 * int(lengths.sum()),
+    ).reshape(-1, 2)
+    starts = np.cumsum(lengths) - lengths
+    lows = np.minimum.reduceat(points, starts)
+    highs = np.maximum.reduceat(points, starts)
+
+    xy = _project_to_local_xy(points, lengths)
+    encoded = {"full": encode_polyline6_batch(points, lengths)}
+    for name, tolerance_m in (("medium", 2.0), ("low", 8.0)):
+        keep = _rdp_keep_mask(xy, lengths, tolerance_m)
+        encoded[name] = encode_polyline6_batch(
+            points[keep],
+            np.add.reduceat(keep, starts),
+        )
 
-    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
-    t = max(0.0, min(1.0, t))
-    proj_x = x1 + t * dx
-    proj_y = y1 + t * dy
-    return math.hypot(px - proj_x, py - proj_y)
+    features: list[CoverageMapFeature] = []
+    feature_bboxes: list[list[float]] = []
+    for i, (street, segment_status) in enumerate(rows):
+        bbox = [*lows[i].tolist(), *highs[i].tolist()]
+        feature_bboxes.append(bbox)
+        features.append(
+            CoverageMapFeature(
+                id=street.segment_id,
+                status=segment_status,
+                name=street.street_name,
+                bbox=bbox,
+                geom=EncodedGeometryLOD(
+                    full=encoded["full"][i],
+                    medium=encoded["medium"][i],
+                    low=encoded["low"][i],
+                ),
+            ),
+        )
+    return features, feature_bboxes
 
 
 def _resolve_location_string(value: Any) -> str | None:
@@ -654,38 +734,21 @@ async def get_coverage_map_bundle(
         ).to_list()
         state_map = {state.segment_id: state for state in states}
 
-        for street in streets:
+        def undriven_status(street: Any) -> str | None:
             segment_status = (
-                state_map.get(street.segment_id).status
+                state_map[street.segment_id].status
                 if street.segment_id in state_map
                 else "undriven"
             )
             if status_filter == "undriven" and segment_status != "undriven":
-                continue
-
-            coords = flatten_line_coordinates(street.geometry)
-            if len(coords) < 2:
-                continue
-
-            bbox = bbox_for_coords(coords)
-            feature_bboxes.append(bbox)
-
-            medium = simplify_line_meters(coords, tolerance_m=2.0)
-            low = simplify_line_meters(coords, tolerance_m=8.0)
-
-            features.append(
-                CoverageMapFeature(
-                    id=street.segment_id,
-                    status=segment_status,
-                    name=street.street_name,
-                    bbox=bbox,
-                    geom=EncodedGeometryLOD(
-                        full=encode_polyline6(coords),
-                        medium=encode_polyline6(medium),
-                        low=encode_polyline6(low),
-                    ),
-                ),
-            )
+                return None
+            return segment_status
+
+        features, feature_bboxes = await asyncio.to_thread(
+            _build_coverage_features,
+            streets,
+            undriven_status,
+        )
     else:
         states = await CoverageState.find(
             {
@@ -704,30 +767,11 @@ async def get_coverage_map_bundle(
                 },
             ).to_list()
 
-            for street in streets:
-                coords = flatten_line_coordinates(street.geometry)
-                if len(coords) < 2:
-                    continue
-
-                bbox = bbox_for_coords(coords)
-                feature_bboxes.append(bbox)
-
-                medium = simplify_line_meters(coords, tolerance_m=2.0)
-                low = simplify_line_meters(coords, tolerance_m=8.0)
-
-                features.append(
-                    CoverageMapFeature(
-                        id=street.segment_id,
-                        status=status_filter,
-                        name=street.street_name,
-                        bbox=bbox,
-                        geom=EncodedGeometryLOD(
-                            full=encode_polyline6(coords),
-                            medium=encode_polyline6(medium),
-                            low=encode_polyline6(low),
-                        ),
-                    ),
-                )
+            features, feature_bboxes = await asyncio.to_thread(
+                _build_coverage_features,
+                streets,
+                lambda _street: status_filter,
+            )
 
     max_state_ts: datetime | None = None
     for state in states:
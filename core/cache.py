@@ -1,23 +1,65 @@
 """
-Redis-backed cache for expensive query results.
+Two-tier cache for expensive query results.
 
-Provides a simple decorator for caching async function results keyed by
-their arguments.  Cache entries expire via Redis TTL — no manual
-invalidation is needed for normal operation.
+``cached`` keeps results in a small in-process LRU in front of Redis. Cache
+keys embed a revision token for the decorator's namespace and for every tag it
+declares, so invalidation is a Redis ``INCR`` instead of a key scan: older
+entries simply become unreachable and expire via Redis TTL.
+
+Concurrent misses for the same key share one computation (per process, plus a
+short Redis lease so other processes wait for the first one instead of
+repeating the query). With ``stale_ttl_seconds`` set, an entry past its TTL is
+still served for that grace window while a single background refresh runs.
+
+Values are JSON round-tripped on the way into the cache and the in-process
+tier hands the same object to every caller, so treat cached results as
+read-only.
 """
 
 from __future__ import annotations
 
+import asyncio
 import functools
 import hashlib
 import json
 import logging
-from typing import Any
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from core.redis import get_shared_redis
+from core.trip_map_cache import TRIP_MAP_REVISION_KEY
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
 
 logger = logging.getLogger(__name__)
 
+CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("CACHE_LOCAL_MAX_ENTRIES", "256"))
+CACHE_REVISION_TTL_SECONDS = float(os.getenv("CACHE_REVISION_TTL_SECONDS", "1.0"))
+CACHE_LEASE_SECONDS = 30
+CACHE_LEASE_WAIT_SECONDS = float(os.getenv("CACHE_LEASE_WAIT_SECONDS", "5.0"))
+CACHE_LEASE_POLL_SECONDS = 0.1
+
+# Tag bumped on every trip write (ingest, edits, deletes, matching).
+TRIPS_CACHE_TAG = "trips"
+
+# Tags whose revision is owned by another module's counter.
+_REVISION_KEY_OVERRIDES = {TRIPS_CACHE_TAG: TRIP_MAP_REVISION_KEY}
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    value: Any
+    fresh_until: float
+
+
+_local: OrderedDict[str, _CacheEntry] = OrderedDict()
+_revisions: dict[str, tuple[str, float]] = {}
+_inflight: dict[str, asyncio.Task[Any]] = {}
+
 
 def _make_key(prefix: str, args: tuple, kwargs: dict[str, Any]) -> str:
     """Produce a deterministic cache key from the function arguments."""
@@ -26,65 +68,261 @@ def _make_key(prefix: str, args: tuple, kwargs: dict[str, Any]) -> str:
     return f"cache:{prefix}:{digest}"
 
 
-def cached(prefix: str, ttl_seconds: int = 300):
+def _revision_key(name: str) -> str:
+    return _REVISION_KEY_OVERRIDES.get(name, f"cache:rev:{name}")
+
+
+async def _redis_or_none() -> Any | None:
+    try:
+        return await get_shared_redis()
+    except Exception:
+        logger.debug("Redis unavailable for cache", exc_info=True)
+        return None
+
+
+async def _read_revisions(names: tuple[str, ...]) -> list[str] | None:
+    """Current revision token per namespace/tag, memoized for a moment."""
+    now = time.monotonic()
+    memo = [_revisions.get(name) for name in names]
+    if all(
+        item is not None and now - item[1] < CACHE_REVISION_TTL_SECONDS for item in memo
+    ):
+        return [item[0] for item in memo]
+
+    redis = await _redis_or_none()
+    if redis is None:
+        return None
+    try:
+        values = await redis.mget([_revision_key(name) for name in names])
+    except Exception:
+        logger.debug("Redis cache revision read failed for %s", names, exc_info=True)
+        return None
+
+    tokens = []
+    for name, value in zip(names, values, strict=True):
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        token = str(value) if value is not None else "0"
+        _revisions[name] = (token, now)
+        tokens.append(token)
+    return tokens
+
+
+def _local_get(key: str) -> _CacheEntry | None:
+    entry = _local.get(key)
+    if entry is not None:
+        _local.move_to_end(key)
+    return entry
+
+
+def _local_put(key: str, entry: _CacheEntry) -> None:
+    _local[key] = entry
+    _local.move_to_end(key)
+    while len(_local) > CACHE_LOCAL_MAX_ENTRIES:
+        _local.popitem(last=False)
+
+
+async def _redis_get(redis: Any, key: str) -> _CacheEntry | None:
+    try:
+        hit = await redis.get(key)
+    except Exception:
+        logger.debug("Redis cache read failed for %s", key, exc_info=True)
+        return None
+    if hit is None:
+        return None
+    try:
+        payload = json.loads(hit)
+        return _CacheEntry(value=payload["v"], fresh_until=float(payload["f"]))
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+async def _wait_for_peer(redis: Any, key: str) -> _CacheEntry | None:
+    """Poll Redis while another process holds the fill lease for ``key``."""
+    deadline = time.monotonic() + CACHE_LEASE_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        await asyncio.sleep(CACHE_LEASE_POLL_SECONDS)
+        entry = await _redis_get(redis, key)
+        if entry is not None:
+            return entry
+    return None
+
+
+async def _fill(
+    key: str,
+    compute: Callable[[], Awaitable[Any]],
+    ttl_seconds: int,
+    stale_ttl_seconds: int,
+) -> Any:
+    redis = await _redis_or_none()
+    lease_key = f"cache:lease:{key}"
+    leased = False
+    if redis is not None:
+        try:
+            leased = bool(
+                await redis.set(lease_key, "1", nx=True, ex=CACHE_LEASE_SECONDS),
+            )
+        except Exception:
+            logger.debug("Redis cache lease failed for %s", key, exc_info=True)
+            leased = True
+        if not leased:
+            entry = await _wait_for_peer(redis, key)
+            if entry is not None:
+                _local_put(key, entry)
+                return entry.value
+
+    try:
+        result = await compute()
+        payload = json.dumps(
+            {"v": result, "f": time.time() + ttl_seconds},
+            default=str,
+        )
+        decoded = json.loads(payload)
+        _local_put(key, _CacheEntry(value=decoded["v"], fresh_until=decoded["f"]))
+        if redis is not None:
+            try:
+                await redis.set(key, payload, ex=ttl_seconds + stale_ttl_seconds)
+            except Exception:
+                logger.debug("Redis cache write failed for %s", key, exc_info=True)
+        return result
+    finally:
+        if redis is not None and leased:
+            try:
+                await redis.delete(lease_key)
+            except Exception:
+                logger.debug("Redis cache lease release failed", exc_info=True)
+
+
+def _start_fill(key: str, fill: Callable[[], Awaitable[Any]]) -> asyncio.Task[Any]:
+    task = _inflight.get(key)
+    if task is None or task.done():
+        task = asyncio.ensure_future(fill())
+        _inflight[key] = task
+
+        def _forget(done: asyncio.Task[Any], key: str = key) -> None:
+            if _inflight.get(key) is done:
+                _inflight.pop(key, None)
+            if not done.cancelled() and done.exception() is not None:
+                logger.debug(
+                    "Cache fill failed for %s",
+                    key,
+                    exc_info=done.exception(),
+                )
+
+        task.add_done_callback(_forget)
+    return task
+
+
+def cached(
+    prefix: str,
+    ttl_seconds: int = 300,
+    *,
+    tags: tuple[str, ...] = (),
+    stale_ttl_seconds: int = 0,
+):
     """
-    Decorator that caches an async function's return value in Redis.
+    Decorator that caches an async function's return value.
 
     Parameters
     ----------
     prefix : str
-        Namespace prefix for the Redis key (e.g. ``"driving_insights"``).
+        Cache namespace (e.g. ``"driving_insights"``); invalidated with
+        :func:`invalidate_cache_prefixes`.
     ttl_seconds : int
-        How long to keep the cached result (default 5 minutes).
+        How long a cached result is considered fresh (default 5 minutes).
+    tags : tuple[str, ...]
+        Extra revision tags folded into the key, e.g. :data:`TRIPS_CACHE_TAG`
+        so the entry is dropped whenever trips change.
+    stale_ttl_seconds : int
+        Grace window after ``ttl_seconds`` during which the stale result is
+        returned while one background refresh recomputes it.
     """
+    namespaces = (prefix, *tags)
 
     def decorator(fn):
         @functools.wraps(fn)
         async def wrapper(*args, **kwargs):
-            key = _make_key(prefix, args, kwargs)
-            try:
-                r = await get_shared_redis()
-                hit = await r.get(key)
-                if hit is not None:
-                    return json.loads(hit)
-            except Exception:
-                logger.debug("Redis cache read failed for %s", key, exc_info=True)
+            revisions = await _read_revisions(namespaces)
+            if revisions is None:
+                return await fn(*args, **kwargs)
 
-            result = await fn(*args, **kwargs)
+            key = f"{_make_key(prefix, args, kwargs)}:{'.'.join(revisions)}"
 
-            try:
-                r = await get_shared_redis()
-                await r.set(key, json.dumps(result, default=str), ex=ttl_seconds)
-            except Exception:
-                logger.debug("Redis cache write failed for %s", key, exc_info=True)
+            def fill() -> Awaitable[Any]:
+                return _fill(
+                    key,
+                    lambda: fn(*args, **kwargs),
+                    ttl_seconds,
+                    stale_ttl_seconds,
+                )
+
+            entry = _local_get(key)
+            if entry is None:
+                redis = await _redis_or_none()
+                if redis is not None:
+                    entry = await _redis_get(redis, key)
+                    if entry is not None:
+                        _local_put(key, entry)
+
+            if entry is not None:
+                now = time.time()
+                if now < entry.fresh_until:
+                    return entry.value
+                if now < entry.fresh_until + stale_ttl_seconds:
+                    _start_fill(key, fill)
+                    return entry.value
 
-            return result
+            return await asyncio.shield(_start_fill(key, fill))
 
         return wrapper
 
     return decorator
 
 
-async def invalidate_cache_prefixes(*prefixes: str) -> int:
-    """Best-effort Redis cache invalidation for one or more cache namespaces."""
-    normalized = [str(prefix).strip() for prefix in prefixes if str(prefix).strip()]
-    if not normalized:
+async def _bump_revisions(names: list[str]) -> int:
+    if not names:
         return 0
-
-    deleted = 0
+    bumped = 0
     try:
         redis = await get_shared_redis()
-        for prefix in normalized:
-            cursor = 0
-            pattern = f"cache:{prefix}:*"
-            while True:
-                cursor, keys = await redis.scan(cursor=cursor, match=pattern, count=200)
-                if keys:
-                    deleted += int(await redis.delete(*keys) or 0)
-                if str(cursor) == "0":
-                    break
+        now = time.monotonic()
+        for name in names:
+            token = await redis.incr(_revision_key(name))
+            _revisions[name] = (str(token), now)
+            bumped += 1
     except Exception:
-        logger.debug(
-            "Redis cache invalidation failed for %s", normalized, exc_info=True
-        )
-    return deleted
+        logger.debug("Redis cache invalidation failed for %s", names, exc_info=True)
+    return bumped
+
+
+async def invalidate_cache_prefixes(*prefixes: str) -> int:
+    """
+    Invalidate one or more cache namespaces by bumping their revision.
+
+    Cached entries are not deleted; readers simply stop matching them and
+    they age out under their TTL. Returns the number of namespaces whose
+    revision was bumped, not a count of entries.
+    """
+    normalized = [str(prefix).strip() for prefix in prefixes if str(prefix).strip()]
+    return await _bump_revisions(normalized)
+
+
+async def invalidate_cache_tags(*tags: str) -> int:
+    """Invalidate every cache entry declared with any of ``tags``."""
+    normalized = [str(tag).strip() for tag in tags if str(tag).strip()]
+    return await _bump_revisions(normalized)
+
+
+def clear_local_cache() -> None:
+    """Drop the in-process tier and memoized revisions (tests, shutdown)."""
+    _local.clear()
+    _revisions.clear()
+
+
+__all__ = [
+    "TRIPS_CACHE_TAG",
+    "cached",
+    "clear_local_cache",
+    "invalidate_cache_prefixes",
+    "invalidate_cache_tags",
+]
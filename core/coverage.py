@@ -17,7 +17,7 @@ from statistics import median
 from typing import TYPE_CHECKING, Any, Literal
 
 from beanie import PydanticObjectId
-from pymongo import ReturnDocument, UpdateOne
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 from shapely.geometry import LineString, MultiLineString, shape
 from shapely.ops import transform
@@ -31,6 +31,7 @@ from core.spatial import (
 )
 from core.trip_query_spec import apply_trip_record_filters
 from core.trip_source_policy import enforce_bouncie_source
+from db.bulk import bulk_write_updates
 from db.models import CoverageArea, CoverageDriveEvent, CoverageState, Street, Trip
 from street_coverage.constants import (
     BACKFILL_BULK_WRITE_SIZE,
@@ -166,40 +167,6 @@ def _get_segment_overlap_ratio(
     return base_ratio
 
 
-async def _bulk_write_updates(
-    collection: Any,
-    updates: list[tuple[dict[str, Any], dict[str, Any], bool]],
-    *,
-    ordered: bool = False,
-) -> tuple[int, int]:
-    """Run a batch of update operations efficiently."""
-    if not updates:
-        return 0, 0
-
-    operations = [UpdateOne(flt, doc, upsert=upsert) for flt, doc, upsert in updates]
-    try:
-        result = await collection.bulk_write(operations, ordered=ordered)
-    except TypeError as exc:
-        # pymongo>=4.11 passes `sort=` to UpdateOne bulk internals; older
-        # mongomock implementations don't accept this kwarg. Fall back to
-        # per-update writes in test environments.
-        if "unexpected keyword argument 'sort'" not in str(exc):
-            raise
-        modified = 0
-        upserted = 0
-        for flt, doc, upsert in updates:
-            single_result = await collection.update_one(flt, doc, upsert=upsert)
-            modified += int(getattr(single_result, "modified_count", 0) or 0)
-            if getattr(single_result, "upserted_id", None) is not None:
-                upserted += 1
-        return modified, upserted
-
-    upserted_count = getattr(result, "upserted_count", None)
-    if upserted_count is None:
-        upserted_count = len(getattr(result, "upserted_ids", {}) or {})
-    return int(getattr(result, "modified_count", 0) or 0), int(upserted_count or 0)
-
-
 @dataclass(frozen=True, slots=True)
 class CoverageSegmentsUpdateResult:
     updated: int
@@ -345,7 +312,7 @@ async def _update_driven_states_atomic(
                 )
             )
         for start in range(0, len(trip_updates), BACKFILL_BULK_WRITE_SIZE):
-            await _bulk_write_updates(
+            await bulk_write_updates(
                 collection,
                 trip_updates[start : start + BACKFILL_BULK_WRITE_SIZE],
                 ordered=False,
@@ -1361,7 +1328,7 @@ async def backfill_coverage_for_area(
             )
             for payload in pending_drive_events
         ]
-        await _bulk_write_updates(
+        await bulk_write_updates(
             CoverageDriveEvent.get_pymongo_collection(),
             operations,
             ordered=False,
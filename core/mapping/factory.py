@@ -1,6 +1,17 @@
-"""Factory class for resolving the active MappingProvider."""
+"""
+Factory class for resolving the active MappingProvider.
+
+The resolved provider is cached per process. Saving mapping settings bumps
+a revision counter in Redis; every process compares its cached revision at
+most once per ``MAPPING_PROVIDER_CHECK_SECONDS``, so hot loops (map-match
+chunks, bridge routes, reverse geocodes) resolve the provider without I/O
+and still follow a settings change made by another process.
+"""
 
 import logging
+import os
+import time
+from dataclasses import dataclass
 
 from beanie.exceptions import CollectionWasNotInitialized
 
@@ -8,12 +19,30 @@ from core.exceptions import ValidationException
 from core.mapping.google_provider import GoogleProvider
 from core.mapping.interfaces import Geocoder, MappingProvider, Router
 from core.mapping.local_provider import LocalProvider
+from core.redis import get_shared_redis
 from db.models import AppSettings, MapProvider
 
 logger = logging.getLogger(__name__)
+
+MAPPING_SETTINGS_REVISION_KEY = "mapping:settings:revision"
+MAPPING_PROVIDER_CHECK_SECONDS = float(
+    os.getenv("MAPPING_PROVIDER_CHECK_SECONDS", "5"),
+)
+
 _local_provider: LocalProvider | None = None
 
 
+@dataclass
+class _CachedProvider:
+    provider: MappingProvider
+    is_google: bool
+    revision: str | None
+    checked_at: float
+
+
+_cached_provider: _CachedProvider | None = None
+
+
 def _get_local_provider() -> LocalProvider:
     global _local_provider
     if _local_provider is None:
@@ -25,6 +54,40 @@ def clear_local_provider_cache() -> None:
     """Reset cached local provider so settings-backed env changes take effect."""
     global _local_provider
     _local_provider = None
+    clear_mapping_provider_cache()
+
+
+def clear_mapping_provider_cache() -> None:
+    """Drop the resolved provider so the next call reloads AppSettings."""
+    global _cached_provider
+    _cached_provider = None
+
+
+async def _read_settings_revision() -> str | None:
+    try:
+        redis = await get_shared_redis()
+        value = await redis.get(MAPPING_SETTINGS_REVISION_KEY)
+    except Exception:
+        logger.debug("Unable to read mapping settings revision", exc_info=True)
+        return None
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return "0" if value is None else str(value)
+
+
+async def notify_mapping_settings_changed() -> None:
+    """
+    Invalidate cached providers here and, via Redis, in other processes.
+
+    Without Redis the other processes still pick the change up, because an
+    unreadable revision makes them reload settings on every check.
+    """
+    clear_local_provider_cache()
+    try:
+        redis = await get_shared_redis()
+        await redis.incr(MAPPING_SETTINGS_REVISION_KEY)
+    except Exception:
+        logger.debug("Unable to bump mapping settings revision", exc_info=True)
 
 
 async def _load_mapping_settings() -> AppSettings:
@@ -53,21 +116,7 @@ async def _load_mapping_settings() -> AppSettings:
     return settings
 
 
-async def is_google_map_provider() -> bool:
-    """Return True when map provider is configured to Google."""
-    settings = await _load_mapping_settings()
-    return settings.map_provider == MapProvider.GOOGLE
-
-
-async def get_mapping_provider() -> MappingProvider:
-    """
-    Returns the active MappingProvider based on AppSettings.
-
-    If MapProvider.GOOGLE is selected, a non-empty API key is required.
-    Otherwise, defaults to LocalProvider (Valhalla + Nominatim).
-    """
-    settings = await _load_mapping_settings()
-
+def _build_provider(settings: AppSettings) -> MappingProvider:
     if settings.map_provider == MapProvider.GOOGLE:
         api_key = (settings.google_maps_api_key or "").strip()
         if not api_key:
@@ -82,6 +131,52 @@ async def get_mapping_provider() -> MappingProvider:
     return _get_local_provider()
 
 
+async def _resolve_cached_provider() -> _CachedProvider:
+    global _cached_provider
+    cached = _cached_provider
+    now = time.monotonic()
+    if cached is not None and now - cached.checked_at < MAPPING_PROVIDER_CHECK_SECONDS:
+        return cached
+
+    revision = await _read_settings_revision()
+    if cached is not None and revision is not None and revision == cached.revision:
+        cached.checked_at = now
+        return cached
+
+    if cached is not None:
+        # Another process saved new settings; rebuild the local clients too.
+        clear_local_provider_cache()
+    settings = await _load_mapping_settings()
+    _cached_provider = _CachedProvider(
+        provider=_build_provider(settings),
+        is_google=settings.map_provider == MapProvider.GOOGLE,
+        revision=revision,
+        checked_at=now,
+    )
+    return _cached_provider
+
+
+async def is_google_map_provider() -> bool:
+    """Return True when map provider is configured to Google."""
+    try:
+        return (await _resolve_cached_provider()).is_google
+    except ValidationException as exc:
+        # Google is selected even though the provider itself is unusable.
+        if exc.details.get("code") == "google_key_missing":
+            return True
+        raise
+
+
+async def get_mapping_provider() -> MappingProvider:
+    """
+    Returns the active MappingProvider based on AppSettings.
+
+    If MapProvider.GOOGLE is selected, a non-empty API key is required.
+    Otherwise, defaults to LocalProvider (Valhalla + Nominatim).
+    """
+    return (await _resolve_cached_provider()).provider
+
+
 async def get_geocoder() -> Geocoder:
     provider = await get_mapping_provider()
     return provider.geocoder
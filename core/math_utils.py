@@ -52,3 +52,24 @@ def calculate_circular_average_hour(
 
     # Normalize to 0-24 range
     return (avg_hour + 24.0) % 24.0
+
+
+def circular_average_hour_from_components(
+    sin_sum: float,
+    cos_sum: float,
+    count: int,
+) -> float | None:
+    """
+    Circular average hour from pre-summed unit vectors.
+
+    ``sin_sum``/``cos_sum`` are sums of ``sin``/``cos`` of each hour's angle
+    (``hour / 24 * 2π``) over ``count`` values, so partial sums stored per
+    bucket can be combined without keeping the individual hours. Matches
+    :func:`calculate_circular_average_hour` on the same inputs.
+    """
+    if count <= 0:
+        return None
+    if math.hypot(sin_sum / count, cos_sum / count) < 1e-12:
+        return None
+    avg_hour = (math.atan2(sin_sum, cos_sum) / (2 * math.pi)) * 24.0
+    return (avg_hour + 24.0) % 24.0
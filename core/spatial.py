@@ -12,7 +12,11 @@ import logging
 import math
 from typing import TYPE_CHECKING, Any
 
+import h3
+import numpy as np
 import pyproj
+import shapely
+from shapely import STRtree
 from shapely.validation import make_valid
 
 from core.constants import FEET_PER_METER, METERS_TO_MILES
@@ -611,6 +615,69 @@ def derive_geo_points(
     return None, None
 
 
+def densify_lonlat(coords: np.ndarray, step_m: float) -> np.ndarray:
+    """Insert points so consecutive lon/lat vertices are at most ``step_m`` apart."""
+    if len(coords) < 2:
+        return coords
+    deltas = np.diff(coords, axis=0)
+    lon_scale = np.cos(np.radians(coords[:-1, 1]))
+    lengths_m = np.hypot(deltas[:, 0] * lon_scale, deltas[:, 1]) * 111320.0
+    pieces = np.maximum(np.ceil(lengths_m / step_m).astype(np.int64), 1)
+    offsets = np.arange(int(pieces.sum())) - np.repeat(
+        np.cumsum(pieces) - pieces,
+        pieces,
+    )
+    fractions = (offsets / np.repeat(pieces, pieces))[:, None]
+    dense = (
+        np.repeat(coords[:-1], pieces, axis=0)
+        + np.repeat(deltas, pieces, axis=0) * fractions
+    )
+    return np.vstack([dense, coords[-1:]])
+
+
+def h3_cells_along(coords: Any, resolution: int) -> set[str]:
+    """H3 cells touched by a lon/lat path, with gaps longer than a cell filled."""
+    points = np.asarray(coords, dtype=float).reshape(-1, 2)
+    valid = (
+        np.isfinite(points).all(axis=1)
+        & (np.abs(points[:, 0]) <= 180.0)
+        & (np.abs(points[:, 1]) <= 90.0)
+    )
+    points = points[valid]
+    if len(points) == 0:
+        return set()
+    step_m = h3.average_hexagon_edge_length(resolution, unit="m")
+    dense = densify_lonlat(points, step_m)
+    return {h3.latlng_to_cell(lat, lon, resolution) for lon, lat in dense.tolist()}
+
+
+def dwithin_pairs(points: Any, distance: float) -> tuple[np.ndarray, np.ndarray]:
+    """Index pairs of planar points within ``distance`` (self pairs included)."""
+    geoms = shapely.points(np.asarray(points, dtype=float).reshape(-1, 2))
+    return STRtree(geoms).query(geoms, predicate="dwithin", distance=distance)
+
+
+def connected_component_roots(
+    count: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+) -> np.ndarray:
+    """
+    Lowest node index in each node's connected component.
+
+    ``src``/``dst`` must list every edge in both directions, as a symmetric
+    pair query returns them. Components are joined by min-label propagation
+    with pointer jumping, so the work stays in NumPy instead of a Python BFS.
+    """
+    roots = np.arange(count)
+    while True:
+        previous = roots.copy()
+        np.minimum.at(roots, src, roots[dst])
+        roots = roots[roots]
+        if np.array_equal(roots, previous):
+            return roots
+
+
 def get_local_transformers(
     geom: BaseGeometry,
 ) -> tuple[
@@ -0,0 +1,48 @@
+"""Bulk update helper shared by services that batch their writes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pymongo import UpdateOne
+
+
+async def bulk_write_updates(
+    collection: Any,
+    updates: list[tuple[dict[str, Any], dict[str, Any], bool]],
+    *,
+    ordered: bool = False,
+) -> tuple[int, int]:
+    """
+    Apply ``(filter, update, upsert)`` tuples as one bulk write.
+
+    Returns ``(modified_count, upserted_count)``.
+    """
+    if not updates:
+        return 0, 0
+
+    operations = [UpdateOne(flt, doc, upsert=upsert) for flt, doc, upsert in updates]
+    try:
+        result = await collection.bulk_write(operations, ordered=ordered)
+    except TypeError as exc:
+        # pymongo>=4.11 passes `sort=` to UpdateOne bulk internals; older
+        # mongomock implementations don't accept this kwarg. Fall back to
+        # per-update writes in test environments.
+        if "unexpected keyword argument 'sort'" not in str(exc):
+            raise
+        modified = 0
+        upserted = 0
+        for flt, doc, upsert in updates:
+            single_result = await collection.update_one(flt, doc, upsert=upsert)
+            modified += int(getattr(single_result, "modified_count", 0) or 0)
+            if getattr(single_result, "upserted_id", None) is not None:
+                upserted += 1
+        return modified, upserted
+
+    upserted_count = getattr(result, "upserted_count", None)
+    if upserted_count is None:
+        upserted_count = len(getattr(result, "upserted_ids", {}) or {})
+    return int(getattr(result, "modified_count", 0) or 0), int(upserted_count or 0)
+
+
+__all__ = ["bulk_write_updates"]
@@ -1,10 +1,38 @@
 import contextlib
 import logging
+import re
 from datetime import UTC, datetime
 from typing import Any
 
 from db.models import ServerLog
 
+_LOG_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+# Bounds the multikey index entries a single (possibly huge) message adds.
+MAX_LOG_MESSAGE_TOKENS = 200
+
+
+def log_search_words(text: str | None) -> list[str]:
+    """Distinct lowercase words of ``text``, in first-seen order."""
+    if not text:
+        return []
+    return list(dict.fromkeys(_LOG_TOKEN_RE.findall(text.lower())))
+
+
+def log_message_tokens(message: str | None) -> list[str]:
+    """
+    Search tokens stored with a log message.
+
+    Each word is kept whole and, when it joins parts with underscores
+    (``street_coverage``), each part is added too so a search for one part
+    still finds it.
+    """
+    tokens: dict[str, None] = {}
+    for word in log_search_words(message):
+        tokens[word] = None
+        if "_" in word:
+            tokens.update(dict.fromkeys(part for part in word.split("_") if part))
+    return list(tokens)[:MAX_LOG_MESSAGE_TOKENS]
+
 
 class MongoDBHandler(logging.Handler):
     """Custom logging handler that writes log records to MongoDB via Beanie."""
@@ -63,11 +91,13 @@ class MongoDBHandler(logging.Handler):
 
     def _format_log_entry(self, record: logging.LogRecord) -> dict[str, Any]:
         """Format log record for Beanie ServerLog model."""
+        message = record.getMessage()
         log_entry = {
             "timestamp": datetime.now(UTC),
             "level": record.levelname,
             "logger_name": record.name,
-            "message": record.getMessage(),
+            "message": message,
+            "tokens": log_message_tokens(message),
             "pathname": record.pathname,
             "lineno": record.lineno,
             "funcName": record.funcName,
@@ -39,7 +39,7 @@ from core.spatial import (
     sanitize_geojson_geometry,
     sanitize_geojson_point,
 )
-from map_data.models import GeoServiceHealth, MapServiceConfig
+from map_data.models import GeoServiceHealth, MapServiceConfig, TripCoverageFootprint
 
 
 class MapProvider(str, Enum):
@@ -106,6 +106,8 @@ class Trip(Document):
     # Place associations
     startGeoPoint: dict[str, Any] | None = None
     destinationGeoPoint: dict[str, Any] | None = None
+    # Endpoints, bbox and coarse H3 cells of ``gps`` (see trip_map_geometry).
+    locationSummary: dict[str, Any] | None = None
     destinationPlaceId: str | None = None
     destinationPlaceName: str | None = None
 
@@ -120,6 +122,9 @@ class Trip(Document):
     validated_at: datetime | None = None
     validation_status: str | None = None
     validation_message: str | None = None
+    # Version of the validate_trips rules this trip last passed through;
+    # cleared whenever the trip is reprocessed so the next run revisits it.
+    validation_version: int | None = None
 
     @field_validator(
         "startTime",
@@ -236,6 +241,11 @@ class Trip(Document):
                 [("source", 1), ("startTime", -1)],
                 name="trips_source_startTime_desc_idx",
             ),
+            # Keyset pagination for the trips table: (startTime, _id) seeks.
+            IndexModel(
+                [("source", 1), ("startTime", -1), ("_id", -1)],
+                name="trips_source_startTime_id_desc_idx",
+            ),
             IndexModel([("gps", "2dsphere")], name="trips_gps_2dsphere_idx"),
             IndexModel(
                 [("displayGps", "2dsphere")],
@@ -281,6 +291,22 @@ class Trip(Document):
                 [("imei", 1), ("endTime", -1)],
                 name="trips_imei_endTime_desc_idx",
             ),
+            IndexModel(
+                [("source", 1), ("saved_at", 1)],
+                name="trips_source_saved_at_idx",
+            ),
+            IndexModel(
+                [("source", 1), ("locationSummary.cells", 1)],
+                name="trips_source_location_cells_idx",
+            ),
+            IndexModel(
+                [("source", 1), ("locationSummary.version", 1)],
+                name="trips_source_location_version_idx",
+            ),
+            IndexModel(
+                [("validation_version", 1)],
+                name="trips_validation_version_idx",
+            ),
         ]
 
     model_config = ConfigDict(extra="allow")
@@ -369,6 +395,129 @@ class TripMobilityProfile(Document):
     model_config = ConfigDict(extra="allow")
 
 
+class TripDailyRollup(Document):
+    """
+    Materialized per-vehicle, per-local-day trip totals.
+
+    Rows only cover active, valid Bouncie trips and are keyed by the trip's
+    start date in its own timezone, the same bucketing the analytics
+    pipelines use. Dashboard and trip analytics read these instead of
+    re-aggregating the Trip collection.
+    """
+
+    imei: str | None = None
+    day: str
+    weekday: int = 0  # 0=Sunday, 6=Saturday
+    trip_count: int = 0
+    distance_total: float = 0.0
+    distance_count: int = 0
+    distance_max: float | None = None
+    duration_seconds: float = 0.0
+    paired_distance: float = 0.0
+    paired_duration_seconds: float = 0.0
+    fuel_total: float = 0.0
+    fuel_for_mpg: float = 0.0
+    fuel_distance: float = 0.0
+    fuel_trip_count: int = 0
+    idle_seconds: float = 0.0
+    max_speed: float | None = None
+    start_hour_count: int = 0
+    start_hour_sin: float = 0.0
+    start_hour_cos: float = 0.0
+    hour_trips: list[int] = Field(default_factory=list)
+    hour_distance: list[float] = Field(default_factory=list)
+    speed_histogram: list[int] = Field(default_factory=list)
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    @field_validator("updated_at", mode="before")
+    @classmethod
+    def parse_datetime_fields(cls, v: Any) -> datetime | None:
+        if v is None:
+            return None
+        return parse_timestamp(v)
+
+    class Settings:
+        name = "trip_daily_rollups"
+        indexes: ClassVar[list[IndexModel]] = [
+            IndexModel(
+                [("imei", 1), ("day", 1)],
+                name="trip_daily_rollups_imei_day_unique_idx",
+                unique=True,
+            ),
+            IndexModel([("day", 1)], name="trip_daily_rollups_day_idx"),
+        ]
+
+    model_config = ConfigDict(extra="allow")
+
+
+class TripDistanceSeries(Document):
+    """
+    Per-vehicle cumulative trip distance keyed by trip end time.
+
+    One row per active, valid Bouncie trip. ``cumulative_distance`` is the
+    running total of ``distance`` over the vehicle's rows ordered by
+    (``end_time``, ``transactionId``), so the distance driven between two
+    instants is the difference of two point lookups.
+    """
+
+    transactionId: str
+    imei: str | None = None
+    start_time: datetime
+    end_time: datetime
+    distance: float = 0.0
+    cumulative_distance: float = 0.0
+
+    @field_validator("start_time", "end_time", mode="before")
+    @classmethod
+    def parse_datetime_fields(cls, v: Any) -> datetime | None:
+        if v is None:
+            return None
+        return parse_timestamp(v)
+
+    class Settings:
+        name = "trip_distance_series"
+        indexes: ClassVar[list[IndexModel]] = [
+            IndexModel(
+                [("transactionId", 1)],
+                name="trip_distance_series_transaction_unique_idx",
+                unique=True,
+            ),
+            IndexModel(
+                [("imei", 1), ("end_time", 1), ("transactionId", 1)],
+                name="trip_distance_series_imei_end_idx",
+            ),
+        ]
+
+    model_config = ConfigDict(extra="allow")
+
+
+class TripRollupState(Document):
+    """
+    Build marker for a materialized trip rollup; absent until a full build ran.
+
+    The default id covers ``TripDailyRollup``; other rollups store their own
+    marker under a different id.
+    """
+
+    id: str = Field(default="trip_daily", alias="_id")
+    version: int = 0
+    built_at: datetime | None = None
+    trip_count: int = 0
+    row_count: int = 0
+
+    @field_validator("built_at", mode="before")
+    @classmethod
+    def parse_datetime_fields(cls, v: Any) -> datetime | None:
+        if v is None:
+            return None
+        return parse_timestamp(v)
+
+    class Settings:
+        name = "trip_rollup_state"
+
+    model_config = ConfigDict(extra="allow")
+
+
 class H3StreetLabelCache(Document):
     """Cached reverse-geocoded street labels for H3 cells."""
 
@@ -636,8 +785,13 @@ class CoverageArea(Document):
     # of being dropped.
     coverage_refresh_pending: bool = False
     journal_revision: int = 0
+    # Bumped whenever a segment's driven/undriveable status changes, so
+    # in-memory segment indexes know to reload their status mask.
+    coverage_state_revision: int = 0
     journal_status: str = "pending"
     journal_built_at: datetime | None = None
+    # area_version the CoverageStreetName rows were last built for.
+    street_name_index_version: int | None = None
 
     class Settings:
         name = "coverage_areas"
@@ -695,6 +849,44 @@ class Street(Document):
                 [("area_id", 1), ("area_version", 1), ("osm_extract_id", 1)],
                 name="streets_area_version_extract_idx",
             ),
+            IndexModel(
+                [("area_id", 1), ("area_version", 1), ("street_name", 1)],
+                name="streets_area_version_name_idx",
+            ),
+        ]
+
+    model_config = ConfigDict(extra="allow")
+
+
+class CoverageStreetName(Document):
+    """
+    Per-area street-name summary used by street search.
+
+    One row per distinct ``Street.street_name`` in an area version, rebuilt
+    whenever the area's streets are ingested. Search matches against these
+    rows and only loads segment geometry for the names it returns.
+    """
+
+    area_id: Indexed(PydanticObjectId)
+    area_version: int
+    street_name: str
+    normalized_name: str
+    highway_type: str = "unclassified"
+    segment_count: int = 0
+    total_length_miles: float = 0.0
+
+    class Settings:
+        name = "coverage_street_names"
+        indexes: ClassVar[list[IndexModel]] = [
+            IndexModel(
+                [("area_id", 1), ("area_version", 1), ("street_name", 1)],
+                name="coverage_street_names_area_name_unique_idx",
+                unique=True,
+            ),
+            IndexModel(
+                [("area_id", 1), ("area_version", 1), ("normalized_name", 1)],
+                name="coverage_street_names_area_normalized_idx",
+            ),
         ]
 
     model_config = ConfigDict(extra="allow")
@@ -1309,7 +1501,13 @@ class AppSettings(Document):
 
 
 class ServerLog(Document):
-    """Server log document for MongoDB logging handler."""
+    """
+    Server log document for MongoDB logging handler.
+
+    The handler also stores a ``tokens`` array (distinct lowercase words of
+    ``message`` plus the parts of underscore-joined words) that backs indexed
+    message search; it is left out of API responses.
+    """
 
     timestamp: Indexed(datetime, index_type=-1) | None = None
     level: str | None = None
@@ -1324,6 +1522,14 @@ class ServerLog(Document):
         name = "server_logs"
         indexes: ClassVar[list[IndexModel]] = [
             IndexModel([("level", 1)], name="server_logs_level_idx"),
+            IndexModel(
+                [("level", 1), ("timestamp", -1)],
+                name="server_logs_level_timestamp_idx",
+            ),
+            IndexModel(
+                [("tokens", 1), ("timestamp", -1)],
+                name="server_logs_tokens_timestamp_idx",
+            ),
             IndexModel(
                 [("timestamp", 1)],
                 name="server_logs_ttl_idx",
@@ -1381,6 +1587,9 @@ class CountyVisitedCache(Document):
     updated_at: datetime | None = None
     calculation_time_seconds: float | None = None
     last_job_id: str | None = None
+    boundary_version: str | None = None
+    high_water_mark: datetime | None = None
+    last_full_rebuild_at: datetime | None = None
 
     class Settings:
         name = "county_visited_cache"
@@ -1430,6 +1639,9 @@ class CityVisitedCache(Document):
     updated_at: datetime | None = None
     calculation_time_seconds: float | None = None
     last_job_id: str | None = None
+    boundary_version: str | None = None
+    high_water_mark: datetime | None = None
+    last_full_rebuild_at: datetime | None = None
 
     class Settings:
         name = "city_visited_cache"
@@ -1474,6 +1686,9 @@ class CountyTopology(Document):
 ALL_DOCUMENT_MODELS = [
     Trip,
     TripMobilityProfile,
+    TripDailyRollup,
+    TripDistanceSeries,
+    TripRollupState,
     H3StreetLabelCache,
     RecurringRoute,
     TripIngestIssue,
@@ -1495,6 +1710,7 @@ ALL_DOCUMENT_MODELS = [
     CountyTopology,
     # Coverage system models
     CoverageArea,
+    CoverageStreetName,
     CoverageState,
     CoverageDriveEvent,
     CoverageGoal,
@@ -1507,4 +1723,5 @@ ALL_DOCUMENT_MODELS = [
     # Map data management models
     MapServiceConfig,
     GeoServiceHealth,
+    TripCoverageFootprint,
 ]
@@ -1,8 +1,11 @@
+import asyncio
 import logging
 import math
-from collections import defaultdict
+import os
+from collections import OrderedDict
 from typing import Any
 
+import numpy as np
 from beanie import PydanticObjectId
 from fastapi import HTTPException
 from pydantic import BaseModel, ConfigDict
@@ -19,12 +22,22 @@ from core.spatial import (
 from core.trip_query_spec import apply_trip_record_filters
 from core.trip_source_policy import enforce_bouncie_source
 from db.models import CoverageArea, CoverageState, Street, Trip
+from driving.services.undriven_index import (
+    SegmentCluster,
+    UndrivenSegmentIndex,
+    haversine_m,
+)
 from tracking.services.tracking_service import TrackingService
 
 logger = logging.getLogger(__name__)
 
 CLUSTER_DISTANCE_M = 120.0
-MIN_GRID_SCALE = 0.01
+UNDRIVEN_INDEX_MAX_AREAS = int(os.getenv("UNDRIVEN_INDEX_MAX_AREAS", "8"))
+UNDRIVEN_INDEX_BATCH_SIZE = 2000
+
+# Process-local undriven segment indexes keyed by area id, most recent last.
+_undriven_indexes: OrderedDict[str, UndrivenSegmentIndex] = OrderedDict()
+_undriven_index_locks: dict[str, asyncio.Lock] = {}
 
 
 class DrivingNavigationRequest(BaseModel):
@@ -108,229 +121,179 @@ def _estimate_linestring_length_m(geometry: dict[str, Any] | None) -> float:
     return length_m
 
 
-async def _load_undriven_segments(area: CoverageArea) -> list[dict[str, Any]]:
-    driven_segment_ids = set()
-    undriveable_segment_ids = set()
-    # CoverageState may omit explicit "undriven" rows; only fetch the
-    # non-default statuses to avoid scanning an entire area worth of segments.
-    async for state in CoverageState.find(
-        {
-            "area_id": area.id,
-            "status": {"$in": ["driven", "undriveable"]},
-        },
-    ):
-        if state.status == "driven":
-            driven_segment_ids.add(state.segment_id)
-        elif state.status == "undriveable":
-            undriveable_segment_ids.add(state.segment_id)
-
-    segments = []
-    async for street in Street.find(
-        Street.area_id == area.id,
-        Street.area_version == area.area_version,
-    ):
-        if street.segment_id in driven_segment_ids:
-            continue
-        if street.segment_id in undriveable_segment_ids:
-            continue
-
-        segments.append(
-            {
-                "segment_id": street.segment_id,
-                "street_name": street.street_name,
-                "geometry": street.geometry or {},
-                "length_m": safe_float(street.length_miles) * MILES_TO_METERS,
-            },
-        )
-
-    return segments
+def _street_length_m(doc: dict[str, Any]) -> float:
+    length_m = safe_float(doc.get("length_miles")) * MILES_TO_METERS
+    if length_m <= 0:
+        length_m = _estimate_linestring_length_m(doc.get("geometry"))
+    return length_m
 
 
-def _find_nearest_segment(
-    segments: list[dict[str, Any]],
-    current_lon: float,
-    current_lat: float,
-) -> tuple[dict[str, Any] | None, tuple[float, float] | None]:
-    best_segment = None
-    best_midpoint = None
-    best_distance = None
-
-    for segment in segments:
-        midpoint = _segment_midpoint_coords(segment.get("geometry"))
-        if not midpoint:
-            continue
-
-        distance = GeometryService.haversine_distance(
-            current_lon,
-            current_lat,
-            midpoint[0],
-            midpoint[1],
-            unit="meters",
+async def _build_undriven_index(
+    area: CoverageArea,
+    geometry_key: tuple[Any, ...],
+) -> UndrivenSegmentIndex:
+    segment_ids: list[str] = []
+    street_names: list[str | None] = []
+    midpoints: list[tuple[float, float]] = []
+    lengths_m: list[float] = []
+
+    cursor = Street.get_pymongo_collection().find(
+        {"area_id": area.id, "area_version": area.area_version},
+        projection={
+            "_id": 0,
+            "segment_id": 1,
+            "street_name": 1,
+            "geometry": 1,
+            "length_miles": 1,
+        },
+        batch_size=UNDRIVEN_INDEX_BATCH_SIZE,
+    )
+    async for doc in cursor:
+        segment_ids.append(doc.get("segment_id"))
+        street_names.append(doc.get("street_name"))
+        midpoints.append(
+            _segment_midpoint_coords(doc.get("geometry")) or (math.nan, math.nan),
         )
+        lengths_m.append(_street_length_m(doc))
 
-        if best_distance is None or distance < best_distance:
-            best_distance = distance
-            best_segment = segment
-            best_midpoint = midpoint
+    logger.info(
+        "Built undriven segment index for area %s with %d segments",
+        area.id,
+        len(segment_ids),
+    )
+    return UndrivenSegmentIndex(
+        area.id,
+        geometry_key,
+        segment_ids,
+        street_names,
+        np.array(midpoints, dtype=float).reshape(-1, 2),
+        np.array(lengths_m, dtype=float),
+    )
 
-    return best_segment, best_midpoint
+
+async def _load_excluded_segment_ids(area: CoverageArea) -> list[str]:
+    # CoverageState may omit explicit "undriven" rows; only fetch the
+    # non-default statuses, which the area/status/segment index covers.
+    cursor = CoverageState.get_pymongo_collection().find(
+        {"area_id": area.id, "status": {"$in": ["driven", "undriveable"]}},
+        projection={"_id": 0, "segment_id": 1},
+        batch_size=UNDRIVEN_INDEX_BATCH_SIZE,
+    )
+    return [doc["segment_id"] async for doc in cursor if doc.get("segment_id")]
+
+
+async def _get_undriven_index(area: CoverageArea) -> UndrivenSegmentIndex:
+    """
+    Return the area's undriven segment index, refreshing only what changed.
+
+    Segment geometry is reloaded when the area version or segment count
+    changes (rebuilds, ingestion); the status mask is reloaded when the
+    area's coverage state revision moves.
+    """
+    key = str(area.id)
+    geometry_key = (area.area_version, int(area.total_segments or 0))
+    revision = int(area.coverage_state_revision or 0)
+
+    lock = _undriven_index_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        index = _undriven_indexes.get(key)
+        if index is None or index.geometry_key != geometry_key:
+            index = await _build_undriven_index(area, geometry_key)
+        if index.state_revision != revision:
+            index.apply_statuses(await _load_excluded_segment_ids(area), revision)
+
+        _undriven_indexes[key] = index
+        _undriven_indexes.move_to_end(key)
+        while len(_undriven_indexes) > UNDRIVEN_INDEX_MAX_AREAS:
+            evicted, _ = _undriven_indexes.popitem(last=False)
+            _undriven_index_locks.pop(evicted, None)
+        return index
+
+
+async def _load_segment_geometries(
+    area: CoverageArea,
+    segment_ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    if not segment_ids:
+        return {}
+    cursor = Street.get_pymongo_collection().find(
+        {
+            "area_id": area.id,
+            "area_version": area.area_version,
+            "segment_id": {"$in": segment_ids},
+        },
+        projection={"_id": 0, "segment_id": 1, "geometry": 1},
+    )
+    return {doc["segment_id"]: doc.get("geometry") or {} async for doc in cursor}
 
 
-def _cluster_segments(
-    segments: list[dict[str, Any]],
+def _rank_clusters(
+    index: UndrivenSegmentIndex,
     current_lon: float,
     current_lat: float,
     *,
     threshold_m: float,
     min_cluster_size: int,
-) -> list[dict[str, Any]]:
-    if not segments:
+    top_n: int,
+) -> list[tuple[int, SegmentCluster, float, float]]:
+    clusters = [
+        (cluster_id, cluster)
+        for cluster_id, cluster in enumerate(index.clusters(threshold_m))
+        if len(cluster.positions) >= min_cluster_size
+    ]
+    if not clusters:
         return []
 
-    lat_deg = threshold_m / 111320.0
-    lon_scale = max(math.cos(math.radians(current_lat)), MIN_GRID_SCALE)
-    lon_deg = threshold_m / (111320.0 * lon_scale)
-
-    if lat_deg <= 0 or lon_deg <= 0:
-        return []
-
-    grid: dict[tuple[int, int], list[int]] = defaultdict(list)
-    for idx, segment in enumerate(segments):
-        midpoint = segment.get("midpoint")
-        if not midpoint:
-            continue
-        lon, lat = midpoint
-        cell = (int(lon / lon_deg), int(lat / lat_deg))
-        grid[cell].append(idx)
-
-    parent = list(range(len(segments)))
-
-    def find_root(i: int) -> int:
-        while parent[i] != i:
-            parent[i] = parent[parent[i]]
-            i = parent[i]
-        return i
-
-    def union(i: int, j: int) -> None:
-        root_i = find_root(i)
-        root_j = find_root(j)
-        if root_i != root_j:
-            parent[root_j] = root_i
-
-    for idx, segment in enumerate(segments):
-        midpoint = segment.get("midpoint")
-        if not midpoint:
-            continue
-        lon, lat = midpoint
-        cell = (int(lon / lon_deg), int(lat / lat_deg))
-        for dx in (-1, 0, 1):
-            for dy in (-1, 0, 1):
-                for other_idx in grid.get((cell[0] + dx, cell[1] + dy), []):
-                    if other_idx <= idx:
-                        continue
-                    other_midpoint = segments[other_idx].get("midpoint")
-                    if not other_midpoint:
-                        continue
-                    distance = GeometryService.haversine_distance(
-                        lon,
-                        lat,
-                        other_midpoint[0],
-                        other_midpoint[1],
-                        unit="meters",
-                    )
-                    if distance <= threshold_m:
-                        union(idx, other_idx)
-
-    groups: dict[int, list[int]] = defaultdict(list)
-    for idx in range(len(segments)):
-        groups[find_root(idx)].append(idx)
-
-    clusters = []
-    for indices in groups.values():
-        if len(indices) < min_cluster_size:
-            continue
-
-        cluster_segments = []
-        total_length_m = 0.0
-        centroid_lon = 0.0
-        centroid_lat = 0.0
-        nearest_segment = None
-        nearest_distance = None
-
-        for idx in indices:
-            segment = segments[idx]
-            midpoint = segment.get("midpoint")
-            if not midpoint:
-                continue
-
-            centroid_lon += midpoint[0]
-            centroid_lat += midpoint[1]
-
-            length_m = segment.get("length_m") or 0.0
-            if length_m <= 0:
-                length_m = _estimate_linestring_length_m(segment.get("geometry"))
-            total_length_m += length_m
-
-            distance = GeometryService.haversine_distance(
-                current_lon,
-                current_lat,
-                midpoint[0],
-                midpoint[1],
-                unit="meters",
-            )
-            if nearest_distance is None or distance < nearest_distance:
-                nearest_distance = distance
-                nearest_segment = segment
-
-            cluster_segments.append(
-                {
-                    "segment_id": segment.get("segment_id"),
-                    "street_name": segment.get("street_name"),
-                    "geometry": segment.get("geometry"),
-                    "length_m": length_m,
-                },
-            )
-
-        if not cluster_segments:
-            continue
-
-        centroid_lon /= len(cluster_segments)
-        centroid_lat /= len(cluster_segments)
-
-        distance_to_cluster_m = GeometryService.haversine_distance(
-            current_lon,
-            current_lat,
-            centroid_lon,
-            centroid_lat,
-            unit="meters",
-        )
-
-        efficiency_score = total_length_m / max(distance_to_cluster_m, 1.0)
+    centroids = np.array([cluster.centroid for _, cluster in clusters])
+    distances = haversine_m(current_lon, current_lat, centroids[:, 0], centroids[:, 1])
+    lengths = np.array([cluster.total_length_m for _, cluster in clusters])
+    scores = lengths / np.maximum(distances, 1.0)
+    best = np.argsort(-scores, kind="stable")[:top_n]
+    return [
+        (clusters[i][0], clusters[i][1], float(distances[i]), float(scores[i]))
+        for i in best
+    ]
+
+
+def _cluster_payload(
+    index: UndrivenSegmentIndex,
+    cluster_id: int,
+    cluster: SegmentCluster,
+    distance_to_cluster_m: float,
+    efficiency_score: float,
+    geometries: dict[str, dict[str, Any]],
+    current_lon: float,
+    current_lat: float,
+) -> dict[str, Any]:
+    positions = cluster.positions
+    member_distances = haversine_m(
+        current_lon,
+        current_lat,
+        index.midpoints[positions, 0],
+        index.midpoints[positions, 1],
+    )
+    nearest = index.segment(int(positions[int(np.argmin(member_distances))]))
 
-        clusters.append(
-            {
-                "cluster_id": len(clusters),
-                "segment_count": len(cluster_segments),
-                "segments": cluster_segments,
-                "centroid": [centroid_lon, centroid_lat],
-                "total_length_m": total_length_m,
-                "distance_to_cluster_m": distance_to_cluster_m,
-                "efficiency_score": efficiency_score,
-                "nearest_segment": {
-                    "segment_id": (
-                        nearest_segment.get("segment_id") if nearest_segment else None
-                    ),
-                    "street_name": (
-                        nearest_segment.get("street_name") if nearest_segment else None
-                    ),
-                    "geometry": (
-                        nearest_segment.get("geometry") if nearest_segment else None
-                    ),
-                },
-            },
-        )
+    cluster_segments = []
+    for pos in positions:
+        segment = index.segment(int(pos))
+        segment["geometry"] = geometries.get(segment["segment_id"])
+        cluster_segments.append(segment)
 
-    return clusters
+    return {
+        "cluster_id": cluster_id,
+        "segment_count": len(cluster_segments),
+        "segments": cluster_segments,
+        "centroid": list(cluster.centroid),
+        "total_length_m": cluster.total_length_m,
+        "distance_to_cluster_m": distance_to_cluster_m,
+        "efficiency_score": efficiency_score,
+        "nearest_segment": {
+            "segment_id": nearest["segment_id"],
+            "street_name": nearest["street_name"],
+            "geometry": geometries.get(nearest["segment_id"]),
+        },
+    }
 
 
 async def _get_route(
@@ -448,9 +411,9 @@ class DrivingService:
     ) -> dict[str, Any]:
         """Find a route to the nearest undriven street (or a specific segment)."""
         area = await _resolve_coverage_area(payload.area_id)
-        undriven_segments = await _load_undriven_segments(area)
+        index = await _get_undriven_index(area)
 
-        if not undriven_segments:
+        if index.undriven_count == 0:
             return {
                 "status": "completed",
                 "message": f"All streets in {area.display_name} are driven.",
@@ -477,40 +440,29 @@ class DrivingService:
         location_source = _normalize_location_source(location_source)
 
         segment_id = payload.segment_id
-        target_segment = None
-        target_midpoint = None
 
         if segment_id:
-            target_segment = next(
-                (
-                    segment
-                    for segment in undriven_segments
-                    if segment.get("segment_id") == segment_id
-                ),
-                None,
-            )
-            if not target_segment:
+            position = index.undriven_position(segment_id)
+            if position is None:
                 raise HTTPException(
                     status_code=404,
                     detail="Requested segment not found or already driven.",
                 )
-            target_midpoint = _segment_midpoint_coords(target_segment.get("geometry"))
+            target_midpoint = index.midpoint(position)
             if not target_midpoint:
                 raise HTTPException(
                     status_code=404,
                     detail="Target segment has no valid geometry.",
                 )
         else:
-            target_segment, target_midpoint = _find_nearest_segment(
-                undriven_segments,
-                current_lon,
-                current_lat,
-            )
-            if not target_segment or not target_midpoint:
+            position = index.nearest(current_lon, current_lat)
+            target_midpoint = index.midpoint(position) if position is not None else None
+            if not target_midpoint:
                 raise HTTPException(
                     status_code=404,
                     detail="No routable undriven streets found.",
                 )
+        target_segment = index.segment(position)
 
         route = await _get_route(
             current_lon,
@@ -550,51 +502,59 @@ class DrivingService:
         if not coerce_coordinate_pair([current_lon, current_lat]):
             raise HTTPException(status_code=400, detail="Invalid current position.")
 
-        undriven_segments = await _load_undriven_segments(area)
-        if not undriven_segments:
+        index = await _get_undriven_index(area)
+        if index.undriven_count == 0:
             return {
                 "status": "no_streets",
                 "message": f"No undriven streets found in {area.display_name}.",
             }
 
-        prepared_segments = []
-        for segment in undriven_segments:
-            midpoint = _segment_midpoint_coords(segment.get("geometry"))
-            if not midpoint:
-                continue
-            prepared_segments.append({**segment, "midpoint": midpoint})
-
-        if not prepared_segments:
+        if len(index.routable_positions) == 0:
             return {
                 "status": "no_streets",
                 "message": f"No routable streets found in {area.display_name}.",
             }
 
-        top_n = max(top_n, 1)
-        min_cluster_size = max(min_cluster_size, 1)
-
-        clusters = _cluster_segments(
-            prepared_segments,
+        ranked = _rank_clusters(
+            index,
             current_lon,
             current_lat,
             threshold_m=CLUSTER_DISTANCE_M,
-            min_cluster_size=min_cluster_size,
+            min_cluster_size=max(min_cluster_size, 1),
+            top_n=max(top_n, 1),
         )
 
-        if not clusters:
+        if not ranked:
             return {
                 "status": "no_clusters",
                 "message": "No efficient clusters found.",
             }
 
-        clusters.sort(
-            key=lambda cluster: cluster.get("efficiency_score", 0),
-            reverse=True,
+        geometries = await _load_segment_geometries(
+            area,
+            [
+                index.segment_ids[int(pos)]
+                for _, cluster, _, _ in ranked
+                for pos in cluster.positions
+            ],
         )
+        clusters = [
+            _cluster_payload(
+                index,
+                cluster_id,
+                cluster,
+                distance_m,
+                score,
+                geometries,
+                current_lon,
+                current_lat,
+            )
+            for cluster_id, cluster, distance_m, score in ranked
+        ]
         return sanitize_for_json(
             {
                 "status": "success",
-                "suggested_clusters": clusters[:top_n],
+                "suggested_clusters": clusters,
             },
         )
 
@@ -0,0 +1,210 @@
+"""
+In-memory spatial index of undriven street segments for one coverage area.
+
+Street geometry is immutable for an area version, so segment midpoints,
+lengths and names are loaded once and kept as NumPy arrays. Driven and
+undriveable status is layered on top as a boolean mask that is swapped only
+when the area's ``coverage_state_revision`` moves. The STRtree over undriven
+midpoints and the connected-component clustering are derived lazily from that
+mask, so navigation requests never rescan the Street collection.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import shapely
+from shapely import STRtree
+
+from core.spatial import (
+    GeometryService,
+    connected_component_roots,
+    dwithin_pairs,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from beanie import PydanticObjectId
+
+METERS_PER_DEGREE = 111320.0
+MIN_LON_SCALE = 0.01
+
+
+def haversine_m(
+    lon: float,
+    lat: float,
+    lons: np.ndarray,
+    lats: np.ndarray,
+) -> np.ndarray:
+    """Great-circle distance in meters from one point to many."""
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    dphi = phi2 - phi1
+    dlmb = np.radians(lons) - math.radians(lon)
+    a = np.sin(dphi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(dlmb / 2) ** 2
+    return 2 * GeometryService.EARTH_RADIUS_M * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentCluster:
+    """Connected group of undriven segments whose midpoints chain together."""
+
+    positions: np.ndarray
+    centroid: tuple[float, float]
+    total_length_m: float
+
+
+class UndrivenSegmentIndex:
+    """
+    Midpoint index over every segment of an area version.
+
+    Positions are stable for the lifetime of the index; ``apply_statuses``
+    only flips the excluded mask and drops the derived structures when the
+    undriven set actually changed.
+    """
+
+    def __init__(
+        self,
+        area_id: PydanticObjectId,
+        geometry_key: tuple[Any, ...],
+        segment_ids: list[str],
+        street_names: list[str | None],
+        midpoints: np.ndarray,
+        lengths_m: np.ndarray,
+    ) -> None:
+        self.area_id = area_id
+        self.geometry_key = geometry_key
+        self.segment_ids = segment_ids
+        self.street_names = street_names
+        self.midpoints = np.asarray(midpoints, dtype=float).reshape(-1, 2)
+        self.lengths_m = np.asarray(lengths_m, dtype=float)
+        self.position_by_id = {sid: pos for pos, sid in enumerate(segment_ids)}
+        self.has_midpoint = ~np.isnan(self.midpoints).any(axis=1)
+        self.excluded = np.zeros(len(segment_ids), dtype=bool)
+        self.state_revision: int | None = None
+
+        lats = self.midpoints[self.has_midpoint, 1]
+        origin_lat = float(lats.mean()) if len(lats) else 0.0
+        lon_scale = max(math.cos(math.radians(origin_lat)), MIN_LON_SCALE)
+        self._scale = np.array([METERS_PER_DEGREE * lon_scale, METERS_PER_DEGREE])
+        self._xy = self.midpoints * self._scale
+
+        self._routable: np.ndarray | None = None
+        self._tree: STRtree | None = None
+        self._clusters: dict[float, list[SegmentCluster]] = {}
+
+    def __len__(self) -> int:
+        return len(self.segment_ids)
+
+    def apply_statuses(self, excluded_ids: Iterable[str], revision: int) -> bool:
+        """Replace the driven/undriveable mask; returns whether it changed."""
+        excluded = np.zeros(len(self.segment_ids), dtype=bool)
+        positions = [
+            pos
+            for sid in excluded_ids
+            if (pos := self.position_by_id.get(sid)) is not None
+        ]
+        if positions:
+            excluded[positions] = True
+        self.state_revision = revision
+        if np.array_equal(excluded, self.excluded):
+            return False
+        self.excluded = excluded
+        self._routable = None
+        self._tree = None
+        self._clusters = {}
+        return True
+
+    @property
+    def undriven_count(self) -> int:
+        return int(len(self.segment_ids) - self.excluded.sum())
+
+    @property
+    def routable_positions(self) -> np.ndarray:
+        """Positions of undriven segments that have a usable midpoint."""
+        if self._routable is None:
+            self._routable = np.flatnonzero(~self.excluded & self.has_midpoint)
+        return self._routable
+
+    def undriven_position(self, segment_id: str) -> int | None:
+        pos = self.position_by_id.get(segment_id)
+        if pos is None or self.excluded[pos]:
+            return None
+        return pos
+
+    def midpoint(self, pos: int) -> tuple[float, float] | None:
+        if not self.has_midpoint[pos]:
+            return None
+        lon, lat = self.midpoints[pos]
+        return float(lon), float(lat)
+
+    def segment(self, pos: int) -> dict[str, Any]:
+        return {
+            "segment_id": self.segment_ids[pos],
+            "street_name": self.street_names[pos],
+            "length_m": float(self.lengths_m[pos]),
+        }
+
+    def nearest(self, lon: float, lat: float) -> int | None:
+        """Position of the undriven segment whose midpoint is closest."""
+        routable = self.routable_positions
+        if len(routable) == 0:
+            return None
+        if self._tree is None:
+            self._tree = STRtree(shapely.points(self._xy[routable]))
+        origin = shapely.points(np.array([lon, lat]) * self._scale)
+        hits = self._tree.query_nearest(origin, all_matches=True)
+        candidates = routable[np.atleast_1d(hits)]
+        if len(candidates) == 1:
+            return int(candidates[0])
+        # Ties in the planar projection are settled on the sphere.
+        distances = haversine_m(
+            lon,
+            lat,
+            self.midpoints[candidates, 0],
+            self.midpoints[candidates, 1],
+        )
+        return int(candidates[int(np.argmin(distances))])
+
+    def clusters(self, threshold_m: float) -> list[SegmentCluster]:
+        """
+        Group undriven midpoints chained within ``threshold_m`` of each other.
+
+        Uses the ``core.spatial`` pair query and component helper. The result
+        depends only on the undriven mask, so it is cached until the next
+        status change.
+        """
+        cached = self._clusters.get(threshold_m)
+        if cached is not None:
+            return cached
+
+        routable = self.routable_positions
+        if len(routable) == 0:
+            self._clusters[threshold_m] = []
+            return []
+
+        src, dst = dwithin_pairs(self._xy[routable], threshold_m)
+        roots = connected_component_roots(len(routable), src, dst)
+
+        order = np.argsort(roots, kind="stable")
+        boundaries = np.flatnonzero(np.diff(roots[order])) + 1
+        clusters = []
+        for members in np.split(order, boundaries):
+            positions = routable[members]
+            centroid = self.midpoints[positions].mean(axis=0)
+            clusters.append(
+                SegmentCluster(
+                    positions=positions,
+                    centroid=(float(centroid[0]), float(centroid[1])),
+                    total_length_m=float(self.lengths_m[positions].sum()),
+                ),
+            )
+        self._clusters[threshold_m] = clusters
+        return clusters
+
+
+__all__ = ["SegmentCluster", "UndrivenSegmentIndex", "haversine_m"]
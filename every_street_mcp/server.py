@@ -19,6 +19,7 @@ from mcp.types import CallToolResult, TextContent, ToolAnnotations
 from analytics.services.dashboard_service import DashboardService
 from analytics.services.trip_analytics_service import TripAnalyticsService
 from core.auth import get_session_secret
+from core.cache import TRIPS_CACHE_TAG, cached
 from core.redis import get_shared_redis
 from db.models import (
     CoverageArea,
@@ -46,9 +47,27 @@ ACTION_RESOURCE_URI = "ui://every-street/action-review-v1.html"
 VIEW_TTL_SECONDS = 20 * 60
 ACTION_MAX_AGE_SECONDS = 10 * 60
 AUDIT_TTL_DAYS = 30
+# Agent sessions repeat the same reads; results are keyed on data revisions,
+# so the TTL only bounds staleness for changes that bump no revision.
+TOOL_CACHE_TTL_SECONDS = 60
 TOOL_COUNT = 17
 MODEL_TOOL_COUNT = 15
 
+_HISTORICAL_TRIP_QUERY = {
+    "source": "bouncie",
+    "inactive": {"$ne": True},
+    "invalid": {"$ne": True},
+}
+_AREA_SUMMARY_PROJECTION = {
+    "display_name": 1,
+    "status": 1,
+    "area_version": 1,
+    "journal_revision": 1,
+    "coverage_percentage": 1,
+    "driveable_length_miles": 1,
+    "driven_length_miles": 1,
+}
+
 NOAUTH = [{"type": "noauth"}]
 READ_ANNOTATIONS = ToolAnnotations(
     readOnlyHint=True,
@@ -336,6 +355,136 @@ async def _consume_action_nonce(nonce: str) -> None:
         raise ValueError("This action was already committed")
 
 
+async def _area_summaries(sort: list[tuple[str, int]]) -> list[dict[str, Any]]:
+    """Coverage area summary fields without hydrating boundaries or stats."""
+    cursor = CoverageArea.get_pymongo_collection().find(
+        {},
+        _AREA_SUMMARY_PROJECTION,
+        sort=sort,
+    )
+    return [area async for area in cursor]
+
+
+@cached(
+    "mcp_historical_trip_count",
+    ttl_seconds=TOOL_CACHE_TTL_SECONDS,
+    tags=(TRIPS_CACHE_TAG,),
+)
+async def _historical_trip_count() -> int:
+    return await Trip.find(_HISTORICAL_TRIP_QUERY).count()
+
+
+@cached(
+    "mcp_place_trip_counts",
+    ttl_seconds=TOOL_CACHE_TTL_SECONDS,
+    tags=(TRIPS_CACHE_TAG,),
+)
+async def _place_trip_counts(place_ids: list[str]) -> dict[str, int]:
+    """
+    Trips starting or ending at each place, from one grouped aggregation.
+
+    A trip that starts and ends at the same place counts once for it.
+    """
+    counts = dict.fromkeys(place_ids, 0)
+    if not place_ids:
+        return counts
+    pipeline = [
+        {
+            "$match": {
+                "source": "bouncie",
+                "inactive": {"$ne": True},
+                "$or": [
+                    {"destinationPlaceId": {"$in": place_ids}},
+                    {"startPlaceId": {"$in": place_ids}},
+                ],
+            },
+        },
+        {
+            "$group": {
+                "_id": {
+                    "destination": "$destinationPlaceId",
+                    "start": "$startPlaceId",
+                },
+                "count": {"$sum": 1},
+            },
+        },
+    ]
+    async for row in Trip.aggregate(pipeline):
+        key = row.get("_id") or {}
+        destination = key.get("destination")
+        start = key.get("start")
+        for place_id in {destination, start}:
+            if place_id in counts:
+                counts[place_id] += int(row.get("count") or 0)
+    return counts
+
+
+def _explorer_view_key(area: CoverageArea) -> str:
+    return (
+        f"mcp:explorer:{area.id}:{area.area_version}:"
+        f"{int(area.coverage_state_revision or 0)}"
+    )
+
+
+async def _cached_explorer_view(area: CoverageArea) -> tuple[str, dict] | None:
+    """Reuse a saved explorer view while the area's streets and states match."""
+    try:
+        redis = await get_shared_redis()
+        view_id = await redis.get(_explorer_view_key(area))
+        if not view_id:
+            return None
+        if isinstance(view_id, bytes):
+            view_id = view_id.decode("utf-8")
+        raw = await redis.get(f"mcp:view:{view_id}")
+        if not raw:
+            return None
+        await redis.expire(f"mcp:view:{view_id}", VIEW_TTL_SECONDS)
+        return view_id, json.loads(raw)
+    except Exception:
+        return None
+
+
+async def _build_explorer_view(area: CoverageArea) -> dict[str, Any]:
+    """Explorer payload read with projections; undriven is the default status."""
+    status_by_segment = {
+        state["segment_id"]: state.get("status")
+        async for state in CoverageState.get_pymongo_collection().find(
+            {"area_id": area.id, "status": {"$ne": "undriven"}},
+            {"_id": 0, "segment_id": 1, "status": 1},
+        )
+    }
+    streets = Street.get_pymongo_collection().find(
+        {"area_id": area.id, "area_version": area.area_version},
+        {
+            "_id": 0,
+            "segment_id": 1,
+            "street_name": 1,
+            "highway_type": 1,
+            "length_miles": 1,
+            "geometry": 1,
+        },
+    )
+    return {
+        "area": {
+            "id": str(area.id),
+            "name": area.display_name,
+            "boundary": area.boundary,
+            "bounding_box": area.bounding_box,
+        },
+        "features": [
+            {
+                "segment_id": street.get("segment_id"),
+                "street_name": street.get("street_name"),
+                "highway_type": street.get("highway_type"),
+                "length_miles": street.get("length_miles"),
+                "status": status_by_segment.get(street.get("segment_id"), "undriven"),
+                "geometry": street.get("geometry"),
+            }
+            async for street in streets
+        ],
+    }
+
+
 @mcp.tool(
     title="Get Every Street snapshot",
     description="Summarize historical driving, street coverage, places, recurring routes, and live-drive state.",
@@ -345,12 +494,8 @@ async def _consume_action_nonce(nonce: str) -> None:
 )
 async def get_every_street_snapshot() -> CallToolResult:
     started = await _start_tool("get_every_street_snapshot")
-    areas = (
-        await CoverageArea.find_all().sort(-CoverageArea.coverage_percentage).to_list()
-    )
-    trip_count = await Trip.find(
-        {"source": "bouncie", "inactive": {"$ne": True}, "invalid": {"$ne": True}},
-    ).count()
+    areas = await _area_summaries([("coverage_percentage", -1)])
+    trip_count = await _historical_trip_count()
     place_count = await Place.find_all().count()
     recurring_count = await RecurringRoute.find(
         {"is_recurring": True, "is_hidden": {"$ne": True}},
@@ -364,12 +509,18 @@ async def get_every_street_snapshot() -> CallToolResult:
         "live_drive_active": bool(live),
         "coverage_areas": [
             {
-                "id": str(area.id),
-                "name": area.display_name,
-                "status": area.status,
-                "coverage_percentage": round(float(area.coverage_percentage or 0.0), 3),
-                "driven_miles": round(float(area.driven_length_miles or 0.0), 3),
-                "driveable_miles": round(float(area.driveable_length_miles or 0.0), 3),
+                "id": str(area["_id"]),
+                "name": area.get("display_name"),
+                "status": area.get("status"),
+                "coverage_percentage": round(
+                    float(area.get("coverage_percentage") or 0.0),
+                    3,
+                ),
+                "driven_miles": round(float(area.get("driven_length_miles") or 0.0), 3),
+                "driveable_miles": round(
+                    float(area.get("driveable_length_miles") or 0.0),
+                    3,
+                ),
             }
             for area in areas
         ],
@@ -505,21 +656,14 @@ async def analyze_places(limit: int = 50) -> CallToolResult:
     places = (
         await Place.find_all().sort(Place.name).limit(min(max(limit, 1), 100)).to_list()
     )
+    counts = await _place_trip_counts(sorted(str(place.id) for place in places))
     rows = []
     hidden_geometries: dict[str, Any] = {}
     for place in places:
         place_id = str(place.id)
-        visit_count = await Trip.find(
-            {
-                "source": "bouncie",
-                "inactive": {"$ne": True},
-                "$or": [
-                    {"destinationPlaceId": place_id},
-                    {"startPlaceId": place_id},
-                ],
-            },
-        ).count()
-        rows.append({"id": place_id, "name": place.name, "trip_count": visit_count})
+        rows.append(
+            {"id": place_id, "name": place.name, "trip_count": counts.get(place_id, 0)},
+        )
         hidden_geometries[place_id] = place.geometry
     rows.sort(key=lambda row: (-int(row["trip_count"]), str(row["name"])))
     await _audit("analyze_places", started, result_count=len(rows))
@@ -581,28 +725,27 @@ async def get_geographic_coverage() -> CallToolResult:
 )
 async def list_coverage_areas() -> CallToolResult:
     started = await _start_tool("list_coverage_areas")
-    areas = await CoverageArea.find_all().sort(CoverageArea.display_name).to_list()
-    rows = [
-        {
-            "id": str(area.id),
-            "name": area.display_name,
-            "status": area.status,
-            "area_version": area.area_version,
-            "journal_revision": int(area.journal_revision or 0),
-            "coverage_percentage": round(float(area.coverage_percentage or 0.0), 3),
-            "driveable_miles": round(float(area.driveable_length_miles or 0.0), 3),
-            "driven_miles": round(float(area.driven_length_miles or 0.0), 3),
-            "remaining_miles": round(
-                max(
-                    float(area.driveable_length_miles or 0.0)
-                    - float(area.driven_length_miles or 0.0),
-                    0.0,
+    areas = await _area_summaries([("display_name", 1)])
+    rows = []
+    for area in areas:
+        driveable = float(area.get("driveable_length_miles") or 0.0)
+        driven = float(area.get("driven_length_miles") or 0.0)
+        rows.append(
+            {
+                "id": str(area["_id"]),
+                "name": area.get("display_name"),
+                "status": area.get("status"),
+                "area_version": area.get("area_version"),
+                "journal_revision": int(area.get("journal_revision") or 0),
+                "coverage_percentage": round(
+                    float(area.get("coverage_percentage") or 0.0),
+                    3,
                 ),
-                3,
-            ),
-        }
-        for area in areas
-    ]
+                "driveable_miles": round(driveable, 3),
+                "driven_miles": round(driven, 3),
+                "remaining_miles": round(max(driveable - driven, 0.0), 3),
+            },
+        )
     await _audit("list_coverage_areas", started, result_count=len(rows))
     return _result(f"Found {len(rows)} coverage areas.", {"areas": rows})
 
@@ -773,38 +916,22 @@ async def render_every_street_explorer(area_id: str) -> CallToolResult:
     if area is None:
         raise ValueError("Coverage area not found")
     intelligence = await CoverageIntelligenceService.get_intelligence(oid)
-    streets = await Street.find(
-        {"area_id": oid, "area_version": area.area_version},
-    ).to_list()
-    states = await CoverageState.find({"area_id": oid}).to_list()
-    status_by_segment = {state.segment_id: state.status for state in states}
-    view_payload = {
-        "area": {
-            "id": str(area.id),
-            "name": area.display_name,
-            "boundary": area.boundary,
-            "bounding_box": area.bounding_box,
-        },
-        "features": [
-            {
-                "segment_id": street.segment_id,
-                "street_name": street.street_name,
-                "highway_type": street.highway_type,
-                "length_miles": street.length_miles,
-                "status": status_by_segment.get(street.segment_id, "undriven"),
-                "geometry": street.geometry,
-            }
-            for street in streets
-        ],
-    }
-    view_id = await _save_view(view_payload)
+    reused = await _cached_explorer_view(area)
+    if reused is not None:
+        view_id, view_payload = reused
+    else:
+        view_payload = await _build_explorer_view(area)
+        view_id = await _save_view(view_payload)
+        redis = await get_shared_redis()
+        await redis.setex(_explorer_view_key(area), VIEW_TTL_SECONDS, view_id)
+    feature_count = len(view_payload["features"])
     structured = {
         "view_id": view_id,
         "view_expires_in_seconds": VIEW_TTL_SECONDS,
-        "feature_count": len(streets),
+        "feature_count": feature_count,
         "intelligence": intelligence,
     }
-    await _audit("render_every_street_explorer", started, result_count=len(streets))
+    await _audit("render_every_street_explorer", started, result_count=feature_count)
     return _result(
         f"The {area.display_name} explorer is ready.",
         structured,
@@ -4,7 +4,7 @@ from pathlib import Path
 
 from beanie import PydanticObjectId
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from core.job_serialization import serialize_job_payload
 from db.models import Job
@@ -83,6 +83,26 @@ async def create_export_job(
     return _export_job_response(job)
 
 
+@router.post("/stream")
+async def stream_export(export_request: ExportRequest):
+    """Stream an export straight to the client without creating a job."""
+    try:
+        filename, media_type, body = await ExportService.stream_export(
+            export_request,
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/{job_id}", response_model=ExportStatusResponse)
 async def get_export_job(job_id: PydanticObjectId, request: Request):
     owner_key = get_owner_key(request)
@@ -5,11 +5,20 @@ from typing import Final
 EXPORT_SPEC_VERSION: Final[int] = 1
 
 EXPORT_FORMATS_BY_ENTITY: Final[dict[str, set[str]]] = {
-    "trips": {"json", "csv", "geojson", "gpx"},
-    "matched_trips": {"json", "csv", "geojson", "gpx"},
-    "streets": {"geojson"},
+    "trips": {"json", "csv", "geojson", "gpx", "parquet"},
+    "matched_trips": {"json", "csv", "geojson", "gpx", "parquet"},
+    "streets": {"geojson", "parquet"},
     "boundaries": {"geojson"},
-    "undriven_streets": {"geojson"},
+    "undriven_streets": {"geojson", "parquet"},
+}
+
+EXPORT_MEDIA_TYPES: Final[dict[str, str]] = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "geojson": "application/geo+json",
+    "gpx": "application/gpx+xml",
+    "parquet": "application/vnd.apache.parquet",
+    "zip": "application/zip",
 }
 
 EXPORT_SUBDIR_BY_ENTITY: Final[dict[str, str]] = {
@@ -94,6 +103,12 @@ TRIP_CSV_FIELDS: Final[list[str]] = [
     "matchedGps",
 ]
 
+TRIP_PARQUET_FIELDS: Final[list[str]] = [
+    *TRIP_BASE_FIELDS,
+    "startGeoPoint",
+    "destinationGeoPoint",
+]
+
 TRIP_GEOJSON_PROPERTIES_FIELDS: Final[list[str]] = [
     *TRIP_BASE_FIELDS,
     "startGeoPoint",
@@ -128,3 +143,33 @@ BOUNDARY_PROPERTIES_FIELDS: Final[list[str]] = [
     "driven_segments",
     "last_synced",
 ]
+
+# Parquet columns are typed; fields not listed here are written as strings
+# (nested values JSON-encoded, as in CSV exports).
+PARQUET_FLOAT_FIELDS: Final[frozenset[str]] = frozenset(
+    {
+        "duration",
+        "durationSeconds",
+        "durationMinutes",
+        "distance",
+        "coverageDistance",
+        "currentSpeed",
+        "maxSpeed",
+        "avgSpeed",
+        "pointsRecorded",
+        "totalIdleDuration",
+        "hardBrakingCounts",
+        "hardAccelerationCounts",
+        "fuelConsumed",
+        "startOdometer",
+        "endOdometer",
+        "sequence",
+        "location_schema_version",
+        "area_version",
+        "length_miles",
+    },
+)
+
+PARQUET_BOOL_FIELDS: Final[frozenset[str]] = frozenset(
+    {"invalid", "manually_marked"},
+)
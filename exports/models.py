@@ -15,7 +15,7 @@ ExportEntity = Literal[
     "undriven_streets",
 ]
 
-ExportFormat = Literal["json", "csv", "geojson", "gpx"]
+ExportFormat = Literal["json", "csv", "geojson", "gpx", "parquet"]
 
 
 class TripFilters(BaseModel):
@@ -27,9 +27,12 @@ from db.models import CoverageArea, CoverageState, Job, Street, Trip
 from exports.constants import (
     EXPORT_DEFAULT_FORMAT,
     EXPORT_FORMATS_BY_ENTITY,
+    EXPORT_MEDIA_TYPES,
     EXPORT_SPEC_VERSION,
     EXPORT_SUBDIR_BY_ENTITY,
+    STREET_PROPERTIES_FIELDS,
     TRIP_CSV_FIELDS,
+    TRIP_PARQUET_FIELDS,
 )
 from exports.serializers import (
     normalize_value,
@@ -39,19 +42,54 @@ from exports.serializers import (
     serialize_trip_properties,
     serialize_trip_record,
 )
+from exports.services.export_stream import (
+    STREAM_BATCH_SIZE,
+    CsvEncoder,
+    GeoJsonEncoder,
+    GpxEncoder,
+    JsonArrayEncoder,
+    ParquetEncoder,
+    StreamEncoder,
+    StreamEntry,
+    iter_file_bytes,
+    iter_zip_bytes,
+)
 from exports.services.export_writer import (
     write_csv,
     write_geojson_features,
     write_gpx_tracks,
     write_json_array,
+    write_parquet,
 )
 from trips.serialization import TripSerializer
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
     from exports.models import ExportItem, ExportRequest
 
 logger = logging.getLogger(__name__)
 
+_TRIP_HEAVY_FIELDS = ("gps", "matchedGps", "coordinates", "processing_history")
+_STREET_FIELDS = (
+    "segment_id",
+    "area_id",
+    "area_version",
+    "street_name",
+    "highway_type",
+    "osm_id",
+    "length_miles",
+    "geometry",
+)
+_STREET_STATE_FIELDS = (
+    "segment_id",
+    "status",
+    "last_driven_at",
+    "first_driven_at",
+    "manually_marked",
+    "marked_at",
+)
+
 EXPORT_ROOT = Path("cache") / "exports"
 EXPORT_RETENTION_DAYS = 7
 PROGRESS_UPDATE_EVERY = 500
@@ -376,17 +414,7 @@ class ExportService:
         trip_filters = spec.get("trip_filters") or {}
         area_id = spec.get("area_id")
 
-        area = None
-        if area_id:
-            area = await CoverageArea.get(PydanticObjectId(area_id))
-            if not area:
-                raise HTTPException(status_code=404, detail="Coverage area not found")
-            if area.status != "ready":
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Coverage area is not ready (status: {area.status})",
-                )
-
+        area = await cls._resolve_export_area(area_id)
         trip_clip_context = cls._resolve_trip_export_clip_context(trip_filters, area)
         total_records = await cls._estimate_total_records(
             items,
@@ -432,6 +460,20 @@ class ExportService:
 
         return {"records": records, "files": files, "area": area}
 
+    @staticmethod
+    async def _resolve_export_area(area_id: str | None) -> CoverageArea | None:
+        if not area_id:
+            return None
+        area = await CoverageArea.get(PydanticObjectId(area_id))
+        if not area:
+            raise HTTPException(status_code=404, detail="Coverage area not found")
+        if area.status != "ready":
+            raise HTTPException(
+                status_code=400,
+                detail=f"Coverage area is not ready (status: {area.status})",
+            )
+        return area
+
     @classmethod
     async def _estimate_total_records(
         cls,
@@ -484,13 +526,20 @@ class ExportService:
                 trip_clip_context,
             )
         if entity == "streets":
-            return await cls._write_street_export(file_path, area, None, progress)
+            return await cls._write_street_export(
+                file_path,
+                area,
+                None,
+                progress,
+                fmt,
+            )
         if entity == "undriven_streets":
             return await cls._write_street_export(
                 file_path,
                 area,
                 "undriven",
                 progress,
+                fmt,
             )
         if entity == "boundaries":
             return await cls._write_boundary_export(file_path, area, progress)
@@ -499,27 +548,25 @@ class ExportService:
         raise ValueError(msg)
 
     @classmethod
-    async def _write_trip_export(
+    def _trip_serializer(
         cls,
-        entity: str,
         fmt: str,
-        file_path: Path,
-        trip_filters: dict[str, Any],
+        *,
+        geometry_field: str,
         include_geometry: bool,
-        progress: ExportProgress,
         trip_clip_context: _TripExportClipContext,
-    ) -> int:
-        matched_only = entity == "matched_trips"
-        geometry_field = "matchedGps" if matched_only else "gps"
-        query = cls._build_trip_query(trip_filters, matched_only, trip_clip_context)
-        cursor = Trip.find(query).sort(Trip.startTime)
+    ) -> Callable[[Any], dict[str, Any] | None]:
+        """Per-trip serializer shared by the job writers and streaming exports."""
 
-        def serialize_structured_trip(trip: Any) -> dict[str, Any] | None:
-            row = cls._prepare_trip_export_row(
+        def prepare(trip: Any) -> dict[str, Any] | None:
+            return cls._prepare_trip_export_row(
                 trip,
                 geometry_field=geometry_field,
                 clip_context=trip_clip_context,
             )
+
+        def serialize_structured_trip(trip: Any) -> dict[str, Any] | None:
+            row = prepare(trip)
             if row is None:
                 return None
             record = serialize_trip_record(
@@ -531,11 +578,84 @@ class ExportService:
                 record["matchedGps"] = None
             return record
 
+        def serialize_gpx_track(trip: Any) -> dict[str, Any] | None:
+            row = prepare(trip)
+            if row is None:
+                return None
+            segments = cls._gpx_segments(row, geometry_field=geometry_field)
+
+            base = serialize_trip_base(row)
+            trip_id = base.get("tripId") or base.get("transactionId")
+            name = f"Trip {trip_id}" if trip_id else None
+
+            description_parts = []
+            if base.get("startTime"):
+                description_parts.append(f"start: {base['startTime']}")
+            if base.get("endTime"):
+                description_parts.append(f"end: {base['endTime']}")
+            if base.get("distance") is not None:
+                description_parts.append(f"distance_mi: {base['distance']}")
+            if base.get("coverageDistance") is not None:
+                description_parts.append(
+                    f"coverage_distance_mi: {base['coverageDistance']}",
+                )
+            if base.get("imei"):
+                description_parts.append(f"imei: {base['imei']}")
+            if base.get("vin"):
+                description_parts.append(f"vin: {base['vin']}")
+            description = " | ".join(description_parts) if description_parts else None
+
+            return {
+                "segments": segments,
+                "name": name,
+                "description": description,
+            }
+
+        def serialize_feature(trip: Any) -> dict[str, Any] | None:
+            row = prepare(trip)
+            if row is None:
+                return None
+            geometry = GeometryService.parse_geojson(row.get(geometry_field))
+            props = serialize_trip_properties(row)
+            return GeometryService.feature_from_geometry(geometry, props)
+
+        if fmt in {"json", "csv", "parquet"}:
+            return serialize_structured_trip
+        if fmt == "gpx":
+            return serialize_gpx_track
+        if fmt == "geojson":
+            return serialize_feature
+
+        msg = f"Unsupported trip export format '{fmt}'."
+        raise ValueError(msg)
+
+    @classmethod
+    async def _write_trip_export(
+        cls,
+        entity: str,
+        fmt: str,
+        file_path: Path,
+        trip_filters: dict[str, Any],
+        include_geometry: bool,
+        progress: ExportProgress,
+        trip_clip_context: _TripExportClipContext,
+    ) -> int:
+        matched_only = entity == "matched_trips"
+        geometry_field = "matchedGps" if matched_only else "gps"
+        query = cls._build_trip_query(trip_filters, matched_only, trip_clip_context)
+        cursor = Trip.find(query).sort(Trip.startTime)
+        serializer = cls._trip_serializer(
+            fmt,
+            geometry_field=geometry_field,
+            include_geometry=include_geometry,
+            trip_clip_context=trip_clip_context,
+        )
+
         if fmt == "json":
             return await write_json_array(
                 file_path,
                 cursor,
-                serialize_structured_trip,
+                serializer,
                 progress.bump,
             )
         if fmt == "csv":
@@ -543,77 +663,62 @@ class ExportService:
                 file_path,
                 cursor,
                 TRIP_CSV_FIELDS,
-                serialize_structured_trip,
+                serializer,
+                progress.bump,
+            )
+        if fmt == "parquet":
+            return await write_parquet(
+                file_path,
+                cursor,
+                TRIP_PARQUET_FIELDS,
+                serializer,
                 progress.bump,
+                geometry_field=geometry_field if include_geometry else None,
             )
         if fmt == "gpx":
-
-            def serializer(trip: Any) -> dict[str, Any] | None:
-                row = cls._prepare_trip_export_row(
-                    trip,
-                    geometry_field=geometry_field,
-                    clip_context=trip_clip_context,
-                )
-                if row is None:
-                    return None
-                segments = cls._gpx_segments(row, geometry_field=geometry_field)
-
-                base = serialize_trip_base(row)
-                trip_id = base.get("tripId") or base.get("transactionId")
-                name = f"Trip {trip_id}" if trip_id else None
-
-                description_parts = []
-                if base.get("startTime"):
-                    description_parts.append(f"start: {base['startTime']}")
-                if base.get("endTime"):
-                    description_parts.append(f"end: {base['endTime']}")
-                if base.get("distance") is not None:
-                    description_parts.append(f"distance_mi: {base['distance']}")
-                if base.get("coverageDistance") is not None:
-                    description_parts.append(
-                        f"coverage_distance_mi: {base['coverageDistance']}",
-                    )
-                if base.get("imei"):
-                    description_parts.append(f"imei: {base['imei']}")
-                if base.get("vin"):
-                    description_parts.append(f"vin: {base['vin']}")
-                description = (
-                    " | ".join(description_parts) if description_parts else None
-                )
-
-                return {
-                    "segments": segments,
-                    "name": name,
-                    "description": description,
-                }
-
             return await write_gpx_tracks(
                 file_path,
                 cursor,
                 serializer,
                 progress.bump,
             )
-        if fmt == "geojson":
 
-            async def features():
-                async for trip in cursor:
-                    row = cls._prepare_trip_export_row(
-                        trip,
-                        geometry_field=geometry_field,
-                        clip_context=trip_clip_context,
-                    )
-                    if row is None:
-                        await progress.bump(1)
-                        continue
-                    geometry = GeometryService.parse_geojson(row.get(geometry_field))
-                    props = serialize_trip_properties(row)
-                    yield GeometryService.feature_from_geometry(geometry, props)
-                    await progress.bump(1)
-
-            return await write_geojson_features(file_path, features())
+        async def features():
+            async for trip in cursor:
+                feature = serializer(trip)
+                if feature is not None:
+                    yield feature
+                await progress.bump(1)
 
-        msg = f"Unsupported trip export format '{fmt}'."
-        raise ValueError(msg)
+        return await write_geojson_features(file_path, features())
+
+    @staticmethod
+    def _street_serializer(
+        fmt: str,
+        state_map: dict[str, Any],
+        status_filter: str | None,
+    ) -> Callable[[Any], dict[str, Any] | None]:
+        def serialize(street: Any) -> dict[str, Any] | None:
+            if isinstance(street, dict):
+                segment_id = street.get("segment_id")
+                geometry = street.get("geometry")
+            else:
+                segment_id = street.segment_id
+                geometry = street.geometry
+            state = state_map.get(segment_id)
+            status = (
+                (state.get("status") if isinstance(state, dict) else state.status)
+                if state
+                else "undriven"
+            )
+            if status_filter and status != status_filter:
+                return None
+            props = serialize_street_properties(street, state)
+            if fmt == "parquet":
+                return {**props, "geometry": normalize_value(geometry)}
+            return GeometryService.feature_from_geometry(geometry, props)
+
+        return serialize
 
     @classmethod
     async def _write_street_export(
@@ -622,6 +727,7 @@ class ExportService:
         area: CoverageArea | None,
         status_filter: str | None,
         progress: ExportProgress,
+        fmt: str = "geojson",
     ) -> int:
         if not area:
             msg = "Coverage area is required for street exports."
@@ -629,6 +735,7 @@ class ExportService:
 
         states = await CoverageState.find({"area_id": area.id}).to_list()
         state_map = {state.segment_id: state for state in states}
+        serializer = cls._street_serializer(fmt, state_map, status_filter)
 
         streets = Street.find(
             {
@@ -637,15 +744,21 @@ class ExportService:
             },
         ).sort(Street.segment_id)
 
+        if fmt == "parquet":
+            return await write_parquet(
+                file_path,
+                streets,
+                STREET_PROPERTIES_FIELDS,
+                serializer,
+                progress.bump,
+                geometry_field="geometry",
+            )
+
         async def features():
             async for street in streets:
-                state = state_map.get(street.segment_id)
-                status = state.status if state else "undriven"
-                if status_filter and status != status_filter:
-                    await progress.bump(1)
-                    continue
-                props = serialize_street_properties(street, state)
-                yield GeometryService.feature_from_geometry(street.geometry, props)
+                feature = serializer(street)
+                if feature is not None:
+                    yield feature
                 await progress.bump(1)
 
         return await write_geojson_features(file_path, features())
@@ -670,6 +783,184 @@ class ExportService:
 
         return await write_geojson_features(file_path, features())
 
+    @staticmethod
+    def _trip_projection(
+        fmt: str,
+        *,
+        geometry_field: str,
+        include_geometry: bool,
+        clip_enabled: bool,
+    ) -> dict[str, int] | None:
+        """Exclude the heavy geometry/history fields a format never reads."""
+        needed: set[str] = set()
+        if fmt == "json":
+            needed.add("processing_history")
+            if include_geometry:
+                needed.update({"gps", "matchedGps", "coordinates"})
+        elif fmt == "csv":
+            if include_geometry:
+                needed.update({"gps", "matchedGps"})
+        elif fmt == "gpx":
+            needed.update({geometry_field, "coordinates"})
+        elif fmt == "geojson" or include_geometry:
+            needed.add(geometry_field)
+        if clip_enabled:
+            needed.add(geometry_field)
+
+        excluded = {field: 0 for field in _TRIP_HEAVY_FIELDS if field not in needed}
+        return excluded or None
+
+    @classmethod
+    async def _stream_entry(
+        cls,
+        item: dict[str, Any],
+        trip_filters: dict[str, Any],
+        area: CoverageArea | None,
+        trip_clip_context: _TripExportClipContext,
+    ) -> StreamEntry:
+        entity = item["entity"]
+        fmt = item["format"]
+        include_geometry = item.get("include_geometry", True)
+        arcname = str(cls._entity_file_path(Path(), entity, fmt))
+
+        if entity in {"trips", "matched_trips"}:
+            matched_only = entity == "matched_trips"
+            geometry_field = "matchedGps" if matched_only else "gps"
+            query = cls._build_trip_query(trip_filters, matched_only, trip_clip_context)
+            source = Trip.get_pymongo_collection().find(
+                query,
+                projection=cls._trip_projection(
+                    fmt,
+                    geometry_field=geometry_field,
+                    include_geometry=include_geometry,
+                    clip_enabled=trip_clip_context.enabled,
+                ),
+                sort=[("startTime", 1)],
+                batch_size=STREAM_BATCH_SIZE,
+            )
+            serializer = cls._trip_serializer(
+                fmt,
+                geometry_field=geometry_field,
+                include_geometry=include_geometry,
+                trip_clip_context=trip_clip_context,
+            )
+            if fmt == "parquet":
+                encoder: StreamEncoder = ParquetEncoder(
+                    TRIP_PARQUET_FIELDS,
+                    geometry_field=geometry_field if include_geometry else None,
+                )
+            elif fmt == "csv":
+                encoder = CsvEncoder(TRIP_CSV_FIELDS)
+            elif fmt == "gpx":
+                encoder = GpxEncoder()
+            elif fmt == "geojson":
+                encoder = GeoJsonEncoder()
+            else:
+                encoder = JsonArrayEncoder()
+            return StreamEntry(arcname, source, serializer, encoder)
+
+        if not area:
+            msg = "Coverage area is required for coverage exports."
+            raise ValueError(msg)
+
+        if entity == "boundaries":
+
+            async def boundary_source():
+                yield area
+
+            return StreamEntry(
+                arcname,
+                boundary_source(),
+                lambda value: GeometryService.feature_from_geometry(
+                    normalize_value(value.boundary),
+                    serialize_boundary_properties(value),
+                ),
+                GeoJsonEncoder(),
+            )
+
+        if entity in {"streets", "undriven_streets"}:
+            states = (
+                await CoverageState.get_pymongo_collection()
+                .find(
+                    {"area_id": area.id},
+                    projection=dict.fromkeys(_STREET_STATE_FIELDS, 1),
+                )
+                .to_list(None)
+            )
+            state_map = {state.get("segment_id"): state for state in states}
+            source = Street.get_pymongo_collection().find(
+                {"area_id": area.id, "area_version": area.area_version},
+                projection=dict.fromkeys(_STREET_FIELDS, 1),
+                sort=[("segment_id", 1)],
+                batch_size=STREAM_BATCH_SIZE,
+            )
+            serializer = cls._street_serializer(
+                fmt,
+                state_map,
+                "undriven" if entity == "undriven_streets" else None,
+            )
+            encoder = (
+                ParquetEncoder(STREET_PROPERTIES_FIELDS, geometry_field="geometry")
+                if fmt == "parquet"
+                else GeoJsonEncoder()
+            )
+            return StreamEntry(arcname, source, serializer, encoder)
+
+        msg = f"Unsupported export entity '{entity}'."
+        raise ValueError(msg)
+
+    @classmethod
+    async def stream_export(
+        cls,
+        request: ExportRequest,
+    ) -> tuple[str, str, AsyncIterator[bytes]]:
+        """
+        Prepare a streamed export and return ``(filename, media_type, body)``.
+
+        A single item is streamed as its own file; several items are streamed
+        as a zip archive with a manifest. Validation and area lookup happen
+        here, before any bytes are sent.
+        """
+        items = [cls._normalize_item(item) for item in request.items]
+        trip_filters = request.trip_filters.model_dump() if request.trip_filters else {}
+        area = await cls._resolve_export_area(
+            str(request.area_id) if request.area_id else None,
+        )
+        trip_clip_context = cls._resolve_trip_export_clip_context(trip_filters, area)
+        entries = [
+            await cls._stream_entry(item, trip_filters, area, trip_clip_context)
+            for item in items
+        ]
+
+        if len(entries) == 1:
+            entry = entries[0]
+            fmt = items[0]["format"]
+            return (
+                Path(entry.arcname).name,
+                EXPORT_MEDIA_TYPES[fmt],
+                iter_file_bytes(entry),
+            )
+
+        def manifest(done: list[StreamEntry]) -> dict[str, Any]:
+            return cls._build_manifest(
+                job_id=None,
+                owner_key=None,
+                filters=trip_filters or None,
+                area=area,
+                files=[
+                    {
+                        "entity": item["entity"],
+                        "format": item["format"],
+                        "filename": entry.arcname,
+                        "record_count": entry.encoder.count,
+                    }
+                    for item, entry in zip(items, done, strict=True)
+                ],
+            )
+
+        filename = f"export_{datetime.now(UTC).strftime('%Y%m%dT%H%M%SZ')}.zip"
+        return filename, EXPORT_MEDIA_TYPES["zip"], iter_zip_bytes(entries, manifest)
+
     @staticmethod
     def _build_trip_query(
         filters: dict[str, Any],
@@ -732,14 +1023,20 @@ class ExportService:
         return export_dir / filename
 
     @staticmethod
-    def _write_manifest(job: Job, results: dict[str, Any], path: Path) -> None:
-        area = results.get("area")
-        manifest = {
+    def _build_manifest(
+        *,
+        job_id: str | None,
+        owner_key: str | None,
+        filters: dict[str, Any] | None,
+        area: CoverageArea | None,
+        files: list[dict[str, Any]],
+    ) -> dict[str, Any]:
+        return {
             "spec_version": EXPORT_SPEC_VERSION,
             "generated_at": datetime.now(UTC).isoformat(),
-            "job_id": str(job.id),
-            "owner_key": job.owner_key,
-            "filters": job.spec.get("trip_filters") if job.spec else None,
+            "job_id": job_id,
+            "owner_key": owner_key,
+            "filters": filters,
             "area": (
                 {
                     "id": str(area.id),
@@ -749,9 +1046,24 @@ class ExportService:
                 if area
                 else None
             ),
-            "items": results.get("files", []),
+            "items": files,
         }
 
+    @classmethod
+    def _write_manifest(
+        cls,
+        job: Job,
+        results: dict[str, Any],
+        path: Path,
+    ) -> None:
+        manifest = cls._build_manifest(
+            job_id=str(job.id),
+            owner_key=job.owner_key,
+            filters=job.spec.get("trip_filters") if job.spec else None,
+            area=results.get("area"),
+            files=results.get("files", []),
+        )
+
         path.write_text(
             json.dumps(manifest, indent=2, ensure_ascii=True),
             encoding="utf-8",
@@ -0,0 +1,268 @@
+"""
+Streaming export encoders.
+
+Rows are pulled from the database in batches, serialized and encoded in a
+worker thread, and the produced bytes are handed to the HTTP response as soon
+as each batch is encoded. Multi-entity exports are streamed as a zip archive
+written to a non-seekable sink, so nothing is staged on disk.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import zipfile
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import gpxpy.gpxfield
+
+from exports.services.export_writer import (
+    ParquetRecordWriter,
+    _serialize_csv_value,
+    build_gpx_track,
+    new_gpx_document,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+STREAM_BATCH_SIZE = 500
+
+
+class ByteSink(io.RawIOBase):
+    """Write-only, non-seekable buffer drained after every encoded batch."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        size = len(data)
+        self._buffer += data
+        self._position += size
+        return size
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class StreamEncoder:
+    """Incremental writer of one export file into a binary stream."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._out: Any = None
+
+    def open(self, out: Any) -> None:
+        self._out = out
+
+    def write(self, records: list[Any]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return None
+
+    def _emit(self, text: str) -> None:
+        self._out.write(text.encode("utf-8"))
+
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=True)
+
+
+class JsonArrayEncoder(StreamEncoder):
+    def __init__(self, *, prefix: str = "[", suffix: str = "]") -> None:
+        super().__init__()
+        self._prefix = prefix
+        self._suffix = suffix
+
+    def open(self, out: Any) -> None:
+        super().open(out)
+        self._emit(self._prefix)
+
+    def write(self, records: list[Any]) -> None:
+        if not records:
+            return
+        body = ",".join(_compact_json(record) for record in records)
+        self._emit(body if self.count == 0 else f",{body}")
+        self.count += len(records)
+
+    def close(self) -> None:
+        self._emit(self._suffix)
+
+
+class GeoJsonEncoder(JsonArrayEncoder):
+    def __init__(self) -> None:
+        super().__init__(prefix='{"type":"FeatureCollection","features":[', suffix="]}")
+
+
+class CsvEncoder(StreamEncoder):
+    def __init__(self, fieldnames: list[str]) -> None:
+        super().__init__()
+        self.fieldnames = fieldnames
+
+    def _rows_to_text(self, rows: list[dict[str, Any]], *, header: bool) -> str:
+        buffer = io.StringIO(newline="")
+        writer = csv.DictWriter(buffer, fieldnames=self.fieldnames)
+        if header:
+            writer.writeheader()
+        writer.writerows(rows)
+        return buffer.getvalue()
+
+    def open(self, out: Any) -> None:
+        super().open(out)
+        self._emit(self._rows_to_text([], header=True))
+
+    def write(self, records: list[Any]) -> None:
+        rows = [
+            {
+                field: _serialize_csv_value(record.get(field))
+                for field in self.fieldnames
+            }
+            for record in records
+        ]
+        self._emit(self._rows_to_text(rows, header=False))
+        self.count += len(rows)
+
+
+class GpxEncoder(StreamEncoder):
+    _CLOSING_TAG = "</gpx>"
+
+    def open(self, out: Any) -> None:
+        super().open(out)
+        self._version = "1.1"
+        document = new_gpx_document().to_xml(version=self._version)
+        self._emit(document[: document.rindex(self._CLOSING_TAG)].rstrip())
+
+    def write(self, records: list[Any]) -> None:
+        parts = []
+        for track_data in records:
+            track = build_gpx_track(track_data)
+            if track is None:
+                continue
+            parts.append(
+                gpxpy.gpxfield.gpx_fields_to_xml(track, "trk", version=self._version),
+            )
+            self.count += 1
+        if parts:
+            self._emit("".join(parts))
+
+    def close(self) -> None:
+        self._emit(f"\n{self._CLOSING_TAG}")
+
+
+class ParquetEncoder(StreamEncoder):
+    def __init__(
+        self,
+        fieldnames: list[str],
+        *,
+        geometry_field: str | None = None,
+    ) -> None:
+        super().__init__()
+        self.fieldnames = fieldnames
+        self.geometry_field = geometry_field
+        self._writer: ParquetRecordWriter | None = None
+
+    def open(self, out: Any) -> None:
+        super().open(out)
+        self._writer = ParquetRecordWriter(
+            out,
+            self.fieldnames,
+            geometry_field=self.geometry_field,
+        )
+
+    def write(self, records: list[Any]) -> None:
+        self._writer.extend(records)
+        self.count = self._writer.count
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+@dataclass
+class StreamEntry:
+    """One export file: raw rows, a per-row serializer and an encoder."""
+
+    arcname: str
+    source: AsyncIterator[Any]
+    serializer: Callable[[Any], Any | None]
+    encoder: StreamEncoder
+
+
+async def _batches(source: AsyncIterator[Any]) -> AsyncIterator[list[Any]]:
+    batch: list[Any] = []
+    async for item in source:
+        batch.append(item)
+        if len(batch) >= STREAM_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _encode_batch(entry: StreamEntry, batch: list[Any]) -> None:
+    records = []
+    for item in batch:
+        record = entry.serializer(item)
+        if record is not None:
+            records.append(record)
+    entry.encoder.write(records)
+
+
+async def _stream_entry(entry: StreamEntry, sink: ByteSink) -> AsyncIterator[bytes]:
+    async for batch in _batches(entry.source):
+        await asyncio.to_thread(_encode_batch, entry, batch)
+        chunk = sink.drain()
+        if chunk:
+            yield chunk
+
+
+async def iter_file_bytes(entry: StreamEntry) -> AsyncIterator[bytes]:
+    """Stream a single export file."""
+    sink = ByteSink()
+    entry.encoder.open(sink)
+    async for chunk in _stream_entry(entry, sink):
+        yield chunk
+    await asyncio.to_thread(entry.encoder.close)
+    tail = sink.drain()
+    if tail:
+        yield tail
+
+
+async def iter_zip_bytes(
+    entries: list[StreamEntry],
+    manifest: Callable[[list[StreamEntry]], dict[str, Any]],
+) -> AsyncIterator[bytes]:
+    """Stream several export files as one zip archive, manifest last."""
+    sink = ByteSink()
+    archive = zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED)
+    for entry in entries:
+        handle = archive.open(entry.arcname, "w", force_zip64=True)
+        entry.encoder.open(handle)
+        async for chunk in _stream_entry(entry, sink):
+            yield chunk
+
+        def finish(encoder: StreamEncoder = entry.encoder, out: Any = handle) -> None:
+            encoder.close()
+            out.close()
+
+        await asyncio.to_thread(finish)
+        yield sink.drain()
+
+    archive.writestr(
+        "manifest.json",
+        json.dumps(manifest(entries), indent=2, ensure_ascii=True),
+    )
+    archive.close()
+    yield sink.drain()
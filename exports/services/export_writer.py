@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import csv
 import json
@@ -8,7 +9,10 @@ from typing import TYPE_CHECKING, Any
 
 import gpxpy
 import gpxpy.gpx
+import shapely
+from shapely.geometry import shape
 
+from exports.constants import PARQUET_BOOL_FIELDS, PARQUET_FLOAT_FIELDS
 from exports.serializers import normalize_value
 
 if TYPE_CHECKING:
@@ -102,6 +106,58 @@ async def write_geojson_features(
     return count
 
 
+def build_gpx_track(track_data: dict[str, Any]) -> gpxpy.gpx.GPXTrack | None:
+    segment_data = track_data.get("segments") or []
+    if not isinstance(segment_data, list):
+        segment_data = []
+
+    track = gpxpy.gpx.GPXTrack()
+    for raw_segment in segment_data:
+        if not isinstance(raw_segment, dict):
+            continue
+        coords = raw_segment.get("coordinates") or []
+        timestamps = raw_segment.get("timestamps") or []
+        if not isinstance(coords, list) or not isinstance(timestamps, list):
+            continue
+
+        segment = gpxpy.gpx.GPXTrackSegment()
+        for idx, coord in enumerate(coords):
+            if not isinstance(coord, list | tuple) or len(coord) < 2:
+                continue
+            try:
+                lon = float(coord[0])
+                lat = float(coord[1])
+            except (TypeError, ValueError):
+                continue
+            point = gpxpy.gpx.GPXTrackPoint(lat, lon)
+            if idx < len(timestamps) and timestamps[idx] is not None:
+                with contextlib.suppress(TypeError, ValueError, OSError):
+                    point.time = datetime.fromtimestamp(
+                        int(timestamps[idx]),
+                        tz=UTC,
+                    )
+            segment.points.append(point)
+        if segment.points:
+            track.segments.append(segment)
+
+    if not track.segments:
+        return None
+
+    name = track_data.get("name")
+    if name:
+        track.name = str(name)
+    description = track_data.get("description")
+    if description:
+        track.description = str(description)
+    return track
+
+
+def new_gpx_document() -> gpxpy.gpx.GPX:
+    gpx = gpxpy.gpx.GPX()
+    gpx.creator = "Every Street"
+    return gpx
+
+
 async def write_gpx_tracks(
     path: Path,
     cursor: AsyncIterator[Any],
@@ -109,8 +165,7 @@ async def write_gpx_tracks(
     progress: Callable[[int], Any] | None = None,
 ) -> int:
     track_count = 0
-    gpx = gpxpy.gpx.GPX()
-    gpx.creator = "Every Street"
+    gpx = new_gpx_document()
 
     async for item in cursor:
         track_data = serializer(item)
@@ -118,46 +173,9 @@ async def write_gpx_tracks(
             if progress:
                 await progress(1)
             continue
-        segment_data = track_data.get("segments") or []
-        if not isinstance(segment_data, list):
-            segment_data = []
 
-        track = gpxpy.gpx.GPXTrack()
-        for raw_segment in segment_data:
-            if not isinstance(raw_segment, dict):
-                continue
-            coords = raw_segment.get("coordinates") or []
-            timestamps = raw_segment.get("timestamps") or []
-            if not isinstance(coords, list) or not isinstance(timestamps, list):
-                continue
-
-            segment = gpxpy.gpx.GPXTrackSegment()
-            for idx, coord in enumerate(coords):
-                if not isinstance(coord, list | tuple) or len(coord) < 2:
-                    continue
-                try:
-                    lon = float(coord[0])
-                    lat = float(coord[1])
-                except (TypeError, ValueError):
-                    continue
-                point = gpxpy.gpx.GPXTrackPoint(lat, lon)
-                if idx < len(timestamps) and timestamps[idx] is not None:
-                    with contextlib.suppress(TypeError, ValueError, OSError):
-                        point.time = datetime.fromtimestamp(
-                            int(timestamps[idx]),
-                            tz=UTC,
-                        )
-                segment.points.append(point)
-            if segment.points:
-                track.segments.append(segment)
-
-        if track.segments:
-            name = track_data.get("name")
-            if name:
-                track.name = str(name)
-            description = track_data.get("description")
-            if description:
-                track.description = str(description)
+        track = build_gpx_track(track_data)
+        if track is not None:
             gpx.tracks.append(track)
             track_count += 1
 
@@ -166,3 +184,154 @@ async def write_gpx_tracks(
 
     path.write_text(gpx.to_xml(), encoding="utf-8")
     return track_count
+
+
+PARQUET_ROW_GROUP_SIZE = 5000
+
+
+def _require_pyarrow() -> tuple[Any, Any]:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        msg = "pyarrow is required for Parquet exports."
+        raise RuntimeError(msg) from exc
+    return pa, pq
+
+
+def _parquet_float(value: Any) -> float | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parquet_string(value: Any) -> str | None:
+    normalized = _serialize_csv_value(value)
+    return None if normalized is None else str(normalized)
+
+
+def _wkb_or_none(geometry: Any) -> bytes | None:
+    if not isinstance(geometry, dict) or not geometry.get("type"):
+        return None
+    try:
+        return shapely.to_wkb(shape(geometry))
+    except Exception:
+        return None
+
+
+class ParquetRecordWriter:
+    """
+    Buffer serialized records and write them to ``sink`` as Parquet row groups.
+
+    When ``geometry_field`` is set, that GeoJSON field is stored as WKB in a
+    ``geometry`` column and GeoParquet metadata is attached to the schema.
+    """
+
+    def __init__(
+        self,
+        sink: Any,
+        fieldnames: list[str],
+        *,
+        geometry_field: str | None = None,
+    ) -> None:
+        pa, pq = _require_pyarrow()
+        self._pa = pa
+        self.fieldnames = fieldnames
+        self.geometry_field = geometry_field
+        self.count = 0
+        self._rows: list[dict[str, Any]] = []
+
+        columns = [pa.field(name, self._arrow_type(name)) for name in fieldnames]
+        metadata = None
+        if geometry_field:
+            columns.append(pa.field("geometry", pa.binary()))
+            metadata = {
+                b"geo": json.dumps(
+                    {
+                        "version": "1.0.0",
+                        "primary_column": "geometry",
+                        "columns": {
+                            "geometry": {"encoding": "WKB", "geometry_types": []},
+                        },
+                    },
+                ).encode("utf-8"),
+            }
+        self._schema = pa.schema(columns, metadata=metadata)
+        self._writer = pq.ParquetWriter(sink, self._schema, compression="zstd")
+
+    def _arrow_type(self, name: str) -> Any:
+        if name in PARQUET_FLOAT_FIELDS:
+            return self._pa.float64()
+        if name in PARQUET_BOOL_FIELDS:
+            return self._pa.bool_()
+        return self._pa.string()
+
+    def _column(self, name: str) -> list[Any]:
+        values = [row.get(name) for row in self._rows]
+        if name in PARQUET_FLOAT_FIELDS:
+            return [_parquet_float(value) for value in values]
+        if name in PARQUET_BOOL_FIELDS:
+            return [None if value is None else bool(value) for value in values]
+        return [_parquet_string(value) for value in values]
+
+    def extend(self, records: list[dict[str, Any]]) -> None:
+        self._rows.extend(records)
+        self.count += len(records)
+        if len(self._rows) >= PARQUET_ROW_GROUP_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        arrays = [
+            self._pa.array(self._column(name), type=self._arrow_type(name))
+            for name in self.fieldnames
+        ]
+        if self.geometry_field:
+            arrays.append(
+                self._pa.array(
+                    [_wkb_or_none(row.get(self.geometry_field)) for row in self._rows],
+                    type=self._pa.binary(),
+                ),
+            )
+        self._writer.write_batch(
+            self._pa.record_batch(arrays, schema=self._schema),
+        )
+        self._rows.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+
+async def write_parquet(
+    path: Path,
+    cursor: AsyncIterator[Any],
+    fieldnames: list[str],
+    serializer: Callable[[Any], dict[str, Any] | None],
+    progress: Callable[[int], Any] | None = None,
+    *,
+    geometry_field: str | None = None,
+) -> int:
+    with path.open("wb") as handle:
+        writer = ParquetRecordWriter(
+            handle,
+            fieldnames,
+            geometry_field=geometry_field,
+        )
+        pending: list[dict[str, Any]] = []
+        async for item in cursor:
+            record = serializer(item)
+            if record is not None:
+                pending.append(record)
+            if len(pending) >= PARQUET_ROW_GROUP_SIZE:
+                await asyncio.to_thread(writer.extend, pending)
+                pending = []
+            if progress:
+                await progress(1)
+        await asyncio.to_thread(writer.extend, pending)
+        await asyncio.to_thread(writer.close)
+    return writer.count
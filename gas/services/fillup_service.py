@@ -6,13 +6,14 @@ from typing import Any
 
 from beanie import PydanticObjectId
 
-from core.date_utils import parse_timestamp
+from core.date_utils import ensure_utc, parse_timestamp
 from core.exceptions import (
     DuplicateResourceException,
     ResourceNotFoundException,
     ValidationException,
 )
 from core.trip_map_cache import bump_trip_map_revision
+from db.bulk import bulk_write_updates
 from db.models import GasFillup, Vehicle
 
 from .fillup_filters import build_fillup_date_conditions
@@ -171,13 +172,7 @@ class FillupService:
         while cursor is not None and steps < FillupService._MAX_CHAIN_LOOKBACK:
             steps += 1
 
-            is_trusted_anchor = (
-                cursor.is_full_tank
-                and cursor.odometer is not None
-                and cursor.odometer_source == "manual"
-                and cursor.odometer_is_estimated is not True
-            )
-            if is_trusted_anchor:
+            if FillupService._is_trusted_anchor(cursor):
                 # A full-tank row remains a valid anchor even if it was marked
                 # missed_previous; that flag only invalidates MPG before it.
                 anchor_fillup = cursor
@@ -649,6 +644,98 @@ class FillupService:
 
         return {"status": "success", "message": "Fill-up deleted"}
 
+    @staticmethod
+    def _is_trusted_anchor(fillup: GasFillup) -> bool:
+        """Whether a fill-up can anchor an MPG chain."""
+        return bool(
+            fillup.is_full_tank
+            and fillup.odometer is not None
+            and fillup.odometer_source == "manual"
+            and fillup.odometer_is_estimated is not True
+        )
+
+    @staticmethod
+    def _timeline_stats(
+        timeline: list[GasFillup],
+        start_index: int = 0,
+    ) -> list[tuple[float | None, float | None, float | None]]:
+        """
+        Compute derived MPG fields for a sorted fill-up timeline in one pass.
+
+        Applies the same rules as `_calculate_fillup_stats` while carrying the
+        chain state forward, so no per-row lookback queries are needed.
+        Returns stats for `timeline[start_index:]`.
+        """
+        results: list[tuple[float | None, float | None, float | None]] = []
+        anchor_odometer: float | None = None
+        # Gallons of non-anchor rows since the anchor, in timeline order.
+        chain_gallons: list[float] = []
+        chain_broken = False
+
+        for index, fillup in enumerate(timeline):
+            if index >= start_index:
+                previous_odometer = timeline[index - 1].odometer if index > 0 else None
+                stats: tuple[float | None, float | None, float | None] = (
+                    None,
+                    None,
+                    previous_odometer,
+                )
+                eligible = (
+                    fillup.odometer is not None
+                    and fillup.gallons is not None
+                    and fillup.gallons > 0
+                    and fillup.is_full_tank
+                    and not fillup.missed_previous
+                    and not chain_broken
+                    and anchor_odometer is not None
+                    and len(chain_gallons) < FillupService._MAX_CHAIN_LOOKBACK
+                )
+                if eligible:
+                    # Sum newest-first to match the reverse chain walk exactly.
+                    gallons_used = float(fillup.gallons)
+                    for gallons in reversed(chain_gallons):
+                        gallons_used += gallons
+                    miles_since_last = fillup.odometer - anchor_odometer
+                    if miles_since_last > 0 and gallons_used > 0:
+                        stats = (
+                            miles_since_last / gallons_used,
+                            miles_since_last,
+                            anchor_odometer,
+                        )
+                    else:
+                        stats = (None, None, anchor_odometer)
+                results.append(stats)
+
+            if FillupService._is_trusted_anchor(fillup):
+                anchor_odometer = fillup.odometer
+                chain_gallons = []
+                chain_broken = False
+            elif (
+                fillup.missed_previous or fillup.gallons is None or fillup.gallons <= 0
+            ):
+                chain_broken = True
+            elif not chain_broken:
+                chain_gallons.append(float(fillup.gallons))
+
+        return results
+
+    @staticmethod
+    async def _write_fillup_stats(
+        updates: list[tuple[PydanticObjectId, dict[str, Any]]],
+    ) -> int:
+        """Persist derived stat changes in a single bulk write."""
+        if not updates:
+            return 0
+
+        modified, _ = await bulk_write_updates(
+            GasFillup.get_pymongo_collection(),
+            [
+                ({"_id": fillup_id}, {"$set": fields}, False)
+                for fillup_id, fields in updates
+            ],
+        )
+        return modified
+
     @staticmethod
     async def recalculate_subsequent_fillup(
         imei: str,
@@ -656,10 +743,11 @@ class FillupService:
         anchor_id: PydanticObjectId | None = None,
     ) -> None:
         """
-        Finds the next fill-up after 'after_time' and recalculates its MPG/distance
-        stats.
+        Recalculate MPG/distance stats for every fill-up after 'after_time'.
 
-        This ensures cascading recalculation when fill-ups are inserted, updated, or deleted.
+        Loads the vehicle's fill-up timeline once, recomputes derived fields in
+        memory and writes only rows whose stats changed, so cascades after
+        inserts, updates, or deletes cost a fixed number of round trips.
 
         Args:
             imei: Vehicle IMEI
@@ -670,53 +758,61 @@ class FillupService:
             return
 
         try:
-            cursor_time = after_time
-            cursor_anchor_id = anchor_id
-            recalculated = 0
-
-            # Recalculate forward through the timeline so downstream entries do
-            # not keep stale anchors after edits/deletes.
-            while recalculated < FillupService._MAX_CHAIN_LOOKBACK:
-                next_fillup = await FillupService._get_next_fillup(
-                    imei=imei,
-                    after_time=cursor_time,
-                    anchor_id=cursor_anchor_id,
-                    exclude_id=cursor_anchor_id,
+            timeline = (
+                await GasFillup.find(
+                    {"imei": imei, "fillup_time": {"$ne": None}},
                 )
-
-                if not next_fillup or next_fillup.fillup_time is None:
-                    break
-
-                (
-                    calculated_mpg,
-                    miles_since_last,
-                    previous_odometer,
-                ) = await FillupService._calculate_fillup_stats(
-                    imei=imei,
-                    fillup_time=next_fillup.fillup_time,
-                    current_id=next_fillup.id,
-                    current_odometer=next_fillup.odometer,
-                    current_gallons=next_fillup.gallons,
-                    is_full_tank=next_fillup.is_full_tank,
-                    missed_previous=next_fillup.missed_previous,
+                .sort(FillupService._sort_asc())
+                .to_list()
+            )
+            cutoff = ensure_utc(after_time)
+
+            def _is_after(fillup: GasFillup) -> bool:
+                fillup_time = ensure_utc(fillup.fillup_time)
+                if anchor_id is None:
+                    # When no anchor exists (e.g. deleted record), include
+                    # same-time rows.
+                    return fillup_time >= cutoff
+                return fillup_time > cutoff or (
+                    fillup_time == cutoff and fillup.id > anchor_id
                 )
 
-                next_fillup.calculated_mpg = calculated_mpg
-                next_fillup.miles_since_last_fillup = miles_since_last
-                next_fillup.previous_odometer = previous_odometer
-                await next_fillup.save()
-                logger.info("Recalculated stats for fill-up %s", next_fillup.id)
-
-                recalculated += 1
-                cursor_time = next_fillup.fillup_time
-                cursor_anchor_id = next_fillup.id
+            start_index = next(
+                (i for i, fillup in enumerate(timeline) if _is_after(fillup)),
+                len(timeline),
+            )
+            stats = FillupService._timeline_stats(timeline, start_index)
+
+            updates: list[tuple[PydanticObjectId, dict[str, Any]]] = []
+            for fillup, (mpg, miles, previous_odometer) in zip(
+                timeline[start_index:],
+                stats,
+                strict=True,
+            ):
+                if (
+                    fillup.calculated_mpg == mpg
+                    and fillup.miles_since_last_fillup == miles
+                    and fillup.previous_odometer == previous_odometer
+                ):
+                    continue
+                updates.append(
+                    (
+                        fillup.id,
+                        {
+                            "calculated_mpg": mpg,
+                            "miles_since_last_fillup": miles,
+                            "previous_odometer": previous_odometer,
+                        },
+                    ),
+                )
 
-            if recalculated >= FillupService._MAX_CHAIN_LOOKBACK:
-                logger.warning(
-                    "Stopping fill-up recalc cascade after %d entries for IMEI=%s after_time=%s",
-                    FillupService._MAX_CHAIN_LOOKBACK,
+            await FillupService._write_fillup_stats(updates)
+            if updates:
+                logger.info(
+                    "Recalculated stats for %d of %d fill-ups for IMEI=%s",
+                    len(updates),
+                    len(timeline) - start_index,
                     imei,
-                    after_time,
                 )
         except Exception as exc:
             logger.exception("Error recalculating subsequent fillup")
@@ -5,6 +5,7 @@ from datetime import datetime
 from itertools import pairwise
 from typing import Any
 
+from analytics.services.trip_distance_series import TripDistanceSeriesService
 from core.date_utils import parse_timestamp
 from core.exceptions import ValidationException
 from core.spatial import GeometryService
@@ -413,7 +414,12 @@ class OdometerService:
         start_time: datetime,
         end_time: datetime,
     ) -> float:
-        """Sum distance across an interval, prorating partially overlapping trips."""
+        """
+        Sum distance across an interval, prorating partially overlapping trips.
+
+        Reads two points of the cumulative distance series when it has been
+        built, and otherwise scans the overlapping trips.
+        """
         start_time = parse_timestamp(start_time)
         end_time = parse_timestamp(end_time)
         if start_time is None or end_time is None:
@@ -422,6 +428,14 @@ class OdometerService:
         if start_time >= end_time:
             return 0.0
 
+        series_distance = await TripDistanceSeriesService.distance_between(
+            imei,
+            start_time,
+            end_time,
+        )
+        if series_distance is not None:
+            return series_distance
+
         overlapping_trips = await (
             Trip.find(
                 enforce_bouncie_source(
@@ -0,0 +1,597 @@
+"""
+Prepared county/state/city boundary set for geo coverage.
+
+Decoding the county TopoJSON, repairing every polygon and building the
+STRtrees is the most expensive fixed cost of a geo coverage run, and the
+Region Explorer read paths need the same decoded shapes. The index built here
+is tagged with a boundary version (county topology timestamp plus city
+boundary count/timestamp), memoized per process and shared by the
+recalculation task and the API. When ``GEO_BOUNDARY_CACHE_DIR`` is set, the
+repaired geometries are also written there as WKB so a fresh process can skip
+the decode entirely.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import shapely
+from shapely import STRtree
+from shapely.geometry import shape
+
+from core.serialization import serialize_datetime
+from core.spatial import validate_and_fix_geometry
+from county.services.county_data_service import (
+    DEFAULT_TOPOLOGY_VARIANT,
+    TOPOLOGY_VARIANTS,
+    get_county_topology_document,
+)
+from county.services.topojson_utils import topojson_to_geojson
+from db.aggregation import aggregate_to_list
+from db.models import CityBoundary, CountyTopology
+
+logger = logging.getLogger(__name__)
+
+GEO_BOUNDARY_CACHE_DIR = os.getenv("GEO_BOUNDARY_CACHE_DIR", "").strip()
+GEO_BOUNDARY_VERSION_TTL_SECONDS = float(
+    os.getenv("GEO_BOUNDARY_VERSION_TTL_SECONDS", "60"),
+)
+_CACHE_FILE_PREFIX = "geo-boundaries-"
+# Bump when the cached metadata layout changes so old files are rebuilt.
+_CACHE_FORMAT = 2
+
+
+def _state_fips(value: str | None) -> str:
+    raw = str(value or "").strip()
+    if raw.isdigit() and len(raw) <= 2:
+        return raw.zfill(2)
+    return raw
+
+
+def _valid_state_fips(value: str | None) -> str | None:
+    normalized = _state_fips(value)
+    if len(normalized) == 2 and normalized.isdigit():
+        return normalized
+    return None
+
+
+def _county_fips(value: Any) -> str | None:
+    raw = str(value if value is not None else "").strip()
+    if not raw.isdigit() or len(raw) > 5:
+        return None
+    return raw.zfill(5)
+
+
+def _valid_boundary_geometry(value: Any) -> Any | None:
+    if not isinstance(value, dict):
+        return None
+    try:
+        return validate_and_fix_geometry(shape(value))
+    except Exception:
+        return None
+
+
+@dataclass(frozen=True)
+class BoundaryLayer:
+    """Prepared boundary polygons with an STRtree over them."""
+
+    ids: tuple[str, ...]
+    shapes: np.ndarray
+    tree: STRtree | None
+
+    @classmethod
+    def build(cls, ids: list[str], shapes: list[Any]) -> BoundaryLayer:
+        geometries = np.empty(len(shapes), dtype=object)
+        geometries[:] = shapes
+        shapely.prepare(geometries)
+        tree = STRtree(geometries) if len(geometries) else None
+        return cls(ids=tuple(ids), shapes=geometries, tree=tree)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def copy(self) -> BoundaryLayer:
+        """Return an independent copy (GEOS prepared state is not shared)."""
+        return BoundaryLayer.build(
+            list(self.ids),
+            list(shapely.from_wkb(shapely.to_wkb(self.shapes))),
+        )
+
+    def to_wkb(self) -> tuple[np.ndarray, np.ndarray]:
+        """Pack the shapes into one WKB byte buffer plus end offsets."""
+        blobs = shapely.to_wkb(self.shapes) if len(self.shapes) else []
+        offsets = np.cumsum([len(blob) for blob in blobs], dtype=np.int64)
+        buffer = np.frombuffer(b"".join(blobs), dtype=np.uint8)
+        return buffer, offsets
+
+    @classmethod
+    def from_wkb(
+        cls,
+        ids: list[str],
+        buffer: np.ndarray,
+        offsets: np.ndarray,
+    ) -> BoundaryLayer:
+        raw = buffer.tobytes()
+        starts = np.concatenate(([0], offsets[:-1])) if len(offsets) else []
+        blobs = [
+            raw[int(start) : int(end)]
+            for start, end in zip(starts, offsets, strict=True)
+        ]
+        return cls.build(ids, list(shapely.from_wkb(blobs)) if blobs else [])
+
+    def intersecting(self, geometry: Any) -> list[str]:
+        """Return ids of boundaries that intersect ``geometry``."""
+        if self.tree is None:
+            return []
+        candidates = self.tree.query(geometry)
+        if not len(candidates):
+            return []
+        hits = candidates[shapely.intersects(self.shapes[candidates], geometry)]
+        return [self.ids[idx] for idx in hits]
+
+    def covering(self, point: Any) -> list[str]:
+        """Return ids of boundaries that cover ``point`` (edges included)."""
+        if self.tree is None:
+            return []
+        candidates = self.tree.query(point)
+        if not len(candidates):
+            return []
+        hits = candidates[shapely.covers(self.shapes[candidates], point)]
+        return [self.ids[idx] for idx in hits]
+
+
+_LAYERS = ("counties", "states", "cities")
+
+
+@dataclass(frozen=True)
+class GeoBoundaryIndex:
+    """County, state and city boundary layers plus the metadata derived from them."""
+
+    version: str
+    counties: BoundaryLayer
+    cities: BoundaryLayer
+    state_names: dict[str, str]
+    county_totals_by_state: dict[str, int]
+    city_state_index: dict[str, str]
+    city_state_names: dict[str, str]
+    city_totals_by_state: dict[str, int]
+    invalid_counties: int = 0
+    invalid_cities: int = 0
+    states: BoundaryLayer = field(default_factory=lambda: BoundaryLayer.build([], []))
+    city_properties: dict[str, dict[str, Any]] = field(default_factory=dict)
+    _city_features: dict[str, list[dict[str, Any]]] = field(
+        default_factory=dict,
+        repr=False,
+        compare=False,
+    )
+    _city_rows: dict[str, list[dict[str, Any]]] = field(
+        default_factory=dict,
+        repr=False,
+        compare=False,
+    )
+
+    def copy(self) -> GeoBoundaryIndex:
+        return GeoBoundaryIndex(
+            version=self.version,
+            counties=self.counties.copy(),
+            cities=self.cities.copy(),
+            state_names=self.state_names,
+            county_totals_by_state=self.county_totals_by_state,
+            city_state_index=self.city_state_index,
+            city_state_names=self.city_state_names,
+            city_totals_by_state=self.city_totals_by_state,
+            invalid_counties=self.invalid_counties,
+            invalid_cities=self.invalid_cities,
+            states=self.states.copy(),
+            city_properties=self.city_properties,
+        )
+
+    def state_features(self) -> list[dict[str, Any]]:
+        """GeoJSON features for every valid state boundary."""
+        return [
+            {
+                "type": "Feature",
+                "id": state_fips,
+                "properties": {
+                    "stateFips": state_fips,
+                    "name": self.state_names.get(state_fips, "Unknown"),
+                },
+                "geometry": geom.__geo_interface__,
+            }
+            for state_fips, geom in zip(
+                self.states.ids,
+                self.states.shapes,
+                strict=True,
+            )
+        ]
+
+    def city_features(self, state_fips: str) -> list[dict[str, Any]]:
+        """Name-sorted GeoJSON features for one state's cities (memoized)."""
+        cached = self._city_features.get(state_fips)
+        if cached is not None:
+            return cached
+
+        features = []
+        for city_id, geom in zip(self.cities.ids, self.cities.shapes, strict=True):
+            if self.city_state_index.get(city_id) != state_fips:
+                continue
+            props = self.city_properties.get(city_id) or {}
+            features.append(
+                {
+                    "type": "Feature",
+                    "id": city_id,
+                    "properties": {
+                        "cityId": city_id,
+                        "name": props.get("name"),
+                        "stateFips": state_fips,
+                        "stateName": props.get("stateName"),
+                        "classfp": props.get("classfp"),
+                    },
+                    "geometry": geom.__geo_interface__,
+                }
+            )
+        features.sort(key=lambda feature: str(feature["properties"]["name"] or ""))
+        self._city_features[state_fips] = features
+        return features
+
+    def city_rows(self, state_fips: str) -> list[dict[str, Any]]:
+        """Name-sorted id/name/bbox rows for one state's cities (memoized)."""
+        cached = self._city_rows.get(state_fips)
+        if cached is not None:
+            return cached
+
+        rows = []
+        for city_id in self.cities.ids:
+            if self.city_state_index.get(city_id) != state_fips:
+                continue
+            props = self.city_properties.get(city_id) or {}
+            rows.append(
+                {
+                    "cityId": city_id,
+                    "name": props.get("name") or "",
+                    "stateFips": state_fips,
+                    "stateName": props.get("stateName"),
+                    "bbox": props.get("bbox"),
+                    "centroid": props.get("centroid"),
+                }
+            )
+        rows.sort(key=lambda row: row["name"])
+        self._city_rows[state_fips] = rows
+        return rows
+
+    def _metadata(self) -> dict[str, Any]:
+        return {
+            "version": self.version,
+            "ids": {layer: list(getattr(self, layer).ids) for layer in _LAYERS},
+            "state_names": self.state_names,
+            "county_totals_by_state": self.county_totals_by_state,
+            "city_state_index": self.city_state_index,
+            "city_state_names": self.city_state_names,
+            "city_totals_by_state": self.city_totals_by_state,
+            "city_properties": self.city_properties,
+            "invalid_counties": self.invalid_counties,
+            "invalid_cities": self.invalid_cities,
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the repaired geometries as WKB plus JSON metadata (atomic)."""
+        arrays: dict[str, np.ndarray] = {
+            "metadata": np.frombuffer(
+                json.dumps(self._metadata()).encode("utf-8"),
+                dtype=np.uint8,
+            ),
+        }
+        for layer in _LAYERS:
+            buffer, offsets = getattr(self, layer).to_wkb()
+            arrays[f"{layer}_wkb"] = buffer
+            arrays[f"{layer}_offsets"] = offsets
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("wb") as handle:
+            np.savez(handle, **arrays)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> GeoBoundaryIndex:
+        with np.load(path, allow_pickle=False) as data:
+            metadata = json.loads(data["metadata"].tobytes().decode("utf-8"))
+            layers = {
+                layer: BoundaryLayer.from_wkb(
+                    metadata["ids"][layer],
+                    data[f"{layer}_wkb"],
+                    data[f"{layer}_offsets"],
+                )
+                for layer in _LAYERS
+            }
+        return cls(
+            version=metadata["version"],
+            counties=layers["counties"],
+            states=layers["states"],
+            cities=layers["cities"],
+            state_names=metadata["state_names"],
+            county_totals_by_state=metadata["county_totals_by_state"],
+            city_state_index=metadata["city_state_index"],
+            city_state_names=metadata["city_state_names"],
+            city_totals_by_state=metadata["city_totals_by_state"],
+            city_properties=metadata["city_properties"],
+            invalid_counties=int(metadata["invalid_counties"]),
+            invalid_cities=int(metadata["invalid_cities"]),
+        )
+
+
+def build_geo_boundary_index(
+    topology: dict[str, Any],
+    city_docs: list[dict[str, Any]],
+    *,
+    version: str,
+) -> GeoBoundaryIndex:
+    """Decode, validate and prepare county/state/city boundaries (CPU bound)."""
+    state_names: dict[str, str] = {}
+    state_shapes: list[Any] = []
+    state_ids: list[str] = []
+    for feature in topojson_to_geojson(topology, "states"):
+        state_fips = _valid_state_fips(feature.get("id"))
+        if not state_fips:
+            continue
+        props = feature.get("properties") or {}
+        state_names[state_fips] = str(
+            props.get("name") or props.get("state") or "Unknown"
+        )
+        geom = _valid_boundary_geometry(feature.get("geometry"))
+        if geom is not None:
+            state_shapes.append(geom)
+            state_ids.append(state_fips)
+
+    county_shapes: list[Any] = []
+    county_ids: list[str] = []
+    county_totals_by_state: dict[str, int] = {}
+    invalid_counties = 0
+    for feature in topojson_to_geojson(topology, "counties"):
+        county_id = _county_fips(feature.get("id"))
+        geom = _valid_boundary_geometry(feature.get("geometry"))
+        if county_id is None or geom is None:
+            invalid_counties += 1
+            continue
+        county_shapes.append(geom)
+        county_ids.append(county_id)
+        state_fips = county_id[:2]
+        county_totals_by_state[state_fips] = (
+            county_totals_by_state.get(state_fips, 0) + 1
+        )
+
+    city_shapes: list[Any] = []
+    city_ids: list[str] = []
+    city_state_index: dict[str, str] = {}
+    city_state_names: dict[str, str] = {}
+    city_totals_by_state: dict[str, int] = {}
+    city_properties: dict[str, dict[str, Any]] = {}
+    invalid_cities = 0
+    for city in city_docs:
+        city_id = city.get("_id")
+        state_fips = _valid_state_fips(city.get("state_fips"))
+        geom = _valid_boundary_geometry(city.get("geometry"))
+        if city_id is None or state_fips is None or geom is None:
+            invalid_cities += 1
+            continue
+        city_id = str(city_id)
+        city_shapes.append(geom)
+        city_ids.append(city_id)
+        city_state_index[city_id] = state_fips
+        city_properties[city_id] = {
+            "name": city.get("name"),
+            "stateName": city.get("state_name"),
+            "classfp": city.get("classfp"),
+            "bbox": city.get("bbox"),
+            "centroid": city.get("centroid"),
+        }
+        city_totals_by_state[state_fips] = city_totals_by_state.get(state_fips, 0) + 1
+        city_state_names[state_fips] = city.get("state_name") or city_state_names.get(
+            state_fips,
+            "Unknown",
+        )
+
+    return GeoBoundaryIndex(
+        version=version,
+        counties=BoundaryLayer.build(county_ids, county_shapes),
+        states=BoundaryLayer.build(state_ids, state_shapes),
+        cities=BoundaryLayer.build(city_ids, city_shapes),
+        city_properties=city_properties,
+        state_names=state_names,
+        county_totals_by_state=county_totals_by_state,
+        city_state_index=city_state_index,
+        city_state_names=city_state_names,
+        city_totals_by_state=city_totals_by_state,
+        invalid_counties=invalid_counties,
+        invalid_cities=invalid_cities,
+    )
+
+
+async def get_boundary_version() -> str:
+    """Cheap version token for the stored county topology and city boundaries."""
+    topology_id = TOPOLOGY_VARIANTS[DEFAULT_TOPOLOGY_VARIANT]["id"]
+    topology_doc = await CountyTopology.get_pymongo_collection().find_one(
+        {"_id": topology_id},
+        {"updated_at": 1},
+    )
+    city_rows = await aggregate_to_list(
+        CityBoundary,
+        [
+            {
+                "$group": {
+                    "_id": None,
+                    "count": {"$sum": 1},
+                    "updatedAt": {"$max": "$updated_at"},
+                },
+            },
+        ],
+    )
+    city_stats = city_rows[0] if city_rows else {}
+    topology_stamp = (
+        serialize_datetime((topology_doc or {}).get("updated_at")) or "missing"
+    )
+    city_stamp = serialize_datetime(city_stats.get("updatedAt")) or "none"
+    return (
+        f"{topology_id}:{topology_stamp}"
+        f"|cities:{int(city_stats.get('count') or 0)}:{city_stamp}"
+    )
+
+
+_index: GeoBoundaryIndex | None = None
+_index_lock = asyncio.Lock()
+_version_checked_at = 0.0
+
+
+def _cache_path(version: str) -> Path | None:
+    if not GEO_BOUNDARY_CACHE_DIR:
+        return None
+    digest = hashlib.sha256(f"{_CACHE_FORMAT}:{version}".encode()).hexdigest()[:16]
+    return Path(GEO_BOUNDARY_CACHE_DIR) / f"{_CACHE_FILE_PREFIX}{digest}.npz"
+
+
+def _load_cached_index(path: Path, version: str) -> GeoBoundaryIndex | None:
+    if not path.exists():
+        return None
+    try:
+        index = GeoBoundaryIndex.load(path)
+    except Exception as exc:
+        logger.warning(
+            "Geo coverage: ignoring unreadable boundary cache %s: %s", path, exc
+        )
+        return None
+    return index if index.version == version else None
+
+
+def _store_cached_index(path: Path, index: GeoBoundaryIndex) -> None:
+    try:
+        index.save(path)
+        for stale in path.parent.glob(f"{_CACHE_FILE_PREFIX}*.npz"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("Geo coverage: could not write boundary cache %s: %s", path, exc)
+
+
+async def _build_index(version: str) -> GeoBoundaryIndex:
+    document = await get_county_topology_document()
+    if not document or "topology" not in document:
+        msg = "County topology could not be loaded from database"
+        raise RuntimeError(msg)
+    city_docs = (
+        await CityBoundary.get_pymongo_collection()
+        .find(
+            {},
+            {
+                "name": 1,
+                "state_fips": 1,
+                "state_name": 1,
+                "classfp": 1,
+                "bbox": 1,
+                "centroid": 1,
+                "geometry": 1,
+            },
+        )
+        .to_list(None)
+    )
+    return await asyncio.to_thread(
+        build_geo_boundary_index,
+        document["topology"],
+        city_docs,
+        version=version,
+    )
+
+
+async def get_geo_boundary_index(*, revalidate: bool = False) -> GeoBoundaryIndex:
+    """
+    Return the shared boundary index, rebuilding it only on version change.
+
+    Read paths reuse the memoized index for ``GEO_BOUNDARY_VERSION_TTL_SECONDS``
+    before re-checking the version; ``revalidate=True`` always re-checks.
+    """
+    global _index, _version_checked_at
+
+    if (
+        _index is not None
+        and not revalidate
+        and time.monotonic() - _version_checked_at < GEO_BOUNDARY_VERSION_TTL_SECONDS
+    ):
+        return _index
+
+    version = await get_boundary_version()
+    if _index is not None and _index.version == version:
+        _version_checked_at = time.monotonic()
+        return _index
+
+    async with _index_lock:
+        if _index is not None and _index.version == version:
+            return _index
+
+        path = _cache_path(version)
+        index = (
+            await asyncio.to_thread(_load_cached_index, path, version)
+            if path is not None
+            else None
+        )
+        if index is None:
+            index = await _build_index(version)
+            if path is not None:
+                await asyncio.to_thread(_store_cached_index, path, index)
+            source = "built"
+        else:
+            source = "loaded"
+
+        logger.info(
+            "Geo coverage: %s boundary index %s (%d counties, %d invalid; "
+            "%d states; %d cities, %d invalid)",
+            source,
+            version,
+            len(index.counties),
+            index.invalid_counties,
+            len(index.states),
+            len(index.cities),
+            index.invalid_cities,
+        )
+        _index = index
+        _version_checked_at = time.monotonic()
+        return index
+
+
+def reset_geo_boundary_index() -> None:
+    """Forget the memoized index (tests and topology refreshes)."""
+    global _index, _version_checked_at
+    _index = None
+    _version_checked_at = 0.0
+
+
+_worker_state = threading.local()
+
+
+def init_boundary_worker(index: GeoBoundaryIndex) -> None:
+    """Thread-pool initializer giving each worker its own prepared geometries."""
+    _worker_state.index = index.copy()
+
+
+def worker_boundary_index() -> GeoBoundaryIndex:
+    return _worker_state.index
+
+
+__all__ = [
+    "BoundaryLayer",
+    "GeoBoundaryIndex",
+    "build_geo_boundary_index",
+    "get_boundary_version",
+    "get_geo_boundary_index",
+    "init_boundary_worker",
+    "reset_geo_boundary_index",
+    "worker_boundary_index",
+]
@@ -2,24 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal
 
+from bson import ObjectId
 from fastapi import BackgroundTasks, HTTPException, status
-from shapely import STRtree
 from shapely.geometry import Point, shape
 
 from core.date_utils import parse_timestamp
 from core.job_serialization import serialize_job_payload
 from core.jobs import resolve_job_reference
 from core.serialization import serialize_datetime
-from core.spatial import coerce_coordinate_pair, validate_and_fix_geometry
+from core.spatial import coerce_coordinate_pair
 from core.trip_query_spec import apply_trip_record_filters
 from core.trip_source_policy import enforce_bouncie_source
 from county.services.county_data_service import get_county_topology_document
-from county.services.topojson_utils import topojson_to_geojson
 from db.models import (
     CityBoundary,
     CityVisitedCache,
@@ -28,34 +30,64 @@ from db.models import (
     StateBoundaryCache,
     Trip,
 )
+from geo_coverage.services.boundary_index import (
+    GeoBoundaryIndex,
+    _county_fips,
+    _valid_boundary_geometry,
+    _valid_state_fips,
+    get_geo_boundary_index,
+    init_boundary_worker,
+    worker_boundary_index,
+)
 
 logger = logging.getLogger(__name__)
 
+GeoRecalcMode = Literal["full", "incremental"]
+
 GEO_COVERAGE_JOB_TYPE = "geo_coverage_recalc"
 GEO_RECALC_ACTIVE_STATUSES: set[str] = {"pending", "running"}
 GEO_RECALC_STALE_AFTER_SECONDS = int(
     os.getenv("GEO_RECALC_STALE_AFTER_SECONDS", str(6 * 60 * 60))
 )
 
+# Incremental syncs still fall back to a full rebuild this often so trips that
+# were deleted or deactivated eventually drop out of the caches.
+GEO_FULL_REBUILD_INTERVAL_SECONDS = int(
+    os.getenv("GEO_FULL_REBUILD_INTERVAL_SECONDS", str(24 * 60 * 60))
+)
+GEO_COVERAGE_MAX_WORKERS = max(
+    1, min(int(os.getenv("GEO_COVERAGE_MAX_WORKERS", "4")), 8)
+)
+GEO_PARALLEL_MIN_TRIPS = int(os.getenv("GEO_COVERAGE_PARALLEL_MIN_TRIPS", "2000"))
+GEO_TRIP_BATCH_SIZE = 500
+
 _SUPPORTED_GEO_TYPES: set[str] = {"LineString", "MultiLineString", "Point"}
+_TRIP_PROJECTION: dict[str, int] = {
+    "_id": 0,
+    "transactionId": 1,
+    "startTime": 1,
+    "endTime": 1,
+    "gps": 1,
+    "matchedGps": 1,
+}
 
 
 def _is_supported_geojson_geometry(value: Any) -> bool:
     return isinstance(value, dict) and value.get("type") in _SUPPORTED_GEO_TYPES
 
 
-def _select_trip_geometry(trip: Trip) -> dict[str, Any] | None:
+def _select_trip_geometry(trip_doc: dict[str, Any]) -> dict[str, Any] | None:
     """
     Return the best geometry for geo coverage processing.
 
     Prefer map-matched geometry when it is a supported type; otherwise
     fall back to raw trip GPS if available.
     """
-    matched = trip.matchedGps
+    matched = trip_doc.get("matchedGps")
     if _is_supported_geojson_geometry(matched):
         return matched
 
-    raw = trip.gps
+    raw = trip_doc.get("gps")
     if _is_supported_geojson_geometry(raw):
         return raw
 
@@ -81,29 +113,6 @@ def _record_visit(
         visit_map[key]["lastVisit"] = visit_time
 
 
-def _record_boundary_visits(
-    *,
-    trip_geometry: Any,
-    boundary_tree: STRtree | None,
-    boundary_index_lookup: dict[int, int],
-    boundary_shapes: list[Any],
-    boundary_ids: list[str],
-    visit_map: dict[str, dict[str, datetime | None]],
-    visit_time: datetime | None,
-) -> None:
-    """Record every boundary intersected by any supported trip geometry."""
-    if boundary_tree is None:
-        return
-    for idx in _iter_tree_indexes(
-        boundary_tree,
-        boundary_index_lookup,
-        len(boundary_shapes),
-        trip_geometry,
-    ):
-        if boundary_shapes[idx].intersects(trip_geometry):
-            _record_visit(visit_map, boundary_ids[idx], visit_time)
-
-
 def _extract_stop_points(
     gps_data: dict[str, Any] | None,
     trip_start_time: datetime | None,
@@ -175,36 +184,6 @@ def _percent(visited: int, total: int) -> float:
     return round((visited / total) * 100.0, 2)
 
 
-def _state_fips(value: str | None) -> str:
-    raw = str(value or "").strip()
-    if raw.isdigit() and len(raw) <= 2:
-        return raw.zfill(2)
-    return raw
-
-
-def _valid_state_fips(value: str | None) -> str | None:
-    normalized = _state_fips(value)
-    if len(normalized) == 2 and normalized.isdigit():
-        return normalized
-    return None
-
-
-def _county_fips(value: Any) -> str | None:
-    raw = str(value if value is not None else "").strip()
-    if not raw.isdigit() or len(raw) > 5:
-        return None
-    return raw.zfill(5)
-
-
-def _valid_boundary_geometry(value: Any) -> Any | None:
-    if not isinstance(value, dict):
-        return None
-    try:
-        return validate_and_fix_geometry(shape(value))
-    except Exception:
-        return None
-
-
 def _serialize_visit_map(
     raw_map: dict[str, dict[str, datetime | None]],
 ) -> dict[str, dict[str, str | None]]:
@@ -229,6 +208,22 @@ def _serialize_stop_map(
     }
 
 
+def _deserialize_visit_map(
+    raw_map: dict[str, Any] | None,
+    suffix: Literal["Visit", "Stop"],
+) -> dict[str, dict[str, datetime | None]]:
+    """Invert ``_serialize_visit_map``/``_serialize_stop_map`` for merging."""
+    result: dict[str, dict[str, datetime | None]] = {}
+    for key, payload in (raw_map or {}).items():
+        if not isinstance(payload, dict):
+            continue
+        result[key] = {
+            "firstVisit": parse_timestamp(payload.get(f"first{suffix}")),
+            "lastVisit": parse_timestamp(payload.get(f"last{suffix}")),
+        }
+    return result
+
+
 def _build_trip_query() -> dict[str, Any]:
     geometry_filter = apply_trip_record_filters(
         {
@@ -248,6 +243,18 @@ def _build_trip_query() -> dict[str, Any]:
     return enforce_bouncie_source(geometry_filter)
 
 
+async def _count_new_trips(trip_query: dict[str, Any], since: datetime) -> int:
+    """
+    Count trips in an incremental scan that were created after ``since``.
+
+    Trips re-saved since the last sync were already counted then, so only
+    those whose ``_id`` postdates the high-water mark add to the total.
+    """
+    return await Trip.find(
+        {**trip_query, "_id": {"$gt": ObjectId.from_datetime(since)}},
+    ).count()
+
+
 def _serialize_job(job: Job | None) -> dict[str, Any] | None:
     if not job:
         return None
@@ -260,7 +267,7 @@ def _serialize_job(job: Job | None) -> dict[str, Any] | None:
         "progress": payload["progress"],
         "message": payload["message"] or "",
         "error": payload["error"],
-        "mode": "full",
+        "mode": (job.metadata or {}).get("mode") or "full",
         "createdAt": payload["created_at"],
         "startedAt": payload["started_at"],
         "updatedAt": payload["updated_at"],
@@ -406,28 +413,10 @@ async def _get_state_feature_collection() -> dict[str, Any]:
     if cache and cache.feature_collection:
         return cache.feature_collection
 
-    topology_document = await _get_county_topology_payload()
-    topology = topology_document["topology"]
-    states_geojson = topojson_to_geojson(topology, "states")
-
-    features = []
-    for feature in states_geojson:
-        state_fips = str(feature.get("id", "")).zfill(2)
-        props = dict(feature.get("properties") or {})
-        props["stateFips"] = state_fips
-        props.setdefault("name", props.get("state") or "Unknown")
-        features.append(
-            {
-                "type": "Feature",
-                "id": state_fips,
-                "properties": props,
-                "geometry": feature.get("geometry"),
-            }
-        )
-
+    index = await get_geo_boundary_index()
     feature_collection = {
         "type": "FeatureCollection",
-        "features": features,
+        "features": index.state_features(),
     }
 
     new_doc = StateBoundaryCache(
@@ -440,38 +429,439 @@ async def _get_state_feature_collection() -> dict[str, Any]:
     return feature_collection
 
 
-def _build_query_index(geometries: list[Any]) -> dict[int, int]:
-    return {id(geom): idx for idx, geom in enumerate(geometries)}
+@dataclass(frozen=True)
+class _TripBoundaryHits:
+    """Boundary ids touched by one trip, computed off the event loop."""
 
+    visit_time: datetime | None
+    counties: list[str]
+    cities: list[str]
+    county_stops: list[tuple[str, datetime | None]]
+    city_stops: list[tuple[str, datetime | None]]
 
-def _iter_tree_indexes(
-    tree: STRtree,
-    index_lookup: dict[int, int],
-    candidate_count: int,
-    query_geom: Any,
-):
-    for raw in tree.query(query_geom):
-        try:
-            idx = int(raw)
-            if 0 <= idx < candidate_count:
-                yield idx
-                continue
-        except (TypeError, ValueError):
-            pass
 
-        idx = index_lookup.get(id(raw))
-        if idx is not None:
-            yield idx
+def _evaluate_trip(
+    index: GeoBoundaryIndex,
+    trip_doc: dict[str, Any],
+) -> _TripBoundaryHits | None:
+    gps_data = _select_trip_geometry(trip_doc)
+    if not gps_data:
+        return None
+
+    trip_start_time = parse_timestamp(trip_doc.get("startTime"))
+    trip_end_time = parse_timestamp(trip_doc.get("endTime"))
+    trip_time = trip_start_time or trip_end_time
+
+    try:
+        trip_geom = shape(gps_data)
+        county_stops: list[tuple[str, datetime | None]] = []
+        city_stops: list[tuple[str, datetime | None]] = []
+        for point, stop_time in _extract_stop_points(
+            gps_data,
+            trip_start_time,
+            trip_end_time,
+            trip_time,
+        ):
+            county_stops.extend(
+                (county_id, stop_time) for county_id in index.counties.covering(point)
+            )
+            city_stops.extend(
+                (city_id, stop_time) for city_id in index.cities.covering(point)
+            )
+        return _TripBoundaryHits(
+            visit_time=trip_time,
+            counties=index.counties.intersecting(trip_geom),
+            cities=index.cities.intersecting(trip_geom),
+            county_stops=county_stops,
+            city_stops=city_stops,
+        )
+    except Exception as exc:
+        logger.warning(
+            "Geo coverage: error processing trip %s: %s",
+            trip_doc.get("transactionId") or "unknown",
+            exc,
+        )
+        return None
+
+
+def _evaluate_trip_batch(
+    index: GeoBoundaryIndex,
+    trip_docs: list[dict[str, Any]],
+) -> list[_TripBoundaryHits | None]:
+    return [_evaluate_trip(index, trip_doc) for trip_doc in trip_docs]
+
+
+def _evaluate_trip_batch_in_worker(
+    trip_docs: list[dict[str, Any]],
+) -> list[_TripBoundaryHits | None]:
+    return _evaluate_trip_batch(worker_boundary_index(), trip_docs)
+
+
+@dataclass
+class _GeoVisitMaps:
+    """Accumulated first/last visit and stop times keyed by boundary id."""
+
+    county_visits: dict[str, dict[str, datetime | None]] = field(default_factory=dict)
+    county_stops: dict[str, dict[str, datetime | None]] = field(default_factory=dict)
+    city_visits: dict[str, dict[str, datetime | None]] = field(default_factory=dict)
+    city_stops: dict[str, dict[str, datetime | None]] = field(default_factory=dict)
+
+    @classmethod
+    def from_caches(
+        cls,
+        county_cache: CountyVisitedCache,
+        city_cache: CityVisitedCache,
+    ) -> _GeoVisitMaps:
+        return cls(
+            county_visits=_deserialize_visit_map(county_cache.counties, "Visit"),
+            county_stops=_deserialize_visit_map(county_cache.stopped_counties, "Stop"),
+            city_visits=_deserialize_visit_map(city_cache.cities, "Visit"),
+            city_stops=_deserialize_visit_map(city_cache.stopped_cities, "Stop"),
+        )
+
+    def merge(self, hits: _TripBoundaryHits) -> None:
+        for county_id in hits.counties:
+            _record_visit(self.county_visits, county_id, hits.visit_time)
+        for city_id in hits.cities:
+            _record_visit(self.city_visits, city_id, hits.visit_time)
+        for county_id, stop_time in hits.county_stops:
+            _record_visit(self.county_stops, county_id, stop_time)
+        for city_id, stop_time in hits.city_stops:
+            _record_visit(self.city_stops, city_id, stop_time)
+
+    def retain_cities(self, valid_city_ids: set[str]) -> None:
+        self.city_visits = {
+            city_id: visits
+            for city_id, visits in self.city_visits.items()
+            if city_id in valid_city_ids
+        }
+        self.city_stops = {
+            city_id: stops
+            for city_id, stops in self.city_stops.items()
+            if city_id in valid_city_ids
+        }
+
+
+def _geo_metrics(
+    mode: str,
+    *,
+    processed_trips: int,
+    total_trips: int,
+    maps: _GeoVisitMaps,
+) -> dict[str, Any]:
+    return {
+        "mode": mode,
+        "processedTrips": processed_trips,
+        "totalTrips": total_trips,
+        "visitedCounties": len(maps.county_visits),
+        "stoppedCounties": len(maps.county_stops),
+        "visitedCities": len(maps.city_visits),
+        "stoppedCities": len(maps.city_stops),
+    }
+
+
+def _resolve_geo_recalc_mode(
+    requested_mode: GeoRecalcMode,
+    *,
+    county_cache: CountyVisitedCache | None,
+    city_cache: CityVisitedCache | None,
+    boundary_version: str,
+    now: datetime,
+) -> GeoRecalcMode:
+    """Downgrade an incremental request to a full rebuild when it is not safe."""
+    if requested_mode == "full" or county_cache is None or city_cache is None:
+        return "full"
+
+    for cache in (county_cache, city_cache):
+        if cache.boundary_version != boundary_version:
+            return "full"
+        if cache.high_water_mark is None:
+            return "full"
+        last_full = parse_timestamp(cache.last_full_rebuild_at)
+        if last_full is None or now - last_full > timedelta(
+            seconds=GEO_FULL_REBUILD_INTERVAL_SECONDS
+        ):
+            return "full"
+    return "incremental"
+
+
+async def _scan_trips(
+    index: GeoBoundaryIndex,
+    trip_query: dict[str, Any],
+    maps: _GeoVisitMaps,
+    *,
+    job: Job | None,
+    mode: GeoRecalcMode,
+    total_trips: int,
+) -> int:
+    """
+    Stream projected trips and fold their boundary hits into ``maps``.
+
+    Geometry tests for each fetched batch run in a thread pool; every worker
+    thread owns a private copy of the prepared boundaries because GEOS prepared
+    geometries are not safe to share across threads.
+    """
+    workers = GEO_COVERAGE_MAX_WORKERS if total_trips >= GEO_PARALLEL_MIN_TRIPS else 1
+    executor: ThreadPoolExecutor | None = None
+    if workers > 1:
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="geo-coverage",
+            initializer=init_boundary_worker,
+            initargs=(index,),
+        )
+
+    loop = asyncio.get_running_loop()
+    cursor = Trip.get_pymongo_collection().find(
+        trip_query,
+        projection=_TRIP_PROJECTION,
+        batch_size=GEO_TRIP_BATCH_SIZE,
+    )
+    trips_analyzed = 0
+    batch: list[dict[str, Any]] = []
+
+    async def flush() -> None:
+        nonlocal trips_analyzed
+        if executor is None:
+            results = _evaluate_trip_batch(index, batch)
+        else:
+            chunk_size = max(1, -(-len(batch) // workers))
+            chunks = [
+                batch[start : start + chunk_size]
+                for start in range(0, len(batch), chunk_size)
+            ]
+            chunk_results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor, _evaluate_trip_batch_in_worker, chunk
+                    )
+                    for chunk in chunks
+                )
+            )
+            results = [hit for chunk in chunk_results for hit in chunk]
+
+        for hits in results:
+            if hits is not None:
+                maps.merge(hits)
+        trips_analyzed += len(batch)
+        batch.clear()
+
+        progress = (
+            12
+            if total_trips <= 0
+            else 12 + (min(trips_analyzed, total_trips) / total_trips) * 78
+        )
+        await _update_geo_job(
+            job,
+            stage="Processing trips",
+            progress=progress,
+            message=(
+                f"Processed {trips_analyzed:,} of {total_trips:,} trips..."
+                if total_trips > 0
+                else "Processing trips..."
+            ),
+            metrics=_geo_metrics(
+                mode,
+                processed_trips=trips_analyzed,
+                total_trips=total_trips,
+                maps=maps,
+            ),
+        )
+        logger.info(
+            "Geo coverage progress: %d/%d trips, %d counties, %d cities",
+            trips_analyzed,
+            total_trips,
+            len(maps.county_visits),
+            len(maps.city_visits),
+        )
+
+    try:
+        async for trip_doc in cursor:
+            batch.append(trip_doc)
+            if len(batch) >= GEO_TRIP_BATCH_SIZE:
+                await flush()
+        if batch:
+            await flush()
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return trips_analyzed
+
+
+def _build_city_state_rollups(
+    index: GeoBoundaryIndex,
+    city_visits: dict[str, dict[str, datetime | None]],
+    city_stops: dict[str, dict[str, datetime | None]],
+) -> dict[str, dict[str, Any]]:
+    def new_rollup(state_fips: str) -> dict[str, Any]:
+        return {
+            "stateFips": state_fips,
+            "stateName": index.city_state_names.get(state_fips, "Unknown"),
+            "visited": 0,
+            "stopped": 0,
+            "total": index.city_totals_by_state.get(state_fips, 0),
+            "percent": 0.0,
+            "firstVisit": None,
+            "lastVisit": None,
+            "firstStop": None,
+            "lastStop": None,
+        }
+
+    state_rollups: dict[str, dict[str, Any]] = {
+        state_fips: new_rollup(state_fips) for state_fips in index.city_totals_by_state
+    }
+
+    for city_id, visits in city_visits.items():
+        state_fips = index.city_state_index.get(city_id)
+        if not state_fips:
+            continue
+        rollup = state_rollups.setdefault(state_fips, new_rollup(state_fips))
+        rollup["visited"] += 1
+
+        first_visit = visits.get("firstVisit")
+        last_visit = visits.get("lastVisit")
+        if first_visit and (
+            rollup.get("firstVisit") is None or first_visit < rollup["firstVisit"]
+        ):
+            rollup["firstVisit"] = first_visit
+        if last_visit and (
+            rollup.get("lastVisit") is None or last_visit > rollup["lastVisit"]
+        ):
+            rollup["lastVisit"] = last_visit
+
+    for city_id, stops in city_stops.items():
+        state_fips = index.city_state_index.get(city_id)
+        if not state_fips:
+            continue
+        rollup = state_rollups.setdefault(state_fips, new_rollup(state_fips))
+        rollup["stopped"] += 1
+
+        first_stop = stops.get("firstVisit")
+        last_stop = stops.get("lastVisit")
+        if first_stop and (
+            rollup.get("firstStop") is None or first_stop < rollup["firstStop"]
+        ):
+            rollup["firstStop"] = first_stop
+        if last_stop and (
+            rollup.get("lastStop") is None or last_stop > rollup["lastStop"]
+        ):
+            rollup["lastStop"] = last_stop
+
+    for rollup in state_rollups.values():
+        total = int(rollup.get("total") or 0)
+        visited = int(rollup.get("visited") or 0)
+        rollup["percent"] = _percent(visited, total)
+        rollup["firstVisit"] = serialize_datetime(rollup.get("firstVisit"))
+        rollup["lastVisit"] = serialize_datetime(rollup.get("lastVisit"))
+        rollup["firstStop"] = serialize_datetime(rollup.get("firstStop"))
+        rollup["lastStop"] = serialize_datetime(rollup.get("lastStop"))
+
+    return state_rollups
+
+
+async def _save_geo_caches(
+    *,
+    index: GeoBoundaryIndex,
+    maps: _GeoVisitMaps,
+    county_cache: CountyVisitedCache | None,
+    city_cache: CityVisitedCache | None,
+    mode: GeoRecalcMode,
+    trips_analyzed: int,
+    high_water_mark: datetime,
+    duration_seconds: float,
+    job: Job | None,
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any], dict[str, Any]]:
+    counties_serializable = _serialize_visit_map(maps.county_visits)
+    stops_serializable = _serialize_stop_map(maps.county_stops)
+    cities_serializable = _serialize_visit_map(maps.city_visits)
+    city_stops_serializable = _serialize_stop_map(maps.city_stops)
+
+    county_state_rollups = {
+        state_fips: {
+            "stateFips": state_fips,
+            "stateName": index.state_names.get(state_fips, "Unknown"),
+            "total": total,
+        }
+        for state_fips, total in index.county_totals_by_state.items()
+    }
+    state_rollups = _build_city_state_rollups(
+        index,
+        maps.city_visits,
+        maps.city_stops,
+    )
+
+    now = datetime.now(UTC)
+    last_full_rebuild_at = (
+        now
+        if mode == "full"
+        else (county_cache.last_full_rebuild_at if county_cache else None)
+    )
+    shared_fields = {
+        "trips_analyzed": trips_analyzed,
+        "updated_at": now,
+        "calculation_time_seconds": duration_seconds,
+        "last_job_id": str(job.id) if job else None,
+        "boundary_version": index.version,
+        "high_water_mark": high_water_mark,
+        "last_full_rebuild_at": last_full_rebuild_at,
+    }
+
+    county_fields = {
+        "counties": counties_serializable,
+        "stopped_counties": stops_serializable,
+        "state_rollups": county_state_rollups,
+        "total_counties": len(index.counties),
+        **shared_fields,
+    }
+    if county_cache:
+        for key, value in county_fields.items():
+            setattr(county_cache, key, value)
+        await county_cache.save()
+    else:
+        await CountyVisitedCache(**county_fields).insert()
+
+    city_fields = {
+        "cities": cities_serializable,
+        "stopped_cities": city_stops_serializable,
+        "state_rollups": state_rollups,
+        "total_visited": len(cities_serializable),
+        "total_stopped": len(city_stops_serializable),
+        "total_cities": len(index.cities),
+        **shared_fields,
+    }
+    if city_cache:
+        for key, value in city_fields.items():
+            setattr(city_cache, key, value)
+        await city_cache.save()
+    else:
+        await CityVisitedCache(**city_fields).insert()
+
+    return (
+        counties_serializable,
+        stops_serializable,
+        cities_serializable,
+        city_stops_serializable,
+    )
 
 
 async def calculate_geo_coverage_task(
     *,
     job_id: str | None = None,
+    mode: GeoRecalcMode = "full",
 ) -> None:
-    """Background task to calculate county + city visit coverage."""
+    """
+    Background task to calculate county + city visit coverage.
+
+    ``mode="incremental"`` folds only trips saved since the stored high-water
+    mark into the existing caches. It falls back to a full rebuild when the
+    caches are missing, the boundary version changed, or the last full rebuild
+    is older than ``GEO_FULL_REBUILD_INTERVAL_SECONDS`` (which is how deleted
+    or deactivated trips eventually drop out of the caches).
+    """
     job = await _resolve_job(job_id)
 
-    logger.info("Starting full unified geo coverage calculation...")
+    logger.info("Starting unified geo coverage calculation (requested=%s)...", mode)
     start_time = datetime.now(UTC)
 
     await _update_geo_job(
@@ -483,100 +873,55 @@ async def calculate_geo_coverage_task(
     )
 
     try:
-        topology_document = await _get_county_topology_payload()
-        topology = topology_document["topology"]
-
-        counties_geojson = topojson_to_geojson(topology, "counties")
-
-        state_names: dict[str, str] = {}
-        for feature in topojson_to_geojson(topology, "states"):
-            state_fips = _valid_state_fips(feature.get("id"))
-            if state_fips:
-                state_names[state_fips] = str(
-                    (feature.get("properties") or {}).get("name") or "Unknown"
-                )
-
-        county_shapes = []
-        county_fips = []
-        county_totals_by_state: dict[str, int] = {}
-        invalid_counties = 0
-
-        for feature in counties_geojson:
-            county_id = _county_fips(feature.get("id"))
-            geom = _valid_boundary_geometry(feature.get("geometry"))
-            if county_id is None or geom is None:
-                invalid_counties += 1
-                continue
-            state_fips = county_id[:2]
-            county_shapes.append(geom)
-            county_fips.append(county_id)
-            county_totals_by_state[state_fips] = (
-                county_totals_by_state.get(state_fips, 0) + 1
-            )
-
-        county_tree = STRtree(county_shapes) if county_shapes else None
-        county_index_lookup = _build_query_index(county_shapes)
+        index = await get_geo_boundary_index(revalidate=True)
         logger.info(
-            "Geo coverage: loaded %d county polygons (%d invalid)",
-            len(county_shapes),
-            invalid_counties,
-        )
-
-        city_docs = await CityBoundary.find_all().to_list()
-        city_shapes = []
-        city_ids = []
-        city_state_index: dict[str, str] = {}
-        city_state_names: dict[str, str] = {}
-        city_totals_by_state: dict[str, int] = {}
-        invalid_cities = 0
-
-        for city in city_docs:
-            state_fips = _valid_state_fips(city.state_fips)
-            geom = _valid_boundary_geometry(city.geometry)
-            if state_fips is None or geom is None:
-                invalid_cities += 1
-                continue
-            city_shapes.append(geom)
-            city_ids.append(city.id)
-            city_state_index[city.id] = state_fips
-            city_totals_by_state[state_fips] = (
-                city_totals_by_state.get(state_fips, 0) + 1
-            )
-            city_state_names[state_fips] = city.state_name or city_state_names.get(
-                state_fips,
-                "Unknown",
-            )
-
-        city_tree = STRtree(city_shapes) if city_shapes else None
-        city_index_lookup = _build_query_index(city_shapes)
-        logger.info(
-            "Geo coverage: loaded %d city polygons (%d invalid)",
-            len(city_shapes),
-            invalid_cities,
+            "Geo coverage: using %d county polygons (%d invalid), "
+            "%d city polygons (%d invalid)",
+            len(index.counties),
+            index.invalid_counties,
+            len(index.cities),
+            index.invalid_cities,
         )
 
         county_cache = await CountyVisitedCache.get("visited_counties")
         city_cache = await CityVisitedCache.get("visited_cities")
+        effective_mode = _resolve_geo_recalc_mode(
+            mode,
+            county_cache=county_cache,
+            city_cache=city_cache,
+            boundary_version=index.version,
+            now=start_time,
+        )
 
         if job:
             metadata = dict(job.metadata or {})
-            metadata["mode"] = "full"
+            metadata["mode"] = effective_mode
             job.metadata = metadata
             await job.save()
 
-        county_visits: dict[str, dict[str, datetime | None]] = {}
-        county_stops: dict[str, dict[str, datetime | None]] = {}
-        city_visits: dict[str, dict[str, datetime | None]] = {}
-        city_stops: dict[str, dict[str, datetime | None]] = {}
+        trip_query = _build_trip_query()
+        previous_trips_analyzed = 0
+        since: datetime | None = None
+        if effective_mode == "incremental" and county_cache and city_cache:
+            maps = _GeoVisitMaps.from_caches(county_cache, city_cache)
+            since = min(
+                parse_timestamp(county_cache.high_water_mark),
+                parse_timestamp(city_cache.high_water_mark),
+            )
+            trip_query["saved_at"] = {"$gt": since}
+            previous_trips_analyzed = int(county_cache.trips_analyzed or 0)
+            scan_message = "Scanning trips saved since the last sync..."
+        else:
+            maps = _GeoVisitMaps()
+            scan_message = "Scanning all trips for full rebuild..."
 
         await _update_geo_job(
             job,
             stage="Scanning trips",
             progress=8,
-            message="Scanning all trips for full rebuild...",
+            message=scan_message,
         )
 
-        trip_query = _build_trip_query()
         total_trips = await Trip.find(trip_query).count()
 
         await _update_geo_job(
@@ -584,343 +929,93 @@ async def calculate_geo_coverage_task(
             stage="Processing trips",
             progress=12,
             message="Processing trip geometry and stop points...",
-            metrics={
-                "mode": "full",
-                "processedTrips": 0,
-                "totalTrips": total_trips,
-                "visitedCounties": len(county_visits),
-                "stoppedCounties": len(county_stops),
-                "visitedCities": len(city_visits),
-                "stoppedCities": len(city_stops),
-            },
+            metrics=_geo_metrics(
+                effective_mode,
+                processed_trips=0,
+                total_trips=total_trips,
+                maps=maps,
+            ),
         )
 
-        trips_cursor = Trip.find(trip_query)
-        trips_analyzed = 0
-
-        async for trip in trips_cursor:
-            trips_analyzed += 1
-
-            trip_start_time = parse_timestamp(trip.startTime)
-            trip_end_time = parse_timestamp(trip.endTime)
-            trip_time = trip_start_time or trip_end_time
-
-            gps_data = _select_trip_geometry(trip)
-            if not gps_data:
-                continue
-
-            try:
-                trip_geom = shape(gps_data)
-
-                _record_boundary_visits(
-                    trip_geometry=trip_geom,
-                    boundary_tree=county_tree,
-                    boundary_index_lookup=county_index_lookup,
-                    boundary_shapes=county_shapes,
-                    boundary_ids=county_fips,
-                    visit_map=county_visits,
-                    visit_time=trip_time,
-                )
-                _record_boundary_visits(
-                    trip_geometry=trip_geom,
-                    boundary_tree=city_tree,
-                    boundary_index_lookup=city_index_lookup,
-                    boundary_shapes=city_shapes,
-                    boundary_ids=city_ids,
-                    visit_map=city_visits,
-                    visit_time=trip_time,
-                )
-
-                for point, stop_time in _extract_stop_points(
-                    gps_data,
-                    trip_start_time,
-                    trip_end_time,
-                    trip_time,
-                ):
-                    if county_tree:
-                        for idx in _iter_tree_indexes(
-                            county_tree,
-                            county_index_lookup,
-                            len(county_shapes),
-                            point,
-                        ):
-                            if county_shapes[idx].covers(point):
-                                _record_visit(county_stops, county_fips[idx], stop_time)
-
-                    if city_tree:
-                        for idx in _iter_tree_indexes(
-                            city_tree,
-                            city_index_lookup,
-                            len(city_shapes),
-                            point,
-                        ):
-                            if city_shapes[idx].covers(point):
-                                _record_visit(city_stops, city_ids[idx], stop_time)
-
-            except Exception as exc:
-                logger.warning(
-                    "Geo coverage: error processing trip %s: %s",
-                    trip.transactionId or "unknown",
-                    exc,
-                )
-
-            if trips_analyzed % 100 == 0:
-                progress = (
-                    12
-                    if total_trips <= 0
-                    else 12 + (min(trips_analyzed, total_trips) / total_trips) * 78
-                )
-                metrics = {
-                    "mode": "full",
-                    "processedTrips": trips_analyzed,
-                    "totalTrips": total_trips,
-                    "visitedCounties": len(county_visits),
-                    "stoppedCounties": len(county_stops),
-                    "visitedCities": len(city_visits),
-                    "stoppedCities": len(city_stops),
-                }
-                await _update_geo_job(
-                    job,
-                    stage="Processing trips",
-                    progress=progress,
-                    message=(
-                        f"Processed {trips_analyzed:,} of {total_trips:,} trips..."
-                        if total_trips > 0
-                        else "Processing trips..."
-                    ),
-                    metrics=metrics,
-                )
-                logger.info(
-                    "Geo coverage progress: %d/%d trips, %d counties, %d cities",
-                    trips_analyzed,
-                    total_trips,
-                    len(county_visits),
-                    len(city_visits),
-                )
-
-        valid_city_ids = set(city_ids)
-        city_visits = {
-            city_id: visits
-            for city_id, visits in city_visits.items()
-            if city_id in valid_city_ids
-        }
-        city_stops = {
-            city_id: stops
-            for city_id, stops in city_stops.items()
-            if city_id in valid_city_ids
-        }
+        trips_processed = await _scan_trips(
+            index,
+            trip_query,
+            maps,
+            job=job,
+            mode=effective_mode,
+            total_trips=total_trips,
+        )
+        maps.retain_cities(set(index.cities.ids))
+        new_trips = (
+            trips_processed
+            if since is None
+            else await _count_new_trips(trip_query, since)
+        )
 
         await _update_geo_job(
             job,
             stage="Saving cache",
             progress=94,
             message="Saving county and city cache documents...",
-            metrics={
-                "mode": "full",
-                "processedTrips": trips_analyzed,
-                "totalTrips": total_trips,
-                "visitedCounties": len(county_visits),
-                "stoppedCounties": len(county_stops),
-                "visitedCities": len(city_visits),
-                "stoppedCities": len(city_stops),
-            },
+            metrics=_geo_metrics(
+                effective_mode,
+                processed_trips=trips_processed,
+                total_trips=total_trips,
+                maps=maps,
+            ),
         )
 
-        counties_serializable = _serialize_visit_map(county_visits)
-        stops_serializable = _serialize_stop_map(county_stops)
-        cities_serializable = _serialize_visit_map(city_visits)
-        city_stops_serializable = _serialize_stop_map(city_stops)
-
-        county_state_rollups = {
-            state_fips: {
-                "stateFips": state_fips,
-                "stateName": state_names.get(state_fips, "Unknown"),
-                "total": total,
-            }
-            for state_fips, total in county_totals_by_state.items()
-        }
-
-        state_rollups: dict[str, dict[str, Any]] = {}
-        for state_fips, total in city_totals_by_state.items():
-            state_rollups[state_fips] = {
-                "stateFips": state_fips,
-                "stateName": city_state_names.get(state_fips, "Unknown"),
-                "visited": 0,
-                "stopped": 0,
-                "total": total,
-                "percent": 0.0,
-                "firstVisit": None,
-                "lastVisit": None,
-                "firstStop": None,
-                "lastStop": None,
-            }
-
-        for city_id, visits in city_visits.items():
-            state_fips = city_state_index.get(city_id)
-            if not state_fips:
-                continue
-
-            rollup = state_rollups.setdefault(
-                state_fips,
-                {
-                    "stateFips": state_fips,
-                    "stateName": city_state_names.get(state_fips, "Unknown"),
-                    "visited": 0,
-                    "stopped": 0,
-                    "total": city_totals_by_state.get(state_fips, 0),
-                    "percent": 0.0,
-                    "firstVisit": None,
-                    "lastVisit": None,
-                    "firstStop": None,
-                    "lastStop": None,
-                },
-            )
-            rollup["visited"] += 1
-
-            first_visit = visits.get("firstVisit")
-            last_visit = visits.get("lastVisit")
-
-            if first_visit and (
-                rollup.get("firstVisit") is None or first_visit < rollup["firstVisit"]
-            ):
-                rollup["firstVisit"] = first_visit
-            if last_visit and (
-                rollup.get("lastVisit") is None or last_visit > rollup["lastVisit"]
-            ):
-                rollup["lastVisit"] = last_visit
-
-        for city_id, stops in city_stops.items():
-            state_fips = city_state_index.get(city_id)
-            if not state_fips:
-                continue
+        duration_seconds = (datetime.now(UTC) - start_time).total_seconds()
+        (
+            counties_serializable,
+            stops_serializable,
+            cities_serializable,
+            city_stops_serializable,
+        ) = await _save_geo_caches(
+            index=index,
+            maps=maps,
+            county_cache=county_cache,
+            city_cache=city_cache,
+            mode=effective_mode,
+            trips_analyzed=previous_trips_analyzed + new_trips,
+            high_water_mark=start_time,
+            duration_seconds=duration_seconds,
+            job=job,
+        )
 
-            rollup = state_rollups.setdefault(
-                state_fips,
-                {
-                    "stateFips": state_fips,
-                    "stateName": city_state_names.get(state_fips, "Unknown"),
-                    "visited": 0,
-                    "stopped": 0,
-                    "total": city_totals_by_state.get(state_fips, 0),
-                    "percent": 0.0,
-                    "firstVisit": None,
-                    "lastVisit": None,
-                    "firstStop": None,
-                    "lastStop": None,
-                },
-            )
-            rollup["stopped"] += 1
-
-            first_stop = stops.get("firstVisit")
-            last_stop = stops.get("lastVisit")
-
-            if first_stop and (
-                rollup.get("firstStop") is None or first_stop < rollup["firstStop"]
-            ):
-                rollup["firstStop"] = first_stop
-            if last_stop and (
-                rollup.get("lastStop") is None or last_stop > rollup["lastStop"]
-            ):
-                rollup["lastStop"] = last_stop
-
-        for rollup in state_rollups.values():
-            total = int(rollup.get("total") or 0)
-            visited = int(rollup.get("visited") or 0)
-            rollup["percent"] = _percent(visited, total)
-            rollup["firstVisit"] = serialize_datetime(rollup.get("firstVisit"))
-            rollup["lastVisit"] = serialize_datetime(rollup.get("lastVisit"))
-            rollup["firstStop"] = serialize_datetime(rollup.get("firstStop"))
-            rollup["lastStop"] = serialize_datetime(rollup.get("lastStop"))
-
-        now = datetime.now(UTC)
-        duration_seconds = (now - start_time).total_seconds()
-
-        if county_cache:
-            county_cache.counties = counties_serializable
-            county_cache.stopped_counties = stops_serializable
-            county_cache.state_rollups = county_state_rollups
-            county_cache.total_counties = len(county_shapes)
-            county_cache.trips_analyzed = trips_analyzed
-            county_cache.updated_at = now
-            county_cache.calculation_time_seconds = duration_seconds
-            county_cache.last_job_id = str(job.id) if job else None
-            await county_cache.save()
-        else:
-            await CountyVisitedCache(
-                counties=counties_serializable,
-                stopped_counties=stops_serializable,
-                state_rollups=county_state_rollups,
-                total_counties=len(county_shapes),
-                trips_analyzed=trips_analyzed,
-                updated_at=now,
-                calculation_time_seconds=duration_seconds,
-                last_job_id=str(job.id) if job else None,
-            ).insert()
-
-        if city_cache:
-            city_cache.cities = cities_serializable
-            city_cache.stopped_cities = city_stops_serializable
-            city_cache.state_rollups = state_rollups
-            city_cache.total_visited = len(cities_serializable)
-            city_cache.total_stopped = len(city_stops_serializable)
-            city_cache.total_cities = len(city_shapes)
-            city_cache.trips_analyzed = trips_analyzed
-            city_cache.updated_at = now
-            city_cache.calculation_time_seconds = duration_seconds
-            city_cache.last_job_id = str(job.id) if job else None
-            await city_cache.save()
-        else:
-            await CityVisitedCache(
-                cities=cities_serializable,
-                stopped_cities=city_stops_serializable,
-                state_rollups=state_rollups,
-                total_visited=len(cities_serializable),
-                total_stopped=len(city_stops_serializable),
-                total_cities=len(city_shapes),
-                trips_analyzed=trips_analyzed,
-                updated_at=now,
-                calculation_time_seconds=duration_seconds,
-                last_job_id=str(job.id) if job else None,
-            ).insert()
-
-        result = {
-            "mode": "full",
-            "processedTrips": trips_analyzed,
+        final_metrics = {
+            "mode": effective_mode,
+            "processedTrips": trips_processed,
             "totalTrips": total_trips,
             "visitedCounties": len(counties_serializable),
             "stoppedCounties": len(stops_serializable),
             "visitedCities": len(cities_serializable),
             "stoppedCities": len(city_stops_serializable),
-            "durationSeconds": round(duration_seconds, 2),
         }
-
         await _update_geo_job(
             job,
             status_value="completed",
             stage="Completed",
             progress=100,
             message=(
-                f"Region Explorer cache rebuild complete: {trips_analyzed:,} trips processed."
+                f"Region Explorer cache {'sync' if effective_mode == 'incremental' else 'rebuild'} "
+                f"complete: {trips_processed:,} trips processed."
             ),
-            metrics={
-                "mode": "full",
-                "processedTrips": trips_analyzed,
-                "totalTrips": total_trips,
-                "visitedCounties": len(counties_serializable),
-                "stoppedCounties": len(stops_serializable),
-                "visitedCities": len(cities_serializable),
-                "stoppedCities": len(city_stops_serializable),
+            metrics=final_metrics,
+            result={
+                **final_metrics,
+                "durationSeconds": round(duration_seconds, 2),
             },
-            result=result,
         )
 
         logger.info(
-            "Geo coverage calculation complete: %d counties, %d county stops, %d cities, %d city stops, %d/%d trips, %.1fs",
+            "Geo coverage calculation complete (%s): %d counties, %d county stops, %d cities, %d city stops, %d/%d trips, %.1fs",
+            effective_mode,
             len(counties_serializable),
             len(stops_serializable),
             len(cities_serializable),
             len(city_stops_serializable),
-            trips_analyzed,
+            trips_processed,
             total_trips,
             duration_seconds,
         )
@@ -1128,6 +1223,66 @@ async def get_summary() -> dict[str, Any]:
     }
 
 
+async def _load_city_features(state_fips: str) -> list[dict[str, Any]]:
+    """Decode one state's city boundaries directly (no boundary index)."""
+    cities = (
+        await CityBoundary.find(CityBoundary.state_fips == state_fips)
+        .sort("name")
+        .to_list()
+    )
+
+    features = []
+    for city in cities:
+        geom = _valid_boundary_geometry(city.geometry)
+        if geom is None:
+            continue
+        features.append(
+            {
+                "type": "Feature",
+                "id": city.id,
+                "properties": {
+                    "cityId": city.id,
+                    "name": city.name,
+                    "stateFips": city.state_fips,
+                    "stateName": city.state_name,
+                    "classfp": city.classfp,
+                },
+                "geometry": geom.__geo_interface__,
+            }
+        )
+    return features
+
+
+async def _load_city_rows(state_fips: str) -> list[dict[str, Any]]:
+    """Read one state's city rows directly (no boundary index)."""
+    cities = (
+        await CityBoundary.find(CityBoundary.state_fips == state_fips)
+        .sort("name")
+        .to_list()
+    )
+    return [
+        {
+            "cityId": city.id,
+            "name": city.name,
+            "stateFips": city.state_fips,
+            "stateName": city.state_name,
+            "bbox": city.bbox,
+            "centroid": city.centroid,
+        }
+        for city in cities
+        if _valid_boundary_geometry(city.geometry) is not None
+    ]
+
+
+async def _state_city_rows(state_fips: str) -> list[dict[str, Any]]:
+    """One state's valid cities, served from the shared boundary index."""
+    try:
+        index = await get_geo_boundary_index()
+    except RuntimeError:
+        return await _load_city_rows(state_fips)
+    return index.city_rows(state_fips)
+
+
 async def get_topology(
     level: Literal["county", "state", "city"],
     state_fips: str | None = None,
@@ -1159,31 +1314,12 @@ async def get_topology(
                 detail="stateFips is required when level=city",
             )
 
-        cities = (
-            await CityBoundary.find(CityBoundary.state_fips == normalized_fips)
-            .sort("name")
-            .to_list()
-        )
-
-        features = []
-        for city in cities:
-            geom = _valid_boundary_geometry(city.geometry)
-            if geom is None:
-                continue
-            features.append(
-                {
-                    "type": "Feature",
-                    "id": city.id,
-                    "properties": {
-                        "cityId": city.id,
-                        "name": city.name,
-                        "stateFips": city.state_fips,
-                        "stateName": city.state_name,
-                        "classfp": city.classfp,
-                    },
-                    "geometry": geom.__geo_interface__,
-                }
-            )
+        try:
+            index = await get_geo_boundary_index()
+        except RuntimeError:
+            features = await _load_city_features(normalized_fips)
+        else:
+            features = index.city_features(normalized_fips)
 
         return {
             "success": True,
@@ -1250,10 +1386,7 @@ async def get_visits(
         normalized_fips = _valid_state_fips(state_fips)
         if normalized_fips:
             city_ids = {
-                city.id
-                for city in await CityBoundary.find(
-                    CityBoundary.state_fips == normalized_fips
-                ).to_list()
+                row["cityId"] for row in await _state_city_rows(normalized_fips)
             }
             visits = {
                 city_id: value
@@ -1324,11 +1457,7 @@ async def list_cities(
     page_size = max(page_size, 1)
     page_size = min(page_size, 200)
 
-    cities = (
-        await CityBoundary.find(CityBoundary.state_fips == normalized_fips)
-        .sort("name")
-        .to_list()
-    )
+    cities = await _state_city_rows(normalized_fips)
 
     cache = await CityVisitedCache.get("visited_cities")
     visits = cache.cities if cache else {}
@@ -1337,10 +1466,8 @@ async def list_cities(
     rows = []
     query = (q or "").strip().lower()
     for city in cities:
-        if _valid_boundary_geometry(city.geometry) is None:
-            continue
-        visit = visits.get(city.id)
-        stop = stops.get(city.id)
+        visit = visits.get(city["cityId"])
+        stop = stops.get(city["cityId"])
         visited = visit is not None
         stopped = stop is not None
         first_visit = visit.get("firstVisit") if isinstance(visit, dict) else None
@@ -1356,23 +1483,23 @@ async def list_cities(
             continue
         if status_filter == "unvisited" and (visited or stopped):
             continue
-        if query and query not in city.name.lower():
+        if query and query not in city["name"].lower():
             continue
 
         rows.append(
             {
-                "cityId": city.id,
-                "name": city.name,
-                "stateFips": city.state_fips,
-                "stateName": city.state_name,
+                "cityId": city["cityId"],
+                "name": city["name"],
+                "stateFips": city["stateFips"],
+                "stateName": city["stateName"],
                 "visited": visited,
                 "stopped": stopped,
                 "firstVisit": first_visit,
                 "lastVisit": last_visit,
                 "firstStop": first_stop,
                 "lastStop": last_stop,
-                "bbox": city.bbox,
-                "centroid": city.centroid,
+                "bbox": city["bbox"],
+                "centroid": city["centroid"],
             }
         )
 
@@ -1483,8 +1610,16 @@ async def recalculate(
     }
 
 
-async def run_scheduled_recalculate() -> dict[str, Any]:
-    """Run Region Explorer cache rebuild from scheduled/background task context."""
+async def run_scheduled_recalculate(
+    *,
+    mode: GeoRecalcMode = "incremental",
+) -> dict[str, Any]:
+    """
+    Run a Region Explorer cache sync from scheduled/background task context.
+
+    Scheduled and ingest-triggered runs are incremental by default; the task
+    itself decides when a full rebuild is required.
+    """
     active_job = await _get_active_geo_recalc_job()
     if active_job:
         return {
@@ -1492,7 +1627,7 @@ async def run_scheduled_recalculate() -> dict[str, Any]:
             "reason": "already_running",
             "message": "Region Explorer cache rebuild is already running.",
             "job_id": str(active_job.id),
-            "mode": "full",
+            "mode": (active_job.metadata or {}).get("mode") or "full",
         }
 
     now = datetime.now(UTC)
@@ -1501,15 +1636,15 @@ async def run_scheduled_recalculate() -> dict[str, Any]:
         status="pending",
         stage="Queued",
         progress=0.0,
-        message="Queued scheduled full Region Explorer cache rebuild...",
+        message=f"Queued scheduled {mode} Region Explorer cache sync...",
         created_at=now,
         updated_at=now,
         metadata={
-            "mode": "full",
+            "mode": mode,
             "trigger": "scheduled",
         },
         metrics={
-            "mode": "full",
+            "mode": mode,
             "processedTrips": 0,
             "totalTrips": 0,
             "visitedCounties": 0,
@@ -1520,7 +1655,7 @@ async def run_scheduled_recalculate() -> dict[str, Any]:
     )
     await job.insert()
 
-    await calculate_geo_coverage_task(job_id=str(job.id))
+    await calculate_geo_coverage_task(job_id=str(job.id), mode=mode)
 
     finished = await _resolve_job(str(job.id))
     if not finished:
@@ -1531,7 +1666,7 @@ async def run_scheduled_recalculate() -> dict[str, Any]:
         return {
             "status": "success",
             "job_id": str(finished.id),
-            "mode": "full",
+            "mode": (finished.metadata or {}).get("mode") or mode,
             "message": finished.message or "Region Explorer cache rebuild completed.",
             "result": finished.result or {},
         }
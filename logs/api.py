@@ -12,7 +12,9 @@ from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, status
 from pydantic import BaseModel
 
 from core.api import api_route
+from core.date_utils import ensure_utc
 from db.aggregation import aggregate_to_list
+from db.logging_handler import log_search_words
 from db.models import AppSettings, ServerLog
 
 logger = logging.getLogger(__name__)
@@ -52,6 +54,41 @@ async def _get_logs_cutoff() -> datetime | None:
     return cutoff if isinstance(cutoff, datetime) else None
 
 
+def _message_search_filter(search: str) -> dict[str, Any]:
+    """
+    Match log messages containing every word of ``search``.
+
+    Words are looked up in the indexed ``tokens`` array, with the last one
+    treated as a prefix so results keep up while a word is being typed.
+    Matching is by word or word prefix: the parts of underscore-joined names
+    are tokens too, but other text inside a word (``overage`` in
+    ``coverage``) is not matched. Rows written before tokens were stored
+    fall back to a substring match per word until the TTL index expires
+    them; searches without any word characters match the raw substring.
+    """
+    words = log_search_words(search)
+    if not words:
+        # Escape regex metacharacters to prevent regex injection attacks
+        return {"message": {"$regex": re.escape(search), "$options": "i"}}
+
+    *complete, partial = words
+    token_clause: dict[str, Any] = {"tokens": {"$regex": f"^{re.escape(partial)}"}}
+    if complete:
+        token_clause = {"$and": [{"tokens": {"$all": complete}}, token_clause]}
+    return {
+        "$or": [
+            token_clause,
+            {
+                "tokens": {"$exists": False},
+                "$and": [
+                    {"message": {"$regex": re.escape(word), "$options": "i"}}
+                    for word in words
+                ],
+            },
+        ],
+    }
+
+
 class LogsStatsResponse(BaseModel):
     """Response model for logs statistics."""
 
@@ -90,13 +127,15 @@ async def get_server_logs(
             query_filter["level"] = level.upper()
 
         if search:
-            # Escape regex metacharacters to prevent regex injection attacks
-            escaped_search = re.escape(search)
-            query_filter["message"] = {"$regex": escaped_search, "$options": "i"}
+            query_filter.update(_message_search_filter(search))
 
-        logs = (
-            await ServerLog.find(query_filter).sort("-timestamp").limit(limit).to_list()
+        cursor = (
+            ServerLog.get_pymongo_collection()
+            .find(query_filter, {"tokens": 0})
+            .sort("timestamp", -1)
+            .limit(limit)
         )
+        logs = [ServerLog.model_validate(doc) async for doc in cursor]
 
         total_count = await ServerLog.find(query_filter).count()
 
@@ -135,21 +174,29 @@ async def clear_server_logs(
     try:
         delete_filter: dict[str, Any] = {}
 
-        # No filters means "clear everything". For large collections this can be slow if
-        # we hard-delete synchronously, so we do an instant "soft clear" by setting a
-        # cutoff timestamp and enqueueing a background purge.
-        if not level and not older_than_days:
-            cutoff_date = datetime.now(UTC)
+        # Clears that are not level-specific ("everything" or "older than N days")
+        # only move a cutoff timestamp forward. For large collections a synchronous
+        # hard delete can be slow, so we do an instant "soft clear" by setting the
+        # cutoff and enqueueing a background purge.
+        if not level:
+            now = datetime.now(UTC)
+            cutoff_date = (
+                now - timedelta(days=older_than_days) if older_than_days else now
+            )
 
             settings = await AppSettings.find_one()
             if settings:
+                current_cutoff = getattr(settings, "serverLogsCutoff", None)
+                if isinstance(current_cutoff, datetime):
+                    # Never move the cutoff back and re-expose cleared logs.
+                    cutoff_date = max(cutoff_date, ensure_utc(current_cutoff))
                 settings.serverLogsCutoff = cutoff_date
-                settings.updated_at = cutoff_date
+                settings.updated_at = now
                 await settings.save()
             else:
                 await AppSettings(
                     serverLogsCutoff=cutoff_date,
-                    updated_at=cutoff_date,
+                    updated_at=now,
                 ).insert()
 
             # Best-effort background purge via ARQ; if Redis/worker isn't available,
@@ -173,13 +220,14 @@ async def clear_server_logs(
                     logger.exception("Local server log purge failed")
 
             try:
-                from tasks.arq import get_arq_pool
+                from tasks.arq import get_arq_pool, queue_for_task
 
                 pool = await asyncio.wait_for(get_arq_pool(), timeout=0.75)
                 job = await asyncio.wait_for(
                     pool.enqueue_job(
                         "purge_server_logs_before",
                         cutoff_iso=cutoff_date.isoformat(),
+                        _queue_name=queue_for_task("purge_server_logs_before"),
                     ),
                     timeout=0.75,
                 )
@@ -14,12 +14,19 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+import h3
+
 from core.trip_source_policy import enforce_bouncie_source
+from db.bulk import bulk_write_updates
 from db.models import MapProvider
 from map_data.extracts import build_local_osm_artifact_status
 from map_data.models import MapServiceConfig
 from map_data.progress import MapBuildProgress
 from map_data.us_states import get_state, list_states
+from trips.services.trip_map_geometry import (
+    TRIP_LOCATION_SUMMARY_VERSION,
+    build_trip_location_summary,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -93,64 +100,91 @@ def get_states_for_coordinate(lon: float, lat: float) -> set[str]:
     return states
 
 
+def _cell_states(cell: str) -> set[str]:
+    """States whose bounding boxes contain an H3 cell's centre."""
+    lat, lon = h3.cell_to_latlng(cell)
+    return get_states_for_coordinate(lon, lat)
+
+
+def _stale_location_summary_query() -> dict[str, Any]:
+    """Trips with GPS whose ``locationSummary`` is missing or outdated."""
+    return enforce_bouncie_source(
+        {
+            "gps": {"$exists": True, "$ne": None},
+            "locationSummary.version": {"$ne": TRIP_LOCATION_SUMMARY_VERSION},
+        },
+    )
+
+
+async def backfill_trip_location_summaries(batch_size: int = 500) -> int:
+    """
+    Write ``locationSummary`` for trips that predate it or use an old version.
+
+    New and edited trips get the summary when their map path fields are
+    materialized, so after the first run this only touches a few stragglers.
+    Runs from the trip validation pass, and from state detection whenever it
+    finds a trip still waiting for one; the version lookup is served by the
+    source/version index.
+    """
+    from db.models import Trip
+
+    collection = Trip.get_pymongo_collection()
+    query = _stale_location_summary_query()
+    updated = 0
+    updates: list[tuple[dict[str, Any], dict[str, Any], bool]] = []
+    cursor = collection.find(query, {"gps": 1}, batch_size=batch_size)
+    async for trip_doc in cursor:
+        summary = build_trip_location_summary(trip_doc.get("gps"))
+        updates.append(
+            ({"_id": trip_doc["_id"]}, {"$set": {"locationSummary": summary}}, False),
+        )
+        if len(updates) >= batch_size:
+            await bulk_write_updates(collection, updates)
+            updated += len(updates)
+            updates = []
+    if updates:
+        await bulk_write_updates(collection, updates)
+        updated += len(updates)
+    if updated:
+        logger.info("Backfilled location summaries for %d trips", updated)
+    return updated
+
+
 async def detect_trip_states() -> dict[str, Any]:
     """
     Detect which US states have trip data.
 
-    Queries the trips collection and determines which states
-    contain trip GPS data.
+    Works from each trip's ``locationSummary`` cells rather than its GPS
+    geometry: the distinct cell set and the per-state trip counts are both
+    answered by the source/cells index. Summaries are kept current by
+    :func:`backfill_trip_location_summaries`, which the trip validation
+    pass runs; if any trip is still missing a current summary (e.g. right
+    after an upgrade, or with validation disabled) detection runs the
+    backfill first so those trips are not left out.
 
     Returns:
         Dictionary with detected states and trip counts
     """
     from db.models import Trip
 
-    detected_states: dict[str, int] = {}
-    sample_size = 0
-
-    def _sample_gps_points(gps: dict[str, Any]) -> list[list[float]]:
-        def sample_line(coords: Any) -> list[list[float]]:
-            if not isinstance(coords, list) or not coords:
-                return []
-            points = [coords[0]]
-            if len(coords) > 2:
-                points.append(coords[len(coords) // 2])
-            if len(coords) > 1:
-                points.append(coords[-1])
-            return points
-
-        coords = gps.get("coordinates", [])
-        geom_type = gps.get("type", "")
-        if geom_type == "Point" and len(coords) >= 2:
-            return [coords]
-        if geom_type == "LineString":
-            return sample_line(coords)
-        if geom_type == "MultiLineString" and isinstance(coords, list):
-            return [point for line in coords for point in sample_line(line)]
-        return []
-
     collection = Trip.get_pymongo_collection()
-    cursor = collection.find(
-        enforce_bouncie_source({"gps": {"$exists": True, "$ne": None}}),
-        {"gps": 1, "destinationGeoPoint": 1, "_id": 0},
-    )
-    async for trip_doc in cursor:
-        trip_states: set[str] = set()
-        gps = trip_doc.get("gps") or {}
-        for point in _sample_gps_points(gps):
-            if len(point) >= 2:
-                trip_states.update(get_states_for_coordinate(point[0], point[1]))
-                sample_size += 1
-
-        dest = trip_doc.get("destinationGeoPoint")
-        if dest and "coordinates" in dest:
-            coords = dest["coordinates"]
-            if len(coords) >= 2:
-                trip_states.update(get_states_for_coordinate(coords[0], coords[1]))
-                sample_size += 1
-
-        for state in trip_states:
-            detected_states[state] = detected_states.get(state, 0) + 1
+    if await collection.find_one(_stale_location_summary_query(), {"_id": 1}):
+        await backfill_trip_location_summaries()
+    trip_query = enforce_bouncie_source({"locationSummary.cells": {"$exists": True}})
+    cells = await collection.distinct("locationSummary.cells", trip_query)
+
+    cells_by_state: dict[str, list[str]] = {}
+    for cell in cells:
+        for state in _cell_states(cell):
+            cells_by_state.setdefault(state, []).append(cell)
+
+    detected_states: dict[str, int] = {}
+    for state, state_cells in cells_by_state.items():
+        count = await collection.count_documents(
+            enforce_bouncie_source({"locationSummary.cells": {"$in": state_cells}}),
+        )
+        if count:
+            detected_states[state] = count
 
     # Sort by trip count (most trips first)
     sorted_states = sorted(
@@ -175,7 +209,7 @@ async def detect_trip_states() -> dict[str, Any]:
     return {
         "detected_states": [s["code"] for s in state_details],
         "state_details": state_details,
-        "sample_size": sample_size,
+        "sample_size": len(cells),
         "detected_at": datetime.now(UTC).isoformat(),
     }
 
@@ -1,9 +1,10 @@
 """
 Trip coverage extraction for local/offline geocoding.
 
-Builds a buffered coverage polygon from trip GPS geometries and uses
-osmium to extract a smaller OSM PBF for Nominatim/Valhalla imports. All
-configuration uses imperial units (miles/feet).
+Keeps a persisted H3 footprint of every trip, folding in only trips saved
+since the last sync, and derives a buffered coverage polygon from it on
+demand. osmium then extracts a smaller OSM PBF for Nominatim/Valhalla
+imports. All configuration uses imperial units (miles/feet).
 """
 
 from __future__ import annotations
@@ -12,23 +13,31 @@ import asyncio
 import contextlib
 import json
 import logging
+import os
 import time
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import h3
+import numpy as np
+import shapely
 from pyproj import Transformer
-from shapely.geometry import LineString, Point, mapping
-from shapely.ops import transform, unary_union
+from shapely.geometry import LineString, Point, mapping, shape
 
 from config import get_osm_extracts_path
+from core.spatial import h3_cells_along
 from core.trip_source_policy import enforce_bouncie_source
+from map_data.models import TripCoverageFootprint
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
+TRIP_FOOTPRINT_RESOLUTION = int(os.getenv("MAP_COVERAGE_H3_RESOLUTION", "7"))
+
 
 @dataclass
 class CoverageStats:
@@ -37,6 +46,7 @@ class CoverageStats:
     points_used: int = 0
     total_trips: int | None = None
     skipped_reason: str | None = None
+    footprint_cells: int = 0
 
 
 _FEET_PER_MILE = 5280.0
@@ -69,43 +79,78 @@ def _build_trip_geometry(
     return None, 0
 
 
-def _merge_batch(
-    combined: Any | None,
-    batch: list[Any],
-) -> Any | None:
-    if not batch:
-        return combined
-    try:
-        batch_union = unary_union(batch)
-    except Exception:
-        batch_union = batch[0]
-        for geom in batch[1:]:
-            batch_union = batch_union.union(geom)
-    if combined is None:
-        return batch_union
-    try:
-        return unary_union([combined, batch_union])
-    except Exception:
-        return combined.union(batch_union)
+def trip_footprint_cells(geometry: Any, resolution: int) -> set[str]:
+    """H3 cells touched by a trip geometry, with long GPS gaps densified."""
+    return h3_cells_along(shapely.get_coordinates(geometry), resolution)
 
 
-async def build_trip_coverage_polygon(
+def footprint_to_polygon(
+    cells: list[str],
     *,
     buffer_miles: float,
     simplify_feet: float,
+) -> Any | None:
+    """Buffered WGS84 coverage polygon for a set of H3 cells."""
+    if not cells:
+        return None
+    buffer_units = max(buffer_miles, 0.0) * _FEET_PER_MILE * _PROJECTED_UNITS_PER_FOOT
+    simplify_units = max(simplify_feet, 0.0) * _PROJECTED_UNITS_PER_FOOT
+
+    to_3857 = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+    to_4326 = Transformer.from_crs("EPSG:3857", "EPSG:4326", always_xy=True)
+
+    def project(xy: np.ndarray) -> np.ndarray:
+        return np.column_stack(to_3857.transform(xy[:, 0], xy[:, 1]))
+
+    def unproject(xy: np.ndarray) -> np.ndarray:
+        return np.column_stack(to_4326.transform(xy[:, 0], xy[:, 1]))
+
+    footprint = shape(h3.cells_to_h3shape(cells).__geo_interface__)
+    buffered = shapely.transform(footprint, project).buffer(buffer_units)
+    if simplify_units > 0:
+        buffered = buffered.simplify(simplify_units)
+    return shapely.transform(buffered, unproject)
+
+
+def _pending_trip_query(high_water_mark: datetime | None) -> dict[str, Any]:
+    """
+    Trips not yet folded into the footprint.
+
+    After the first sync the source/saved_at pair is answered by the
+    ``trips_source_saved_at_idx`` index; the GPS check only filters the
+    rows it returns.
+    """
+    trip_query = enforce_bouncie_source({"gps": {"$exists": True, "$ne": None}})
+    if high_water_mark is not None:
+        trip_query["saved_at"] = {"$gt": high_water_mark}
+    return trip_query
+
+
+def _footprint_id(resolution: int) -> str:
+    return f"h3:{resolution}"
+
+
+async def sync_trip_coverage_footprint(
+    *,
     max_points_per_trip: int,
     batch_size: int,
+    resolution: int = TRIP_FOOTPRINT_RESOLUTION,
     max_trips: int | None = None,
     max_total_points: int | None = None,
     progress_callback: Callable[[CoverageStats], Any] | None = None,
     progress_every: int = 500,
     progress_interval: float = 2.0,
-) -> tuple[Any | None, CoverageStats]:
+) -> tuple[list[str] | None, CoverageStats]:
+    """
+    Fold trips saved since the last sync into the persisted H3 footprint.
+
+    Each pending trip costs O(points), so the work tracks new data rather
+    than total history. The safety caps apply to pending trips only.
+    Returns the full cell list, or ``None`` when a cap was exceeded.
+    """
     from db.models import Trip
 
     stats = CoverageStats()
-    buffer_miles = max(buffer_miles, 0.0)
-    simplify_feet = max(simplify_feet, 0.0)
     max_points_per_trip = max(int(max_points_per_trip), 1)
     batch_size = max(int(batch_size), 1)
     max_trips = int(max_trips) if max_trips is not None else None
@@ -116,27 +161,20 @@ async def build_trip_coverage_polygon(
     )
     progress_every = max(int(progress_every), 1)
     progress_interval = max(float(progress_interval), 0.1)
-    buffer_units = buffer_miles * _FEET_PER_MILE * _PROJECTED_UNITS_PER_FOOT
-    simplify_units = simplify_feet * _PROJECTED_UNITS_PER_FOOT
-
-    to_3857 = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
-    to_4326 = Transformer.from_crs("EPSG:3857", "EPSG:4326", always_xy=True)
-
-    def project(x: float, y: float, _z: float | None = None) -> tuple[float, float]:
-        return to_3857.transform(x, y)
-
-    def unproject(x: float, y: float, _z: float | None = None) -> tuple[float, float]:
-        return to_4326.transform(x, y)
-
-    batch: list[Any] = []
-    combined: Any | None = None
     last_progress = time.monotonic()
 
     if progress_callback:
         await progress_callback(stats)
 
+    footprint_id = _footprint_id(resolution)
+    footprint = await TripCoverageFootprint.get(footprint_id)
+    known_cells = set(footprint.cells) if footprint else set()
+    scan_started = datetime.now(UTC)
+
     collection = Trip.get_pymongo_collection()
-    trip_query = enforce_bouncie_source({"gps": {"$exists": True, "$ne": None}})
+    trip_query = _pending_trip_query(
+        footprint.high_water_mark if footprint is not None else None,
+    )
     if max_trips is not None:
         total_trips = await collection.count_documents(trip_query)
         stats.total_trips = total_trips
@@ -150,41 +188,31 @@ async def build_trip_coverage_polygon(
                 await progress_callback(stats)
             return None, stats
 
-    cursor = collection.find(trip_query, {"gps": 1, "_id": 0})
+    cursor = collection.find(trip_query, {"gps": 1, "_id": 0}, batch_size=batch_size)
+    new_cells: set[str] = set()
 
     async for doc in cursor:
         stats.trips_seen += 1
         geom, points = _build_trip_geometry(doc.get("gps"), max_points_per_trip)
-        if geom is None:
-            if progress_callback and stats.trips_seen % progress_every == 0:
-                await progress_callback(stats)
-            continue
-        try:
-            projected = transform(project, geom)
-        except Exception:
-            if progress_callback and stats.trips_seen % progress_every == 0:
-                await progress_callback(stats)
-            continue
-        stats.geometries_used += 1
-        stats.points_used += points
-        if max_total_points is not None and stats.points_used > max_total_points:
-            stats.skipped_reason = (
-                f"point count {stats.points_used:,} exceeds safety cap "
-                f"{max_total_points:,}"
-            )
-            logger.warning(
-                "Skipping trip coverage polygon: %s",
-                stats.skipped_reason,
-            )
-            if progress_callback:
-                await progress_callback(stats)
-            return None, stats
-        batch.append(projected)
-        if len(batch) >= batch_size:
-            combined = _merge_batch(combined, batch)
-            batch = []
-            await asyncio.sleep(0)
+        if geom is not None:
+            stats.geometries_used += 1
+            stats.points_used += points
+            if max_total_points is not None and stats.points_used > max_total_points:
+                stats.skipped_reason = (
+                    f"point count {stats.points_used:,} exceeds safety cap "
+                    f"{max_total_points:,}"
+                )
+                logger.warning(
+                    "Skipping trip coverage polygon: %s",
+                    stats.skipped_reason,
+                )
+                if progress_callback:
+                    await progress_callback(stats)
+                return None, stats
+            new_cells.update(trip_footprint_cells(geom, resolution))
 
+        if stats.trips_seen % batch_size == 0:
+            await asyncio.sleep(0)
         if progress_callback:
             now = time.monotonic()
             if stats.trips_seen % progress_every == 0 or (
@@ -193,21 +221,67 @@ async def build_trip_coverage_polygon(
                 last_progress = now
                 await progress_callback(stats)
 
-    combined = _merge_batch(combined, batch)
-    await asyncio.sleep(0)
-    if combined is None:
-        logger.warning("No trip geometries available for coverage polygon.")
-        return None, stats
-
+    added = sorted(new_cells - known_cells)
+    await TripCoverageFootprint.get_pymongo_collection().update_one(
+        {"_id": footprint_id},
+        {
+            "$addToSet": {"cells": {"$each": added}},
+            "$inc": {
+                "trips_analyzed": stats.geometries_used,
+                "points_analyzed": stats.points_used,
+            },
+            "$max": {"high_water_mark": scan_started},
+            "$set": {"resolution": resolution, "updated_at": datetime.now(UTC)},
+        },
+        upsert=True,
+    )
+    cells = [*known_cells, *added]
+    stats.footprint_cells = len(cells)
     if progress_callback:
         await progress_callback(stats)
+    logger.info(
+        "Trip coverage footprint synced: trips=%d points=%d new_cells=%d cells=%d",
+        stats.geometries_used,
+        stats.points_used,
+        len(added),
+        len(cells),
+    )
+    return cells, stats
 
-    buffered = combined.buffer(buffer_units)
-    await asyncio.sleep(0)
-    if simplify_units > 0:
-        buffered = buffered.simplify(simplify_units)
-        await asyncio.sleep(0)
-    coverage = transform(unproject, buffered)
+
+async def build_trip_coverage_polygon(
+    *,
+    buffer_miles: float,
+    simplify_feet: float,
+    max_points_per_trip: int,
+    batch_size: int,
+    max_trips: int | None = None,
+    max_total_points: int | None = None,
+    progress_callback: Callable[[CoverageStats], Any] | None = None,
+    progress_every: int = 500,
+    progress_interval: float = 2.0,
+) -> tuple[Any | None, CoverageStats]:
+    cells, stats = await sync_trip_coverage_footprint(
+        max_points_per_trip=max_points_per_trip,
+        batch_size=batch_size,
+        max_trips=max_trips,
+        max_total_points=max_total_points,
+        progress_callback=progress_callback,
+        progress_every=progress_every,
+        progress_interval=progress_interval,
+    )
+    if cells is None:
+        return None, stats
+    if not cells:
+        logger.warning("No trip geometries available for coverage polygon.")
+        return None, stats
+
+    coverage = await asyncio.to_thread(
+        footprint_to_polygon,
+        cells,
+        buffer_miles=buffer_miles,
+        simplify_feet=simplify_feet,
+    )
     return coverage, stats
 
 
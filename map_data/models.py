@@ -114,6 +114,29 @@ class GeoServiceHealth(Document):
         return health
 
 
+class TripCoverageFootprint(Document):
+    """
+    Persisted H3 cell set covering every trip, one document per resolution.
+
+    Trips saved after ``high_water_mark`` are folded in incrementally; the
+    buffered polygon used for coverage extracts is derived on demand.
+    """
+
+    id: str = Field(..., alias="_id")
+    resolution: int
+    cells: list[str] = Field(default_factory=list)
+    trips_analyzed: int = 0
+    points_analyzed: int = 0
+    high_water_mark: datetime | None = None
+    updated_at: datetime | None = None
+
+    class Settings:
+        name = "trip_coverage_footprint"
+
+    model_config = ConfigDict(extra="allow")
+
+
 # Ensure forward references resolve correctly under Pydantic v2
 MapServiceConfig.model_rebuild()
 GeoServiceHealth.model_rebuild()
+TripCoverageFootprint.model_rebuild()
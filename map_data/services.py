@@ -31,7 +31,7 @@ from map_data.extracts import (
 from map_data.models import GeoServiceHealth, MapServiceConfig
 from map_data.progress import MapBuildProgress
 from map_data.us_states import get_state, total_size_mb
-from tasks.arq import get_arq_pool
+from tasks.arq import get_arq_pool, queue_for_task
 from tasks.config import get_task_config_entry
 from tasks.ops import abort_job
 
@@ -549,7 +549,11 @@ async def configure_map_services(
     await progress.save()
 
     pool = await get_arq_pool()
-    arq_job = await pool.enqueue_job("setup_map_data_task", selected_states)
+    arq_job = await pool.enqueue_job(
+        "setup_map_data_task",
+        selected_states,
+        _queue_name=queue_for_task("setup_map_data_task"),
+    )
     job_id = (
         getattr(arq_job, "job_id", None) or getattr(arq_job, "id", None) or str(arq_job)
     )
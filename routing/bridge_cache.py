@@ -0,0 +1,101 @@
+"""
+Persistent cache of gap-bridge routes.
+
+Bridges are stored per route scope (area and area version) in one Redis hash
+whose fields are the quantized gap endpoints, so regenerating a route for the
+same area resolves its gaps with a single ``HMGET`` instead of re-routing.
+The cache is best effort: any Redis failure behaves like a miss.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import TYPE_CHECKING
+
+from core.redis import get_shared_redis
+from routing.graph_connectivity import BridgeRoute
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(__name__)
+
+BRIDGE_CACHE_PREFIX = "routing:bridge"
+BRIDGE_CACHE_TTL_SECONDS = int(
+    os.getenv("ROUTE_BRIDGE_CACHE_TTL_SECONDS", str(30 * 24 * 3600)),
+)
+# 5 decimal places is ~1 m, well inside graph node snapping tolerance.
+BRIDGE_CACHE_PRECISION = 5
+
+
+def bridge_cache_field(
+    from_xy: tuple[float, float],
+    to_xy: tuple[float, float],
+) -> str:
+    """Hash field for a directed gap between two (lon, lat) points."""
+    p = BRIDGE_CACHE_PRECISION
+    return f"{from_xy[0]:.{p}f},{from_xy[1]:.{p}f}:{to_xy[0]:.{p}f},{to_xy[1]:.{p}f}"
+
+
+def _cache_key(scope: str) -> str:
+    return f"{BRIDGE_CACHE_PREFIX}:{scope}"
+
+
+async def load_cached_bridges(
+    scope: str,
+    fields: Iterable[str],
+) -> dict[str, BridgeRoute]:
+    """Return cached bridges for ``fields`` that exist under ``scope``."""
+    fields = list(dict.fromkeys(fields))
+    if not fields:
+        return {}
+    try:
+        redis = await get_shared_redis()
+        values = await redis.hmget(_cache_key(scope), fields)
+    except Exception:
+        logger.debug("Bridge cache read failed for %s", scope, exc_info=True)
+        return {}
+
+    cached: dict[str, BridgeRoute] = {}
+    for field, raw in zip(fields, values, strict=True):
+        if raw is None:
+            continue
+        try:
+            payload = json.loads(raw)
+            cached[field] = BridgeRoute(
+                coordinates=payload["c"],
+                distance_m=float(payload.get("d") or 0.0),
+                duration_s=float(payload.get("t") or 0.0),
+            )
+        except (ValueError, TypeError, KeyError):
+            continue
+    return cached
+
+
+async def store_bridges(scope: str, bridges: dict[str, BridgeRoute]) -> None:
+    """Persist bridges under ``scope`` and refresh the scope's TTL."""
+    if not bridges:
+        return
+    mapping = {
+        field: json.dumps(
+            {"c": bridge.coordinates, "d": bridge.distance_m, "t": bridge.duration_s},
+        )
+        for field, bridge in bridges.items()
+    }
+    try:
+        redis = await get_shared_redis()
+        key = _cache_key(scope)
+        await redis.hset(key, mapping=mapping)
+        await redis.expire(key, BRIDGE_CACHE_TTL_SECONDS)
+    except Exception:
+        logger.debug("Bridge cache write failed for %s", scope, exc_info=True)
+
+
+__all__ = [
+    "BRIDGE_CACHE_PREFIX",
+    "bridge_cache_field",
+    "load_cached_bridges",
+    "store_bridges",
+]
@@ -35,3 +35,7 @@ ZONE_DECOMPOSITION_THRESHOLD = 2000
 # Gap-filling threshold (fallback mode only; explicit discontinuity bridging
 # should be preferred when route-edge transitions are available).
 GAP_FILL_THRESHOLD_FT = 1000.0
+# Local gap bridging: how far a gap endpoint may sit from a graph node, and the
+# speed used to estimate duration when edges carry no travel_time.
+GAP_BRIDGE_SNAP_TOLERANCE_M = 25.0
+GAP_BRIDGE_LOCAL_SPEED_MPS = 11.2  # ~25 mph
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 from dataclasses import dataclass
 from typing import Any
 
+import networkx as nx
+
 from core.spatial import GeometryService
 
 logger = logging.getLogger(__name__)
@@ -15,6 +18,33 @@ class GapFillStats:
     max_gap_ft_before: float = 0.0
     bridge_distance_m: float = 0.0
     bridge_duration_s: float = 0.0
+    gaps_from_cache: int = 0
+    gaps_bridged_locally: int = 0
+
+
+def _gap_endpoints(
+    route_coords: list[list[float]],
+    gap_idx: int,
+) -> tuple[tuple[float, float], tuple[float, float]]:
+    prev = route_coords[gap_idx - 1]
+    cur = route_coords[gap_idx]
+    return (prev[0], prev[1]), (cur[0], cur[1])
+
+
+def _bridge_gaps_locally(
+    graph: nx.MultiDiGraph,
+    node_xy: dict[Any, tuple[float, float]] | None,
+    endpoints: dict[int, tuple[tuple[float, float], tuple[float, float]]],
+) -> dict[int, Any]:
+    from routing.graph_connectivity import LocalGraphBridger
+
+    bridger = LocalGraphBridger(graph, node_xy)
+    bridged: dict[int, Any] = {}
+    for gap_idx, (from_xy, to_xy) in endpoints.items():
+        bridge = bridger.bridge(from_xy, to_xy)
+        if bridge is not None:
+            bridged[gap_idx] = bridge
+    return bridged
 
 
 async def fill_route_gaps(
@@ -22,12 +52,19 @@ async def fill_route_gaps(
     max_gap_ft: float = 1000.0,
     explicit_gap_indices: list[int] | None = None,
     progress_callback: Any | None = None,
+    *,
+    graph: nx.MultiDiGraph | None = None,
+    node_xy: dict[Any, tuple[float, float]] | None = None,
+    cache_scope: str | None = None,
 ) -> tuple[list[list[float]], GapFillStats]:
     """
-    Fill gaps in a route with actual driving routes from Valhalla.
+    Fill gaps in a route with actual driving routes.
 
-    This is a simple post-processing step that finds any gaps larger than
-    max_gap_ft and fetches real driving routes to fill them.
+    Each gap is resolved from the cheapest source available: the bridge
+    cache for ``cache_scope``, then a shortest path on ``graph`` (the area
+    graph the route was solved on), and only then a Valhalla route request
+    for gaps the graph cannot join (different components). Newly found
+    bridges are written back to the cache.
 
     Args:
         route_coords: List of [lon, lat] coordinates
@@ -37,6 +74,9 @@ async def fill_route_gaps(
             route_coords[i]). When provided, these are filled directly instead
             of scanning all coordinate pairs by distance.
         progress_callback: Optional async callback(stage, pct, message)
+        graph: Optional area graph used for local bridging
+        node_xy: Optional node -> (lon, lat) lookup for ``graph``
+        cache_scope: Optional bridge cache scope (area and area version)
 
     Returns:
         (route coordinates with gaps filled, gap fill stats)
@@ -44,6 +84,11 @@ async def fill_route_gaps(
     if len(route_coords) < 2:
         return route_coords, GapFillStats()
 
+    from routing.bridge_cache import (
+        bridge_cache_field,
+        load_cached_bridges,
+        store_bridges,
+    )
     from routing.graph_connectivity import fetch_bridge_route
 
     gaps_to_fill: list[tuple[int, float]] = []  # (index, gap_ft)
@@ -94,38 +139,78 @@ async def fill_route_gaps(
         logger.info("No gaps > %.0f ft found in route", max_gap_ft)
         return route_coords, GapFillStats(max_gap_ft_before=max_gap_before)
 
-    # Cap total gaps and prioritize the largest if there are too many.
+    logger.info("Found %d gaps to fill in route", len(gaps_to_fill))
+
+    endpoints = {
+        gap_idx: _gap_endpoints(route_coords, gap_idx) for gap_idx, _ in gaps_to_fill
+    }
+    fields = {
+        gap_idx: bridge_cache_field(from_xy, to_xy)
+        for gap_idx, (from_xy, to_xy) in endpoints.items()
+    }
+    results: dict[int, Any] = {}
+    new_bridges: dict[str, Any] = {}
+
+    gaps_from_cache = 0
+    if cache_scope:
+        cached = await load_cached_bridges(cache_scope, fields.values())
+        for gap_idx, field in fields.items():
+            if field in cached:
+                results[gap_idx] = cached[field]
+        gaps_from_cache = len(results)
+
+    gaps_bridged_locally = 0
+    if graph is not None:
+        pending = {
+            gap_idx: pair
+            for gap_idx, pair in endpoints.items()
+            if gap_idx not in results
+        }
+        if pending:
+            local = await asyncio.to_thread(
+                _bridge_gaps_locally,
+                graph,
+                node_xy,
+                pending,
+            )
+            for gap_idx, bridge in local.items():
+                results[gap_idx] = bridge
+                new_bridges[fields[gap_idx]] = bridge
+            gaps_bridged_locally = len(local)
+
+    remote_gaps = [(i, gap_ft) for i, gap_ft in gaps_to_fill if i not in results]
+    if gaps_from_cache or gaps_bridged_locally:
+        logger.info(
+            "Resolved %d gaps from cache and %d on the area graph; %d need routing",
+            gaps_from_cache,
+            gaps_bridged_locally,
+            len(remote_gaps),
+        )
+
+    # Cap routing API requests and prioritize the largest gaps if there are
+    # too many.
     MAX_GAP_BATCH_SIZE = 10
     MAX_GAPS_TOTAL = 100
-    if len(gaps_to_fill) > MAX_GAPS_TOTAL:
+    if len(remote_gaps) > MAX_GAPS_TOTAL:
         logger.warning(
-            "Too many gaps to fill (%d > %d max); filling only the %d largest",
-            len(gaps_to_fill),
+            "Too many gaps to route (%d > %d max); routing only the %d largest",
+            len(remote_gaps),
             MAX_GAPS_TOTAL,
             MAX_GAPS_TOTAL,
         )
-        gaps_to_fill.sort(key=lambda g: -g[1])  # Largest gaps first
-        gaps_to_fill = gaps_to_fill[:MAX_GAPS_TOTAL]
-
-    logger.info("Found %d gaps to fill in route", len(gaps_to_fill))
+        remote_gaps.sort(key=lambda g: -g[1])  # Largest gaps first
+        remote_gaps = remote_gaps[:MAX_GAPS_TOTAL]
 
     # Fetch bridge routes in batches to avoid overwhelming the routing server.
-    import asyncio
-
-    results: dict[int, Any] = {}
-
     async def _fetch_one(gap_idx: int, gap_ft: float) -> tuple[int, float, Any]:
-        prev = route_coords[gap_idx - 1]
-        cur = route_coords[gap_idx]
-        from_xy = (prev[0], prev[1])
-        to_xy = (cur[0], cur[1])
+        from_xy, to_xy = endpoints[gap_idx]
         bridge = await fetch_bridge_route(from_xy, to_xy)
         return gap_idx, gap_ft, bridge
 
     completed_total = 0
-    total_gaps = len(gaps_to_fill)
+    total_gaps = len(remote_gaps)
     for batch_start in range(0, total_gaps, MAX_GAP_BATCH_SIZE):
-        batch = gaps_to_fill[batch_start : batch_start + MAX_GAP_BATCH_SIZE]
+        batch = remote_gaps[batch_start : batch_start + MAX_GAP_BATCH_SIZE]
         tasks = [
             asyncio.create_task(_fetch_one(gap_idx, gap_ft))
             for (gap_idx, gap_ft) in batch
@@ -134,6 +219,8 @@ async def fill_route_gaps(
         for fut in asyncio.as_completed(tasks):
             gap_idx, gap_ft, bridge = await fut
             results[gap_idx] = bridge
+            if bridge and getattr(bridge, "coordinates", None):
+                new_bridges[fields[gap_idx]] = bridge
             completed_total += 1
             if progress_callback:
                 pct = int(completed_total / max(1, total_gaps) * 100)
@@ -143,6 +230,9 @@ async def fill_route_gaps(
                     f"Filling gap {completed_total}/{total_gaps} ({gap_ft / 5280:.2f} mi)",
                 )
 
+    if cache_scope and new_bridges:
+        await store_bridges(cache_scope, new_bridges)
+
     # Rebuild coordinates with inserts.
     filled_coords: list[list[float]] = []
     gaps_filled = 0
@@ -192,5 +282,7 @@ async def fill_route_gaps(
             max_gap_ft_before=max_gap_before,
             bridge_distance_m=bridge_distance_m,
             bridge_duration_s=bridge_duration_s,
+            gaps_from_cache=gaps_from_cache,
+            gaps_bridged_locally=gaps_bridged_locally,
         ),
     )
@@ -1,20 +1,31 @@
 """
-Simple route gap-filling via Valhalla routing API.
+Route gap bridging for the route solver.
 
-This module provides a single function to fetch driving routes between
-points, used by the route solver to fill gaps in generated routes.
+Gaps are first bridged with a shortest path on the area graph the solver
+already loaded (``LocalGraphBridger``); only gaps whose endpoints sit in
+different graph components fall back to the Valhalla routing API
+(``fetch_bridge_route``).
 """
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 from dataclasses import dataclass
+from typing import Any
+
+import networkx as nx
+import shapely
 
 from core.constants import METERS_TO_MILES
 from core.exceptions import ExternalServiceException
 from core.mapping.factory import get_router
 from core.mapping.interfaces import Router
+from core.spatial import GeometryService
+
+from .constants import GAP_BRIDGE_LOCAL_SPEED_MPS, GAP_BRIDGE_SNAP_TOLERANCE_M
+from .graph import get_edge_geometry, pick_best_key
 
 logger = logging.getLogger(__name__)
 
@@ -141,3 +152,108 @@ async def fetch_bridge_route(
 
     logger.warning("No route found by routing API")
     return None
+
+
+class LocalGraphBridger:
+    """
+    Bridge route gaps with shortest paths on an already-loaded area graph.
+
+    Gap endpoints are snapped to graph nodes (exact coordinate match first,
+    then the nearest node within ``snap_tolerance_m``). Endpoints in
+    different weakly connected components cannot be joined locally and are
+    left for the routing API.
+    """
+
+    def __init__(
+        self,
+        G: nx.MultiDiGraph,
+        node_xy: dict[Any, tuple[float, float]] | None = None,
+        *,
+        snap_tolerance_m: float = GAP_BRIDGE_SNAP_TOLERANCE_M,
+    ) -> None:
+        self.G = G
+        self.node_xy = node_xy or {
+            n: (float(G.nodes[n]["x"]), float(G.nodes[n]["y"]))
+            for n in G.nodes
+            if G.nodes[n].get("x") is not None and G.nodes[n].get("y") is not None
+        }
+        self.snap_tolerance_m = snap_tolerance_m
+        self._node_ids = list(self.node_xy)
+        self._by_coord = {
+            (round(x, 7), round(y, 7)): node for node, (x, y) in self.node_xy.items()
+        }
+        self._tree: Any | None = None
+        self._component: dict[Any, int] | None = None
+
+    def snap(self, xy: tuple[float, float]) -> Any | None:
+        node = self._by_coord.get((round(xy[0], 7), round(xy[1], 7)))
+        if node is not None or not self._node_ids:
+            return node
+        if self._tree is None:
+            self._tree = shapely.STRtree(
+                shapely.points([self.node_xy[n] for n in self._node_ids]),
+            )
+        hit = self._tree.query_nearest(shapely.points(xy))
+        if len(hit) == 0:
+            return None
+        node = self._node_ids[int(hit[0])]
+        node_lon, node_lat = self.node_xy[node]
+        distance_m = GeometryService.haversine_distance(
+            xy[0],
+            xy[1],
+            node_lon,
+            node_lat,
+            unit="meters",
+        )
+        return node if distance_m <= self.snap_tolerance_m else None
+
+    def same_component(self, u: Any, v: Any) -> bool:
+        if self._component is None:
+            self._component = {}
+            for idx, nodes in enumerate(nx.weakly_connected_components(self.G)):
+                for node in nodes:
+                    self._component[node] = idx
+        return self._component.get(u, -1) == self._component.get(v, -2)
+
+    def bridge(
+        self,
+        from_xy: tuple[float, float],
+        to_xy: tuple[float, float],
+    ) -> BridgeRoute | None:
+        """Shortest driveable path between two points, or None if not local."""
+        u = self.snap(from_xy)
+        v = self.snap(to_xy)
+        if u is None or v is None or not self.same_component(u, v):
+            return None
+        try:
+            distance_m, path = nx.bidirectional_dijkstra(self.G, u, v, weight="length")
+        except (nx.NetworkXNoPath, nx.NodeNotFound):
+            return None
+
+        coords: list[list[float]] = [[float(from_xy[0]), float(from_xy[1])]]
+        duration_s = 0.0
+        timed = True
+        for a, b in itertools.pairwise(path):
+            key = pick_best_key(self.G, a, b)
+            edge_coords = get_edge_geometry(self.G, a, b, key, node_xy=self.node_xy)
+            if not edge_coords:
+                edge_coords = [list(self.node_xy[a]), list(self.node_xy[b])]
+            if coords[-1] == edge_coords[0]:
+                edge_coords = edge_coords[1:]
+            coords.extend(edge_coords)
+            data = self.G.edges[a, b, key] if key is not None else {}
+            travel_time = data.get("travel_time")
+            if travel_time is None:
+                timed = False
+            else:
+                duration_s += float(travel_time)
+        coords.append([float(to_xy[0]), float(to_xy[1])])
+
+        distance_m = float(distance_m)
+        if not timed:
+            duration_s = distance_m / GAP_BRIDGE_LOCAL_SPEED_MPS
+        return BridgeRoute(
+            coordinates=coords,
+            distance_m=distance_m,
+            duration_s=duration_s,
+        )
@@ -1534,7 +1534,7 @@ async def _generate_optimal_route_with_progress_impl(
                     exc_info=True,
                 )
 
-        # Fill gaps in the route with Valhalla driving directions
+        # Fill gaps in the route: area graph first, Valhalla across components
         await update_progress(
             "filling_gaps",
             85,
@@ -1562,6 +1562,9 @@ async def _generate_optimal_route_with_progress_impl(
                 max_gap_ft=GAP_FILL_THRESHOLD_FT,
                 explicit_gap_indices=explicit_gap_indices or None,
                 progress_callback=gap_progress,
+                graph=G,
+                node_xy=route_node_xy,
+                cache_scope=f"{location_id_str}:{current_area_version}",
             )
         except Exception as e:
             gap_fill_stats = None
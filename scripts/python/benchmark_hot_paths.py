@@ -0,0 +1,714 @@
+"""
+Offline benchmark suite for the expensive coverage, routing and map paths.
+
+Every run seeds the same synthetic dataset from ``--seed`` into an in-memory
+Mongo mock and an in-memory Redis stand-in, so timings are comparable
+between commits and need no live services. The dataset is a square street
+grid (Street segments, a coverage area and a GraphML road graph) plus
+random-walk trips driven across it.
+
+Each phase reports wall time and the process peak RSS after it ran; the
+whole report can also be written as JSON for comparison between runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import math
+import random
+import resource
+import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+ROOT = Path(__file__).resolve().parents[2]
+for path in (ROOT, ROOT / "tests"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import networkx as nx  # noqa: E402
+from bson import ObjectId  # noqa: E402
+from shapely.geometry import box  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+
+from core import redis as core_redis  # noqa: E402
+from db.models import (  # noqa: E402
+    CoverageArea,
+    CoverageDriveEvent,
+    CoverageJournalRollup,
+    CoverageState,
+    CoverageStatusEvent,
+    Street,
+    Trip,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# ~111 m between grid intersections at the benchmark latitude.
+GRID_SPACING_DEG = 0.001
+GRID_ORIGIN = (-97.2, 31.5)
+TRIP_START = datetime(2025, 1, 1, 7, 0, tzinfo=UTC)
+PHASES = (
+    "segment_index",
+    "coverage_backfill",
+    "journal_rollup",
+    "coverage_map_bundle",
+    "trip_map_bundle",
+    "route_generation",
+    "geo_coverage",
+)
+
+
+class MemoryRedis:
+    """Single-process stand-in for the subset of Redis the app calls."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key: str) -> Any:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: Any, **_kwargs: Any) -> bool:
+        self.values[key] = value
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = int(self.values.get(key) or 0) + 1
+        return self.values[key]
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def expire(self, key: str, _seconds: int) -> bool:
+        return key in self.values
+
+    async def hset(
+        self,
+        key: str,
+        field: str | None = None,
+        value: Any = None,
+        mapping: dict[str, Any] | None = None,
+    ) -> int:
+        bucket = self.values.setdefault(key, {})
+        updates = dict(mapping or {})
+        if field is not None:
+            updates[field] = value
+        bucket.update(updates)
+        return len(updates)
+
+    async def hget(self, key: str, field: str) -> Any:
+        return self.values.get(key, {}).get(field)
+
+    async def hmget(self, key: str, fields: list[str]) -> list[Any]:
+        bucket = self.values.get(key, {})
+        return [bucket.get(field) for field in fields]
+
+    async def hgetall(self, key: str) -> dict[str, Any]:
+        return dict(self.values.get(key, {}))
+
+    async def publish(self, _channel: str, _message: Any) -> int:
+        return 0
+
+
+@dataclass
+class PhaseResult:
+    name: str
+    wall_seconds: float
+    peak_rss_mb: float
+    steps: dict[str, float] = field(default_factory=dict)
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BenchmarkContext:
+    grid_size: int
+    area: CoverageArea
+    graph_path: Path
+    trip_docs: list[dict[str, Any]]
+    steps: dict[str, float] = field(default_factory=dict)
+    results: list[PhaseResult] = field(default_factory=list)
+
+    @asynccontextmanager
+    async def step(self, name: str) -> AsyncIterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps[name] = time.perf_counter() - started
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _node_id(grid_size: int, col: int, row: int) -> int:
+    return row * grid_size + col
+
+
+def _node_xy(grid_size: int, node: int) -> tuple[float, float]:
+    row, col = divmod(node, grid_size)
+    return (
+        round(GRID_ORIGIN[0] + col * GRID_SPACING_DEG, 6),
+        round(GRID_ORIGIN[1] + row * GRID_SPACING_DEG, 6),
+    )
+
+
+def _grid_edges(grid_size: int) -> list[tuple[int, int]]:
+    edges: list[tuple[int, int]] = []
+    for row in range(grid_size):
+        for col in range(grid_size):
+            node = _node_id(grid_size, col, row)
+            if col + 1 < grid_size:
+                edges.append((node, _node_id(grid_size, col + 1, row)))
+            if row + 1 < grid_size:
+                edges.append((node, _node_id(grid_size, col, row + 1)))
+    return edges
+
+
+def _edge_length_m(a: tuple[float, float], b: tuple[float, float]) -> float:
+    mean_lat = math.radians((a[1] + b[1]) / 2)
+    dx = (b[0] - a[0]) * math.cos(mean_lat) * 111_320.0
+    dy = (b[1] - a[1]) * 110_540.0
+    return math.hypot(dx, dy)
+
+
+def build_grid_graph(grid_size: int) -> nx.MultiDiGraph:
+    """Two-way street grid in lon/lat shaped like an OSMnx drive graph."""
+    G = nx.MultiDiGraph(crs="EPSG:4326", simplified=True)
+    for node in range(grid_size * grid_size):
+        x, y = _node_xy(grid_size, node)
+        G.add_node(node, x=x, y=y, street_count=4)
+    for osmid, (u, v) in enumerate(_grid_edges(grid_size), start=1):
+        length = _edge_length_m(_node_xy(grid_size, u), _node_xy(grid_size, v))
+        for a, b in ((u, v), (v, u)):
+            G.add_edge(
+                a,
+                b,
+                key=0,
+                osmid=osmid,
+                length=length,
+                highway="residential",
+                oneway=False,
+                reversed=a != u,
+            )
+    return G
+
+
+def _random_walk(rng: random.Random, grid_size: int, steps: int) -> list[int]:
+    col, row = rng.randrange(grid_size), rng.randrange(grid_size)
+    walk = [_node_id(grid_size, col, row)]
+    for _ in range(steps):
+        moves = [
+            (col + dc, row + dr)
+            for dc, dr in ((1, 0), (-1, 0), (0, 1), (0, -1))
+            if 0 <= col + dc < grid_size and 0 <= row + dr < grid_size
+        ]
+        col, row = rng.choice(moves)
+        walk.append(_node_id(grid_size, col, row))
+    return walk
+
+
+def _trip_coordinates(
+    rng: random.Random,
+    grid_size: int,
+    walk: list[int],
+) -> list[list[float]]:
+    # Four GPS fixes per block with a few metres of jitter.
+    coords: list[list[float]] = []
+    for u, v in pairwise(walk):
+        ax, ay = _node_xy(grid_size, u)
+        bx, by = _node_xy(grid_size, v)
+        for step in range(4):
+            t = step / 4
+            coords.append(
+                [
+                    round(ax + (bx - ax) * t + rng.gauss(0, 0.00002), 6),
+                    round(ay + (by - ay) * t + rng.gauss(0, 0.00002), 6),
+                ],
+            )
+    coords.append(list(_node_xy(grid_size, walk[-1])))
+    return coords
+
+
+async def seed_dataset(
+    *,
+    seed: int,
+    grid_size: int,
+    trip_count: int,
+    workdir: Path,
+) -> BenchmarkContext:
+    """Initialise the mock database and insert the synthetic dataset."""
+    from db_helpers import init_mock_beanie
+
+    from trips.services.trip_map_geometry import build_encoded_path_metadata
+
+    await init_mock_beanie(
+        CoverageArea,
+        CoverageState,
+        CoverageDriveEvent,
+        CoverageStatusEvent,
+        CoverageJournalRollup,
+        Street,
+        Trip,
+        database_name="benchmark_hot_paths",
+    )
+    rng = random.Random(seed)
+
+    min_x, min_y = GRID_ORIGIN
+    max_x, max_y = _node_xy(grid_size, grid_size * grid_size - 1)
+    area = CoverageArea(
+        display_name=f"Benchmark Grid {grid_size}x{grid_size}",
+        status="ready",
+        health="healthy",
+        boundary=box(min_x, min_y, max_x, max_y).__geo_interface__,
+    )
+    await area.insert()
+
+    street_docs: list[dict[str, Any]] = []
+    total_miles = 0.0
+    for osmid, (u, v) in enumerate(_grid_edges(grid_size), start=1):
+        a, b = _node_xy(grid_size, u), _node_xy(grid_size, v)
+        length_miles = _edge_length_m(a, b) / 1609.344
+        total_miles += length_miles
+        row = u // grid_size
+        street_docs.append(
+            {
+                "segment_id": f"{area.id}-{area.area_version}-{osmid}",
+                "area_id": area.id,
+                "area_version": area.area_version,
+                "geometry": {"type": "LineString", "coordinates": [list(a), list(b)]},
+                "street_name": (
+                    f"Row {row} Street" if v == u + 1 else f"Col {u % grid_size} Ave"
+                ),
+                "highway_type": "residential",
+                "osm_id": osmid,
+                "length_miles": length_miles,
+            },
+        )
+    await Street.get_pymongo_collection().insert_many(street_docs)
+    await area.set(
+        {
+            "total_segments": len(street_docs),
+            "total_length_miles": total_miles,
+            "driveable_length_miles": total_miles,
+        },
+    )
+
+    trip_docs: list[dict[str, Any]] = []
+    for index in range(trip_count):
+        walk = _random_walk(rng, grid_size, rng.randint(8, 40))
+        coords = _trip_coordinates(rng, grid_size, walk)
+        start = TRIP_START + timedelta(hours=index * 7 + rng.randint(0, 5))
+        end = start + timedelta(minutes=len(walk))
+        gps = {"type": "LineString", "coordinates": coords}
+        trip_docs.append(
+            {
+                "_id": ObjectId(),
+                "transactionId": f"bench-{index:06d}",
+                "source": "bouncie",
+                "imei": f"bench-imei-{index % 3}",
+                "startTime": start,
+                "endTime": end,
+                "startTimeZone": "America/Chicago",
+                "endTimeZone": "America/Chicago",
+                "distance": sum(
+                    _edge_length_m(_node_xy(grid_size, u), _node_xy(grid_size, v))
+                    for u, v in pairwise(walk)
+                )
+                / 1609.344,
+                "maxSpeed": float(rng.randint(25, 55)),
+                "avgSpeed": float(rng.randint(12, 30)),
+                "gps": gps,
+                "displayGps": gps,
+                "displayMapPath": build_encoded_path_metadata(
+                    gps,
+                    geometry_source="displayGps",
+                ),
+            },
+        )
+    await Trip.get_pymongo_collection().insert_many(trip_docs)
+
+    graph_path = workdir / "benchmark_grid.graphml"
+    import osmnx as ox
+
+    ox.save_graphml(build_grid_graph(grid_size), graph_path)
+
+    return BenchmarkContext(
+        grid_size=grid_size,
+        area=area,
+        graph_path=graph_path,
+        trip_docs=trip_docs,
+    )
+
+
+async def bench_segment_index(ctx: BenchmarkContext) -> dict[str, Any]:
+    from core.coverage import AreaSegmentIndex, trip_to_linestring_candidates
+
+    async with ctx.step("build"):
+        index = await AreaSegmentIndex(ctx.area.id, ctx.area.area_version).build()
+    matched = 0
+    async with ctx.step("match"):
+        for trip in ctx.trip_docs:
+            for line, _is_matched in trip_to_linestring_candidates(
+                trip,
+                trip_mode="regular",
+            ):
+                matched += len(index.find_matching_segments(line))
+    return {"segments": len(index.segments), "segment_matches": matched}
+
+
+async def bench_coverage_backfill(ctx: BenchmarkContext) -> dict[str, Any]:
+    from core.coverage import backfill_coverage_for_area
+
+    async with ctx.step("backfill"):
+        updated = await backfill_coverage_for_area(
+            ctx.area.id,
+            trip_mode="regular",
+            full=True,
+        )
+    return {"newly_driven_segments": updated}
+
+
+async def bench_journal_rollup(ctx: BenchmarkContext) -> dict[str, Any]:
+    from street_coverage.journal import mark_journal_pending, rebuild_journal_rollup
+
+    await mark_journal_pending(ctx.area.id)
+    async with ctx.step("rebuild"):
+        rollup = await rebuild_journal_rollup(ctx.area.id)
+    events = await CoverageDriveEvent.find({"area_id": ctx.area.id}).count()
+    return {"drive_events": events, "rollup_status": getattr(rollup, "status", None)}
+
+
+async def bench_coverage_map_bundle(ctx: BenchmarkContext) -> dict[str, Any]:
+    from api.map_bundle import get_coverage_map_bundle
+
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/", "headers": []},
+    )
+    async with ctx.step("bundle"):
+        response = await get_coverage_map_bundle(request, ctx.area.id)
+    payload = json.loads(response.body)
+    return {"features": payload["segment_count"], "body_bytes": len(response.body)}
+
+
+async def bench_trip_map_bundle(ctx: BenchmarkContext) -> dict[str, Any]:
+    # The endpoint's date filter relies on $dateToString timezones that the
+    # Mongo mock lacks, so this runs the bundle's per-trip work directly.
+    from api.map_bundle import _build_trip_map_summary, _path_metadata_for_doc
+    from core.coverage_clip import CoverageClipContext
+    from core.serialization import serialize_utc_datetime
+    from trips.services.trip_map_geometry import build_encoded_path_metadata
+
+    async with ctx.step("materialize_paths"):
+        for trip in ctx.trip_docs:
+            build_encoded_path_metadata(trip["gps"], geometry_source="displayGps")
+
+    features: list[dict[str, Any]] = []
+    async with ctx.step("assemble"):
+        cursor = Trip.get_pymongo_collection().find(
+            {"source": "bouncie", "displayGps": {"$ne": None}},
+            projection={"gps": 0, "displayGps": 0},
+        )
+        async for trip_doc in cursor:
+            path_metadata, _ = _path_metadata_for_doc(
+                trip_doc,
+                path_field="displayMapPath",
+                geometry_field="displayGps",
+                coverage_clip=CoverageClipContext(),
+            )
+            if not path_metadata:
+                continue
+            features.append(
+                {
+                    "id": trip_doc["transactionId"],
+                    "start_time": trip_doc["startTime"],
+                    "start_time_zone": trip_doc.get("startTimeZone"),
+                    "end_time": trip_doc["endTime"],
+                    "distance_miles": trip_doc.get("distance"),
+                    "duration_seconds": (
+                        trip_doc["endTime"] - trip_doc["startTime"]
+                    ).total_seconds(),
+                    "max_speed": trip_doc.get("maxSpeed"),
+                    "bbox": path_metadata["bbox"],
+                    "path": path_metadata["path"],
+                },
+            )
+        summary = _build_trip_map_summary(features)
+    async with ctx.step("serialize"):
+        body = json.dumps(
+            {"summary": summary, "trips": features},
+            separators=(",", ":"),
+            default=serialize_utc_datetime,
+        )
+    return {"features": len(features), "body_bytes": len(body)}
+
+
+async def bench_route_generation(ctx: BenchmarkContext) -> dict[str, Any]:
+    from core.osmnx_graphml import load_graphml_robust
+    from routing.constants import LOCAL_SEARCH_TIME_BUDGET_S
+    from routing.core import make_req_id, solve_greedy_route
+    from routing.graph import (
+        build_osmid_index,
+        prepare_spatial_matching_graph,
+        project_linestring_coords,
+        try_match_osmid,
+    )
+    from routing.local_search import improve_route_2opt
+
+    async with ctx.step("load_graphml"):
+        G = await asyncio.to_thread(load_graphml_robust, ctx.graph_path)
+
+    driven = {
+        state.segment_id
+        for state in await CoverageState.find(
+            {"area_id": ctx.area.id, "status": "driven"},
+        ).to_list()
+    }
+    undriven = [
+        street
+        for street in await Street.find({"area_id": ctx.area.id}).to_list()
+        if street.segment_id not in driven
+    ]
+
+    required_reqs: dict[Any, Any] = {}
+    async with ctx.step("match_segments"):
+        matching_graph, project_xy = prepare_spatial_matching_graph(G)
+        node_xy = {
+            node: (float(data["x"]), float(data["y"]))
+            for node, data in matching_graph.nodes(data=True)
+        }
+        osmid_index = build_osmid_index(matching_graph)
+        for street in undriven:
+            coords = project_linestring_coords(
+                street.geometry["coordinates"],
+                project_xy,
+            )
+            edge = try_match_osmid(
+                matching_graph,
+                coords or [],
+                street.osm_id,
+                osmid_index,
+                node_xy=node_xy,
+            )
+            if edge is not None:
+                req_id, options = make_req_id(G, edge)
+                required_reqs[req_id] = options
+
+    start_node = next(iter(G.nodes))
+    async with ctx.step("solve"):
+        coords, stats, _edges, sequence = solve_greedy_route(
+            G,
+            required_reqs,
+            start_node,
+        )
+    async with ctx.step("local_search"):
+        _coords, improved, _sequence = improve_route_2opt(
+            G,
+            sequence,
+            required_reqs,
+            start_node=start_node,
+            time_budget_s=LOCAL_SEARCH_TIME_BUDGET_S,
+        )
+    return {
+        "required_edges": len(required_reqs),
+        "route_points": len(coords),
+        "deadhead_pct": round(stats.get("deadhead_percentage", 0.0), 2),
+        "deadhead_pct_2opt": round(improved.get("deadhead_percentage", 0.0), 2),
+    }
+
+
+async def bench_geo_coverage(ctx: BenchmarkContext) -> dict[str, Any]:
+    from geo_coverage.services.boundary_index import BoundaryLayer, GeoBoundaryIndex
+    from geo_coverage.services.geo_coverage_service import (
+        _evaluate_trip_batch,
+        _GeoVisitMaps,
+    )
+
+    # Quarter the grid into "counties" and give each a "city" in its centre.
+    half = ctx.grid_size * GRID_SPACING_DEG / 2
+    county_ids: list[str] = []
+    county_shapes: list[Any] = []
+    city_ids: list[str] = []
+    city_shapes: list[Any] = []
+    for index, (dx, dy) in enumerate(((0, 0), (1, 0), (0, 1), (1, 1))):
+        min_x = GRID_ORIGIN[0] + dx * half
+        min_y = GRID_ORIGIN[1] + dy * half
+        county_ids.append(f"48{index:03d}")
+        county_shapes.append(box(min_x, min_y, min_x + half, min_y + half))
+        city_ids.append(f"city-{index}")
+        city_shapes.append(
+            box(
+                min_x + half / 4,
+                min_y + half / 4,
+                min_x + 3 * half / 4,
+                min_y + 3 * half / 4,
+            ),
+        )
+
+    async with ctx.step("build_index"):
+        index = GeoBoundaryIndex(
+            version="benchmark",
+            counties=BoundaryLayer.build(county_ids, county_shapes),
+            cities=BoundaryLayer.build(city_ids, city_shapes),
+            state_names={"48": "Texas"},
+            county_totals_by_state={"48": len(county_ids)},
+            city_state_index=dict.fromkeys(city_ids, "48"),
+            city_state_names={"48": "Texas"},
+            city_totals_by_state={"48": len(city_ids)},
+        )
+    maps = _GeoVisitMaps()
+    async with ctx.step("evaluate_trips"):
+        for hits in _evaluate_trip_batch(index, ctx.trip_docs):
+            if hits is not None:
+                maps.merge(hits)
+    return {
+        "counties_visited": len(maps.county_visits),
+        "cities_visited": len(maps.city_visits),
+        "cities_stopped": len(maps.city_stops),
+    }
+
+
+PHASE_RUNNERS = {
+    "segment_index": bench_segment_index,
+    "coverage_backfill": bench_coverage_backfill,
+    "journal_rollup": bench_journal_rollup,
+    "coverage_map_bundle": bench_coverage_map_bundle,
+    "trip_map_bundle": bench_trip_map_bundle,
+    "route_generation": bench_route_generation,
+    "geo_coverage": bench_geo_coverage,
+}
+
+
+async def run_benchmarks(
+    *,
+    seed: int = 1,
+    grid_size: int = 30,
+    trip_count: int = 400,
+    phases: tuple[str, ...] = PHASES,
+) -> dict[str, Any]:
+    """Seed the dataset, run ``phases`` in order and return the report."""
+    previous_client = core_redis._shared_client
+    core_redis._shared_client = MemoryRedis()
+    started = time.perf_counter()
+    try:
+        with tempfile.TemporaryDirectory(prefix="benchmark_hot_paths_") as tmp:
+            seed_started = time.perf_counter()
+            ctx = await seed_dataset(
+                seed=seed,
+                grid_size=grid_size,
+                trip_count=trip_count,
+                workdir=Path(tmp),
+            )
+            ctx.results.append(
+                PhaseResult(
+                    name="seed",
+                    wall_seconds=time.perf_counter() - seed_started,
+                    peak_rss_mb=_peak_rss_mb(),
+                    details={"trips": trip_count, "grid_size": grid_size},
+                ),
+            )
+            for name in phases:
+                gc.collect()
+                ctx.steps = {}
+                phase_started = time.perf_counter()
+                details = await PHASE_RUNNERS[name](ctx)
+                ctx.results.append(
+                    PhaseResult(
+                        name=name,
+                        wall_seconds=time.perf_counter() - phase_started,
+                        peak_rss_mb=_peak_rss_mb(),
+                        steps=ctx.steps,
+                        details=details,
+                    ),
+                )
+    finally:
+        core_redis._shared_client = previous_client
+
+    return {
+        "seed": seed,
+        "grid_size": grid_size,
+        "trip_count": trip_count,
+        "python": sys.version.split()[0],
+        "generated_at": datetime.now(UTC).isoformat(),
+        "total_seconds": time.perf_counter() - started,
+        "peak_rss_mb": _peak_rss_mb(),
+        "phases": [asdict(result) for result in ctx.results],
+    }
+
+
+def format_report(report: dict[str, Any]) -> str:
+    grid = f"{report['grid_size']}x{report['grid_size']}"
+    header = f"seed={report['seed']} grid={grid} trips={report['trip_count']}"
+    lines = [
+        f"{header} python={report['python']}",
+        f"{'phase':<22}{'wall s':>10}{'peak MB':>10}  steps",
+    ]
+    for phase in report["phases"]:
+        steps = " ".join(
+            f"{name}={seconds:.3f}" for name, seconds in phase["steps"].items()
+        )
+        lines.append(
+            f"{phase['name']:<22}{phase['wall_seconds']:>10.3f}"
+            f"{phase['peak_rss_mb']:>10.1f}  {steps}",
+        )
+    lines.append(
+        f"{'total':<22}{report['total_seconds']:>10.3f}{report['peak_rss_mb']:>10.1f}",
+    )
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--grid-size",
+        type=int,
+        default=30,
+        help="Intersections per side of the synthetic street grid.",
+    )
+    parser.add_argument("--trips", type=int, default=400)
+    parser.add_argument(
+        "--phase",
+        action="append",
+        choices=PHASES,
+        help="Run only this phase (repeatable). Defaults to all phases.",
+    )
+    parser.add_argument("--json", type=Path, help="Also write the report here.")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(
+        run_benchmarks(
+            seed=args.seed,
+            grid_size=args.grid_size,
+            trip_count=args.trips,
+            phases=tuple(args.phase or PHASES),
+        ),
+    )
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -13,7 +13,8 @@ from core.coverage_clip import (
 )
 from core.mapping.factory import get_geocoder
 from core.spatial import extract_line_geometry
-from db.models import CoverageArea, CoverageState, Street
+from db.models import CoverageArea
+from street_coverage.street_names import search_street_names
 
 if TYPE_CHECKING:
     from beanie import PydanticObjectId
@@ -175,41 +176,10 @@ class SearchService:
             return []
 
         location_name = new_area.display_name
-
-        driven_segment_ids = set()
-        async for state in CoverageState.find(
-            CoverageState.area_id == coverage_area_id,
-            CoverageState.status == "driven",
-        ):
-            driven_segment_ids.add(state.segment_id)
-
-        street_groups: dict[str, dict[str, Any]] = {}
-        async for street in Street.find(
-            Street.area_id == coverage_area_id,
-            Street.area_version == new_area.area_version,
-            Street.street_name != None,  # noqa: E711
-        ):
-            name = street.street_name
-            if not name or query.lower() not in name.lower():
-                continue
-
-            if name not in street_groups:
-                street_groups[name] = {
-                    "geometries": [],
-                    "highway": street.highway_type,
-                    "total_length": 0.0,
-                    "segment_count": 0,
-                    "driven_count": 0,
-                }
-
-            street_groups[name]["geometries"].append(street.geometry)
-            street_groups[name]["total_length"] += street.length_miles * 5280
-            street_groups[name]["segment_count"] += 1
-            if street.segment_id in driven_segment_ids:
-                street_groups[name]["driven_count"] += 1
+        matches = await search_street_names(new_area, query, limit)
 
         features = []
-        for street_name, data in list(street_groups.items())[:limit]:
+        for data in matches:
             coordinates = [
                 geom.get("coordinates", [])
                 for geom in data["geometries"]
@@ -225,11 +195,11 @@ class SearchService:
                             "coordinates": coordinates,
                         },
                         "properties": {
-                            "street_name": street_name,
+                            "street_name": data["street_name"],
                             "location": location_name,
-                            "highway": data["highway"],
+                            "highway": data["highway_type"],
                             "segment_count": data["segment_count"],
-                            "total_length": data["total_length"],
+                            "total_length": data["total_length_miles"] * 5280,
                             "driven_count": data["driven_count"],
                         },
                     },
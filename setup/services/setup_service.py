@@ -627,7 +627,15 @@ async def restart_service(service_name: str) -> dict[str, Any]:
 async def get_service_logs(service_name: str, tail: int = 100) -> dict[str, Any]:
     """Fetch recent logs for a service container."""
     service_name = service_name.strip().lower()
-    allowed = {"nominatim", "valhalla", "mongo", "redis", "worker", "app"}
+    allowed = {
+        "nominatim",
+        "valhalla",
+        "mongo",
+        "redis",
+        "worker",
+        "worker-heavy",
+        "app",
+    }
     if (
         service_name not in allowed
         and not service_name.startswith("everystreet-")
@@ -644,6 +652,7 @@ async def get_service_logs(service_name: str, tail: int = 100) -> dict[str, Any]
         "mongodb": "mongo",
         "redis": "redis",
         "worker": "worker",
+        "worker-heavy": "worker-heavy",
         "app": "app",
         "bouncie": "app",
     }
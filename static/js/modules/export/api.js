@@ -15,10 +15,43 @@ export async function fetchVehicles(signal) {
   }
 }
 
-export function createExportJob(payload, signal) {
-  return apiClient.post("/api/exports", payload, { signal });
+async function readErrorDetail(response) {
+  try {
+    const data = await response.json();
+    return data?.detail || data?.error || `HTTP ${response.status}`;
+  } catch {
+    return `HTTP ${response.status}`;
+  }
 }
 
-export function fetchExportStatus(jobId, signal) {
-  return apiClient.get(`/api/exports/${jobId}`, { signal });
+function filenameFromDisposition(header, fallback) {
+  const match = /filename="?([^";]+)"?/i.exec(header || "");
+  return match ? match[1] : fallback;
+}
+
+/**
+ * Stream an export straight from the server; nothing is staged on disk.
+ * Resolves to the open Response plus the filename the server chose.
+ */
+export async function streamExport(payload, signal) {
+  const response = await apiClient.raw("/api/exports/stream", {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload),
+    signal,
+    retry: false,
+    timeout: 0,
+  });
+  if (!response.ok) {
+    const error = new Error(await readErrorDetail(response));
+    error.status = response.status;
+    throw error;
+  }
+  return {
+    response,
+    filename: filenameFromDisposition(
+      response.headers.get("content-disposition"),
+      "export"
+    ),
+  };
 }
@@ -1,10 +1,11 @@
+import { fetchCoverageAreas, fetchVehicles, streamExport } from "../../export/api.js";
 import {
-  createExportJob,
-  fetchCoverageAreas,
-  fetchExportStatus,
-  fetchVehicles,
-} from "../../export/api.js";
-import { announce, isAbortError, showNotification } from "../../utils.js";
+  announce,
+  downloadBlob,
+  formatBytes,
+  isAbortError,
+  showNotification,
+} from "../../utils.js";
 
 const ENTITY_LABELS = {
   trips: "Trips",
@@ -15,8 +16,7 @@ const ENTITY_LABELS = {
 };
 
 const DEFAULT_RANGE_DAYS = 30;
-const POLL_INTERVAL_MS = 2000;
-let activePoll = null;
+let lastExport = null;
 
 function cacheElements() {
   return {
@@ -36,6 +36,7 @@ function cacheElements() {
     exportBoundaries: document.getElementById("export-boundaries"),
     exportUndriven: document.getElementById("export-undriven"),
     coverageArea: document.getElementById("coverage-area"),
+    coverageFormatSelect: document.getElementById("coverage-format"),
     exportError: document.getElementById("export-error"),
     exportSummary: document.getElementById("export-summary"),
     exportSummaryList: document.getElementById("export-summary-list"),
@@ -54,9 +55,14 @@ function getTripFormat(elements) {
   return elements.tripFormatSelect?.value || "json";
 }
 
+function getCoverageFormat(elements) {
+  return elements.coverageFormatSelect?.value || "geojson";
+}
+
 function getSelectedItems(elements) {
   const items = [];
   const format = getTripFormat(elements);
+  const coverageFormat = getCoverageFormat(elements);
   const includeGeometry = elements.includeTripGeometry?.checked ?? true;
 
   if (elements.exportTrips?.checked) {
@@ -76,7 +82,7 @@ function getSelectedItems(elements) {
   }
 
   if (elements.exportStreets?.checked) {
-    items.push({ entity: "streets", format: "geojson" });
+    items.push({ entity: "streets", format: coverageFormat });
   }
 
   if (elements.exportBoundaries?.checked) {
@@ -84,7 +90,7 @@ function getSelectedItems(elements) {
   }
 
   if (elements.exportUndriven?.checked) {
-    items.push({ entity: "undriven_streets", format: "geojson" });
+    items.push({ entity: "undriven_streets", format: coverageFormat });
   }
 
   return items;
@@ -92,6 +98,11 @@ function getSelectedItems(elements) {
 
 function updateGeometryToggle(elements) {
   const format = getTripFormat(elements);
+  if (elements.coverageFormatSelect) {
+    elements.coverageFormatSelect.disabled = !(
+      elements.exportStreets?.checked || elements.exportUndriven?.checked
+    );
+  }
   const hasTripExports =
     elements.exportTrips?.checked || elements.exportMatchedTrips?.checked;
 
@@ -285,113 +296,51 @@ function showResult(elements) {
   }
 }
 
-function updateProgress(elements, status) {
-  if (!status) {
-    if (elements.exportStatusText) {
-      elements.exportStatusText.textContent = "Preparing...";
-    }
-    if (elements.exportProgressPercent) {
-      elements.exportProgressPercent.textContent = "0%";
-    }
-    if (elements.exportProgressBar) {
-      elements.exportProgressBar.style.width = "0%";
-    }
-    return;
-  }
-
-  const percent = Math.round(status.progress || 0);
+function updateProgress(elements, bytesReceived = 0) {
   if (elements.exportStatusText) {
-    elements.exportStatusText.textContent =
-      status.message || status.status || "Processing...";
+    elements.exportStatusText.textContent = bytesReceived
+      ? "Downloading..."
+      : "Preparing...";
   }
   if (elements.exportProgressPercent) {
-    elements.exportProgressPercent.textContent = `${percent}%`;
+    elements.exportProgressPercent.textContent = formatBytes(bytesReceived);
   }
   if (elements.exportProgressBar) {
-    elements.exportProgressBar.style.width = `${percent}%`;
+    // The streamed size isn't known up front, so the bar only marks activity.
+    elements.exportProgressBar.style.width = bytesReceived ? "100%" : "0%";
   }
 }
 
-function updateResult(elements, status) {
-  if (!status || status.status !== "completed") {
-    return;
+async function readExportBody(elements, response) {
+  if (!response.body?.getReader) {
+    const blob = await response.blob();
+    updateProgress(elements, blob.size);
+    return blob;
   }
 
-  const records = status.result?.records || {};
-  const parts = Object.entries(records).map(
-    ([entity, count]) => `${ENTITY_LABELS[entity] || entity}: ${count}`
-  );
-
-  if (elements.exportResultDetails) {
-    elements.exportResultDetails.textContent = parts.length
-      ? parts.join(" | ")
-      : "Export completed";
-  }
-
-  if (status.download_url && elements.exportDownload) {
-    elements.exportDownload.href = status.download_url;
+  const reader = response.body.getReader();
+  const chunks = [];
+  let bytesReceived = 0;
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) {
+      break;
+    }
+    chunks.push(value);
+    bytesReceived += value.byteLength;
+    updateProgress(elements, bytesReceived);
   }
+  return new Blob(chunks, {
+    type: response.headers.get("content-type") || "application/octet-stream",
+  });
 }
 
-function startPolling(elements, jobId, signal) {
-  if (activePoll) {
-    activePoll.stop();
+function updateResult(elements, items, exported) {
+  const labels = items.map((item) => ENTITY_LABELS[item.entity] || item.entity);
+  if (elements.exportResultDetails) {
+    const file = `${exported.filename}, ${formatBytes(exported.blob.size)}`;
+    elements.exportResultDetails.textContent = `${labels.join(" | ")} (${file})`;
   }
-
-  let polling = true;
-  const stop = () => {
-    polling = false;
-  };
-  activePoll = { stop };
-
-  const poll = async () => {
-    if (!polling) {
-      return;
-    }
-    if (signal?.aborted) {
-      polling = false;
-      activePoll = null;
-      return;
-    }
-
-    try {
-      const status = await fetchExportStatus(jobId, signal);
-      updateProgress(elements, status);
-
-      if (["completed", "failed"].includes(status.status)) {
-        polling = false;
-        activePoll = null;
-        hideProgress(elements);
-
-        if (status.status === "failed") {
-          setError(elements, status.error || "Export failed");
-          showNotification(`Export failed: ${status.error}`, "danger");
-        } else {
-          updateResult(elements, status);
-          showResult(elements);
-          showNotification("Export ready to download", "success");
-        }
-        announce(status.message || `Export ${status.status}`, "polite");
-        return;
-      }
-    } catch (error) {
-      if (isAbortError(error)) {
-        polling = false;
-        activePoll = null;
-        return;
-      }
-      polling = false;
-      activePoll = null;
-      hideProgress(elements);
-      setError(elements, error.message || "Failed to check export status.");
-      showNotification("Export status check failed", "danger");
-      return;
-    }
-
-    setTimeout(poll, POLL_INTERVAL_MS);
-  };
-
-  poll();
 }
 
 async function loadCoverageAreas(elements, signal) {
@@ -490,6 +439,9 @@ function resetForm(elements) {
   if (elements.tripFormatSelect) {
     elements.tripFormatSelect.value = "json";
   }
+  if (elements.coverageFormatSelect) {
+    elements.coverageFormatSelect.value = "geojson";
+  }
   if (elements.includeTripGeometry) {
     elements.includeTripGeometry.checked = true;
   }
@@ -512,6 +464,7 @@ function resetForm(elements) {
   }
   setError(elements, null);
   hideProgress(elements);
+  lastExport = null;
   if (elements.exportResult) {
     elements.exportResult.classList.add("hidden");
   }
@@ -551,6 +504,7 @@ function registerEventListeners(elements, signal) {
     elements.exportBoundaries,
     elements.exportUndriven,
     elements.tripFormatSelect,
+    elements.coverageFormatSelect,
     elements.includeTripGeometry,
     elements.tripAllTime,
     elements.tripClipToCoverage,
@@ -575,6 +529,17 @@ function registerEventListeners(elements, signal) {
     eventOptions
   );
 
+  elements.exportDownload?.addEventListener(
+    "click",
+    (event) => {
+      event.preventDefault();
+      if (lastExport) {
+        downloadBlob(lastExport.blob, lastExport.filename);
+      }
+    },
+    eventOptions
+  );
+
   elements.form?.addEventListener(
     "submit",
     async (event) => {
@@ -592,23 +557,30 @@ function registerEventListeners(elements, signal) {
       const submitButton = document.getElementById("export-submit");
       if (submitButton) {
         submitButton.disabled = true;
-        submitButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Starting...';
+        submitButton.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Exporting...';
       }
 
       try {
-        const job = await createExportJob(payload, signal);
+        lastExport = null;
         showProgress(elements);
-        updateProgress(elements, {
-          status: job.status,
-          progress: job.progress,
-          message: job.message,
-        });
+        updateProgress(elements);
         announce("Export started", "polite");
-        showNotification("Export started", "info");
-        startPolling(elements, job.id, signal);
+        const { response, filename } = await streamExport(payload, signal);
+        const blob = await readExportBody(elements, response);
+        lastExport = { blob, filename };
+        hideProgress(elements);
+        updateResult(elements, payload.items, lastExport);
+        showResult(elements);
+        downloadBlob(blob, filename);
+        showNotification("Export downloaded", "success");
+        announce("Export complete", "polite");
       } catch (error) {
-        setError(elements, error.message || "Failed to start export.");
-        showNotification("Failed to start export", "danger");
+        hideProgress(elements);
+        if (isAbortError(error)) {
+          return;
+        }
+        setError(elements, error.message || "Failed to export.");
+        showNotification("Export failed", "danger");
       } finally {
         if (submitButton) {
           submitButton.disabled = false;
@@ -641,10 +613,7 @@ export default function initExportPage({ signal, cleanup } = {}) {
   bindCollapsibleSections(signal);
 
   const teardown = () => {
-    if (activePoll) {
-      activePoll.stop();
-      activePoll = null;
-    }
+    lastExport = null;
   };
 
   if (typeof cleanup === "function") {
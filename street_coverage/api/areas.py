@@ -33,7 +33,7 @@ from street_coverage.ingestion import (
 )
 from street_coverage.public_road_filter import get_public_road_filter_signature
 from street_coverage.stats import update_area_stats
-from tasks.arq import extract_arq_job_id, get_arq_pool
+from tasks.arq import extract_arq_job_id, get_arq_pool, queue_for_task
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/coverage", tags=["coverage"])
@@ -854,6 +854,7 @@ async def queue_batch_recalculate(request: BatchRecalculateRequest):
             str(parent_job.id),
             batch_items,
             selected_trip_mode,
+            _queue_name=queue_for_task("run_area_recalculate_batch_job"),
         )
         task_id = extract_arq_job_id(arq_job)
     except Exception as exc:
@@ -28,7 +28,7 @@ from core.spatial import (
     geodesic_length_meters,
     get_local_transformers,
 )
-from db.models import CoverageArea, CoverageState, Job, Street
+from db.models import CoverageArea, CoverageState, CoverageStreetName, Job, Street
 from map_data.extracts import extract_graph_metadata, get_configured_extract_identity
 from map_data.us_states import get_state
 from street_coverage.constants import (
@@ -43,7 +43,11 @@ from street_coverage.public_road_filter import (
     get_public_road_filter_signature,
 )
 from street_coverage.stats import update_area_stats
-from tasks.arq import extract_arq_job_id, get_arq_pool
+from street_coverage.street_names import (
+    build_street_name_index,
+    clear_street_name_index,
+)
+from tasks.arq import extract_arq_job_id, get_arq_pool, queue_for_task
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -70,6 +74,7 @@ async def _enqueue_pipeline_job(
         str(area_id),
         str(job_id),
         trip_mode,
+        _queue_name=queue_for_task(task_name),
         **enqueue_kwargs,
     )
     return extract_arq_job_id(arq_job)
@@ -188,6 +193,7 @@ async def delete_area(area_id: PydanticObjectId) -> bool:
 
     # Delete all streets for this area
     await Street.find({"area_id": area_id}).delete()
+    await CoverageStreetName.find({"area_id": area_id}).delete()
 
     # Delete all coverage state for this area
     await CoverageState.find({"area_id": area_id}).delete()
@@ -254,6 +260,7 @@ async def reset_area_for_rebuild(area_id: PydanticObjectId) -> CoverageArea:
 
     # Rebuilds are a clean slate: remove all prior derived data and cached graphs
     await Street.find({"area_id": area_id}).delete()
+    await clear_street_name_index(area_id)
     await CoverageState.find({"area_id": area_id}).delete()
     with contextlib.suppress(Exception):
         from routing.constants import GRAPH_STORAGE_DIR
@@ -848,6 +855,7 @@ async def _run_ingestion_pipeline(
 
         await _clear_existing_area_data(area_doc_id)
         await _store_segments(segments)
+        await build_street_name_index(area)
         store_ms = (datetime.now(UTC) - stage_start).total_seconds() * 1000
 
         await update_job(
@@ -1825,4 +1833,5 @@ async def _clear_existing_area_data(area_id: PydanticObjectId) -> None:
     area to avoid accumulating old versions.
     """
     await Street.find({"area_id": area_id}).delete()
+    await CoverageStreetName.find({"area_id": area_id}).delete()
     await CoverageState.find({"area_id": area_id}).delete()
@@ -8,6 +8,10 @@ This script:
     b. Buffers it slightly (ROUTING_BUFFER_FT).
     c. Loads the driveable street network from the active local OSM extract.
     d. Saves the graph as a .graphml file to `data/graphs/{location_id}.graphml`.
+
+When building every area at once, areas that share a source extract are
+parsed together: one extract of the union of their routing polygons, one
+network parse, then each area graph is cut from the shared network.
 """
 
 from __future__ import annotations
@@ -52,6 +56,7 @@ logger = logging.getLogger(__name__)
 OSM_EXTENSIONS = {".osm", ".xml", ".pbf"}
 DEFAULT_AREA_EXTRACT_THRESHOLD_MB = 256
 DEFAULT_GRAPH_MEMORY_LIMIT_MB = 4096
+DEFAULT_GRAPH_BATCH_WORKERS = 2
 
 _REQUIRED_OSMNX_WAY_TAGS = {
     "highway",
@@ -100,6 +105,16 @@ def _get_area_extract_threshold_mb() -> int:
         return DEFAULT_AREA_EXTRACT_THRESHOLD_MB
 
 
+def _get_graph_batch_workers() -> int:
+    raw = os.getenv("COVERAGE_GRAPH_BATCH_WORKERS", "").strip()
+    if not raw:
+        return DEFAULT_GRAPH_BATCH_WORKERS
+    try:
+        return max(int(raw), 1)
+    except ValueError:
+        return DEFAULT_GRAPH_BATCH_WORKERS
+
+
 def _is_area_extract_required() -> bool:
     raw = os.getenv("OSM_AREA_EXTRACT_REQUIRED", "").strip().lower()
     return raw not in {"0", "false", "no", "off"}
@@ -471,6 +486,14 @@ def _build_graph_in_process(
     extract_metadata: dict[str, Any] | None,
 ) -> nx.MultiDiGraph:
     G = _load_graph_from_extract(osm_path, routing_polygon)
+    return _finalize_and_save_graph(G, graph_path, extract_metadata)
+
+
+def _finalize_and_save_graph(
+    G: nx.MultiDiGraph,
+    graph_path: Path,
+    extract_metadata: dict[str, Any] | None,
+) -> nx.MultiDiGraph:
     if not isinstance(G, nx.MultiDiGraph):
         G = nx.MultiDiGraph(G)
     _prune_non_driveable_edges(G)
@@ -627,6 +650,104 @@ def _build_graph_with_limit(
     return None
 
 
+def _subgraph_within_polygon(
+    G: nx.MultiDiGraph,
+    node_ids: list[Any],
+    node_tree: Any,
+    routing_polygon: Any,
+) -> nx.MultiDiGraph:
+    """
+    Copy of the part of a shared graph that serves ``routing_polygon``.
+
+    Mirrors ``truncate_graph_polygon(..., truncate_by_edge=True)``: nodes
+    inside the polygon plus their direct neighbors. Only the kept nodes are
+    copied, so cutting many areas from one large graph stays proportional
+    to each area.
+    """
+    inside = {node_ids[i] for i in node_tree.query(routing_polygon, "intersects")}
+    if not inside:
+        msg = "Found no graph nodes within the requested polygon."
+        raise ValueError(msg)
+    keep = set(inside)
+    for node in inside:
+        keep.update(G.successors(node))
+        keep.update(G.predecessors(node))
+    return G.subgraph(keep).copy()
+
+
+def _build_area_graphs_from_shared(
+    osm_path: Path,
+    areas: list[dict[str, Any]],
+    extract_metadata: dict[str, Any] | None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Parse ``osm_path`` once and save one GraphML per area from the result.
+
+    Each area dict carries ``location_id``, ``routing_geojson`` and
+    ``graph_path``. Failures are reported per area so one bad boundary does
+    not sink the rest of the batch.
+    """
+    import shapely
+
+    polygons = [shape(area["routing_geojson"]) for area in areas]
+    shared = _load_graph_from_extract(osm_path, shapely.union_all(polygons))
+    node_ids = list(shared.nodes)
+    node_tree = shapely.STRtree(
+        shapely.points(
+            [
+                (float(shared.nodes[node]["x"]), float(shared.nodes[node]["y"]))
+                for node in node_ids
+            ],
+        ),
+    )
+
+    results: dict[str, dict[str, Any]] = {}
+    for area, routing_polygon in zip(areas, polygons, strict=True):
+        location_id = area["location_id"]
+        try:
+            G = _subgraph_within_polygon(shared, node_ids, node_tree, routing_polygon)
+            G = _finalize_and_save_graph(G, Path(area["graph_path"]), extract_metadata)
+            results[location_id] = {
+                "success": True,
+                "nodes": int(G.number_of_nodes()),
+                "edges": int(G.number_of_edges()),
+            }
+        except Exception as exc:
+            logger.warning("Batch graph build failed for %s: %s", location_id, exc)
+            results[location_id] = {"success": False, "error": str(exc)}
+    return results
+
+
+def _graph_batch_worker(
+    source_path_str: str,
+    areas: list[dict[str, Any]],
+    max_mb: int,
+    extract_metadata: dict[str, Any] | None,
+) -> dict[str, dict[str, Any]]:
+    """Build every area graph that shares one source extract (pool entry point)."""
+    try:
+        _apply_memory_limit(max_mb)
+        from shapely import union_all
+
+        union_polygon = union_all([shape(area["routing_geojson"]) for area in areas])
+        keys = sorted(area["extract_cache_key"] for area in areas)
+        digest = hashlib.sha1("|".join(keys).encode("utf-8")).hexdigest()[:12]
+        osm_path = _resolve_graph_source(
+            Path(source_path_str),
+            union_polygon,
+            f"batch-{digest}",
+        )
+        return _build_area_graphs_from_shared(osm_path, areas, extract_metadata)
+    except MemoryError:
+        error = (
+            f"Batch graph build exceeded memory limit of {max_mb} MB. "
+            "Increase COVERAGE_GRAPH_MAX_MB or lower COVERAGE_GRAPH_BATCH_WORKERS."
+        )
+    except Exception as exc:
+        error = str(exc)
+    return {area["location_id"]: {"success": False, "error": error} for area in areas}
+
+
 def _coerce_nodes_edges(network: tuple[Any, Any]) -> tuple[Any, Any] | None:
     nodes_gdf, edges_gdf = network
 
@@ -795,6 +916,52 @@ def _validate_osm_path(osm_path: Path) -> None:
         )
 
 
+def _resolve_graph_source(
+    source_path: Path,
+    routing_polygon: Any,
+    extract_cache_key: str,
+) -> Path:
+    """Path to parse for ``routing_polygon``: an area extract when the source is large."""
+    logger.info("Using local OSM extract: %s", source_path)
+    _validate_osm_path(source_path)
+    threshold_mb = _get_area_extract_threshold_mb()
+    try:
+        size_mb = source_path.stat().st_size / (1024 * 1024)
+    except OSError:
+        size_mb = 0
+    require_extract = (
+        _is_area_extract_required() and threshold_mb > 0 and size_mb >= threshold_mb
+    )
+    area_extract = _maybe_extract_area_pbf(
+        source_path,
+        routing_polygon,
+        extract_cache_key,
+        require_extract=require_extract,
+        threshold_mb=threshold_mb,
+    )
+    if area_extract:
+        logger.info("Using area extract for graph build: %s", area_extract)
+        return area_extract
+    return source_path
+
+
+def _location_routing_polygon(location: dict) -> Any | None:
+    """Boundary (or bounding box) of a location buffered for routing."""
+    boundary_geom = (
+        location.get("boundary") or location.get("geojson") or location.get("geometry")
+    )
+    if isinstance(boundary_geom, dict) and boundary_geom.get("type") == "Feature":
+        boundary_geom = boundary_geom.get("geometry")
+    if boundary_geom:
+        polygon = shape(boundary_geom)
+    else:
+        bbox = location.get("bounding_box")
+        if not bbox or len(bbox) < 4:
+            return None
+        polygon = box(float(bbox[0]), float(bbox[1]), float(bbox[2]), float(bbox[3]))
+    return buffer_polygon_for_routing(polygon, ROUTING_BUFFER_FT)
+
+
 async def preprocess_streets(
     location: dict,
     task_id: str | None = None,
@@ -824,33 +991,13 @@ async def preprocess_streets(
         logger.info("Preprocessing graph for %s (ID: %s)", location_name, location_id)
 
     try:
-        # 1. Get Polygon
-        boundary_geom = (
-            location.get("boundary")
-            or location.get("geojson")
-            or location.get("geometry")
-        )
-        if isinstance(boundary_geom, dict) and boundary_geom.get("type") == "Feature":
-            boundary_geom = boundary_geom.get("geometry")
-        if boundary_geom:
-            polygon = shape(boundary_geom)
-        else:
-            bbox = location.get("bounding_box")
-            if bbox and len(bbox) >= 4:
-                polygon = box(
-                    float(bbox[0]),
-                    float(bbox[1]),
-                    float(bbox[2]),
-                    float(bbox[3]),
-                )
-            else:
-                logger.warning("No valid boundary for %s. Skipping.", location_name)
-                return None
-
-        # 2. Buffer Polygon
-        routing_polygon = buffer_polygon_for_routing(polygon, ROUTING_BUFFER_FT)
+        # 1. Get the buffered routing polygon
+        routing_polygon = _location_routing_polygon(location)
+        if routing_polygon is None:
+            logger.warning("No valid boundary for %s. Skipping.", location_name)
+            return None
 
-        # 3. Load Graph from the active local OSM extract
+        # 2. Load Graph from the active local OSM extract
         logger.info("Loading OSM graph for %s...", location_name)
 
         # Run synchronous ox operations in a thread pool to avoid blocking the event loop
@@ -862,32 +1009,11 @@ async def preprocess_streets(
             GRAPH_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
             file_path = GRAPH_STORAGE_DIR / f"{location_id}.graphml"
 
-            local_osm_path = Path(str(source_extract_metadata.get("path") or ""))
-            logger.info("Using local OSM extract: %s", local_osm_path)
-            _validate_osm_path(local_osm_path)
-            threshold_mb = _get_area_extract_threshold_mb()
-            try:
-                size_mb = local_osm_path.stat().st_size / (1024 * 1024)
-            except OSError:
-                size_mb = 0
-            require_extract = (
-                _is_area_extract_required()
-                and threshold_mb > 0
-                and size_mb >= threshold_mb
-            )
-            area_extract = _maybe_extract_area_pbf(
-                local_osm_path,
+            local_osm_path = _resolve_graph_source(
+                Path(str(source_extract_metadata.get("path") or "")),
                 routing_polygon,
                 _build_extract_cache_key(location_id, area_version),
-                require_extract=require_extract,
-                threshold_mb=threshold_mb,
             )
-            if area_extract:
-                local_osm_path = area_extract
-                logger.info(
-                    "Using area extract for graph build: %s",
-                    local_osm_path,
-                )
 
             graph = _build_graph_with_limit(
                 local_osm_path,
@@ -911,7 +1037,118 @@ async def preprocess_streets(
         return graph, file_path
 
 
-async def preprocess_all_graphs() -> None:
+async def preprocess_graphs_batch(
+    locations: list[dict],
+    *,
+    max_workers: int | None = None,
+) -> dict[str, Path]:
+    """
+    Build graphs for many locations, parsing each source extract only once.
+
+    Locations are grouped by the OSM extract they build from. Each group
+    cuts a single extract for the union of its routing polygons, parses it
+    once, and writes every area graph from that shared network. Groups run
+    in a bounded process pool (``COVERAGE_GRAPH_BATCH_WORKERS``), each worker
+    under the usual graph memory limit. Areas the batch could not build are
+    retried one at a time through :func:`preprocess_streets`.
+
+    Returns:
+        Mapping of location ID to the saved GraphML path.
+    """
+    source_extract_metadata = await get_preferred_osm_extract_metadata()
+    source_path = str(source_extract_metadata.get("path") or "")
+    GRAPH_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+
+    by_id: dict[str, dict] = {}
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for location in locations:
+        location_id = str(location.get("_id") or location.get("id") or "unknown")
+        routing_polygon = _location_routing_polygon(location)
+        if routing_polygon is None:
+            logger.warning(
+                "No valid boundary for %s. Skipping.",
+                location.get("display_name", location_id),
+            )
+            continue
+        by_id[location_id] = location
+        # Every area currently resolves to the active extract; the grouping
+        # keeps areas on different extracts from being parsed together.
+        groups.setdefault(source_path, []).append(
+            {
+                "location_id": location_id,
+                "routing_geojson": mapping(routing_polygon),
+                "graph_path": str(GRAPH_STORAGE_DIR / f"{location_id}.graphml"),
+                "extract_cache_key": _build_extract_cache_key(
+                    location_id,
+                    location.get("area_version"),
+                ),
+            },
+        )
+    if not groups:
+        return {}
+
+    max_mb = _get_graph_memory_limit_mb()
+    workers = max(1, min(max_workers or _get_graph_batch_workers(), len(groups)))
+    logger.info(
+        "Building %d area graphs from %d source extract(s) with %d worker(s)",
+        len(by_id),
+        len(groups),
+        workers,
+    )
+
+    loop = asyncio.get_running_loop()
+    jobs = [
+        (path, areas, max_mb, source_extract_metadata) for path, areas in groups.items()
+    ]
+    if max_mb <= 0:
+        # No memory cap requested: build in-process like preprocess_streets.
+        batches = [
+            await loop.run_in_executor(None, _graph_batch_worker, *job) for job in jobs
+        ]
+    else:
+        import multiprocessing as mp
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context("spawn"),
+        ) as pool:
+            batches = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, _graph_batch_worker, *job)
+                    for job in jobs
+                ),
+            )
+
+    built: dict[str, Path] = {}
+    retry: list[str] = []
+    for batch in batches:
+        for location_id, result in batch.items():
+            if result.get("success"):
+                built[location_id] = GRAPH_STORAGE_DIR / f"{location_id}.graphml"
+            else:
+                retry.append(location_id)
+
+    for location_id in retry:
+        logger.info("Retrying graph build for %s on its own", location_id)
+        try:
+            processed = await preprocess_streets(by_id[location_id])
+        except Exception:
+            # preprocess_streets already logged the failure.
+            continue
+        if processed:
+            built[location_id] = processed[1]
+
+    logger.info(
+        "Batch graph build complete: %d of %d built, %d retried individually",
+        len(built),
+        len(by_id),
+        len(retry),
+    )
+    return built
+
+
+async def preprocess_all_graphs(*, batch: bool = True) -> None:
     """Main function to process all coverage areas."""
     from db.models import CoverageArea
 
@@ -926,8 +1163,8 @@ async def preprocess_all_graphs() -> None:
     areas = await CoverageArea.find_all().to_list()
     logger.info("Found %d coverage areas.", len(areas))
 
-    for area in areas:
-        loc_data = {
+    locations = [
+        {
             "_id": str(area.id),
             "id": str(area.id),
             "display_name": area.display_name,
@@ -935,8 +1172,14 @@ async def preprocess_all_graphs() -> None:
             "bounding_box": area.bounding_box,
             "area_version": area.area_version,
         }
+        for area in areas
+    ]
 
-        await preprocess_streets(loc_data)
+    if batch:
+        await preprocess_graphs_batch(locations)
+    else:
+        for loc_data in locations:
+            await preprocess_streets(loc_data)
 
     logger.info("Preprocessing complete.")
 
@@ -87,6 +87,10 @@ async def apply_area_stats_delta(
     }
     if update_last_synced:
         counter_set["last_synced"] = now
+    if driven_segments_delta or undriveable_segments_delta:
+        counter_set["coverage_state_revision"] = {
+            "$add": [{"$ifNull": ["$coverage_state_revision", 0]}, 1],
+        }
 
     update_pipeline: list[dict[str, Any]] = [
         {"$set": counter_set},
@@ -175,6 +179,14 @@ async def apply_area_stats_delta(
     return await CoverageArea.get(area_id)
 
 
+async def bump_coverage_state_revision(area_id: PydanticObjectId) -> None:
+    """Signal a bulk segment status change that bypassed the stats deltas."""
+    await CoverageArea.get_pymongo_collection().update_one(
+        {"_id": area_id},
+        {"$inc": {"coverage_state_revision": 1}},
+    )
+
+
 async def calculate_area_stats(
     area_id: PydanticObjectId,
     area_version: int | None = None,
@@ -315,6 +327,7 @@ async def update_area_stats(area_id: PydanticObjectId) -> CoverageArea | None:
     area.driveable_length_miles = stats["driveable_length_miles"]
     area.coverage_percentage = stats["coverage_percentage"]
     area.last_synced = datetime.now(UTC)
+    area.coverage_state_revision = int(area.coverage_state_revision or 0) + 1
 
     await area.save()
 
@@ -0,0 +1,206 @@
+"""Per-area street-name index backing coverage street search."""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import defaultdict
+from typing import Any
+
+from beanie import PydanticObjectId
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from db.bulk import bulk_write_updates
+from db.models import CoverageArea, CoverageState, CoverageStreetName, Street
+
+logger = logging.getLogger(__name__)
+
+_UPSERT_BATCH_SIZE = 1000
+
+
+def normalize_search_name(value: str | None) -> str:
+    """Case-folded form street names are matched on."""
+    return str(value or "").lower()
+
+
+async def clear_street_name_index(area_id: PydanticObjectId) -> None:
+    """Drop an area's street-name rows so the next search rebuilds them."""
+    await CoverageStreetName.find({"area_id": area_id}).delete()
+    await CoverageArea.get_pymongo_collection().update_one(
+        {"_id": area_id},
+        {"$set": {"street_name_index_version": None}},
+    )
+
+
+async def build_street_name_index(area: CoverageArea) -> int:
+    """Rebuild the street-name rows for the area's current streets."""
+    area_id = area.id
+    area_version = area.area_version
+    groups: dict[str, dict[str, Any]] = {}
+    cursor = Street.get_pymongo_collection().find(
+        {
+            "area_id": area_id,
+            "area_version": area_version,
+            "street_name": {"$ne": None},
+        },
+        {"_id": 0, "street_name": 1, "highway_type": 1, "length_miles": 1},
+    )
+    async for street in cursor:
+        name = street.get("street_name")
+        if not name:
+            continue
+        group = groups.get(name)
+        if group is None:
+            group = groups[name] = {
+                "area_id": area_id,
+                "area_version": area_version,
+                "street_name": name,
+                "normalized_name": normalize_search_name(name),
+                "highway_type": street.get("highway_type") or "unclassified",
+                "segment_count": 0,
+                "total_length_miles": 0.0,
+            }
+        group["segment_count"] += 1
+        group["total_length_miles"] += float(street.get("length_miles") or 0.0)
+
+    # Upsert per name and then drop stale rows, so two searches building the
+    # same area at once converge on the same rows instead of colliding on
+    # the unique (area_id, area_version, street_name) index.
+    collection = CoverageStreetName.get_pymongo_collection()
+    rows = list(groups.values())
+    for start in range(0, len(rows), _UPSERT_BATCH_SIZE):
+        await _upsert_rows(collection, rows[start : start + _UPSERT_BATCH_SIZE])
+    await collection.delete_many(
+        {
+            "area_id": area_id,
+            "$or": [
+                {"area_version": {"$ne": area_version}},
+                {"street_name": {"$nin": list(groups)}},
+            ],
+        },
+    )
+    await CoverageArea.get_pymongo_collection().update_one(
+        {"_id": area_id},
+        {"$set": {"street_name_index_version": area_version}},
+    )
+    # Keep the in-memory document in step so a later save() keeps the marker.
+    area.street_name_index_version = area_version
+    logger.debug(
+        "Indexed %d street names for area %s v%s",
+        len(rows),
+        area_id,
+        area_version,
+    )
+    return len(rows)
+
+
+async def _upsert_rows(collection: Any, rows: list[dict[str, Any]]) -> None:
+    updates = [
+        (
+            {
+                "area_id": row["area_id"],
+                "area_version": row["area_version"],
+                "street_name": row["street_name"],
+            },
+            {"$set": row},
+            True,
+        )
+        for row in rows
+    ]
+    try:
+        await bulk_write_updates(collection, updates)
+    except (BulkWriteError, DuplicateKeyError):
+        # A concurrent build inserted some of these names between our match
+        # and insert; the rows now exist, so a second pass only updates them.
+        logger.debug("Retrying street-name upserts after a concurrent build")
+        await bulk_write_updates(collection, updates)
+
+
+async def ensure_street_name_index(area: CoverageArea) -> None:
+    """Build the index for areas ingested before it existed or since changed."""
+    if area.street_name_index_version == area.area_version:
+        return
+    await build_street_name_index(area)
+
+
+async def search_street_names(
+    area: CoverageArea,
+    query: str,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """
+    Street names in ``area`` containing ``query``, case-insensitively.
+
+    Names starting with the query rank first, then alphabetical order. Each
+    result carries the matching segments' geometry and driven count, loaded
+    only for the returned names.
+    """
+    await ensure_street_name_index(area)
+
+    needle = normalize_search_name(query)
+    rows = [
+        row
+        async for row in CoverageStreetName.get_pymongo_collection().find(
+            {
+                "area_id": area.id,
+                "area_version": area.area_version,
+                "normalized_name": {"$regex": re.escape(needle)},
+            },
+            {"_id": 0},
+        )
+    ]
+    rows.sort(
+        key=lambda row: (
+            not row["normalized_name"].startswith(needle),
+            row["normalized_name"],
+            row["street_name"],
+        ),
+    )
+    rows = rows[:limit]
+    if not rows:
+        return []
+
+    by_name = {row["street_name"]: row for row in rows}
+    geometries: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    segment_names: dict[str, str] = {}
+    async for street in Street.get_pymongo_collection().find(
+        {
+            "area_id": area.id,
+            "area_version": area.area_version,
+            "street_name": {"$in": list(by_name)},
+        },
+        {"_id": 0, "segment_id": 1, "street_name": 1, "geometry": 1},
+    ):
+        name = street["street_name"]
+        geometries[name].append(street.get("geometry") or {})
+        segment_names[street["segment_id"]] = name
+
+    driven_counts: dict[str, int] = defaultdict(int)
+    if segment_names:
+        async for state in CoverageState.get_pymongo_collection().find(
+            {
+                "area_id": area.id,
+                "status": "driven",
+                "segment_id": {"$in": list(segment_names)},
+            },
+            {"_id": 0, "segment_id": 1},
+        ):
+            driven_counts[segment_names[state["segment_id"]]] += 1
+
+    return [
+        {
+            **row,
+            "geometries": geometries.get(row["street_name"], []),
+            "driven_count": driven_counts.get(row["street_name"], 0),
+        }
+        for row in rows
+    ]
+
+
+__all__ = [
+    "build_street_name_index",
+    "clear_street_name_index",
+    "ensure_street_name_index",
+    "normalize_search_name",
+    "search_street_names",
+]
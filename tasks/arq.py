@@ -5,10 +5,12 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+import os
 from urllib.parse import urlparse
 
 from arq import create_pool
 from arq.connections import ArqRedis, RedisSettings
+from arq.constants import default_queue_name
 
 from core.redis import get_redis_url
 
@@ -17,6 +19,44 @@ logger = logging.getLogger(__name__)
 _pool: ArqRedis | None = None
 _pool_lock = asyncio.Lock()
 
+DEFAULT_QUEUE_NAME = default_queue_name
+HEAVY_QUEUE_NAME = os.getenv("ARQ_HEAVY_QUEUE_NAME", f"{default_queue_name}:heavy")
+
+# Long-running jobs that get their own queue and worker pool so they cannot
+# hold up scheduled fetches and other short jobs on the default queue.
+HEAVY_TASKS: frozenset[str] = frozenset(
+    {
+        "fetch_all_missing_trips",
+        "map_match_trips",
+        "backfill_trip_display_geometry",
+        "sync_mobility_profiles",
+        "build_recurring_routes",
+        "generate_optimal_route",
+        "run_area_ingestion_job",
+        "run_area_backfill_job",
+        "run_area_recalculate_batch_job",
+        "setup_map_data_task",
+    },
+)
+
+
+def heavy_queue_enabled() -> bool:
+    """
+    Whether heavy tasks are routed to their own queue.
+
+    Off by default so single-worker deployments keep running every job; turn
+    it on only where a worker runs ``tasks.worker.HeavyWorkerSettings``.
+    """
+    value = os.getenv("ARQ_HEAVY_QUEUE_ENABLED", "").strip().lower()
+    return value in {"1", "true", "yes", "on"}
+
+
+def queue_for_task(task_name: str) -> str:
+    """ARQ queue a task's jobs are enqueued on."""
+    if task_name in HEAVY_TASKS and heavy_queue_enabled():
+        return HEAVY_QUEUE_NAME
+    return DEFAULT_QUEUE_NAME
+
 
 def get_redis_settings() -> RedisSettings:
     """Build RedisSettings from REDIS_URL or component env vars."""
@@ -42,6 +82,14 @@ def extract_arq_job_id(arq_job) -> str:
     )
 
 
+async def find_job_queue(redis: ArqRedis, job_id: str) -> str:
+    """Queue a not-yet-started job is waiting on, defaulting to the main one."""
+    for queue_name in (DEFAULT_QUEUE_NAME, HEAVY_QUEUE_NAME):
+        if await redis.zscore(queue_name, job_id) is not None:
+            return queue_name
+    return DEFAULT_QUEUE_NAME
+
+
 async def get_arq_pool() -> ArqRedis:
     """Get or create a shared ARQ redis pool."""
     global _pool
@@ -127,7 +127,7 @@ async def update_coverage_for_new_trips(
 
 
 async def _sync_geo_coverage_logic() -> dict[str, Any]:
-    """Fully rebuild geo coverage explorer caches from current trip data."""
+    """Sync geo coverage explorer caches with trips saved since the last run."""
     result = await run_scheduled_recalculate()
     status = str(result.get("status") or "")
     if status == "skipped":
@@ -149,7 +149,7 @@ async def _sync_geo_coverage_logic() -> dict[str, Any]:
     )
     return {
         "status": "success",
-        "mode": "full",
+        "mode": result.get("mode"),
         "job_id": result.get("job_id"),
         "result": result.get("result") or {},
         "message": result.get("message") or "Geo coverage sync completed.",
@@ -160,7 +160,7 @@ async def sync_geo_coverage(
     ctx: dict[str, Any],
     manual_run: bool = False,
 ) -> dict[str, Any]:
-    """ARQ job for a full geo coverage cache rebuild."""
+    """ARQ job for an incremental geo coverage cache sync."""
     return await run_task_with_history(
         ctx,
         "sync_geo_coverage",
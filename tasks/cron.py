@@ -1,17 +1,72 @@
-"""ARQ cron wrappers for scheduled tasks."""
+"""
+ARQ cron wrappers for scheduled tasks.
+
+Crons fire on the default worker. When the heavy queue is enabled, a due
+task listed in ``HEAVY_TASKS`` is enqueued onto that queue instead of
+running inline, so long jobs never hold a default worker slot.
+"""
 
 from __future__ import annotations
 
+import logging
+from typing import TYPE_CHECKING, Any
+
+from tasks.arq import HEAVY_TASKS, heavy_queue_enabled
+from tasks.config import get_latest_task_history, update_task_history_entry
 from tasks.coverage import sync_geo_coverage, update_coverage_for_new_trips
 from tasks.fetch import periodic_fetch_trips
 from tasks.maintenance import remap_unmatched_trips, validate_trips
 from tasks.map_data import auto_provision_check, monitor_map_services
 from tasks.mobility import sync_mobility_profiles
-from tasks.ops import run_task_if_due
+from tasks.ops import enqueue_task, job_is_active, run_task_if_due
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+async def _enqueue_heavy_task(task_id: str) -> dict[str, Any] | None:
+    """
+    Hand a due task to the heavy queue unless a run is already queued.
+
+    A PENDING or RUNNING history entry only blocks the enqueue while ARQ
+    still holds its job; an entry left behind by a lost or killed worker is
+    marked failed so it cannot hold the task back forever.
+    """
+    history = (await get_latest_task_history([task_id])).get(task_id)
+    if history is not None and history.status in {"PENDING", "RUNNING"}:
+        if await job_is_active(history.id):
+            logger.info("Skipping %s (already %s)", task_id, history.status)
+            return None
+        logger.warning(
+            "Job %s for %s is no longer queued; enqueueing a new run",
+            history.id,
+            task_id,
+        )
+        await update_task_history_entry(
+            job_id=history.id,
+            task_name=task_id,
+            status="FAILED",
+            manual_run=bool(history.manual_run),
+            error="Job was lost before it finished",
+        )
+    return await enqueue_task(task_id)
+
+
+async def _run_scheduled(
+    ctx: dict,
+    task_id: str,
+    func: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict | None:
+    """Run a due task inline, or enqueue it when it belongs on the heavy queue."""
+    if task_id in HEAVY_TASKS and heavy_queue_enabled():
+        return await run_task_if_due(ctx, task_id, lambda: _enqueue_heavy_task(task_id))
+    return await run_task_if_due(ctx, task_id, func)
 
 
 async def cron_periodic_fetch_trips(ctx: dict) -> dict | None:
-    return await run_task_if_due(
+    return await _run_scheduled(
         ctx,
         "periodic_fetch_trips",
         lambda: periodic_fetch_trips(ctx, trigger_source="scheduled"),
@@ -19,7 +74,7 @@ async def cron_periodic_fetch_trips(ctx: dict) -> dict | None:
 
 
 async def cron_validate_trips(ctx: dict) -> dict | None:
-    return await run_task_if_due(
+    return await _run_scheduled(
         ctx,
         "validate_trips",
         lambda: validate_trips(ctx),
@@ -27,7 +82,7 @@ async def cron_validate_trips(ctx: dict) -> dict | None:
 
 
 async def cron_remap_unmatched_trips(ctx: dict) -> dict | None:
-    return await run_task_if_due(
+    return await _run_scheduled(
         ctx,
         "remap_unmatched_trips",
         lambda: remap_unmatched_trips(ctx),
@@ -35,7 +90,7 @@ async def cron_remap_unmatched_trips(ctx: dict) -> dict | None:
 
 
 async def cron_update_coverage_for_new_trips(ctx: dict) -> dict | None:
-    return await run_task_if_due(
+    return await _run_scheduled(
         ctx,
         "update_coverage_for_new_trips",
         lambda: update_coverage_for_new_trips(ctx),
@@ -43,7 +98,7 @@ async def cron_update_coverage_for_new_trips(ctx: dict) -> dict | None:
 
 
 async def cron_sync_geo_coverage(ctx: dict) -> dict | None:
-    return await run_task_if_due(
+    return await _run_scheduled(
         ctx,
         "sync_geo_coverage",
         lambda: sync_geo_coverage(ctx),
@@ -51,7 +106,7 @@ async def cron_sync_geo_coverage(ctx: dict) -> dict | None:
 
 
 async def cron_sync_mobility_profiles(ctx: dict) -> dict | None:
-    return await run_task_if_due(
+    return await _run_scheduled(
         ctx,
         "sync_mobility_profiles",
         lambda: sync_mobility_profiles(ctx),
@@ -59,7 +114,7 @@ async def cron_sync_mobility_profiles(ctx: dict) -> dict | None:
 
 
 async def cron_monitor_map_data_jobs(ctx: dict) -> dict | None:
-    return await run_task_if_due(
+    return await _run_scheduled(
         ctx,
         "monitor_map_data_jobs",
         lambda: monitor_map_services(ctx),
@@ -73,7 +128,7 @@ async def cron_auto_provision_map_data(ctx: dict) -> dict | None:
     If trips are found in states without map data, automatically
     triggers provisioning to download and build map data.
     """
-    return await run_task_if_due(
+    return await _run_scheduled(
         ctx,
         "auto_provision_map_data",
         lambda: auto_provision_check(ctx),
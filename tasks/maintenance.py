@@ -19,10 +19,14 @@ from typing import Any
 from pydantic import ValidationError
 
 from analytics.services.mobility_insights_service import MobilityInsightsService
+from analytics.services.trip_distance_series import TripDistanceSeriesService
+from analytics.services.trip_rollup_service import TripRollupService
 from core.jobs import create_job
 from core.trip_map_cache import bump_trip_map_revision
 from core.trip_query_spec import TripQuerySpec
+from db.bulk import bulk_write_updates
 from db.models import Trip
+from map_data.auto_provision import backfill_trip_location_summaries
 from tasks.config import check_dependencies
 from tasks.ops import run_task_with_history
 from trips.models import MapMatchJobRequest
@@ -41,6 +45,51 @@ logger = logging.getLogger(__name__)
 
 _LINE_GEOMETRY_TYPES = ["LineString", "MultiLineString"]
 
+# Bump when Trip.validate_meaningful changes so every trip is re-checked.
+TRIP_VALIDATION_VERSION = 1
+_VALIDATION_BATCH_SIZE = 500
+# Fields validate_meaningful reads, plus what the rollup refresh needs.
+_VALIDATION_PROJECTION = {
+    "transactionId": 1,
+    "imei": 1,
+    "source": 1,
+    "startTime": 1,
+    "startTimeZone": 1,
+    "endTime": 1,
+    "distance": 1,
+    "maxSpeed": 1,
+    "gps": 1,
+    "saved_at": 1,
+}
+
+
+async def _bulk_write_trips(
+    updates: list[tuple[dict[str, Any], dict[str, Any]]],
+) -> int:
+    """Apply trip updates in one round trip; returns the modified count."""
+    if not updates:
+        return 0
+    modified, _ = await bulk_write_updates(
+        Trip.get_pymongo_collection(),
+        [(flt, doc, False) for flt, doc in updates],
+    )
+    return modified
+
+
+def _check_trip(doc: dict[str, Any]) -> tuple[Trip | None, bool, str | None]:
+    """Hydrate a projected trip and run ``validate_meaningful`` on it."""
+    trip: Trip | None = None
+    try:
+        trip = Trip.model_validate(doc)
+        valid, message = trip.validate_meaningful()
+    except ValidationError as e:
+        valid = False
+        message = str(e)
+    except Exception as e:
+        valid = False
+        message = f"Unexpected error during validation: {e}"
+    return trip, valid, message
+
 
 async def _validate_trips_logic() -> dict[str, Any]:
     """
@@ -50,11 +99,38 @@ async def _validate_trips_logic() -> dict[str, Any]:
     1. Required fields (transactionId, startTime, endTime, gps)
     2. GPS data structure and coordinate validity
     3. Stationary trips (brief engine on/off without driving)
+
+    Only trips not yet stamped with the current ``TRIP_VALIDATION_VERSION``
+    are visited. The pipeline clears the stamp whenever it rewrites a trip,
+    so steady-state runs only see new or reprocessed trips. Each batch is
+    written back with a single bulk write.
+
+    It also performs the initial build of the daily trip rollups and the
+    per-vehicle distance series, then keeps them in step with the trips it
+    invalidates. Trips missing a current ``locationSummary`` (used by map
+    data state detection) are backfilled here too.
     """
     processed_count = 0
     modified_count = 0
+    invalidated_trips: list[Trip] = []
+
+    try:
+        await TripRollupService.ensure_built()
+    except Exception:
+        logger.exception("Failed to build daily trip rollups")
+    try:
+        await TripDistanceSeriesService.ensure_built()
+    except Exception:
+        logger.exception("Failed to build trip distance series")
+    try:
+        await backfill_trip_location_summaries()
+    except Exception:
+        logger.exception("Failed to backfill trip location summaries")
 
-    query = {"invalid": {"$ne": True}}
+    query = {
+        "invalid": {"$ne": True},
+        "validation_version": {"$ne": TRIP_VALIDATION_VERSION},
+    }
 
     total_docs_to_process = await Trip.find(query).count()
     logger.info("Found %d trips to validate.", total_docs_to_process)
@@ -67,40 +143,51 @@ async def _validate_trips_logic() -> dict[str, Any]:
             "modified_count": 0,
         }
 
-    # Beanie iteration
-    # Iterate using Beanie cursor
-    # Note: Trip.find(query) returns a FindMany object which is async iterable
-
-    async for trip in Trip.find(query):
-        processed_count += 1
-
+    async def _flush(
+        batch: list[tuple[dict[str, Any], dict[str, Any], Trip | None]],
+    ) -> None:
+        nonlocal modified_count
         try:
-            # Trip document is already a Pydantic model (Beanie Document)
-            # and now contains the validation logic from TripDataModel.
-            valid, message = trip.validate_meaningful()
-        except ValidationError as e:
-            valid = False
-            message = str(e)
-        except Exception as e:
-            valid = False
-            message = f"Unexpected error during validation: {e}"
-
-        if not valid:
-            # Mark as invalid
-            try:
+            await _bulk_write_trips([(flt, doc) for flt, doc, _ in batch])
+        except Exception:
+            logger.exception("Failed to write a batch of trip validation results")
+            return
+        flagged = [trip for _, _, trip in batch if trip is not None]
+        modified_count += len(flagged)
+        invalidated_trips.extend(flagged)
+
+    batch: list[tuple[dict[str, Any], dict[str, Any], Trip | None]] = []
+    cursor = Trip.get_pymongo_collection().find(
+        query,
+        _VALIDATION_PROJECTION,
+        batch_size=_VALIDATION_BATCH_SIZE,
+    )
+    async for doc in cursor:
+        processed_count += 1
+        trip, valid, message = _check_trip(doc)
+
+        # Only stamp the trip if it still holds the data that was checked;
+        # a concurrent reprocess resets saved_at and keeps it queued.
+        selector = {"_id": doc["_id"], "saved_at": doc.get("saved_at")}
+        stamp: dict[str, Any] = {"validation_version": TRIP_VALIDATION_VERSION}
+        if valid:
+            batch.append((selector, {"$set": stamp}, None))
+        else:
+            validated_at = datetime.now(UTC)
+            stamp.update(
+                invalid=True,
+                validation_message=message or "Invalid data detected",
+                validated_at=validated_at,
+            )
+            if trip is not None:
                 trip.invalid = True
-                trip.validation_message = message or "Invalid data detected"
-                trip.validated_at = datetime.now(UTC)
+                trip.validation_message = stamp["validation_message"]
+                trip.validated_at = validated_at
+            batch.append((selector, {"$set": stamp}, trip))
 
-                await trip.save()
-                modified_count += 1
-            except Exception:
-                logger.exception(
-                    "Failed to save invalid trip %s",
-                    trip.id,
-                )
-
-        if processed_count % 500 == 0:
+        if len(batch) >= _VALIDATION_BATCH_SIZE:
+            await _flush(batch)
+            batch = []
             logger.info(
                 "Processed %d/%d trips for validation.",
                 processed_count,
@@ -109,7 +196,10 @@ async def _validate_trips_logic() -> dict[str, Any]:
             # Yield to event loop
             await asyncio.sleep(0.01)
 
+    await _flush(batch)
+
     if modified_count:
+        await TripRollupService.refresh_for_trips(invalidated_trips)
         await bump_trip_map_revision()
 
     return {
@@ -40,7 +40,7 @@ from map_data.models import MapServiceConfig
 from map_data.progress import MapBuildProgress
 from map_data.services import check_service_health
 from map_data.us_states import build_geofabrik_path, get_state
-from tasks.arq import get_arq_pool
+from tasks.arq import get_arq_pool, queue_for_task
 from tasks.map_setup_progress import MapSetupCancelledError, MapSetupProgress
 from tasks.ops import abort_job, run_task_with_history
 
@@ -1043,7 +1043,11 @@ async def setup_map_data_task(ctx: dict, states: list[str]) -> dict[str, Any]:
 
 async def _enqueue_setup_job(states: list[str]) -> str:
     pool = await get_arq_pool()
-    arq_job = await pool.enqueue_job("setup_map_data_task", states)
+    arq_job = await pool.enqueue_job(
+        "setup_map_data_task",
+        states,
+        _queue_name=queue_for_task("setup_map_data_task"),
+    )
     return (
         getattr(arq_job, "job_id", None) or getattr(arq_job, "id", None) or str(arq_job)
     )
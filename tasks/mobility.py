@@ -6,20 +6,19 @@ import logging
 import os
 from typing import Any
 
-from analytics.services.mobility_insights_service import (
-    MAX_SYNC_TRIPS_PER_REQUEST,
-    MobilityInsightsService,
-)
+from analytics.services.mobility_insights_service import MobilityInsightsService
 from tasks.ops import run_task_with_history
 
 logger = logging.getLogger(__name__)
 
+# Batches are projected reads, threaded H3 work and bulk writes, so the
+# scheduled sweep takes far larger ones than the on-request sync.
 MOBILITY_SYNC_BATCH_SIZE = max(
     1,
     int(
         os.getenv(
             "MOBILITY_INSIGHTS_SYNC_BATCH_SIZE",
-            str(MAX_SYNC_TRIPS_PER_REQUEST),
+            "1000",
         ),
     ),
 )
@@ -28,7 +27,7 @@ MOBILITY_SYNC_BATCHES_PER_RUN = max(
     int(
         os.getenv(
             "MOBILITY_INSIGHTS_SYNC_BATCHES_PER_RUN",
-            "2",
+            "20",
         ),
     ),
 )
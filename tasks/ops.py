@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any
 
 from core.service_config import refresh_service_config
 from db.models import Job, TaskHistory
-from tasks.arq import get_arq_pool
+from tasks.arq import find_job_queue, get_arq_pool, queue_for_task
 from tasks.config import (
     check_dependencies,
     get_global_disable,
@@ -276,6 +276,7 @@ async def enqueue_task(
     redis = await get_arq_pool()
     job_kwargs = dict(kwargs)
     job_kwargs.setdefault("manual_run", manual_run)
+    job_kwargs.setdefault("_queue_name", queue_for_task(task_id))
     job = await redis.enqueue_job(task_id, *args, **job_kwargs)
     job_id = getattr(job, "job_id", None) or getattr(job, "id", None) or str(job)
     now = datetime.now(UTC)
@@ -467,6 +468,22 @@ async def run_task_if_due(
     return await func()
 
 
+async def job_is_active(job_id: str) -> bool:
+    """Whether ARQ still holds ``job_id`` as queued, deferred or in progress."""
+    from arq.jobs import (
+        Job as ArqJob,
+        JobStatus,
+    )
+
+    redis: ArqRedis = await get_arq_pool()
+    job = ArqJob(job_id, redis, _queue_name=await find_job_queue(redis, job_id))
+    return await job.status() in {
+        JobStatus.deferred,
+        JobStatus.queued,
+        JobStatus.in_progress,
+    }
+
+
 async def abort_job(job_id: str, *, abort_timeout_seconds: float = 10.0) -> bool:
     """Abort an ARQ job and return only after it is confirmed stopped."""
     redis: ArqRedis = await get_arq_pool()
@@ -474,7 +491,11 @@ async def abort_job(job_id: str, *, abort_timeout_seconds: float = 10.0) -> bool
     try:
         from arq.jobs import Job as ArqJob
 
-        job = ArqJob(job_id, redis)
+        job = ArqJob(
+            job_id,
+            redis,
+            _queue_name=await find_job_queue(redis, job_id),
+        )
 
         async def has_stopped() -> bool:
             job_status = await job.status()
@@ -98,7 +98,8 @@ TASK_DEFINITIONS: dict[str, dict[str, object]] = {
         "enabled_by_default": True,
         "dependencies": [],
         "description": (
-            "Rebuilds county/state/city coverage explorer caches from all current trips."
+            "Folds newly saved trips into the county/state/city coverage explorer "
+            "caches, with a periodic full rebuild from all current trips."
         ),
     },
     "sync_mobility_profiles": {
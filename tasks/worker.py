@@ -9,7 +9,7 @@ from typing import ClassVar
 from arq import cron, func
 
 from core.startup import initialize_shared_runtime, shutdown_shared_runtime
-from tasks.arq import get_redis_settings
+from tasks.arq import HEAVY_QUEUE_NAME, get_redis_settings
 from tasks.coverage import sync_geo_coverage, update_coverage_for_new_trips
 from tasks.cron import (
     cron_auto_provision_map_data,
@@ -82,6 +82,40 @@ COVERAGE_BATCH_TIMEOUT_SECONDS = int(
 MAP_MATCHING_JOB_TIMEOUT_SECONDS = int(
     os.getenv("MAP_MATCHING_JOB_TIMEOUT_SECONDS", str(12 * 60 * 60)),
 )
+# Concurrent jobs per worker process for each queue.
+DEFAULT_QUEUE_MAX_JOBS = int(os.getenv("ARQ_DEFAULT_MAX_JOBS", "10"))
+HEAVY_QUEUE_MAX_JOBS = int(os.getenv("ARQ_HEAVY_MAX_JOBS", "2"))
+
+# Short, latency-sensitive jobs served by the default queue.
+SHORT_FUNCTIONS: list[object] = [
+    func(periodic_fetch_trips, timeout=PERIODIC_FETCH_TIMEOUT_SECONDS),
+    fetch_trip_by_transaction_id,
+    manual_fetch_trips_range,
+    validate_trips,
+    remap_unmatched_trips,
+    dedupe_mobility_profiles,
+    update_coverage_for_new_trips,
+    sync_geo_coverage,
+    worker_heartbeat,
+    func(purge_server_logs_before, timeout=LOG_PURGE_TIMEOUT_SECONDS),
+    # Map services monitoring tasks
+    monitor_map_services,
+    auto_provision_check,
+]
+
+# Long-running jobs; see ``tasks.arq.HEAVY_TASKS`` for their queue routing.
+HEAVY_FUNCTIONS: list[object] = [
+    func(fetch_all_missing_trips, timeout=HISTORY_IMPORT_TIMEOUT_SECONDS),
+    backfill_trip_display_geometry,
+    func(map_match_trips, timeout=MAP_MATCHING_JOB_TIMEOUT_SECONDS),
+    func(sync_mobility_profiles, timeout=MOBILITY_SYNC_TIMEOUT_SECONDS),
+    build_recurring_routes,
+    func(generate_optimal_route, timeout=OPTIMAL_ROUTE_TIMEOUT_SECONDS),
+    func(run_area_ingestion_job, timeout=COVERAGE_INGEST_TIMEOUT_SECONDS),
+    func(run_area_backfill_job, timeout=COVERAGE_BACKFILL_TIMEOUT_SECONDS),
+    func(run_area_recalculate_batch_job, timeout=COVERAGE_BATCH_TIMEOUT_SECONDS),
+    func(setup_map_data_task, timeout=SETUP_JOB_TIMEOUT_SECONDS),
+]
 
 
 async def on_startup(ctx: dict) -> None:
@@ -100,32 +134,16 @@ async def on_shutdown(ctx: dict) -> None:
 
 
 class WorkerSettings:
+    """
+    Default queue worker; also runs the cron schedule.
+
+    Heavy functions stay registered so jobs enqueued here before routing was
+    enabled, or while ``ARQ_HEAVY_QUEUE_ENABLED`` is off, still run.
+    """
+
     allow_abort_jobs = True
-    functions: ClassVar[list[object]] = [
-        func(periodic_fetch_trips, timeout=PERIODIC_FETCH_TIMEOUT_SECONDS),
-        fetch_trip_by_transaction_id,
-        manual_fetch_trips_range,
-        func(fetch_all_missing_trips, timeout=HISTORY_IMPORT_TIMEOUT_SECONDS),
-        validate_trips,
-        remap_unmatched_trips,
-        backfill_trip_display_geometry,
-        dedupe_mobility_profiles,
-        func(map_match_trips, timeout=MAP_MATCHING_JOB_TIMEOUT_SECONDS),
-        update_coverage_for_new_trips,
-        sync_geo_coverage,
-        func(sync_mobility_profiles, timeout=MOBILITY_SYNC_TIMEOUT_SECONDS),
-        build_recurring_routes,
-        func(generate_optimal_route, timeout=OPTIMAL_ROUTE_TIMEOUT_SECONDS),
-        worker_heartbeat,
-        func(purge_server_logs_before, timeout=LOG_PURGE_TIMEOUT_SECONDS),
-        func(run_area_ingestion_job, timeout=COVERAGE_INGEST_TIMEOUT_SECONDS),
-        func(run_area_backfill_job, timeout=COVERAGE_BACKFILL_TIMEOUT_SECONDS),
-        func(run_area_recalculate_batch_job, timeout=COVERAGE_BATCH_TIMEOUT_SECONDS),
-        # Map services setup tasks
-        func(setup_map_data_task, timeout=SETUP_JOB_TIMEOUT_SECONDS),
-        monitor_map_services,
-        auto_provision_check,
-    ]
+    max_jobs = DEFAULT_QUEUE_MAX_JOBS
+    functions: ClassVar[list[object]] = [*SHORT_FUNCTIONS, *HEAVY_FUNCTIONS]
     cron_jobs: ClassVar[list[object]] = [
         cron(cron_periodic_fetch_trips, timeout=PERIODIC_FETCH_TIMEOUT_SECONDS),
         cron(
@@ -145,3 +163,15 @@ class WorkerSettings:
     redis_settings = get_redis_settings()
     on_startup = on_startup
     on_shutdown = on_shutdown
+
+
+class HeavyWorkerSettings:
+    """Dedicated pool for long-running jobs on the heavy queue."""
+
+    allow_abort_jobs = True
+    queue_name = HEAVY_QUEUE_NAME
+    max_jobs = HEAVY_QUEUE_MAX_JOBS
+    functions: ClassVar[list[object]] = HEAVY_FUNCTIONS
+    redis_settings = get_redis_settings()
+    on_startup = on_startup
+    on_shutdown = on_shutdown
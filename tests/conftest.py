@@ -2,6 +2,7 @@ import pytest
 from db_helpers import init_mock_beanie
 from network_blocker import install_network_blocker
 
+from core.mapping import factory as mapping_factory
 from db.models import GasFillup, Trip, Vehicle
 
 
@@ -12,6 +13,19 @@ def _default_test_env(monkeypatch: pytest.MonkeyPatch) -> None:
     install_network_blocker(monkeypatch)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_mapping_provider(monkeypatch: pytest.MonkeyPatch):
+    # Each test patches its own settings, so never reuse a resolved provider
+    # and skip the Redis revision lookup.
+    async def no_revision() -> None:
+        return None
+
+    monkeypatch.setattr(mapping_factory, "_read_settings_revision", no_revision)
+    mapping_factory.clear_local_provider_cache()
+    yield
+    mapping_factory.clear_local_provider_cache()
+
+
 @pytest.fixture
 async def beanie_db():
     return await init_mock_beanie(Trip, GasFillup, Vehicle)
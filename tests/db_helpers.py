@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 
 from beanie import init_beanie
+from mongomock.collection import BulkOperationBuilder
 from pymongo_async_mock import AsyncMongoMockClient
 
 
@@ -21,10 +22,21 @@ def _patch_mock_database_for_beanie_2_1(client: AsyncMongoMockClient, database):
     database.list_collection_names = list_collection_names
 
 
+def _collapse_bulk_update_patch() -> None:
+    # pymongo_async_mock wraps BulkOperationBuilder.add_update again for every
+    # collection it creates; across a long test run the nested wrappers hit
+    # the recursion limit inside bulk_write. Keep only the innermost wrapper.
+    add_update = BulkOperationBuilder.add_update
+    while getattr(getattr(add_update, "__wrapped__", None), "__wrapped__", None):
+        add_update = add_update.__wrapped__
+    BulkOperationBuilder.add_update = add_update
+
+
 async def init_mock_beanie(
     *document_models: Any,
     database_name: str = "test_db",
 ):
+    _collapse_bulk_update_patch()
     client = AsyncMongoMockClient()
     database = client[database_name]
     _patch_mock_database_for_beanie_2_1(client, database)
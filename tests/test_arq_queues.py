@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tasks import arq as arq_module
+from tasks.worker import HeavyWorkerSettings, WorkerSettings
+
+
+def _function_names(functions: list[object]) -> set[str]:
+    return {getattr(fn, "name", None) or fn.__name__ for fn in functions}
+
+
+def test_heavy_tasks_route_to_heavy_queue_only_when_enabled(monkeypatch) -> None:
+    monkeypatch.delenv("ARQ_HEAVY_QUEUE_ENABLED", raising=False)
+    assert arq_module.queue_for_task("generate_optimal_route") == "arq:queue"
+
+    monkeypatch.setenv("ARQ_HEAVY_QUEUE_ENABLED", "true")
+    assert arq_module.queue_for_task("generate_optimal_route") == (
+        arq_module.HEAVY_QUEUE_NAME
+    )
+    assert arq_module.queue_for_task("periodic_fetch_trips") == "arq:queue"
+
+
+def test_worker_pools_cover_their_queues() -> None:
+    heavy = _function_names(HeavyWorkerSettings.functions)
+    default = _function_names(WorkerSettings.functions)
+
+    assert heavy == arq_module.HEAVY_TASKS
+    assert HeavyWorkerSettings.queue_name == arq_module.HEAVY_QUEUE_NAME
+    assert HeavyWorkerSettings.allow_abort_jobs is True
+    assert not getattr(HeavyWorkerSettings, "cron_jobs", None)
+    # The default worker keeps heavy functions for single-worker deployments.
+    assert heavy < default
+    assert "periodic_fetch_trips" in default
+
+
+@pytest.mark.asyncio
+async def test_find_job_queue_locates_queued_heavy_job() -> None:
+    queued = {(arq_module.HEAVY_QUEUE_NAME, "job-heavy"): 1.0}
+    redis = SimpleNamespace(
+        zscore=AsyncMock(side_effect=lambda queue, job_id: queued.get((queue, job_id))),
+    )
+
+    assert await arq_module.find_job_queue(redis, "job-heavy") == (
+        arq_module.HEAVY_QUEUE_NAME
+    )
+    assert await arq_module.find_job_queue(redis, "job-running") == "arq:queue"
+
+
+@pytest.mark.asyncio
+async def test_heavy_cron_enqueues_instead_of_running_inline(monkeypatch) -> None:
+    from tasks import cron
+
+    async def run_if_due(_ctx, _task_id, func):
+        return await func()
+
+    inline = AsyncMock(return_value={"status": "success"})
+    enqueue = AsyncMock(return_value={"job_id": "job-1", "status": "success"})
+    monkeypatch.setattr(cron, "run_task_if_due", run_if_due)
+    monkeypatch.setattr(cron, "sync_mobility_profiles", inline)
+    monkeypatch.setattr(cron, "enqueue_task", enqueue)
+    monkeypatch.setattr(cron, "get_latest_task_history", AsyncMock(return_value={}))
+
+    monkeypatch.setenv("ARQ_HEAVY_QUEUE_ENABLED", "true")
+    assert (await cron.cron_sync_mobility_profiles({}))["job_id"] == "job-1"
+    enqueue.assert_awaited_once_with("sync_mobility_profiles")
+    inline.assert_not_awaited()
+
+    monkeypatch.delenv("ARQ_HEAVY_QUEUE_ENABLED")
+    await cron.cron_sync_mobility_profiles({})
+    inline.assert_awaited_once()
+    assert enqueue.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_heavy_cron_skips_when_a_run_is_already_queued(monkeypatch) -> None:
+    from tasks import cron
+
+    enqueue = AsyncMock(return_value={"job_id": "job-2", "status": "success"})
+    record_failure = AsyncMock()
+    pending = SimpleNamespace(id="job-1", status="PENDING", manual_run=False)
+    monkeypatch.setenv("ARQ_HEAVY_QUEUE_ENABLED", "true")
+    monkeypatch.setattr(cron, "enqueue_task", enqueue)
+    monkeypatch.setattr(cron, "update_task_history_entry", record_failure)
+    monkeypatch.setattr(
+        cron,
+        "get_latest_task_history",
+        AsyncMock(return_value={"sync_mobility_profiles": pending}),
+    )
+
+    monkeypatch.setattr(cron, "job_is_active", AsyncMock(return_value=True))
+    assert await cron._enqueue_heavy_task("sync_mobility_profiles") is None
+    enqueue.assert_not_awaited()
+
+    # A history entry whose job ARQ no longer holds does not block the task.
+    monkeypatch.setattr(cron, "job_is_active", AsyncMock(return_value=False))
+    result = await cron._enqueue_heavy_task("sync_mobility_profiles")
+    assert result["job_id"] == "job-2"
+    enqueue.assert_awaited_once_with("sync_mobility_profiles")
+    assert record_failure.await_args.kwargs["job_id"] == "job-1"
+    assert record_failure.await_args.kwargs["status"] == "FAILED"
+
+
+@pytest.mark.asyncio
+async def test_job_is_active_reads_arq_job_status(monkeypatch) -> None:
+    from arq.jobs import JobStatus
+
+    from tasks import ops
+
+    statuses = iter([JobStatus.queued, JobStatus.in_progress, JobStatus.not_found])
+
+    class FakeJob:
+        def __init__(self, job_id, _redis, _queue_name) -> None:
+            self.job_id = job_id
+
+        async def status(self):
+            return next(statuses)
+
+    monkeypatch.setattr("arq.jobs.Job", FakeJob)
+    monkeypatch.setattr(ops, "get_arq_pool", AsyncMock(return_value=object()))
+    monkeypatch.setattr(ops, "find_job_queue", AsyncMock(return_value="arq:queue"))
+
+    assert await ops.job_is_active("job-1") is True
+    assert await ops.job_is_active("job-1") is True
+    assert await ops.job_is_active("job-1") is False
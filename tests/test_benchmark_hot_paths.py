@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts/python/benchmark_hot_paths.py"
+
+
+def _load_script():
+    if "benchmark_hot_paths" in sys.modules:
+        return sys.modules["benchmark_hot_paths"]
+    spec = importlib.util.spec_from_file_location("benchmark_hot_paths", SCRIPT)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses resolve string annotations through sys.modules.
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.asyncio
+async def test_benchmark_suite_runs_every_phase_on_a_tiny_dataset() -> None:
+    bench = _load_script()
+
+    report = await bench.run_benchmarks(seed=3, grid_size=5, trip_count=8)
+
+    phases = {phase["name"]: phase for phase in report["phases"]}
+    assert list(phases) == ["seed", *bench.PHASES]
+    assert all(phase["wall_seconds"] >= 0 for phase in phases.values())
+    assert report["peak_rss_mb"] > 0
+    assert phases["coverage_backfill"]["details"]["newly_driven_segments"] > 0
+    assert phases["journal_rollup"]["details"]["drive_events"] == 8
+    assert phases["coverage_map_bundle"]["details"]["features"] == 40
+    assert phases["trip_map_bundle"]["details"]["features"] == 8
+    assert set(phases["route_generation"]["steps"]) == {
+        "load_graphml",
+        "match_segments",
+        "solve",
+        "local_search",
+    }
+    assert "seed=3 grid=5x5 trips=8" in bench.format_report(report)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from core import cache
+from core.cache import (
+    TRIPS_CACHE_TAG,
+    cached,
+    clear_local_cache,
+    invalidate_cache_prefixes,
+    invalidate_cache_tags,
+)
+from core.trip_map_cache import TRIP_MAP_REVISION_KEY
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.store.get(key)
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        return [self.store.get(key) for key in keys]
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        nx: bool = False,
+        ex: int | None = None,
+    ) -> bool | None:
+        del ex
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = int(self.store.get(key, 0)) + 1
+        self.store[key] = str(value)
+        return value
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self.store.pop(key, None) is not None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    redis = _FakeRedis()
+
+    async def get_redis() -> _FakeRedis:
+        return redis
+
+    monkeypatch.setattr(cache, "get_shared_redis", get_redis)
+    monkeypatch.setattr(cache, "CACHE_REVISION_TTL_SECONDS", 0.0)
+    clear_local_cache()
+    yield redis
+    clear_local_cache()
+
+
+async def test_concurrent_misses_share_one_computation(fake_redis: _FakeRedis) -> None:
+    calls = 0
+
+    @cached("test_single_flight")
+    async def compute(value: int) -> dict[str, int]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": value}
+
+    results = await asyncio.gather(*(compute(3) for _ in range(5)))
+
+    assert calls == 1
+    assert results == [{"value": 3}] * 5
+    assert not any(key.startswith("cache:lease:") for key in fake_redis.store)
+
+
+async def test_local_tier_and_redis_serve_repeat_calls(fake_redis: _FakeRedis) -> None:
+    calls = 0
+
+    @cached("test_tiers")
+    async def compute() -> list[int]:
+        nonlocal calls
+        calls += 1
+        return [1, 2]
+
+    assert await compute() == [1, 2]
+    assert await compute() == [1, 2]
+    # A fresh process (empty local tier) still reads the shared Redis entry.
+    clear_local_cache()
+    assert await compute() == [1, 2]
+    assert calls == 1
+
+
+async def test_prefix_and_tag_invalidation_force_recompute(
+    fake_redis: _FakeRedis,
+) -> None:
+    calls = 0
+
+    @cached("test_invalidation", tags=(TRIPS_CACHE_TAG,))
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await compute() == 1
+    assert await compute() == 1
+
+    assert await invalidate_cache_prefixes("test_invalidation", " ") == 1
+    assert await compute() == 2
+
+    assert await invalidate_cache_tags(TRIPS_CACHE_TAG) == 1
+    assert fake_redis.store[TRIP_MAP_REVISION_KEY] == "1"
+    assert await compute() == 3
+
+    # Bumping the trip map revision elsewhere also reaches tagged entries.
+    await fake_redis.incr(TRIP_MAP_REVISION_KEY)
+    assert await compute() == 4
+
+
+async def test_stale_entry_served_while_refreshing(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = 0
+    release = asyncio.Event()
+
+    @cached("test_stale", ttl_seconds=60, stale_ttl_seconds=60)
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            await release.wait()
+        return calls
+
+    assert await compute() == 1
+
+    now = time.time()
+    monkeypatch.setattr(cache.time, "time", lambda: now + 90)
+    assert await compute() == 1
+    assert await compute() == 1
+    await asyncio.sleep(0)
+    assert calls == 2
+
+    release.set()
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert await compute() == 2
+
+    monkeypatch.setattr(cache.time, "time", lambda: now + 500)
+    release.set()
+    assert await compute() == 3
+
+
+async def test_falls_back_to_direct_call_without_redis(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def broken_redis() -> Any:
+        msg = "redis down"
+        raise ConnectionError(msg)
+
+    monkeypatch.setattr(cache, "get_shared_redis", broken_redis)
+    clear_local_cache()
+    calls = 0
+
+    @cached("test_no_redis")
+    async def compute() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await compute() == 1
+    assert await compute() == 2
+    assert await invalidate_cache_prefixes("test_no_redis") == 0
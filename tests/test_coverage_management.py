@@ -22,6 +22,7 @@ from db.models import (
     CoverageJournalRollup,
     CoverageState,
     CoverageStatusEvent,
+    CoverageStreetName,
     Job,
     Street,
     Trip,
@@ -37,6 +38,7 @@ async def coverage_db():
         CoverageDriveEvent,
         CoverageStatusEvent,
         CoverageJournalRollup,
+        CoverageStreetName,
         Job,
         Street,
         Trip,
@@ -873,6 +875,7 @@ async def test_create_area_enqueues_ingestion_job(coverage_db) -> None:
         str(area.id),
         str(job.id),
         "matched",
+        _queue_name="arq:queue",
     )
 
 
@@ -930,6 +933,7 @@ async def test_rebuild_area_enqueues_ingestion_job(coverage_db) -> None:
         str(area.id),
         str(created_job.id),
         "regular",
+        _queue_name="arq:queue",
     )
 
 
@@ -967,6 +971,7 @@ async def test_backfill_area_enqueues_backfill_job(coverage_db) -> None:
         str(area.id),
         str(created_job.id),
         "both",
+        _queue_name="arq:queue",
     )
 
 
@@ -394,3 +394,99 @@ async def test_graph_rebuilds_when_osm_extract_id_changes(tmp_path: Path) -> Non
     finally:
         routing_constants.GRAPH_STORAGE_DIR = original_graph_dir
         preprocess_module.GRAPH_STORAGE_DIR = original_graph_dir
+
+
+def _box_location(location_id: str, lon: float, lat: float) -> dict:
+    half = 0.0015
+    return {
+        "_id": location_id,
+        "id": location_id,
+        "display_name": location_id,
+        "boundary": {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [lon - half, lat - half],
+                    [lon + half, lat - half],
+                    [lon + half, lat + half],
+                    [lon - half, lat + half],
+                    [lon - half, lat - half],
+                ],
+            ],
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_build_parses_shared_extract_once(tmp_path: Path) -> None:
+    graph_dir = tmp_path / "graphs"
+    graph_dir.mkdir(parents=True, exist_ok=True)
+    pbf_path = tmp_path / "state.osm.pbf"
+    pbf_path.write_bytes(b"pbf")
+
+    original_graph_dir = routing_constants.GRAPH_STORAGE_DIR
+    routing_constants.GRAPH_STORAGE_DIR = graph_dir
+    preprocess_module.GRAPH_STORAGE_DIR = graph_dir
+
+    parses: list[Path] = []
+    retried: list[str] = []
+
+    def fake_graph_from_pbf(path: Path) -> nx.MultiDiGraph:
+        parses.append(path)
+        graph = nx.MultiDiGraph()
+        graph.graph["crs"] = "epsg:4326"
+        graph.add_node(1, x=-97.1460, y=31.5490)
+        graph.add_node(2, x=-97.1455, y=31.5490)
+        graph.add_edge(1, 2, key=0, highway="residential", name="West", osmid=1)
+        graph.add_node(11, x=-97.0460, y=31.5490)
+        graph.add_node(12, x=-97.0455, y=31.5490)
+        graph.add_edge(11, 12, key=0, highway="residential", name="East", osmid=2)
+        return graph
+
+    async def fake_preprocess_streets(location: dict, task_id: str | None = None):
+        _ = task_id
+        retried.append(location["_id"])
+
+    try:
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("OSM_DATA_PATH", str(pbf_path))
+            monkeypatch.setenv("COVERAGE_GRAPH_MAX_MB", "0")
+            monkeypatch.setattr(
+                preprocess_module,
+                "_graph_from_pbf",
+                fake_graph_from_pbf,
+            )
+            monkeypatch.setattr(
+                preprocess_module,
+                "preprocess_streets",
+                fake_preprocess_streets,
+            )
+            monkeypatch.setattr(
+                extract_module,
+                "get_configured_extract_identity",
+                _no_configured_extract,
+            )
+
+            built = await preprocess_module.preprocess_graphs_batch(
+                [
+                    _box_location("west", -97.1457, 31.5490),
+                    _box_location("east", -97.0457, 31.5490),
+                    _box_location("empty", -96.5000, 31.5490),
+                    {"_id": "no-boundary", "display_name": "No Boundary"},
+                ],
+            )
+
+        assert parses == [pbf_path]
+        assert set(built) == {"west", "east"}
+        assert retried == ["empty"]
+
+        west = nx.read_graphml(built["west"])
+        east = nx.read_graphml(built["east"])
+        assert set(west.nodes) == {"1", "2"}
+        assert set(east.nodes) == {"11", "12"}
+        assert west.graph.get(GRAPH_ROAD_FILTER_SIGNATURE_KEY) == (
+            get_public_road_filter_signature()
+        )
+    finally:
+        routing_constants.GRAPH_STORAGE_DIR = original_graph_dir
+        preprocess_module.GRAPH_STORAGE_DIR = original_graph_dir
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from driving.services import driving_service
+from driving.services.undriven_index import UndrivenSegmentIndex
+
+# Roughly 100 m apart along a parallel near Austin.
+_LAT = 30.27
+_STEP = 100.0 / (111320.0 * np.cos(np.radians(_LAT)))
+
+
+def _index(count: int = 6, *, gap_after: int = 3) -> UndrivenSegmentIndex:
+    lons = [
+        -97.74 + _STEP * i + (_STEP * 5 if i >= gap_after else 0.0)
+        for i in range(count)
+    ]
+    midpoints = np.array([[lon, _LAT] for lon in lons])
+    return UndrivenSegmentIndex(
+        "area",
+        (1, count),
+        [f"seg-{i}" for i in range(count)],
+        [f"Street {i}" for i in range(count)],
+        midpoints,
+        np.full(count, 100.0),
+    )
+
+
+def test_nearest_skips_excluded_segments() -> None:
+    index = _index()
+    lon = -97.74 + _STEP * 0.1
+
+    assert index.segment(index.nearest(lon, _LAT))["segment_id"] == "seg-0"
+
+    assert index.apply_statuses(["seg-0", "seg-1", "unknown"], revision=3)
+    assert index.undriven_count == 4
+    assert index.undriven_position("seg-0") is None
+    assert index.segment(index.nearest(lon, _LAT))["segment_id"] == "seg-2"
+
+    # Same status set under a new revision keeps the derived structures.
+    assert not index.apply_statuses(["seg-1", "seg-0"], revision=4)
+    assert index.state_revision == 4
+
+
+def test_clusters_follow_status_mask() -> None:
+    index = _index()
+
+    clusters = index.clusters(120.0)
+    assert [len(cluster.positions) for cluster in clusters] == [3, 3]
+    assert clusters[0].total_length_m == pytest.approx(300.0)
+
+    index.apply_statuses(["seg-1"], revision=1)
+    sizes = sorted(len(cluster.positions) for cluster in index.clusters(120.0))
+    assert sizes == [1, 1, 3]
+
+
+def test_missing_midpoints_are_undriven_but_not_routable() -> None:
+    index = UndrivenSegmentIndex(
+        "area",
+        (1, 1),
+        ["seg-0"],
+        [None],
+        np.array([[np.nan, np.nan]]),
+        np.array([0.0]),
+    )
+
+    assert index.undriven_count == 1
+    assert len(index.routable_positions) == 0
+    assert index.nearest(-97.74, _LAT) is None
+    assert index.clusters(120.0) == []
+
+
+@pytest.mark.asyncio
+async def test_index_reloads_only_what_changed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    builds: list[tuple[int, int]] = []
+    status_loads: list[int] = []
+
+    async def fake_build(area, geometry_key):
+        builds.append(geometry_key)
+        return _index()
+
+    async def fake_excluded(area):
+        status_loads.append(area.coverage_state_revision)
+        return ["seg-0"]
+
+    monkeypatch.setattr(driving_service, "_build_undriven_index", fake_build)
+    monkeypatch.setattr(driving_service, "_load_excluded_segment_ids", fake_excluded)
+    monkeypatch.setattr(
+        driving_service, "_undriven_indexes", driving_service.OrderedDict()
+    )
+
+    area = SimpleNamespace(
+        id="area-1",
+        area_version=1,
+        total_segments=6,
+        coverage_state_revision=0,
+    )
+    first = await driving_service._get_undriven_index(area)
+    again = await driving_service._get_undriven_index(area)
+    assert again is first
+    assert builds == [(1, 6)]
+    assert status_loads == [0]
+    assert first.undriven_count == 5
+
+    area.coverage_state_revision = 1
+    await driving_service._get_undriven_index(area)
+    assert builds == [(1, 6)]
+    assert status_loads == [0, 1]
+
+    area.area_version = 2
+    rebuilt = await driving_service._get_undriven_index(area)
+    assert rebuilt is not first
+    assert builds == [(1, 6), (2, 6)]
+    assert status_loads == [0, 1, 1]
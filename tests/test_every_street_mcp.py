@@ -1,13 +1,24 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import AsyncMock
 
 import pytest
 from db_helpers import init_mock_beanie
 from httpx import ASGITransport, AsyncClient
 
 from app import app
-from db.models import McpAuditEvent
+from core import cache
+from db.models import (
+    CoverageArea,
+    CoverageState,
+    McpAuditEvent,
+    Place,
+    Street,
+    Trip,
+)
+from every_street_mcp import server
 from every_street_mcp.api import get_chatgpt_status
 from every_street_mcp.security import OpenAIMtlsProxyGuard
 from every_street_mcp.server import (
@@ -16,13 +27,61 @@ from every_street_mcp.server import (
     LIVE_RESOURCE_URI,
     MODEL_TOOL_COUNT,
     TOOL_COUNT,
+    analyze_places,
     mcp,
     mcp_lifespan,
+    render_every_street_explorer,
 )
 
 pytestmark = pytest.mark.asyncio
 
 
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.values.get(key)
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, *, nx=False, ex=None) -> bool:
+        del ex
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+    async def setex(self, key: str, _seconds: int, value: Any) -> bool:
+        self.values[key] = value
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = int(self.values.get(key) or 0) + 1
+        return self.values[key]
+
+    async def expire(self, key: str, _seconds: int) -> bool:
+        return key in self.values
+
+    async def delete(self, key: str) -> int:
+        return int(self.values.pop(key, None) is not None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    redis = _FakeRedis()
+
+    async def get_redis() -> _FakeRedis:
+        return redis
+
+    monkeypatch.setattr(server, "get_shared_redis", get_redis)
+    monkeypatch.setattr(cache, "get_shared_redis", get_redis)
+    cache.clear_local_cache()
+    yield redis
+    cache.clear_local_cache()
+
+
 @pytest.fixture
 async def mcp_db():
     return await init_mock_beanie(McpAuditEvent, database_name="test_mcp_db")
@@ -159,3 +218,99 @@ async def test_owner_status_reports_redacted_mcp_activity(mcp_db) -> None:
     assert status["activity_24h"] == {"calls": 1, "errors": 0}
     assert status["latest_call"]["tool"] == "get_every_street_snapshot"
     assert "subject_hash" not in status["latest_call"]
+
+
+def _place_trip(tx: str, start: str | None, destination: str | None) -> Trip:
+    return Trip(
+        transactionId=tx,
+        source="bouncie",
+        startPlaceId=start,
+        destinationPlaceId=destination,
+    )
+
+
+async def test_analyze_places_counts_trips_in_one_cached_aggregation(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await init_mock_beanie(McpAuditEvent, Place, Trip, database_name="test_mcp_db")
+    home = Place(name="Home")
+    work = Place(name="Work")
+    await home.insert()
+    await work.insert()
+    home_id, work_id = str(home.id), str(work.id)
+    await Trip.insert_many(
+        [
+            _place_trip("commute", home_id, work_id),
+            _place_trip("return", work_id, home_id),
+            _place_trip("loop", home_id, home_id),
+            _place_trip("errand", home_id, None),
+            _place_trip("elsewhere", None, None),
+        ],
+    )
+
+    result = await analyze_places(limit=10)
+    assert result.structuredContent["places"] == [
+        {"id": home_id, "name": "Home", "trip_count": 4},
+        {"id": work_id, "name": "Work", "trip_count": 2},
+    ]
+
+    # Repeat calls are served from the cache until trips change.
+    def aggregate(*_args, **_kwargs):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(Trip, "aggregate", aggregate)
+    again = await analyze_places(limit=10)
+    assert again.structuredContent == result.structuredContent
+
+    await fake_redis.incr("trip_map:revision")
+    cache.clear_local_cache()
+    with pytest.raises(AssertionError, match="cache miss"):
+        await analyze_places(limit=10)
+
+
+async def test_explorer_reuses_view_until_coverage_state_changes(
+    fake_redis: _FakeRedis,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await init_mock_beanie(
+        McpAuditEvent,
+        CoverageArea,
+        CoverageState,
+        Street,
+        database_name="test_mcp_db",
+    )
+    monkeypatch.setattr(
+        server.CoverageIntelligenceService,
+        "get_intelligence",
+        AsyncMock(return_value={}),
+    )
+    area = CoverageArea(display_name="Testville", status="ready")
+    await area.insert()
+    for seq in (1, 2):
+        await Street(
+            segment_id=f"seg-{seq}",
+            area_id=area.id,
+            area_version=area.area_version,
+            street_name=f"Street {seq}",
+            geometry={"type": "LineString", "coordinates": [[seq, 0], [seq, 1]]},
+        ).insert()
+    await CoverageState(area_id=area.id, segment_id="seg-2", status="driven").insert()
+
+    first = await render_every_street_explorer(str(area.id))
+    features = first.meta["initial_view"]["features"]
+    assert [(f["segment_id"], f["status"]) for f in features] == [
+        ("seg-1", "undriven"),
+        ("seg-2", "driven"),
+    ]
+
+    second = await render_every_street_explorer(str(area.id))
+    assert second.structuredContent["view_id"] == first.structuredContent["view_id"]
+    assert second.meta["initial_view"] == first.meta["initial_view"]
+
+    await CoverageArea.get_pymongo_collection().update_one(
+        {"_id": area.id},
+        {"$inc": {"coverage_state_revision": 1}},
+    )
+    third = await render_every_street_explorer(str(area.id))
+    assert third.structuredContent["view_id"] != first.structuredContent["view_id"]
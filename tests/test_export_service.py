@@ -219,3 +219,44 @@ def test_entity_file_path_returns_correct_extension() -> None:
 
     path = ExportService._entity_file_path(export_dir, "streets", "geojson")
     assert path.name == "streets.geojson"
+
+
+def test_trip_projection_drops_geometry_the_format_does_not_read() -> None:
+    csv_projection = ExportService._trip_projection(
+        "csv",
+        geometry_field="gps",
+        include_geometry=False,
+        clip_enabled=False,
+    )
+    assert csv_projection == {
+        "gps": 0,
+        "matchedGps": 0,
+        "coordinates": 0,
+        "processing_history": 0,
+    }
+
+    gpx_projection = ExportService._trip_projection(
+        "gpx",
+        geometry_field="matchedGps",
+        include_geometry=True,
+        clip_enabled=False,
+    )
+    assert gpx_projection == {"gps": 0, "processing_history": 0}
+
+    clipped_parquet = ExportService._trip_projection(
+        "parquet",
+        geometry_field="gps",
+        include_geometry=False,
+        clip_enabled=True,
+    )
+    assert "gps" not in clipped_parquet
+
+
+def test_normalize_item_accepts_parquet_for_trips_and_streets() -> None:
+    trips = ExportService._normalize_item(ExportItem(entity="trips", format="parquet"))
+    assert trips["include_geometry"] is True
+
+    streets = ExportService._normalize_item(
+        ExportItem(entity="streets", format="parquet"),
+    )
+    assert streets["format"] == "parquet"
@@ -0,0 +1,126 @@
+import csv
+import io
+import json
+import zipfile
+
+import gpxpy
+import pytest
+
+from exports.services.export_stream import (
+    CsvEncoder,
+    GeoJsonEncoder,
+    GpxEncoder,
+    JsonArrayEncoder,
+    StreamEntry,
+    iter_file_bytes,
+    iter_zip_bytes,
+)
+
+
+async def _async_iter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+@pytest.mark.asyncio
+async def test_iter_file_bytes_streams_json_array_and_skips_filtered_rows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("exports.services.export_stream.STREAM_BATCH_SIZE", 2)
+    entry = StreamEntry(
+        "trips.json",
+        _async_iter([{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {"id": 5}]),
+        lambda item: None if item["id"] == 3 else item,
+        JsonArrayEncoder(),
+    )
+
+    chunks = [chunk async for chunk in iter_file_bytes(entry)]
+
+    assert len(chunks) > 1
+    assert json.loads(b"".join(chunks)) == [
+        {"id": 1},
+        {"id": 2},
+        {"id": 4},
+        {"id": 5},
+    ]
+    assert entry.encoder.count == 4
+
+
+@pytest.mark.asyncio
+async def test_iter_file_bytes_streams_csv_with_header() -> None:
+    entry = StreamEntry(
+        "trips.csv",
+        _async_iter([{"id": 1, "payload": {"a": 1}}]),
+        lambda item: item,
+        CsvEncoder(["id", "payload"]),
+    )
+
+    body = (await _collect(iter_file_bytes(entry))).decode("utf-8")
+
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert rows == [{"id": "1", "payload": '{"a":1}'}]
+
+
+@pytest.mark.asyncio
+async def test_iter_file_bytes_streams_valid_gpx() -> None:
+    entry = StreamEntry(
+        "trips.gpx",
+        _async_iter(
+            [
+                {
+                    "name": "Trip 1",
+                    "segments": [
+                        {"coordinates": [[-97.0, 30.0], [-97.1, 30.1]]},
+                    ],
+                },
+                {"name": "Empty", "segments": []},
+            ],
+        ),
+        lambda item: item,
+        GpxEncoder(),
+    )
+
+    body = (await _collect(iter_file_bytes(entry))).decode("utf-8")
+
+    gpx = gpxpy.parse(body)
+    assert [track.name for track in gpx.tracks] == ["Trip 1"]
+    assert len(gpx.tracks[0].segments[0].points) == 2
+    assert entry.encoder.count == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_zip_bytes_streams_entries_and_manifest() -> None:
+    entries = [
+        StreamEntry(
+            "trips.json",
+            _async_iter([{"id": 1}]),
+            lambda item: item,
+            JsonArrayEncoder(),
+        ),
+        StreamEntry(
+            "coverage/streets.geojson",
+            _async_iter(
+                [{"type": "Feature", "geometry": None, "properties": {}}],
+            ),
+            lambda item: item,
+            GeoJsonEncoder(),
+        ),
+    ]
+
+    body = await _collect(
+        iter_zip_bytes(
+            entries,
+            lambda done: {"counts": [entry.encoder.count for entry in done]},
+        ),
+    )
+
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        assert json.loads(archive.read("trips.json")) == [{"id": 1}]
+        streets = json.loads(archive.read("coverage/streets.geojson"))
+        assert streets["type"] == "FeatureCollection"
+        assert len(streets["features"]) == 1
+        assert json.loads(archive.read("manifest.json")) == {"counts": [1, 1]}
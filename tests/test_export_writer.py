@@ -10,6 +10,7 @@ from exports.services.export_writer import (
     write_geojson_features,
     write_gpx_tracks,
     write_json_array,
+    write_parquet,
 )
 
 
@@ -106,3 +107,44 @@ async def test_write_gpx_tracks(tmp_path) -> None:
         1,
         tzinfo=UTC,
     )
+
+
+@pytest.mark.asyncio
+async def test_write_parquet_writes_typed_columns_and_geoparquet_metadata(
+    tmp_path,
+) -> None:
+    import pyarrow.parquet as pq
+    import shapely
+
+    items = [
+        {
+            "tripId": "a",
+            "distance": "3.5",
+            "invalid": False,
+            "startLocation": {"name": "Home"},
+            "gps": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+        },
+        {"tripId": "b", "distance": None, "invalid": None, "gps": None},
+    ]
+    path = tmp_path / "trips.parquet"
+
+    count = await write_parquet(
+        path,
+        _async_iter(items),
+        ["tripId", "distance", "invalid", "startLocation"],
+        lambda item: item,
+        geometry_field="gps",
+    )
+
+    assert count == 2
+    table = pq.read_table(path)
+    assert table.column("distance").to_pylist() == [3.5, None]
+    assert table.column("invalid").to_pylist() == [False, None]
+    assert table.column("startLocation").to_pylist() == ['{"name":"Home"}', None]
+    geometry = table.column("geometry").to_pylist()
+    assert shapely.from_wkb(geometry[0]).equals(
+        shapely.LineString([(0, 0), (1, 1)]),
+    )
+    assert geometry[1] is None
+    geo = json.loads(table.schema.metadata[b"geo"])
+    assert geo["primary_column"] == "geometry"
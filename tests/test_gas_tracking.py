@@ -1045,15 +1045,83 @@ async def test_sync_vehicles_from_trips_only_uses_bouncie_source(beanie_db) -> N
     assert result["synced"] == 1
 
 
+@pytest.mark.asyncio
+async def test_recalculate_subsequent_fillup_recomputes_whole_timeline_in_one_write(
+    beanie_db,
+    monkeypatch,
+) -> None:
+    imei = "imei-single-pass"
+    base = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+    # Trusted full tanks, partial fills and one missed_previous break.
+    rows = [
+        (10.0, 1000.0, True, False),
+        (3.0, 1060.0, False, False),
+        (9.0, 1250.0, True, False),
+        (4.0, 1300.0, True, True),
+        (6.0, 1420.0, True, False),
+        (2.0, None, False, False),
+        (5.0, 1600.0, True, False),
+        (7.0, 1790.0, True, False),
+        (8.0, 1950.0, True, False),
+    ]
+    for index, (gallons, odometer, full, missed) in enumerate(rows):
+        await _trusted_fillup(
+            imei=imei,
+            fillup_time=base + timedelta(days=index),
+            gallons=gallons,
+            odometer=odometer,
+            is_full_tank=full,
+            missed_previous=missed,
+            calculated_mpg=99.0,
+        ).insert()
+
+    # The old cascade stopped after this many rows; the timeline pass must not.
+    monkeypatch.setattr(FillupService, "_MAX_CHAIN_LOOKBACK", 3)
+    writes = []
+    original_write = FillupService._write_fillup_stats
+
+    async def record_write(updates):
+        writes.append(len(updates))
+        return await original_write(updates)
+
+    monkeypatch.setattr(FillupService, "_write_fillup_stats", record_write)
+
+    await FillupService.recalculate_subsequent_fillup(imei, base)
+    assert writes == [len(rows)]
+
+    stored = await GasFillup.find({"imei": imei}).sort("fillup_time").to_list()
+    for fillup in stored:
+        expected = await FillupService._calculate_fillup_stats(
+            imei=imei,
+            fillup_time=fillup.fillup_time,
+            current_id=fillup.id,
+            current_odometer=fillup.odometer,
+            current_gallons=fillup.gallons,
+            is_full_tank=fillup.is_full_tank,
+            missed_previous=fillup.missed_previous,
+        )
+        assert (
+            fillup.calculated_mpg,
+            fillup.miles_since_last_fillup,
+            fillup.previous_odometer,
+        ) == expected
+    assert stored[2].calculated_mpg == pytest.approx(250.0 / 12.0)
+    assert stored[3].calculated_mpg is None
+
+    # A second pass finds nothing stale and writes nothing.
+    await FillupService.recalculate_subsequent_fillup(imei, base)
+    assert writes == [len(rows), 0]
+
+
 @pytest.mark.asyncio
 async def test_recalculate_subsequent_fillup_does_not_raise_on_internal_errors(
     monkeypatch,
 ) -> None:
-    async def boom(**_kwargs):
+    def boom(*_args, **_kwargs):
         msg = "simulated failure"
         raise RuntimeError(msg)
 
-    monkeypatch.setattr(FillupService, "_get_next_fillup", boom)
+    monkeypatch.setattr(GasFillup, "find", boom)
 
     await FillupService.recalculate_subsequent_fillup(
         "imei-recalc-safe",
@@ -5,10 +5,13 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
-from shapely import STRtree
+from bson import ObjectId
+from db_helpers import init_mock_beanie
 from shapely.geometry import Point, box
 
+from db.models import Trip
 from geo_coverage.services import geo_coverage_service as service
+from geo_coverage.services.boundary_index import BoundaryLayer, GeoBoundaryIndex
 
 
 class _FakeGeoRecalcJob:
@@ -118,25 +121,128 @@ def test_extract_stop_points_keeps_end_stop_for_round_trip() -> None:
     assert points[1][1] == end_time
 
 
+def _boundary_index(boundaries: dict[str, object]) -> GeoBoundaryIndex:
+    return GeoBoundaryIndex(
+        version="test",
+        counties=BoundaryLayer.build(
+            list(boundaries),
+            list(boundaries.values()),
+        ),
+        cities=BoundaryLayer.build([], []),
+        state_names={},
+        county_totals_by_state={},
+        city_state_index={},
+        city_state_names={},
+        city_totals_by_state={},
+    )
+
+
 def test_point_trip_records_boundary_visit_as_well_as_stop() -> None:
-    boundary = box(-98.0, 29.0, -96.0, 31.0)
-    boundaries = [boundary]
-    visits: dict[str, dict[str, datetime | None]] = {}
+    index = _boundary_index({"boundary-1": box(-98.0, 29.0, -96.0, 31.0)})
     visit_time = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    maps = service._GeoVisitMaps()
 
-    service._record_boundary_visits(
-        trip_geometry=Point(-97.0, 30.0),
-        boundary_tree=STRtree(boundaries),
-        boundary_index_lookup=service._build_query_index(boundaries),
-        boundary_shapes=boundaries,
-        boundary_ids=["boundary-1"],
-        visit_map=visits,
-        visit_time=visit_time,
+    hits = service._evaluate_trip(
+        index,
+        {
+            "gps": {"type": "Point", "coordinates": [-97.0, 30.0]},
+            "startTime": visit_time,
+        },
     )
+    assert hits is not None
+    maps.merge(hits)
 
-    assert visits == {
+    assert maps.county_visits == {
         "boundary-1": {"firstVisit": visit_time, "lastVisit": visit_time}
     }
+    assert "boundary-1" in maps.county_stops
+
+
+def test_incremental_merge_extends_cached_visit_window() -> None:
+    index = _boundary_index({"boundary-1": box(-98.0, 29.0, -96.0, 31.0)})
+    first = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    later = datetime(2026, 3, 1, 12, 0, tzinfo=UTC)
+    maps = service._GeoVisitMaps(
+        county_visits=service._deserialize_visit_map(
+            service._serialize_visit_map(
+                {"boundary-1": {"firstVisit": first, "lastVisit": first}},
+            ),
+            "Visit",
+        ),
+    )
+
+    hits = service._evaluate_trip(
+        index,
+        {
+            "gps": {
+                "type": "LineString",
+                "coordinates": [[-97.5, 30.0], [-97.0, 30.1]],
+            },
+            "startTime": later,
+            "endTime": later + timedelta(minutes=20),
+        },
+    )
+    assert hits is not None
+    maps.merge(hits)
+
+    assert maps.county_visits["boundary-1"] == {
+        "firstVisit": first,
+        "lastVisit": later,
+    }
+
+
+@pytest.mark.asyncio
+async def test_incremental_count_skips_trips_seen_by_the_last_sync() -> None:
+    await init_mock_beanie(Trip)
+    since = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    for transaction_id, created in (
+        ("resaved", since - timedelta(days=3)),
+        ("new", since + timedelta(minutes=5)),
+    ):
+        await Trip(
+            id=ObjectId.from_datetime(created),
+            transactionId=transaction_id,
+            source="bouncie",
+            startTime=created,
+            endTime=created + timedelta(minutes=20),
+            gps={"type": "Point", "coordinates": [-97.0, 30.0]},
+            saved_at=since + timedelta(minutes=10),
+        ).insert()
+
+    query = {**service._build_trip_query(), "saved_at": {"$gt": since}}
+
+    assert await Trip.find(query).count() == 2
+    assert await service._count_new_trips(query, since) == 1
+
+
+def test_resolve_geo_recalc_mode_falls_back_to_full_when_unsafe() -> None:
+    now = datetime(2026, 1, 2, tzinfo=UTC)
+
+    def cache(**overrides: object) -> SimpleNamespace:
+        fields = {
+            "boundary_version": "v1",
+            "high_water_mark": now - timedelta(minutes=10),
+            "last_full_rebuild_at": now - timedelta(hours=1),
+        }
+        fields.update(overrides)
+        return SimpleNamespace(**fields)
+
+    def resolve(county: object, city: object) -> str:
+        return service._resolve_geo_recalc_mode(
+            "incremental",
+            county_cache=county,
+            city_cache=city,
+            boundary_version="v1",
+            now=now,
+        )
+
+    assert resolve(cache(), cache()) == "incremental"
+    assert resolve(None, cache()) == "full"
+    assert resolve(cache(boundary_version="v0"), cache()) == "full"
+    assert resolve(cache(), cache(high_water_mark=None)) == "full"
+    assert resolve(cache(last_full_rebuild_at=now - timedelta(days=3)), cache()) == (
+        "full"
+    )
 
 
 @pytest.mark.parametrize("field", ["lastStop", "firstVisit", "lastVisit"])
@@ -191,3 +297,99 @@ async def test_get_summary_merges_city_state_totals_with_normalized_fips(
     assert summary["levels"]["city"]["total"] == 5
     alabama = next(row for row in summary["states"] if row.get("stateFips") == "01")
     assert alabama["city"]["total"] == 5
+
+
+def test_boundary_index_round_trips_through_wkb_cache(tmp_path) -> None:
+    index = GeoBoundaryIndex(
+        version="topology:1|cities:2",
+        counties=BoundaryLayer.build(["48453"], [box(-98.0, 30.0, -97.0, 31.0)]),
+        states=BoundaryLayer.build(["48"], [box(-107.0, 25.0, -93.0, 37.0)]),
+        cities=BoundaryLayer.build(
+            ["city-b", "city-a"],
+            [box(-97.8, 30.2, -97.6, 30.4), box(-97.5, 30.2, -97.4, 30.3)],
+        ),
+        state_names={"48": "Texas"},
+        county_totals_by_state={"48": 1},
+        city_state_index={"city-b": "48", "city-a": "48"},
+        city_state_names={"48": "Texas"},
+        city_totals_by_state={"48": 2},
+        city_properties={
+            "city-b": {"name": "Bravo", "stateName": "Texas", "classfp": "C1"},
+            "city-a": {"name": "Alpha", "stateName": "Texas", "classfp": "C1"},
+        },
+    )
+    path = tmp_path / "boundaries.npz"
+
+    index.save(path)
+    loaded = GeoBoundaryIndex.load(path)
+
+    assert loaded.version == index.version
+    assert loaded.counties.covering(Point(-97.5, 30.5)) == ["48453"]
+    assert loaded.states.ids == ("48",)
+    assert [feature["id"] for feature in loaded.city_features("48")] == [
+        "city-a",
+        "city-b",
+    ]
+    assert loaded.city_features("06") == []
+    assert loaded.state_features()[0]["properties"] == {
+        "stateFips": "48",
+        "name": "Texas",
+    }
+
+
+@pytest.mark.asyncio
+async def test_city_listing_and_visits_read_the_shared_boundary_index(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    index = GeoBoundaryIndex(
+        version="test",
+        counties=BoundaryLayer.build([], []),
+        cities=BoundaryLayer.build(
+            ["city-b", "city-a", "city-ok"],
+            [
+                box(-97.8, 30.2, -97.6, 30.4),
+                box(-97.5, 30.2, -97.4, 30.3),
+                box(-96.0, 35.0, -95.0, 36.0),
+            ],
+        ),
+        state_names={},
+        county_totals_by_state={},
+        city_state_index={"city-b": "48", "city-a": "48", "city-ok": "40"},
+        city_state_names={"48": "Texas", "40": "Oklahoma"},
+        city_totals_by_state={"48": 2, "40": 1},
+        city_properties={
+            "city-b": {"name": "Bravo", "stateName": "Texas", "bbox": [1, 2, 3, 4]},
+            "city-a": {"name": "Alpha", "stateName": "Texas"},
+            "city-ok": {"name": "Okay", "stateName": "Oklahoma"},
+        },
+    )
+    visit = {"firstVisit": "2026-01-01T00:00:00Z", "lastVisit": None}
+    city_cache = SimpleNamespace(
+        cities={"city-b": visit, "city-ok": visit},
+        stopped_cities={},
+        updated_at=None,
+        trips_analyzed=3,
+    )
+    monkeypatch.setattr(
+        service,
+        "get_geo_boundary_index",
+        AsyncMock(return_value=index),
+    )
+    monkeypatch.setattr(
+        service.CityVisitedCache,
+        "get",
+        AsyncMock(return_value=city_cache),
+    )
+    monkeypatch.setattr(
+        service.CityBoundary,
+        "find",
+        lambda *_args, **_kwargs: pytest.fail("CityBoundary should not be queried"),
+    )
+
+    listing = await service.list_cities(state_fips="48")
+    visits = await service.get_visits("city", state_fips="48")
+
+    assert [row["cityId"] for row in listing["cities"]] == ["city-a", "city-b"]
+    assert listing["cities"][1]["visited"] is True
+    assert listing["cities"][1]["bbox"] == [1, 2, 3, 4]
+    assert visits["visits"] == {"city-b": visit}
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
-from api.map_bundle import encode_polyline6, simplify_line_meters
+import math
+from types import SimpleNamespace
+
+import numpy as np
+
+from api.map_bundle import _build_coverage_features, simplify_line_meters
 from core.http.valhalla import ValhallaClient
+from trips.services.trip_map_geometry import (
+    _encode_polyline6_scalar,
+    bbox_for_coords,
+    encode_polyline6,
+    encode_polyline6_batch,
+)
 
 
 def test_encode_polyline6_round_trip() -> None:
@@ -34,3 +45,54 @@ def test_simplify_line_meters_keeps_endpoints() -> None:
     assert simplified[0] == coords[0]
     assert simplified[-1] == coords[-1]
     assert len(simplified) < len(coords)
+
+
+def test_polyline6_batch_matches_per_line_encoding() -> None:
+    lines = [
+        [[-97.1 + i * 1e-4, 31.5 + math.sin(i) * 1e-4] for i in range(n)]
+        for n in (0, 1, 2, 15, 16, 40)
+    ]
+    lines.append([[179.999999, -89.999999], [-179.999999, 89.999999]])
+    points = np.array([point for line in lines for point in line], dtype=float)
+
+    encoded = encode_polyline6_batch(points, np.array([len(line) for line in lines]))
+
+    assert encoded == [_encode_polyline6_scalar(line) for line in lines]
+    assert encoded[-2] == encode_polyline6(lines[-2])
+
+
+def test_coverage_features_match_single_line_simplification() -> None:
+    streets = []
+    for i, count in enumerate((2, 3, 9, 60)):
+        coords = [
+            [-97.1 + j * 5e-5, 31.5 + math.sin(j * (i + 1)) * 4e-5]
+            for j in range(count)
+        ]
+        streets.append(
+            SimpleNamespace(
+                segment_id=f"seg-{i}",
+                street_name=None,
+                geometry={"type": "LineString", "coordinates": coords},
+            ),
+        )
+    streets.append(
+        SimpleNamespace(
+            segment_id="point",
+            street_name=None,
+            geometry={"type": "LineString", "coordinates": [[-97.1, 31.5]]},
+        ),
+    )
+
+    features, bboxes = _build_coverage_features(streets, lambda _street: "undriven")
+
+    assert [feature.id for feature in features] == ["seg-0", "seg-1", "seg-2", "seg-3"]
+    for feature, bbox, street in zip(features, bboxes, streets, strict=False):
+        coords = street.geometry["coordinates"]
+        assert feature.bbox == bbox == bbox_for_coords(coords)
+        assert feature.geom.full == encode_polyline6(coords)
+        assert feature.geom.medium == encode_polyline6(
+            simplify_line_meters(coords, tolerance_m=2.0),
+        )
+        assert feature.geom.low == encode_polyline6(
+            simplify_line_meters(coords, tolerance_m=8.0),
+        )
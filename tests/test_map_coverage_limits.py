@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
 import pytest
+from db_helpers import init_mock_beanie
+from shapely.geometry import Point
 
+from core.spatial import densify_lonlat
 from db.models import Trip
 from map_data import auto_provision
-from map_data.coverage import _build_trip_geometry, build_trip_coverage_polygon
+from map_data.coverage import (
+    _build_trip_geometry,
+    _pending_trip_query,
+    build_trip_coverage_polygon,
+    sync_trip_coverage_footprint,
+)
+from map_data.models import TripCoverageFootprint
 
 
 class _FakeTripCollection:
@@ -26,6 +38,7 @@ class _FakeTripCollection:
 async def test_trip_coverage_polygon_skips_before_heavy_scan_when_trip_cap_exceeded(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    await init_mock_beanie(TripCoverageFootprint)
     collection = _FakeTripCollection(total_trips=1001)
     monkeypatch.setattr(
         Trip,
@@ -61,89 +74,165 @@ def test_trip_geometry_downsampling_never_exceeds_point_cap() -> None:
     assert geometry.coords[-1] == (198.0, 0.0)
 
 
-class _FakeTripCursor:
-    def __init__(self, rows):
-        self._rows = rows
+def test_densify_fills_gps_gaps_up_to_step() -> None:
+    coords = [[-97.0, 30.0], [-97.0, 30.01], [-97.0, 30.01]]
+
+    dense = densify_lonlat(np.array(coords), step_m=250.0)
+
+    assert dense[0].tolist() == coords[0]
+    assert dense[-1].tolist() == coords[-1]
+    steps = (dense[1:, 1] - dense[:-1, 1]) * 111320.0
+    assert steps.max() <= 250.0
+    assert len(dense) == 7
 
-    def __aiter__(self):
-        self._iterator = iter(self._rows)
-        return self
 
-    async def __anext__(self):
-        try:
-            return next(self._iterator)
-        except StopIteration as exc:
-            raise StopAsyncIteration from exc
+def _trip(transaction_id: str, coords: list[list[float]], saved_at: datetime) -> Trip:
+    return Trip(
+        transactionId=transaction_id,
+        source="bouncie",
+        gps={"type": "LineString", "coordinates": coords},
+        saved_at=saved_at,
+    )
+
 
+def test_pending_footprint_query_matches_source_saved_at_index() -> None:
+    index = next(
+        candidate
+        for candidate in Trip.Settings.indexes
+        if candidate.document.get("name") == "trips_source_saved_at_idx"
+    )
+    since = datetime(2026, 1, 1, tzinfo=UTC)
 
-class _StateDetectionCollection:
-    def __init__(self, rows):
-        self.rows = rows
-        self.query = None
+    query = _pending_trip_query(since)
 
-    def find(self, query, _projection):
-        self.query = query
-        return _FakeTripCursor(self.rows)
+    assert list(index.document["key"]) == ["source", "saved_at"]
+    assert query["source"] == "bouncie"
+    assert query["saved_at"] == {"$gt": since}
 
 
 @pytest.mark.asyncio
-async def test_state_detection_counts_each_trip_once_per_state(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    collection = _StateDetectionCollection(
-        [
-            {
-                "gps": {
-                    "type": "LineString",
-                    "coordinates": [[-100.0, 31.0], [-99.9, 31.1], [-99.8, 31.2]],
-                },
-                "destinationGeoPoint": {
-                    "type": "Point",
-                    "coordinates": [-99.7, 31.3],
-                },
-            }
-        ]
+async def test_trip_footprint_folds_in_only_newly_saved_trips() -> None:
+    await init_mock_beanie(Trip, TripCoverageFootprint)
+    saved_at = datetime.now(UTC) - timedelta(days=1)
+    await _trip("austin", [[-97.75, 30.27], [-97.70, 30.30]], saved_at).insert()
+
+    coverage, stats = await build_trip_coverage_polygon(
+        buffer_miles=1,
+        simplify_feet=50,
+        max_points_per_trip=100,
+        batch_size=10,
     )
-    monkeypatch.setattr(
-        Trip,
-        "get_pymongo_collection",
-        staticmethod(lambda: collection),
+
+    assert stats.trips_seen == 1
+    assert coverage.contains(Point(-97.72, 30.285))
+    assert not coverage.contains(Point(-96.80, 32.78))
+    first_cells = stats.footprint_cells
+
+    await _trip(
+        "dallas",
+        [[-96.80, 32.78], [-96.79, 32.79]],
+        datetime.now(UTC),
+    ).insert()
+    cells, stats = await sync_trip_coverage_footprint(
+        max_points_per_trip=100,
+        batch_size=10,
+        max_trips=1,
+    )
+
+    assert stats.trips_seen == 1
+    assert len(cells) > first_cells
+    footprint = await TripCoverageFootprint.get("h3:7")
+    assert footprint.trips_analyzed == 2
+    assert sorted(footprint.cells) == sorted(cells)
+
+    cells, stats = await sync_trip_coverage_footprint(
+        max_points_per_trip=100,
+        batch_size=10,
+    )
+    assert stats.trips_seen == 0
+    assert len(cells) == len(footprint.cells)
+
+
+def _state_trip(transaction_id: str, gps: dict) -> Trip:
+    return Trip(
+        transactionId=transaction_id,
+        source="bouncie",
+        startTime=datetime(2024, 1, 1, tzinfo=UTC),
+        endTime=datetime(2024, 1, 1, 1, tzinfo=UTC),
+        gps=gps,
     )
 
+
+@pytest.mark.asyncio
+async def test_state_detection_counts_each_trip_once_per_state() -> None:
+    await init_mock_beanie(Trip)
+    await _state_trip(
+        "tx-trip",
+        {
+            "type": "LineString",
+            "coordinates": [[-100.0, 31.0], [-99.9, 31.1], [-99.8, 31.2]],
+        },
+    ).insert()
+    await Trip(
+        transactionId="other-source",
+        source="webhook",
+        startTime=datetime(2024, 1, 1, tzinfo=UTC),
+        endTime=datetime(2024, 1, 1, 1, tzinfo=UTC),
+        gps={"type": "LineString", "coordinates": [[-100.0, 31.0], [-99.8, 31.2]]},
+    ).insert()
+
+    # Trips without a summary yet are backfilled by detection itself.
     result = await auto_provision.detect_trip_states()
 
     texas = next(row for row in result["state_details"] if row["code"] == "TX")
     assert texas["trip_count"] == 1
-    assert result["sample_size"] == 4
-    assert collection.query["source"] == "bouncie"
+    assert result["sample_size"] >= 1
+
+    stored = await Trip.find_one(Trip.transactionId == "tx-trip")
+    assert stored.locationSummary["start"] == [-100.0, 31.0]
+    assert stored.locationSummary["end"] == [-99.8, 31.2]
+    other = await Trip.find_one(Trip.transactionId == "other-source")
+    assert other.locationSummary is None
+
+    # Once every summary is current, detection leaves the trips alone.
+    assert await auto_provision.backfill_trip_location_summaries() == 0
 
 
 @pytest.mark.asyncio
-async def test_state_detection_samples_every_multiline_part(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    collection = _StateDetectionCollection(
-        [
-            {
-                "gps": {
-                    "type": "MultiLineString",
-                    "coordinates": [
-                        [[-100.0, 31.0], [-99.8, 31.2]],
-                        [[-105.0, 39.0], [-104.8, 39.2]],
-                    ],
-                },
-            }
-        ]
-    )
-    monkeypatch.setattr(
-        Trip,
-        "get_pymongo_collection",
-        staticmethod(lambda: collection),
-    )
+async def test_state_detection_ignores_neighbours_of_border_cells() -> None:
+    await init_mock_beanie(Trip)
+    # About 14 km west of the Kansas line: the H3 cell's extent crosses into
+    # Kansas's bounding box, but its centre is in Colorado.
+    await _state_trip(
+        "near-kansas",
+        {"type": "LineString", "coordinates": [[-102.2, 39.5], [-102.2, 39.55]]},
+    ).insert()
+
+    result = await auto_provision.detect_trip_states()
+
+    assert result["detected_states"] == ["CO"]
+
 
+@pytest.mark.asyncio
+async def test_state_detection_samples_every_multiline_part() -> None:
+    await init_mock_beanie(Trip)
+    await _state_trip(
+        "multi-part",
+        {
+            "type": "MultiLineString",
+            "coordinates": [
+                [[-100.0, 31.0], [-99.8, 31.2]],
+                [[-105.0, 39.0], [-104.8, 39.2]],
+            ],
+        },
+    ).insert()
+
+    await auto_provision.backfill_trip_location_summaries()
     result = await auto_provision.detect_trip_states()
 
     counts = {row["code"]: row["trip_count"] for row in result["state_details"]}
     assert counts["TX"] == 1
     assert counts["CO"] == 1
-    assert result["sample_size"] == 4
+
+    # A second pass reads the persisted summaries without rewriting them.
+    assert await auto_provision.backfill_trip_location_summaries() == 0
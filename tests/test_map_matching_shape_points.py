@@ -1,7 +1,9 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from trips.services import matching
 from trips.services.matching import MapMatchingService, TripMapMatcher
 
 
@@ -400,3 +402,52 @@ async def test_retry_failed_chunk_gives_up_small_input() -> None:
     coords = [[0.0, 0.0], [1.0, 1.0]]
     result = await svc._retry_failed_chunk(coords, None)
     assert result == []
+
+
+class _SlowEchoRouterStub:
+    """Echo the shape back, finishing later chunks first."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def trace_attributes(self, shape, *_args, **_kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Earlier chunks (smaller longitude) sleep longest.
+            await asyncio.sleep(0.001 * (20 - int(shape[0]["lon"] * 1000) % 20))
+            return {
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[point["lon"], point["lat"]] for point in shape],
+                }
+            }
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_chunked_matching_dispatches_concurrently_and_stitches_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    coords = [[i * 0.0001, 32.0] for i in range(200)]
+    monkeypatch.setattr(matching, "MAP_MATCH_CHUNK_CONCURRENCY", 1)
+    sequential = await MapMatchingService(
+        router=_SlowEchoRouterStub(),
+    )._map_match_chunked(coords, None, 50)
+
+    monkeypatch.setattr(matching, "MAP_MATCH_CHUNK_CONCURRENCY", 3)
+    router = _SlowEchoRouterStub()
+    result = await MapMatchingService(router=router)._map_match_chunked(
+        coords,
+        None,
+        50,
+    )
+
+    assert result["code"] == "Ok"
+    assert result == sequential
+    matched = result["matchings"][0]["geometry"]["coordinates"]
+    assert matched[0] == coords[0]
+    assert matched[-1] == coords[-1]
+    assert router.max_in_flight == 3
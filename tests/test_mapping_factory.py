@@ -6,6 +6,7 @@ import pytest
 from beanie.exceptions import CollectionWasNotInitialized
 
 from core.exceptions import ValidationException
+from core.mapping import factory
 from core.mapping.factory import get_mapping_provider, is_google_map_provider
 from core.mapping.google_provider import GoogleProvider
 from core.mapping.local_provider import LocalProvider
@@ -97,3 +98,74 @@ async def test_is_google_map_provider(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(AppSettings, "find_one", fake_find_one)
 
     assert await is_google_map_provider() is True
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    async def incr(self, key: str) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+@pytest.mark.asyncio
+async def test_provider_is_cached_until_settings_revision_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    settings = SimpleNamespace(
+        map_provider=MapProvider.GOOGLE,
+        google_maps_api_key="key-1",
+    )
+    reads: list[object] = []
+
+    async def fake_find_one(query):
+        reads.append(query)
+        return settings
+
+    redis = _FakeRedis()
+
+    async def get_redis() -> _FakeRedis:
+        return redis
+
+    async def read_revision() -> str | None:
+        value = await redis.get(factory.MAPPING_SETTINGS_REVISION_KEY)
+        return value or "0"
+
+    monkeypatch.setattr(AppSettings, "find_one", fake_find_one)
+    monkeypatch.setattr(factory, "get_shared_redis", get_redis)
+    monkeypatch.setattr(factory, "_read_settings_revision", read_revision)
+    monkeypatch.setattr(factory, "MAPPING_PROVIDER_CHECK_SECONDS", 0.0)
+
+    first = await get_mapping_provider()
+    assert await get_mapping_provider() is first
+    assert await is_google_map_provider() is True
+    assert len(reads) == 1
+
+    # A save in another process only bumps the shared revision.
+    settings.map_provider = MapProvider.SELF_HOSTED
+    await redis.incr(factory.MAPPING_SETTINGS_REVISION_KEY)
+    assert isinstance(await get_mapping_provider(), LocalProvider)
+    assert len(reads) == 2
+
+    settings.map_provider = MapProvider.GOOGLE
+    await factory.notify_mapping_settings_changed()
+    assert isinstance(await get_mapping_provider(), GoogleProvider)
+    assert redis.values[factory.MAPPING_SETTINGS_REVISION_KEY] == 2
+    assert len(reads) == 3
+
+
+@pytest.mark.asyncio
+async def test_is_google_map_provider_tolerates_missing_google_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_find_one(_query):
+        return SimpleNamespace(map_provider=MapProvider.GOOGLE, google_maps_api_key="")
+
+    monkeypatch.setattr(AppSettings, "find_one", fake_find_one)
+
+    assert await is_google_map_provider() is True
@@ -10,8 +10,12 @@ from beanie import PydanticObjectId
 from db_helpers import init_mock_beanie
 from pymongo.errors import DuplicateKeyError
 
-from analytics.services.mobility_insights_service import MobilityInsightsService
-from db.models import H3StreetLabelCache, Trip, TripMobilityProfile
+from analytics.services import mobility_insights_service
+from analytics.services.mobility_insights_service import (
+    MobilityInsightsService,
+    _nearest_street_labels,
+)
+from db.models import H3StreetLabelCache, Street, Trip, TripMobilityProfile
 
 
 @pytest.fixture
@@ -560,6 +564,54 @@ async def test_sync_trip_reuses_profile_when_transaction_reimported(
     assert profiles[0].trip_id == reimported.id
 
 
+@pytest.mark.asyncio
+async def test_batch_sync_writes_profiles_in_bulk_and_reports_pending(
+    mobility_db,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    del mobility_db
+    monkeypatch.setattr(mobility_insights_service, "PROFILE_COMPUTE_CHUNK", 2)
+    stale_trip_id = PydanticObjectId()
+    await TripMobilityProfile(
+        trip_id=stale_trip_id,
+        transaction_id="batch-reimported",
+    ).insert()
+    trips = [
+        await _insert_bouncie_trip(tx)
+        for tx in ("batch-a", "batch-b", "batch-reimported", "batch-c")
+    ]
+    parked = Trip(
+        transactionId="batch-parked",
+        source="bouncie",
+        startTime=datetime.now(UTC),
+        gps={"type": "Point", "coordinates": [-122.43, 37.77]},
+    )
+    await parked.insert()
+
+    assert await MobilityInsightsService.sync_unsynced_trips_for_query(
+        {},
+        limit=3,
+    ) == (3, 2)
+    assert await MobilityInsightsService.sync_unsynced_trips_for_query(
+        {},
+        limit=3,
+    ) == (2, 0)
+    assert await MobilityInsightsService.sync_unsynced_trips_for_query({}) == (0, 0)
+
+    profiles = await TripMobilityProfile.find({}).to_list()
+    assert sorted(profile.transaction_id for profile in profiles) == [
+        "batch-a",
+        "batch-b",
+        "batch-c",
+        "batch-reimported",
+    ]
+    # The earlier import's profile was re-pointed rather than duplicated.
+    reimported = next(p for p in profiles if p.transaction_id == "batch-reimported")
+    assert reimported.trip_id == trips[2].id
+    assert all(profile.cell_counts for profile in profiles)
+    assert await Trip.find({"mobility_synced_at": None}).count() == 0
+
+
 @pytest.mark.asyncio
 async def test_remove_trip_clears_profile_from_previous_object_id(mobility_db) -> None:
     del mobility_db
@@ -763,3 +815,111 @@ async def test_remove_trip_clears_stale_only_profile(mobility_db) -> None:
     await MobilityInsightsService.remove_trip(trip.id, trip.transactionId)
 
     assert await TripMobilityProfile.find({}).count() == 0
+
+
+class _FakeStreetCollection:
+    def __init__(self, docs: list[dict[str, Any]]) -> None:
+        self.docs = docs
+        self.queries: list[dict[str, Any]] = []
+
+    def find(self, query: dict[str, Any], _projection: dict[str, Any]):
+        self.queries.append(query)
+        docs = self.docs
+
+        async def cursor():
+            for doc in docs:
+                yield doc
+
+        return cursor()
+
+
+def _cell_ring(cell_id: str) -> list[list[float]]:
+    ring = [[lng, lat] for lat, lng in h3.cell_to_boundary(cell_id)]
+    return [*ring, ring[0]]
+
+
+def test_nearest_street_labels_prefers_street_closest_to_cell_center() -> None:
+    cell_id = h3.latlng_to_cell(37.7749, -122.4194, 11)
+    lat, lon = h3.cell_to_latlng(cell_id)
+    edge_lat = h3.cell_to_boundary(cell_id)[0][0]
+    streets = [
+        {
+            "street_name": "Edge Alley",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[lon - 0.01, edge_lat], [lon + 0.01, edge_lat]],
+            },
+        },
+        {
+            "street_name": " Market Street ",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[lon - 0.01, lat], [lon + 0.01, lat]],
+            },
+        },
+    ]
+    far_cell = h3.latlng_to_cell(37.80, -122.40, 11)
+
+    labels = _nearest_street_labels(
+        {cell_id: _cell_ring(cell_id), far_cell: _cell_ring(far_cell)},
+        streets,
+    )
+
+    assert labels == {cell_id: "Market Street"}
+
+
+@pytest.mark.asyncio
+async def test_resolve_street_names_uses_coverage_streets_before_geocoder(
+    mobility_db,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    del mobility_db
+    cached_cell = h3.latlng_to_cell(37.7700, -122.4300, 11)
+    local_cell = h3.latlng_to_cell(37.7749, -122.4194, 11)
+    remote_cell = h3.latlng_to_cell(40.7128, -74.0060, 11)
+    await H3StreetLabelCache(
+        h3_cell=cached_cell,
+        resolution=11,
+        street_name="Haight Street",
+    ).insert()
+
+    lat, lon = h3.cell_to_latlng(local_cell)
+    streets = _FakeStreetCollection(
+        [
+            {
+                "street_name": "Market Street",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[lon - 0.01, lat], [lon + 0.01, lat]],
+                },
+            },
+        ],
+    )
+    monkeypatch.setattr(Street, "get_pymongo_collection", lambda: streets)
+    geocoder = AsyncMock()
+    geocoder.reverse.return_value = {"address": {"road": "Broadway"}}
+    geocoder_resolver = AsyncMock(return_value=geocoder)
+    monkeypatch.setattr(
+        MobilityInsightsService,
+        "_resolve_street_lookup_geocoder",
+        geocoder_resolver,
+    )
+    monkeypatch.setattr(mobility_insights_service, "STREET_LABEL_LOCAL_CHUNK", 1)
+
+    labels = await MobilityInsightsService._resolve_street_names_for_cells(
+        [cached_cell, local_cell, remote_cell, local_cell],
+        resolution=11,
+    )
+
+    assert labels == {
+        cached_cell: "Haight Street",
+        local_cell: "Market Street",
+        remote_cell: "Broadway",
+    }
+    # One spatial query per chunk of uncached cells; only the miss is geocoded.
+    assert len(streets.queries) == 2
+    geocoder.reverse.assert_awaited_once()
+    stored = await H3StreetLabelCache.find_one({"h3_cell": local_cell})
+    assert stored is not None
+    assert stored.source == "coverage_streets"
+    assert stored.normalized_street_name == "market street"
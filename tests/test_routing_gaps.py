@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from typing import Any
+
+import networkx as nx
 import pytest
 
+from routing import bridge_cache
 from routing.gaps import fill_route_gaps
 from routing.graph_connectivity import BridgeRoute
 
@@ -78,3 +82,91 @@ async def test_fill_route_gaps_with_explicit_indices_ignores_distance_scan(
     assert stats.bridge_distance_m == pytest.approx(1000.0)
     assert calls == [((0.0, 0.01), (0.0, 0.02))]
     assert filled == route_coords
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, Any]] = {}
+
+    async def hmget(self, key: str, fields: list[str]) -> list[Any]:
+        stored = self.hashes.get(key, {})
+        return [stored.get(field) for field in fields]
+
+    async def hset(self, key: str, *, mapping: dict[str, Any]) -> int:
+        self.hashes.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def expire(self, key: str, _seconds: int) -> bool:
+        return key in self.hashes
+
+
+def _two_component_graph() -> nx.MultiDiGraph:
+    # West component: 1 -> 2 -> 3 along y=0; east component: 10 <-> 11.
+    graph = nx.MultiDiGraph()
+    for node, x in ((1, 0.0), (2, 0.001), (3, 0.002), (10, 0.05), (11, 0.051)):
+        graph.add_node(node, x=x, y=0.0)
+    graph.add_edge(1, 2, key=0, length=100.0)
+    graph.add_edge(2, 3, key=0, length=100.0)
+    graph.add_edge(10, 11, key=0, length=100.0)
+    graph.add_edge(11, 10, key=0, length=100.0)
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_fill_route_gaps_bridges_on_graph_and_caches_remote_routes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    redis = _FakeRedis()
+
+    async def get_redis() -> _FakeRedis:
+        return redis
+
+    calls: list[tuple[tuple[float, float], tuple[float, float]]] = []
+
+    async def fake_fetch_bridge_route(from_xy, to_xy, request_timeout: float = 30.0):
+        _ = request_timeout
+        calls.append((from_xy, to_xy))
+        return BridgeRoute(
+            coordinates=[list(from_xy), [0.02, 0.001], list(to_xy)],
+            distance_m=5000.0,
+            duration_s=300.0,
+        )
+
+    monkeypatch.setattr(bridge_cache, "get_shared_redis", get_redis)
+    monkeypatch.setattr(
+        "routing.graph_connectivity.fetch_bridge_route",
+        fake_fetch_bridge_route,
+    )
+
+    # Gap 1 (node 1 -> node 3) stays inside the west component; gap 2
+    # (node 3 -> node 10) crosses components and needs the routing API.
+    route_coords = [[0.0, 0.0], [0.002, 0.0], [0.05, 0.0]]
+    graph = _two_component_graph()
+
+    filled, stats = await fill_route_gaps(
+        route_coords,
+        explicit_gap_indices=[1, 2],
+        graph=graph,
+        cache_scope="area-1:3",
+    )
+
+    assert stats.gaps_filled == 2
+    assert stats.gaps_bridged_locally == 1
+    assert stats.gaps_from_cache == 0
+    assert calls == [((0.002, 0.0), (0.05, 0.0))]
+    assert [0.001, 0.0] in filled
+    assert [0.02, 0.001] in filled
+    assert stats.bridge_distance_m == pytest.approx(5200.0)
+
+    # A repeat generation for the same area is served entirely from cache.
+    calls.clear()
+    refilled, cached_stats = await fill_route_gaps(
+        route_coords,
+        explicit_gap_indices=[1, 2],
+        cache_scope="area-1:3",
+    )
+
+    assert calls == []
+    assert cached_stats.gaps_from_cache == 2
+    assert cached_stats.gaps_filled == 2
+    assert refilled == filled
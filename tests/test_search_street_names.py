@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from db_helpers import init_mock_beanie
+
+from db.models import CoverageArea, CoverageState, CoverageStreetName, Street
+from search.services.search_service import SearchService
+from street_coverage.street_names import build_street_name_index
+
+
+def _street(area: CoverageArea, seq: int, name: str | None, **fields) -> Street:
+    return Street(
+        segment_id=f"{area.id}-{area.area_version}-{seq}",
+        area_id=area.id,
+        area_version=area.area_version,
+        street_name=name,
+        geometry={"type": "LineString", "coordinates": [[seq, 0.0], [seq, 1.0]]},
+        length_miles=0.5,
+        **fields,
+    )
+
+
+@pytest.mark.asyncio
+async def test_street_search_reads_name_index_and_loads_only_matches() -> None:
+    await init_mock_beanie(CoverageArea, CoverageStreetName, CoverageState, Street)
+    area = CoverageArea(display_name="Testville", status="ready")
+    await area.insert()
+    streets = [
+        _street(area, 1, "Old Main Rd"),
+        _street(area, 2, "Main St", highway_type="primary"),
+        _street(area, 3, "Main St", highway_type="secondary"),
+        _street(area, 4, "Maine Ave"),
+        _street(area, 5, "Elm St"),
+        _street(area, 6, None),
+    ]
+    await Street.insert_many(streets)
+    await CoverageState(
+        area_id=area.id,
+        segment_id=streets[2].segment_id,
+        status="driven",
+    ).insert()
+
+    # The first search builds the index for areas ingested before it existed.
+    features = await SearchService.search_streets("MAIN", area.id, limit=10)
+    refreshed = await CoverageArea.get(area.id)
+    assert refreshed.street_name_index_version == area.area_version
+    assert await CoverageStreetName.find({"area_id": area.id}).count() == 4
+
+    props = [feature["properties"] for feature in features]
+    assert [p["street_name"] for p in props] == ["Main St", "Maine Ave", "Old Main Rd"]
+    main = props[0]
+    assert main["highway"] == "primary"
+    assert main["segment_count"] == 2
+    assert main["driven_count"] == 1
+    assert main["total_length"] == pytest.approx(5280.0)
+    assert main["location"] == "Testville"
+    assert features[0]["geometry"]["coordinates"] == [
+        [[2, 0.0], [2, 1.0]],
+        [[3, 0.0], [3, 1.0]],
+    ]
+
+    limited = await SearchService.search_streets("main", area.id, limit=1)
+    assert [f["properties"]["street_name"] for f in limited] == ["Main St"]
+    assert await SearchService.search_streets("zz", area.id, limit=10) == []
+
+    # Rebuilding for a new area version replaces the old rows.
+    refreshed.area_version += 1
+    await Street(
+        segment_id=f"{area.id}-{refreshed.area_version}-1",
+        area_id=area.id,
+        area_version=refreshed.area_version,
+        street_name="Mainline Blvd",
+        geometry={"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+    ).insert()
+    assert await build_street_name_index(refreshed) == 1
+    rows = await CoverageStreetName.find({"area_id": area.id}).to_list()
+    assert [row.street_name for row in rows] == ["Mainline Blvd"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_street_name_index_builds_do_not_collide() -> None:
+    await init_mock_beanie(CoverageArea, CoverageStreetName, CoverageState, Street)
+    area = CoverageArea(display_name="Testville", status="ready")
+    await area.insert()
+    await Street.insert_many(
+        [
+            _street(area, 1, "Main St"),
+            _street(area, 2, "Main St"),
+            _street(area, 3, "Elm St"),
+        ],
+    )
+    other = await CoverageArea.get(area.id)
+
+    assert await asyncio.gather(
+        build_street_name_index(area),
+        build_street_name_index(other),
+    ) == [2, 2]
+    rows = await CoverageStreetName.find({"area_id": area.id}).to_list()
+    assert sorted((row.street_name, row.segment_count) for row in rows) == [
+        ("Elm St", 1),
+        ("Main St", 2),
+    ]
+
+    # A rebuild after a street loses its name drops that name's row.
+    await Street.find({"street_name": "Elm St"}).update({"$set": {"street_name": None}})
+    assert await build_street_name_index(area) == 1
+    rows = await CoverageStreetName.find({"area_id": area.id}).to_list()
+    assert [row.street_name for row in rows] == ["Main St"]
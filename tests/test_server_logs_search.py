@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from db_helpers import init_mock_beanie
+
+from db.logging_handler import MongoDBHandler, log_message_tokens
+from db.models import AppSettings, ServerLog
+from logs.api import get_server_logs
+
+
+def test_log_message_tokens_are_distinct_lowercase_words() -> None:
+    assert log_message_tokens("GET /api/trips failed: Connection refused (trips)") == [
+        "get",
+        "api",
+        "trips",
+        "failed",
+        "connection",
+        "refused",
+    ]
+    assert log_message_tokens("") == []
+    assert log_message_tokens("street_coverage.ingestion done") == [
+        "street_coverage",
+        "street",
+        "coverage",
+        "ingestion",
+        "done",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_matches_indexed_tokens_with_prefix_last_word() -> None:
+    await init_mock_beanie(AppSettings, ServerLog)
+    handler = MongoDBHandler()
+    now = datetime.now(UTC)
+    messages = [
+        "Trip sync failed: connection refused",
+        "Connection restored for trip sync",
+        "Coverage backfill finished",
+        "Unrelated message about connectivity",
+    ]
+    for index, message in enumerate(messages):
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, message, (), None)
+        entry = handler._format_log_entry(record)
+        entry["timestamp"] = now + timedelta(seconds=index)
+        await ServerLog(**entry).insert()
+
+    async def search(term: str) -> list[str]:
+        result = await get_server_logs(limit=100, search=term)
+        assert result["total_count"] == result["returned_count"]
+        return [log.message for log in result["logs"]]
+
+    assert await search("connection") == [messages[1], messages[0]]
+    # The last word is a prefix, and word order does not matter.
+    assert await search("SYNC conn") == [messages[1], messages[0]]
+    assert await search("connect") == [messages[3], messages[1], messages[0]]
+    assert await search("backfill missing") == []
+    # Searches without word characters fall back to a substring match.
+    assert await search(":") == [messages[0]]
+
+    result = await get_server_logs(limit=1, search="trip")
+    assert result["total_count"] == 2
+    assert "tokens" not in result["logs"][0].model_dump()
+
+
+@pytest.mark.asyncio
+async def test_search_finds_name_parts_and_rows_stored_without_tokens() -> None:
+    await init_mock_beanie(AppSettings, ServerLog)
+    handler = MongoDBHandler()
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 1, "street_coverage job done", (), None
+    )
+    await ServerLog(**handler._format_log_entry(record)).insert()
+    # Rows logged before tokens were stored only carry the message.
+    await ServerLog(
+        timestamp=datetime.now(UTC) - timedelta(days=1),
+        level="INFO",
+        message="Legacy coverage rebuild",
+    ).insert()
+
+    async def search(term: str) -> list[str]:
+        result = await get_server_logs(limit=100, search=term)
+        return [log.message for log in result["logs"]]
+
+    assert await search("coverage") == [
+        "street_coverage job done",
+        "Legacy coverage rebuild",
+    ]
+    assert await search("street_cov") == ["street_coverage job done"]
+    assert await search("legacy rebuild") == ["Legacy coverage rebuild"]
@@ -112,3 +112,37 @@ async def test_docker_log_clear_is_idempotent_when_log_file_is_missing(
         "cleared": True,
         "message": "Log file already absent",
     }
+
+
+@pytest.mark.asyncio
+async def test_older_than_clear_moves_cutoff_forward_only(
+    logs_beanie_db,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _no_arq_pool():
+        msg = "arq disabled for tests"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr("tasks.arq.get_arq_pool", _no_arq_pool)
+
+    now = datetime.now(UTC)
+    for days_ago, message in ((10, "old"), (1, "recent")):
+        await ServerLog(
+            timestamp=now - timedelta(days=days_ago),
+            level="INFO",
+            logger_name="test",
+            message=message,
+        ).insert()
+
+    result = await clear_server_logs(BackgroundTasks(), older_than_days=7)
+    assert result["soft_cleared"] is True
+    week_cutoff = parse_timestamp(result["cutoff_timestamp"])
+    assert now - timedelta(days=7, minutes=1) < week_cutoff < now
+
+    logs_result = await get_server_logs(limit=1000)
+    assert [log.message for log in logs_result["logs"]] == ["recent"]
+
+    # A wider window must not re-expose logs an earlier clear hid.
+    result = await clear_server_logs(BackgroundTasks(), older_than_days=30)
+    kept_cutoff = parse_timestamp(result["cutoff_timestamp"])
+    assert abs(kept_cutoff - week_cutoff) < timedelta(milliseconds=1)
@@ -1,4 +1,9 @@
-from core.spatial import GeometryService, derive_geo_points
+from core.spatial import (
+    GeometryService,
+    connected_component_roots,
+    derive_geo_points,
+    dwithin_pairs,
+)
 
 
 def test_validate_coordinate_pair() -> None:
@@ -32,3 +37,12 @@ def test_derive_geo_points() -> None:
     point_gps = {"type": "Point", "coordinates": [-97.0, 32.0]}
     start, end = derive_geo_points(point_gps)
     assert start == end
+
+
+def test_dwithin_components_chain_through_neighbors() -> None:
+    points = [[0.0, 0.0], [9.0, 0.0], [18.0, 0.0], [100.0, 0.0], [104.0, 0.0]]
+
+    src, dst = dwithin_pairs(points, 10.0)
+    roots = connected_component_roots(len(points), src, dst)
+
+    assert roots.tolist() == [0, 0, 0, 3, 3]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
@@ -46,7 +47,7 @@ def test_worker_enables_arq_abort_handling() -> None:
 @pytest.mark.asyncio
 async def test_abort_job_does_not_report_timeout_as_success(monkeypatch) -> None:
     class FakeArqJob:
-        def __init__(self, job_id: str, redis) -> None:
+        def __init__(self, job_id: str, redis, **_kwargs) -> None:
             del job_id, redis
 
         async def status(self):
@@ -55,7 +56,8 @@ async def test_abort_job_does_not_report_timeout_as_success(monkeypatch) -> None
         async def abort(self, **_kwargs):
             raise TimeoutError
 
-    monkeypatch.setattr(ops, "get_arq_pool", AsyncMock(return_value=object()))
+    redis = SimpleNamespace(zscore=AsyncMock(return_value=None))
+    monkeypatch.setattr(ops, "get_arq_pool", AsyncMock(return_value=redis))
     monkeypatch.setattr("arq.jobs.Job", FakeArqJob)
 
     assert await ops.abort_job("job-timeout") is False
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from db_helpers import init_mock_beanie
+
+from analytics.services.dashboard_service import DashboardService
+from analytics.services.trip_analytics_service import TripAnalyticsService
+from analytics.services.trip_rollup_service import (
+    TripRollupService,
+    rollup_scope_from_query,
+    trip_rollup_key,
+)
+from core.trip_query_spec import TripQuerySpec
+from db.models import Trip, TripDailyRollup, TripRollupState
+
+
+def _trip(tx: str, start: datetime, end: datetime, **fields) -> Trip:
+    fields.setdefault("imei", "car-1")
+    fields.setdefault("startTimeZone", "America/Chicago")
+    return Trip(
+        transactionId=tx,
+        source="bouncie",
+        startTime=start,
+        endTime=end,
+        **fields,
+    )
+
+
+def _query(**kwargs) -> dict:
+    return TripQuerySpec(**kwargs).to_mongo_query(enforce_source=True)
+
+
+def test_rollup_key_uses_trip_local_day() -> None:
+    # 03:30 UTC on Mar 2 is still Mar 1 in Chicago.
+    trip = {
+        "imei": "car-1",
+        "startTime": datetime(2026, 3, 2, 3, 30, tzinfo=UTC),
+        "startTimeZone": "America/Chicago",
+    }
+    assert trip_rollup_key(trip) == ("car-1", "2026-03-01")
+
+    trip["startTimeZone"] = "-0500"
+    assert trip_rollup_key(trip) == ("car-1", "2026-03-01")
+    trip["startTimeZone"] = None
+    assert trip_rollup_key(trip) == ("car-1", "2026-03-02")
+
+
+def test_scope_only_covers_default_visibility_queries() -> None:
+    scope = rollup_scope_from_query(
+        _query(start_date="2026-03-01", end_date="2026-03-07", imei="car-1"),
+    )
+    assert scope is not None
+    assert (scope.imei, scope.start_day, scope.end_day) == (
+        "car-1",
+        "2026-03-01",
+        "2026-03-07",
+    )
+
+    assert rollup_scope_from_query(_query(include_inactive=True)) is None
+    assert rollup_scope_from_query(_query(matched_only=True)) is None
+    assert rollup_scope_from_query({"source": "bouncie"}) is None
+
+
+@pytest.mark.asyncio
+async def test_rollups_serve_metrics_and_track_trip_writes() -> None:
+    await init_mock_beanie(Trip, TripDailyRollup, TripRollupState)
+    await _trip(
+        "a",
+        datetime(2026, 3, 2, 14, 0, tzinfo=UTC),
+        datetime(2026, 3, 2, 15, 0, tzinfo=UTC),
+        distance=30.0,
+        maxSpeed=62.0,
+        fuelConsumed=1.0,
+    ).insert()
+    await _trip(
+        "b",
+        datetime(2026, 3, 2, 16, 0, tzinfo=UTC),
+        datetime(2026, 3, 2, 16, 30, tzinfo=UTC),
+        distance=10.0,
+        maxSpeed=41.0,
+    ).insert()
+    await _trip(
+        "hidden",
+        datetime(2026, 3, 2, 16, 0, tzinfo=UTC),
+        datetime(2026, 3, 2, 17, 0, tzinfo=UTC),
+        distance=500.0,
+        invalid=True,
+    ).insert()
+
+    query = _query(start_date="2026-03-01", end_date="2026-03-31")
+    assert await TripRollupService.rows_for_query(query) is None
+
+    assert await TripRollupService.ensure_built()
+    assert not await TripRollupService.ensure_built()
+
+    row = await TripDailyRollup.find_one({"imei": "car-1", "day": "2026-03-02"})
+    assert row is not None
+    assert row.trip_count == 2
+    assert row.weekday == 1
+    assert row.distance_total == pytest.approx(40.0)
+    assert row.hour_trips[8] == 1
+    assert row.hour_trips[10] == 1
+    assert row.speed_histogram[6] == 1
+    assert row.speed_histogram[4] == 1
+
+    metrics = await DashboardService.get_metrics(query)
+    assert metrics["total_trips"] == 2
+    assert metrics["total_distance"] == "40.0"
+    assert metrics["max_speed"] == "62.0"
+    assert metrics["avg_speed"] == "26.67"
+    assert metrics["total_driving_time"] == "1:30"
+    assert metrics["avg_start_time"] == "09:00 AM"
+
+    analytics = await TripAnalyticsService.get_trip_analytics(query)
+    assert analytics["daily_distances"] == [
+        {"date": "2026-03-02", "distance": 40.0, "count": 2},
+    ]
+    assert analytics["weekday_distribution"] == [{"day": 1, "count": 2}]
+
+    # A trip moved into another day and a deletion refresh both rows.
+    trip_b = await Trip.find_one(Trip.transactionId == "b")
+    previous_key = trip_rollup_key(trip_b)
+    trip_b.startTime = datetime(2026, 3, 5, 16, 0, tzinfo=UTC)
+    trip_b.endTime = datetime(2026, 3, 5, 16, 30, tzinfo=UTC)
+    await trip_b.save()
+    await TripRollupService.refresh_for_trips([trip_b], previous_keys=[previous_key])
+
+    trip_a = await Trip.find_one(Trip.transactionId == "a")
+    await trip_a.delete()
+    await TripRollupService.refresh_for_trips([trip_a])
+
+    rows = await TripRollupService.rows_for_query(query)
+    assert [(r["day"], r["trip_count"]) for r in rows] == [("2026-03-05", 1)]
+    metrics = await DashboardService.get_metrics(query)
+    assert metrics["total_trips"] == 1
+    assert metrics["total_distance"] == "10.0"
+
+
+@pytest.mark.asyncio
+async def test_rebuild_clears_ready_marker_until_rows_are_replaced(
+    monkeypatch,
+) -> None:
+    await init_mock_beanie(Trip, TripDailyRollup, TripRollupState)
+    await _trip(
+        "a",
+        datetime(2026, 3, 2, 14, 0, tzinfo=UTC),
+        datetime(2026, 3, 2, 15, 0, tzinfo=UTC),
+        distance=30.0,
+    ).insert()
+    assert await TripRollupService.ensure_built()
+
+    collection = TripDailyRollup.get_pymongo_collection()
+    ready_during_insert: list[bool] = []
+
+    async def failing_insert(*_args, **_kwargs):
+        ready_during_insert.append(await TripRollupService.is_ready())
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(collection, "insert_many", failing_insert)
+    monkeypatch.setattr(
+        TripDailyRollup, "get_pymongo_collection", classmethod(lambda _cls: collection)
+    )
+    with pytest.raises(RuntimeError):
+        await TripRollupService.rebuild()
+
+    assert ready_during_insert == [False]
+    assert not await TripRollupService.is_ready()
+    query = _query(start_date="2026-03-01", end_date="2026-03-31")
+    assert await TripRollupService.rows_for_query(query) is None
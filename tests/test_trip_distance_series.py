@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from db_helpers import init_mock_beanie
+
+from analytics.services.trip_distance_series import TripDistanceSeriesService
+from analytics.services.trip_rollup_service import TripRollupService
+from db.models import (
+    GasFillup,
+    Trip,
+    TripDailyRollup,
+    TripDistanceSeries,
+    TripRollupState,
+)
+from gas.services.odometer_service import OdometerService
+
+BASE = datetime(2026, 3, 2, 8, 0, tzinfo=UTC)
+
+
+def _trip(tx: str, start_hour: float, hours: float, distance: float, **fields) -> Trip:
+    start = BASE + timedelta(hours=start_hour)
+    fields.setdefault("imei", "car-1")
+    return Trip(
+        transactionId=tx,
+        source="bouncie",
+        startTime=start,
+        endTime=start + timedelta(hours=hours),
+        distance=distance,
+        **fields,
+    )
+
+
+async def _scan(start_hour: float, end_hour: float) -> float:
+    """Interval distance from the Trip collection scan fallback."""
+    state = await TripRollupState.get("trip_distance_series")
+    if state is not None:
+        await state.delete()
+    try:
+        return await OdometerService._sum_trip_distance_over_interval(
+            "car-1",
+            BASE + timedelta(hours=start_hour),
+            BASE + timedelta(hours=end_hour),
+        )
+    finally:
+        if state is not None:
+            await state.insert()
+
+
+async def _series(start_hour: float, end_hour: float) -> float | None:
+    return await TripDistanceSeriesService.distance_between(
+        "car-1",
+        BASE + timedelta(hours=start_hour),
+        BASE + timedelta(hours=end_hour),
+    )
+
+
+@pytest.mark.asyncio
+async def test_series_lookups_match_trip_scan_and_track_trip_writes() -> None:
+    await init_mock_beanie(
+        Trip,
+        TripDailyRollup,
+        TripDistanceSeries,
+        TripRollupState,
+        GasFillup,
+    )
+    await _trip("a", 0, 1, 30.0).insert()
+    await _trip("b", 2, 2, 40.0).insert()
+    await _trip("c", 5, 1, 12.0).insert()
+    await _trip("hidden", 7, 1, 500.0, invalid=True).insert()
+    await _trip("other-car", 1, 3, 90.0, imei="car-2").insert()
+
+    assert await _series(0, 6) is None
+    assert await TripDistanceSeriesService.ensure_built()
+    assert not await TripDistanceSeriesService.ensure_built()
+
+    rows = await TripDistanceSeries.find({"imei": "car-1"}).to_list()
+    assert sorted((r.transactionId, r.cumulative_distance) for r in rows) == [
+        ("a", 30.0),
+        ("b", 70.0),
+        ("c", 82.0),
+    ]
+
+    intervals = [(0, 6), (0.5, 3), (1, 2), (3, 5.5), (-1, 10), (6.5, 9)]
+    for start_hour, end_hour in intervals:
+        expected = await _scan(start_hour, end_hour)
+        assert await _series(start_hour, end_hour) == pytest.approx(expected)
+    assert await _series(0.5, 3) == pytest.approx(15.0 + 20.0)
+
+    # A trip ingested between existing ones shifts every later total, and a
+    # deleted trip drops out of them.
+    inserted = _trip("between", 1.25, 0.5, 8.0)
+    await inserted.insert()
+    trip_a = await Trip.find_one(Trip.transactionId == "a")
+    await trip_a.delete()
+    await TripRollupService.refresh_for_trips([inserted, trip_a])
+
+    rows = await TripDistanceSeries.find({"imei": "car-1"}).to_list()
+    assert sorted((r.transactionId, r.cumulative_distance) for r in rows) == [
+        ("b", 48.0),
+        ("between", 8.0),
+        ("c", 60.0),
+    ]
+    for start_hour, end_hour in intervals:
+        expected = await _scan(start_hour, end_hour)
+        assert await _series(start_hour, end_hour) == pytest.approx(expected)
+
+
+@pytest.mark.asyncio
+async def test_odometer_estimate_reads_the_series(monkeypatch) -> None:
+    await init_mock_beanie(TripDistanceSeries, TripRollupState, Trip, GasFillup)
+    await _trip("a", 1, 2, 40.0).insert()
+    await GasFillup(
+        imei="car-1",
+        fillup_time=BASE,
+        gallons=10.0,
+        odometer=1000.0,
+        odometer_source="manual",
+    ).insert()
+    await TripDistanceSeriesService.rebuild()
+
+    def no_scan(*_args, **_kwargs):
+        msg = "trip scan should not run once the series is built"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(Trip, "find", no_scan)
+
+    result = await OdometerService.estimate_odometer_reading(
+        "car-1",
+        (BASE + timedelta(hours=2)).isoformat(),
+    )
+    assert result["method"] == "calculated_from_prev_manual"
+    assert result["estimated_odometer"] == pytest.approx(1020.0)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_clears_ready_marker_until_rows_are_replaced(
+    monkeypatch,
+) -> None:
+    await init_mock_beanie(TripDistanceSeries, TripRollupState, Trip)
+    await _trip("a", 1, 2, 40.0).insert()
+    assert await TripDistanceSeriesService.ensure_built()
+
+    collection = TripDistanceSeries.get_pymongo_collection()
+    ready_during_insert: list[bool] = []
+
+    async def failing_insert(*_args, **_kwargs):
+        ready_during_insert.append(await TripDistanceSeriesService.is_ready())
+        raise RuntimeError("insert failed")
+
+    monkeypatch.setattr(collection, "insert_many", failing_insert)
+    monkeypatch.setattr(
+        TripDistanceSeries,
+        "get_pymongo_collection",
+        classmethod(lambda _cls: collection),
+    )
+    with pytest.raises(RuntimeError):
+        await TripDistanceSeriesService.rebuild()
+
+    assert ready_during_insert == [False]
+    assert not await TripDistanceSeriesService.is_ready()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from core import cache
+from db.models import Trip
+from trips.services import trip_query_service
+from trips.services.trip_query_service import TripQueryService
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, Any]] = {}
+
+    async def hgetall(self, key: str) -> dict[str, Any]:
+        return dict(self.hashes.get(key, {}))
+
+    async def hset(self, key: str, field: str, value: Any) -> int:
+        self.hashes.setdefault(key, {})[field] = value
+        return 1
+
+    async def expire(self, key: str, _seconds: int) -> bool:
+        return key in self.hashes
+
+
+async def _page(start: int, length: int = 4, direction: str = "desc") -> list[str]:
+    result = await TripQueryService.get_trips_datatable(
+        draw=1,
+        start=start,
+        length=length,
+        search_value="",
+        order=[{"column": 0, "dir": direction}],
+        columns=[{"data": "startTime"}],
+        filters={},
+        start_date=None,
+        end_date=None,
+        price_map={},
+    )
+    assert result["recordsFiltered"] == 11
+    return [row["transactionId"] for row in result["data"]]
+
+
+@pytest.mark.asyncio
+async def test_start_time_pages_seek_from_remembered_anchors(
+    beanie_db,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    del beanie_db
+    redis = _FakeRedis()
+
+    async def get_redis() -> _FakeRedis:
+        return redis
+
+    async def revision() -> str:
+        return "7"
+
+    async def no_cache_redis() -> Any:
+        msg = "redis down"
+        raise ConnectionError(msg)
+
+    monkeypatch.setattr(trip_query_service, "get_shared_redis", get_redis)
+    monkeypatch.setattr(trip_query_service, "get_trip_map_revision", revision)
+    monkeypatch.setattr(cache, "get_shared_redis", no_cache_redis)
+
+    base = datetime(2026, 3, 1, 8, 0, tzinfo=UTC)
+    for index in range(11):
+        # Pairs of trips share a start time so the _id tie-break matters.
+        start = base + timedelta(hours=index // 2)
+        await Trip(
+            transactionId=f"tx-{index:02d}",
+            source="bouncie",
+            startTime=start,
+            endTime=start + timedelta(minutes=20),
+        ).insert()
+    trips = await Trip.find({}).to_list()
+    expected = [
+        trip.transactionId
+        for trip in sorted(trips, key=lambda t: (t.startTime, t.id), reverse=True)
+    ]
+
+    pages = [await _page(start) for start in (0, 4, 8)]
+    assert [tx for page in pages for tx in page] == expected
+    (anchors,) = redis.hashes.values()
+    assert set(anchors) == {"4", "8", "11"}
+
+    # A jump and a revisit both resolve from the nearest anchor.
+    assert await _page(6) == expected[6:10]
+    assert await _page(4) == expected[4:8]
+
+    ascending = [await _page(start, direction="asc") for start in (0, 4, 8)]
+    assert [tx for page in ascending for tx in page] == expected[::-1]
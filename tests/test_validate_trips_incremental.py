@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from db_helpers import init_mock_beanie
+
+from db.models import Trip
+from tasks import maintenance
+
+START = datetime(2026, 3, 2, 8, 0, tzinfo=UTC)
+LINE = {"type": "LineString", "coordinates": [[-97.0, 32.0], [-97.1, 32.1]]}
+POINT = {"type": "Point", "coordinates": [-97.0, 32.0]}
+
+
+def _trip(tx: str, *, moving: bool) -> Trip:
+    return Trip(
+        transactionId=tx,
+        source="bouncie",
+        imei="car-1",
+        startTime=START,
+        endTime=START + timedelta(minutes=20 if moving else 1),
+        distance=8.0 if moving else 0.0,
+        maxSpeed=45.0 if moving else 0.0,
+        gps=LINE if moving else POINT,
+        saved_at=START,
+    )
+
+
+@pytest.mark.asyncio
+async def test_validation_only_revisits_unstamped_trips(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    await init_mock_beanie(Trip)
+    for name in ("ensure_built", "refresh_for_trips"):
+        monkeypatch.setattr(maintenance.TripRollupService, name, AsyncMock())
+    monkeypatch.setattr(
+        maintenance.TripDistanceSeriesService,
+        "ensure_built",
+        AsyncMock(),
+    )
+    monkeypatch.setattr(maintenance, "bump_trip_map_revision", AsyncMock())
+
+    await _trip("moving", moving=True).insert()
+    await _trip("parked", moving=False).insert()
+
+    first = await maintenance._validate_trips_logic()
+    assert (first["processed_count"], first["modified_count"]) == (2, 1)
+    parked = await Trip.find_one(Trip.transactionId == "parked")
+    assert parked.invalid is True
+    assert parked.validation_message.startswith("Stationary trip")
+    assert parked.validation_version == maintenance.TRIP_VALIDATION_VERSION
+    (refreshed,) = maintenance.TripRollupService.refresh_for_trips.await_args.args[0]
+    assert refreshed.transactionId == "parked"
+
+    # Nothing changed, so the next run visits nothing.
+    second = await maintenance._validate_trips_logic()
+    assert second["processed_count"] == 0
+
+    # Reprocessing clears the stamp and the trip is checked again.
+    moving = await Trip.find_one(Trip.transactionId == "moving")
+    assert moving.validation_version == maintenance.TRIP_VALIDATION_VERSION
+    moving.distance = 0.0
+    moving.maxSpeed = 0.0
+    moving.endTime = START + timedelta(minutes=1)
+    moving.gps = POINT
+    moving.validation_version = None
+    await moving.save()
+
+    third = await maintenance._validate_trips_logic()
+    assert (third["processed_count"], third["modified_count"]) == (1, 1)
+    assert (await Trip.find_one(Trip.transactionId == "moving")).invalid is True
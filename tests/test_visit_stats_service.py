@@ -5,12 +5,16 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
+from db_helpers import init_mock_beanie
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from shapely.geometry import MultiPoint
 
+from db.aggregation import aggregate_to_list
+from db.models import Trip
 from visits.api import stats as stats_api
 from visits.services import visit_stats_service, visit_tracking_service
+from visits.services.destination_clusters import extract_destination_coords
 from visits.services.visit_stats_service import VisitStatsService
 
 
@@ -209,3 +213,113 @@ def test_visit_suggestion_match_is_scoped_to_bouncie() -> None:
     assert match["source"] == "bouncie"
     assert match["invalid"] == {"$ne": True}
     assert match["inactive"] == {"$ne": True}
+
+
+def test_dbscan_labels_clusters_in_index_order_and_keeps_noise() -> None:
+    points = [
+        (0.0, 0.0),
+        (5.0, 0.0),
+        (10.0, 0.0),
+        (500.0, 500.0),
+        (1000.0, 0.0),
+        (1004.0, 0.0),
+        (1008.0, 0.0),
+        (1016.0, 0.0),
+    ]
+
+    labels = visit_stats_service._dbscan(points, eps=6.0, min_samples=3)
+
+    # The last point is only reachable from a border point, so it stays noise.
+    assert labels == [1, 1, 1, -1, 2, 2, 2, -1]
+
+
+def test_dbscan_assigns_shared_border_point_to_first_cluster() -> None:
+    points = [(float(x), 0.0) for x in (0, 1, 2, 3, 11, 19, 20, 21, 22)]
+
+    labels = visit_stats_service._dbscan(points, eps=8.0, min_samples=4)
+
+    assert labels == [1, 1, 1, 1, 1, 2, 2, 2, 2]
+    assert visit_stats_service._dbscan([], eps=10.0, min_samples=3) == []
+
+
+def test_visit_suggestion_pipeline_projects_endpoints_only() -> None:
+    pipeline = visit_stats_service._suggestion_pipeline({"source": "bouncie"})
+
+    projection = pipeline[1]["$project"]
+    assert projection["destinationGeoPoint"] == 1
+    assert "destination" not in projection
+    assert projection["destination.formatted_address"] == 1
+    gps_expr = projection["gps"]["$cond"]
+    assert gps_expr[1] == "$$REMOVE"
+    assert gps_expr[2]["type"] == "Point"
+
+
+@pytest.mark.asyncio
+async def test_visit_suggestion_pipeline_derives_endpoint_per_geometry_type() -> None:
+    await init_mock_beanie(Trip)
+    geometries = {
+        "line": {"type": "LineString", "coordinates": [[-97.0, 30.0], [-97.1, 30.1]]},
+        "multi": {
+            "type": "MultiLineString",
+            "coordinates": [
+                [[-97.0, 30.0], [-97.1, 30.1]],
+                [[-97.2, 30.2], [-97.3, 30.3]],
+            ],
+        },
+        "polygon": {
+            "type": "Polygon",
+            "coordinates": [
+                [[-97.0, 30.0], [-97.1, 30.0], [-97.1, 30.1], [-97.0, 30.0]]
+            ],
+        },
+    }
+    for transaction_id, gps in geometries.items():
+        await Trip(
+            transactionId=transaction_id,
+            source="bouncie",
+            endTime=datetime(2026, 1, 1, tzinfo=UTC),
+            destinationPlaceName=transaction_id,
+            gps=gps,
+        ).insert()
+
+    docs = await aggregate_to_list(
+        Trip,
+        visit_stats_service._suggestion_pipeline({"source": "bouncie"}),
+    )
+
+    coords = {
+        doc["destinationPlaceName"]: extract_destination_coords(doc) for doc in docs
+    }
+    assert coords == {
+        "line": (-97.1, 30.1),
+        "multi": (-97.3, 30.3),
+        "polygon": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_visit_suggestions_validate_timeframe_before_caching(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    captured: list[tuple[object, ...]] = []
+
+    async def fake_cached(*args):
+        captured.append(args)
+        return [
+            {
+                "suggestedName": "Gym",
+                "totalVisits": 6,
+                "centroid": [-97.7, 30.2],
+                "boundary": {"type": "Point", "coordinates": [-97.7, 30.2]},
+            },
+        ]
+
+    monkeypatch.setattr(visit_stats_service, "_visit_suggestions_cached", fake_cached)
+
+    suggestions = await VisitStatsService.get_visit_suggestions(5, 250, "week")
+
+    assert captured == [(5, 250, "week")]
+    assert suggestions[0].suggestedName == "Gym"
+    with pytest.raises(ValueError):
+        await VisitStatsService.get_visit_suggestions(5, 250, "decade")
+    assert len(captured) == 1
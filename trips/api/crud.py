@@ -6,6 +6,7 @@ from beanie.operators import In
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, status
 
 from analytics.services.mobility_insights_service import MobilityInsightsService
+from analytics.services.trip_rollup_service import TripRollupService
 from core.api import api_route
 from core.trip_map_cache import bump_trip_map_revision
 from db.models import CoverageState, Trip
@@ -137,7 +138,10 @@ async def set_trip_inactive(
         "message": message,
         "trip": trip_dict,
         "changed": changed,
-        "cache_entries_deleted": update_result.get("cache_entries_deleted", 0),
+        "cache_namespaces_invalidated": update_result.get(
+            "cache_namespaces_invalidated",
+            0,
+        ),
         "refresh": {
             "recurring_routes": recurring_routes,
             "geo_coverage": geo_coverage,
@@ -164,6 +168,7 @@ async def delete_trip(trip_id: str):
         await MobilityInsightsService.remove_trip(trip.id, trip.transactionId)
 
     await trip.delete()
+    await TripRollupService.refresh_for_trips([trip])
     await bump_trip_map_revision()
     coverage = await InactiveTripService.queue_coverage_reprocessing_for_trip(trip)
 
@@ -263,6 +268,7 @@ async def bulk_delete_trips(request: Request):
 
     result = await Trip.find(In(Trip.transactionId, trip_ids)).delete()
     if result.deleted_count:
+        await TripRollupService.refresh_for_trips(trips)
         await bump_trip_map_revision()
     coverage_refresh = await InactiveTripService.queue_coverage_reprocessing_for_trips(
         trips,
@@ -321,9 +327,11 @@ async def restore_trip(trip_id: str):
     trip.invalid = None
     trip.validation_message = None
     trip.validated_at = None
+    trip.validation_version = None
     TripPipeline.sanitize_trip_document_geospatial_fields(trip)
     apply_trip_map_path_fields(trip)
     await trip.save()
+    await TripRollupService.refresh_for_trips([trip])
     await bump_trip_map_revision()
     return {"status": "success", "message": "Trip allocated as valid."}
 
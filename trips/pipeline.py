@@ -14,6 +14,7 @@ from beanie import PydanticObjectId
 from pydantic import ValidationError
 
 from analytics.services.mobility_insights_service import MobilityInsightsService
+from analytics.services.trip_rollup_service import TripRollupService, trip_rollup_key
 from core.coverage import update_coverage_for_trip
 from core.date_utils import get_current_utc_time, parse_timestamp
 from core.mapping.factory import is_google_map_provider
@@ -229,6 +230,7 @@ class TripPipeline:
         )
 
         existing_trip = await Trip.find_one(Trip.transactionId == transaction_id)
+        previous_rollup_key = trip_rollup_key(existing_trip) if existing_trip else None
 
         if existing_trip:
             existing_dict = existing_trip.model_dump()
@@ -320,6 +322,8 @@ class TripPipeline:
         self._prepare_trip_display_geometry(final_trip)
         self.sanitize_trip_document_geospatial_fields(final_trip)
         self._prepare_trip_map_paths(final_trip)
+        # New trip data must go through validate_trips again.
+        final_trip.validation_version = None
 
         if existing_trip:
             await final_trip.save()
@@ -349,6 +353,11 @@ class TripPipeline:
             final_trip.coverage_emitted_at = coverage_emitted_at
             await final_trip.save()
 
+        await TripRollupService.refresh_for_trips(
+            [final_trip],
+            previous_keys=[previous_rollup_key],
+        )
+
         if bump_revision:
             await bump_trip_map_revision()
 
@@ -6,6 +6,7 @@ import logging
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from analytics.services.trip_rollup_service import TripRollupService
 from core.cache import invalidate_cache_prefixes
 from core.spatial import bboxes_intersect, extract_line_sequences
 from core.trip_map_cache import bump_trip_map_revision
@@ -15,6 +16,7 @@ from geo_coverage.services.geo_coverage_service import (
 )
 from recurring_routes.models import BuildRecurringRoutesRequest
 from street_coverage.ingestion import backfill_area
+from street_coverage.stats import bump_coverage_state_revision
 from tasks.ops import enqueue_task
 from trips.services.trip_map_geometry import bbox_for_coords
 
@@ -55,16 +57,17 @@ class InactiveTripService:
             if target_state:
                 trip.recurringRouteId = None
             await trip.save()
+            await TripRollupService.refresh_for_trips([trip])
             await bump_trip_map_revision()
 
-        cache_entries_deleted = await invalidate_cache_prefixes(
+        cache_namespaces_invalidated = await invalidate_cache_prefixes(
             *_ANALYTICS_CACHE_PREFIXES,
         )
 
         return {
             "changed": changed,
             "trip": trip,
-            "cache_entries_deleted": cache_entries_deleted,
+            "cache_namespaces_invalidated": cache_namespaces_invalidated,
         }
 
     @staticmethod
@@ -198,6 +201,7 @@ class InactiveTripService:
                 "manually_marked": {"$ne": True},
             },
         ).delete()
+        await bump_coverage_state_revision(area.id)
         await area.set(
             {
                 "last_backfill_trip_endtime": None,
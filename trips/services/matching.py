@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 from itertools import pairwise
 from typing import Any
 
@@ -25,6 +27,12 @@ DEGENERATE_MATCH_ERRORS = frozenset(
     },
 )
 
+# Chunks of one long trip sent to Valhalla at the same time.
+MAP_MATCH_CHUNK_CONCURRENCY = max(
+    1,
+    int(os.getenv("MAP_MATCH_CHUNK_CONCURRENCY", "4")),
+)
+
 DEFAULT_PROVIDER_POLICY = "auto"
 VALID_PROVIDER_POLICIES = {"auto", "valhalla_only", "mapbox_only"}
 
@@ -481,34 +489,40 @@ class MapMatchingService:
             self._CHUNK_OVERLAP,
         )
 
-        final_segments: list[list[list[float]]] = []
-
-        for idx, (start_i, end_i) in enumerate(chunk_indices, 1):
-            chunk_coords = coordinates[start_i:end_i]
-            chunk_ts = (
-                all_timestamps[start_i:end_i]
-                if all_timestamps and len(all_timestamps) == len(coordinates)
-                else None
-            )
+        # Resolve the router once so concurrent chunks share it.
+        await self._get_router()
+        semaphore = asyncio.Semaphore(MAP_MATCH_CHUNK_CONCURRENCY)
+        use_chunk_timestamps = bool(
+            all_timestamps and len(all_timestamps) == len(coordinates),
+        )
 
-            result = await self._map_match_chunk(chunk_coords, chunk_ts)
-            if result.get("code") != "Ok":
-                logger.warning(
-                    "Chunk %d of %d failed map matching, attempting sub-chunk retry. %s",
-                    idx,
-                    len(chunk_indices),
-                    result.get("message", "").strip(),
+        async def match_chunk(
+            idx: int,
+            start_i: int,
+            end_i: int,
+        ) -> list[list[list[float]]] | None:
+            chunk_ts = all_timestamps[start_i:end_i] if use_chunk_timestamps else None
+            async with semaphore:
+                return await self._match_chunk_segments(
+                    coordinates[start_i:end_i],
+                    chunk_ts,
+                    idx=idx,
+                    total=len(chunk_indices),
                 )
-                recovered = await self._retry_failed_chunk(chunk_coords, chunk_ts)
-                if not recovered:
-                    logger.warning(
-                        "Chunk %d: sub-chunk retry also failed, skipping",
-                        idx,
-                    )
-                    continue
-                matched_segments = recovered
-            else:
-                matched_segments = self._extract_matched_segments(result)
+
+        # Chunks (and their sub-chunk retries) run concurrently; stitching
+        # stays in chunk order so overlap trimming sees the same sequence.
+        chunk_results = await asyncio.gather(
+            *(
+                match_chunk(idx, start_i, end_i)
+                for idx, (start_i, end_i) in enumerate(chunk_indices, 1)
+            ),
+        )
+
+        final_segments: list[list[list[float]]] = []
+        for idx, matched_segments in enumerate(chunk_results, 1):
+            if matched_segments is None:
+                continue
             if not matched_segments:
                 logger.warning(
                     "Chunk %d of %d returned no geometry.",
@@ -556,6 +570,31 @@ class MapMatchingService:
             return {"code": "Error", "message": quality_error}
         return result
 
+    async def _match_chunk_segments(
+        self,
+        chunk_coords: list[list[float]],
+        chunk_ts: list[int | None] | None,
+        *,
+        idx: int,
+        total: int,
+    ) -> list[list[list[float]]] | None:
+        """Match one chunk, falling back to sub-chunk retry; None when skipped."""
+        result = await self._map_match_chunk(chunk_coords, chunk_ts)
+        if result.get("code") == "Ok":
+            return self._extract_matched_segments(result)
+
+        logger.warning(
+            "Chunk %d of %d failed map matching, attempting sub-chunk retry. %s",
+            idx,
+            total,
+            result.get("message", "").strip(),
+        )
+        recovered = await self._retry_failed_chunk(chunk_coords, chunk_ts)
+        if not recovered:
+            logger.warning("Chunk %d: sub-chunk retry also failed, skipping", idx)
+            return None
+        return recovered
+
     async def _recover_failed_chunk_as_result(
         self,
         coords: list[list[float]],
@@ -5,10 +5,22 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
-from core.spatial import GeometryService, extract_line_sequences
+import numpy as np
+
+from core.spatial import GeometryService, extract_line_sequences, h3_cells_along
 
 TRIP_MAP_PATH_VERSION = 2
+TRIP_LOCATION_SUMMARY_VERSION = 1
+# Resolution 5 cells are ~250 km^2: coarse enough that a trip touches a
+# handful, fine enough to place it within a state.
+TRIP_LOCATION_H3_RESOLUTION = 5
 _POLYLINE6_SCALE = 1_000_000
+# Zigzagged deltas of valid lon/lat in 1e-6 degrees fit in 30 bits (6 chunks
+# of 5 bits); the 7th chunk keeps out-of-range input up to 35 bits matching
+# the scalar encoder.
+_POLYLINE_MAX_CHUNKS = 7
+# Below this many points the per-call NumPy overhead outweighs the loop.
+_POLYLINE_VECTORIZE_MIN_POINTS = 16
 
 
 def _quantize(value: float) -> int:
@@ -25,11 +37,7 @@ def _encode_polyline_delta(value: int) -> str:
     return "".join(chunks)
 
 
-def encode_polyline6(coords: list[list[float]]) -> str:
-    """Encode `[lon, lat]` coordinates with polyline precision 6."""
-    if not coords:
-        return ""
-
+def _encode_polyline6_scalar(coords: Any) -> str:
     output: list[str] = []
     prev_lat = 0
     prev_lon = 0
@@ -47,6 +55,54 @@ def encode_polyline6(coords: list[list[float]]) -> str:
     return "".join(output)
 
 
+def encode_polyline6_batch(
+    points: np.ndarray,
+    line_lengths: np.ndarray,
+) -> list[str]:
+    """
+    Encode many `[lon, lat]` lines stored back to back in one array.
+
+    Produces exactly what :func:`encode_polyline6` returns for each line, but
+    quantizes, deltas, zigzags and chunks every value in one pass.
+    """
+    line_lengths = np.asarray(line_lengths, dtype=np.int64)
+    if len(points) == 0:
+        return [""] * len(line_lengths)
+
+    quantized = np.round(points[:, 1::-1] * _POLYLINE6_SCALE).astype(np.int64)
+    deltas = np.diff(quantized, axis=0, prepend=np.zeros((1, 2), dtype=np.int64))
+    line_ends = np.cumsum(line_lengths)
+    line_starts = line_ends - line_lengths
+    first_points = line_starts[line_lengths > 0]
+    deltas[first_points] = quantized[first_points]
+    values = deltas.ravel()
+    values = (values << 1) ^ (values >> 63)
+
+    shifts = np.arange(_POLYLINE_MAX_CHUNKS, dtype=np.int64) * 5
+    shifted = values[:, None] >> shifts
+    present = (shifted > 0) | (shifts == 0)
+    more = (values[:, None] >> (shifts + 5)) > 0
+    chunks = (shifted & 0x1F) | np.where(more, 0x20, 0)
+    text = (chunks[present] + 63).astype(np.uint8).tobytes().decode("ascii")
+
+    chars_per_point = present.sum(axis=1).reshape(-1, 2).sum(axis=1)
+    char_offsets = np.concatenate(([0], np.cumsum(chars_per_point)))
+    return [
+        text[char_offsets[start] : char_offsets[end]]
+        for start, end in zip(line_starts.tolist(), line_ends.tolist(), strict=True)
+    ]
+
+
+def encode_polyline6(coords: list[list[float]]) -> str:
+    """Encode `[lon, lat]` coordinates with polyline precision 6."""
+    if len(coords) == 0:
+        return ""
+    if len(coords) < _POLYLINE_VECTORIZE_MIN_POINTS:
+        return _encode_polyline6_scalar(coords)
+    points = np.asarray(coords, dtype=float)
+    return encode_polyline6_batch(points, np.array([len(points)]))[0]
+
+
 def bbox_for_coords(coords: list[list[float]]) -> list[float]:
     lons = [float(point[0]) for point in coords]
     lats = [float(point[1]) for point in coords]
@@ -120,9 +176,48 @@ def build_encoded_path_metadata(
     }
 
 
+def build_trip_location_summary(
+    geometry: dict[str, Any] | None,
+) -> dict[str, Any] | None:
+    """Summarize where a trip went: endpoints, bbox and coarse H3 cells."""
+    normalized_geometry = (
+        _listify_coordinates(geometry) if isinstance(geometry, dict) else geometry
+    )
+    parsed = GeometryService.parse_geojson(normalized_geometry)
+    lines = [
+        normalized
+        for line in extract_line_sequences(parsed, include_point=True)
+        if (normalized := _normalize_line(line))
+    ]
+    if not lines:
+        # Keep a versioned stub so unusable geometry is not re-summarized.
+        if geometry is None:
+            return None
+        return {
+            "version": TRIP_LOCATION_SUMMARY_VERSION,
+            "start": None,
+            "end": None,
+            "bbox": None,
+            "cells": [],
+        }
+
+    cells: set[str] = set()
+    for line in lines:
+        cells.update(h3_cells_along(line, TRIP_LOCATION_H3_RESOLUTION))
+    coords = [point for line in lines for point in line]
+    return {
+        "version": TRIP_LOCATION_SUMMARY_VERSION,
+        "start": coords[0],
+        "end": coords[-1],
+        "bbox": bbox_for_coords(coords),
+        "cells": sorted(cells),
+    }
+
+
 def build_trip_map_path_fields(trip_doc: dict[str, Any]) -> dict[str, Any]:
     """Return materialized map-path fields for a historical trip document."""
     return {
+        "locationSummary": build_trip_location_summary(trip_doc.get("gps")),
         "displayMapPath": build_encoded_path_metadata(
             trip_doc.get("displayGps"),
             geometry_source="displayGps",
@@ -170,12 +265,16 @@ def materialized_path_is_current(value: Any, *, geometry_source: str) -> bool:
 
 
 __all__ = [
+    "TRIP_LOCATION_H3_RESOLUTION",
+    "TRIP_LOCATION_SUMMARY_VERSION",
     "TRIP_MAP_PATH_VERSION",
     "apply_trip_map_path_fields",
     "bbox_for_coords",
     "build_encoded_path_metadata",
+    "build_trip_location_summary",
     "build_trip_map_path_fields",
     "encode_polyline6",
+    "encode_polyline6_batch",
     "materialized_path_is_current",
     "merge_bboxes",
 ]
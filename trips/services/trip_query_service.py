@@ -1,12 +1,20 @@
 """Business logic for trip querying and filtering."""
 
+import hashlib
+import json
 import logging
+import os
 import re
+from datetime import datetime
 from typing import Any
 
+from beanie import PydanticObjectId
 from beanie.operators import In
 
+from core.cache import TRIPS_CACHE_TAG, cached
 from core.date_utils import parse_timestamp
+from core.redis import get_shared_redis
+from core.trip_map_cache import get_trip_map_revision
 from core.trip_query_spec import TripQuerySpec
 from core.trip_source_policy import enforce_bouncie_source
 from db.aggregation import aggregate_to_list
@@ -25,6 +33,14 @@ from trips.services.trip_cost_service import TripCostService
 
 logger = logging.getLogger(__name__)
 
+DATATABLE_COUNT_CACHE_TTL_SECONDS = int(
+    os.getenv("TRIPS_DATATABLE_COUNT_CACHE_TTL_SECONDS", "300"),
+)
+DATATABLE_ANCHOR_TTL_SECONDS = int(
+    os.getenv("TRIPS_DATATABLE_ANCHOR_TTL_SECONDS", "900"),
+)
+_DATATABLE_ANCHOR_PREFIX = "trips:datatable:anchors"
+
 
 def _normalize_identifier(value: Any) -> str | None:
     if value is None:
@@ -89,6 +105,342 @@ def _select_vehicle_for_trip(
     return vehicle_from_imei or vehicle_from_vin
 
 
+def _datatable_cache_digest(*parts: Any) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+@cached(
+    "trips_datatable_counts",
+    ttl_seconds=DATATABLE_COUNT_CACHE_TTL_SECONDS,
+    tags=(TRIPS_CACHE_TAG,),
+    stale_ttl_seconds=DATATABLE_COUNT_CACHE_TTL_SECONDS,
+)
+async def _datatable_counts(
+    base_query: dict[str, Any],
+    query: dict[str, Any],
+) -> dict[str, int]:
+    """Total and filtered row counts; cached until the next trip write."""
+    # Skip the second count when no extra filters applied.
+    if query == base_query:
+        total_count = await Trip.find(base_query).count()
+        return {"total": total_count, "filtered": total_count}
+
+    extra_filters = {k: v for k, v in query.items() if k not in base_query}
+    facet_result = await aggregate_to_list(
+        Trip,
+        [
+            {"$match": base_query},
+            {
+                "$facet": {
+                    "total": [{"$count": "n"}],
+                    "filtered": [
+                        {"$match": extra_filters},
+                        {"$count": "n"},
+                    ],
+                }
+            },
+        ],
+        length=1,
+    )
+    row = facet_result[0] if facet_result else {}
+    total_count = row.get("total", [{}])[0].get("n", 0) if row.get("total") else 0
+    filtered_count = (
+        row.get("filtered", [{}])[0].get("n", 0) if row.get("filtered") else 0
+    )
+    return {"total": total_count, "filtered": filtered_count}
+
+
+@cached(
+    "trips_datatable_summary",
+    ttl_seconds=DATATABLE_COUNT_CACHE_TTL_SECONDS,
+    tags=(TRIPS_CACHE_TAG,),
+    stale_ttl_seconds=DATATABLE_COUNT_CACHE_TTL_SECONDS,
+)
+async def _datatable_summary(query: dict[str, Any]) -> dict[str, Any]:
+    """Filtered totals and frequent routes; cached until the next trip write."""
+    active_filtered_query = {
+        "$and": [query, {"inactive": {"$ne": True}}],
+    }
+    summary_results = await aggregate_to_list(
+        Trip,
+        [
+            {"$match": active_filtered_query},
+            build_trip_duration_fields_stage(include_day_key=False),
+            {
+                "$addFields": {
+                    "routeStart": {
+                        "$ifNull": [
+                            "$startLocation.formatted_address",
+                            "$startLocation",
+                        ]
+                    },
+                    "routeEnd": {
+                        "$ifNull": [
+                            "$destination.formatted_address",
+                            "$destination",
+                        ]
+                    },
+                }
+            },
+            {
+                "$addFields": {
+                    "validDistance": {
+                        "$cond": [
+                            {"$gte": ["$distance", 0]},
+                            "$distance",
+                            None,
+                        ]
+                    },
+                    "validFuel": {
+                        "$cond": [
+                            {"$gte": ["$fuelConsumed", 0]},
+                            "$fuelConsumed",
+                            None,
+                        ]
+                    },
+                }
+            },
+            {
+                "$facet": {
+                    "summary": [
+                        {
+                            "$group": {
+                                "_id": None,
+                                "totalTrips": {"$sum": 1},
+                                "totalDistance": {
+                                    "$sum": {"$ifNull": ["$validDistance", 0.0]}
+                                },
+                                "distanceTripCount": {
+                                    "$sum": {
+                                        "$cond": [
+                                            {"$ne": ["$validDistance", None]},
+                                            1,
+                                            0,
+                                        ]
+                                    }
+                                },
+                                "totalDurationSeconds": {
+                                    "$sum": {"$ifNull": ["$duration_seconds", 0.0]}
+                                },
+                                "durationTripCount": {
+                                    "$sum": {
+                                        "$cond": [
+                                            {"$ne": ["$duration_seconds", None]},
+                                            1,
+                                            0,
+                                        ]
+                                    }
+                                },
+                                "totalFuel": {"$sum": {"$ifNull": ["$validFuel", 0.0]}},
+                                "fuelTripCount": {
+                                    "$sum": {
+                                        "$cond": [
+                                            {"$ne": ["$validFuel", None]},
+                                            1,
+                                            0,
+                                        ]
+                                    }
+                                },
+                                "longestDistance": {"$max": "$validDistance"},
+                            }
+                        }
+                    ],
+                    "frequentRoutes": [
+                        {
+                            "$group": {
+                                "_id": {
+                                    "start": "$routeStart",
+                                    "end": "$routeEnd",
+                                },
+                                "count": {"$sum": 1},
+                            }
+                        },
+                        {"$match": {"count": {"$gt": 3}}},
+                    ],
+                }
+            },
+        ],
+        length=1,
+    )
+    summary_result = summary_results[0] if summary_results else {}
+    summary_rows = summary_result.get("summary") or []
+    summary_row = summary_rows[0] if summary_rows else {}
+    frequent_routes = sorted(
+        {
+            (start_label, end_label)
+            for route in summary_result.get("frequentRoutes") or []
+            if isinstance(route, dict)
+            for route_id in [route.get("_id")]
+            if isinstance(route_id, dict)
+            for start_label, end_label in [
+                (
+                    _location_label(route_id.get("start")),
+                    _location_label(route_id.get("end")),
+                )
+            ]
+            if start_label is not None and end_label is not None
+        },
+    )
+    total_trips = int(summary_row.get("totalTrips") or 0)
+    distance_trip_count = int(summary_row.get("distanceTripCount") or 0)
+    duration_trip_count = int(summary_row.get("durationTripCount") or 0)
+    fuel_trip_count = int(summary_row.get("fuelTripCount") or 0)
+    filtered_summary = {
+        "totalTrips": total_trips,
+        "totalDistance": (
+            float(summary_row.get("totalDistance") or 0.0)
+            if distance_trip_count == total_trips
+            else None
+        ),
+        "distanceTripCount": distance_trip_count,
+        "totalDurationSeconds": (
+            float(summary_row.get("totalDurationSeconds") or 0.0)
+            if duration_trip_count == total_trips
+            else None
+        ),
+        "durationTripCount": duration_trip_count,
+        "totalFuel": (
+            float(summary_row.get("totalFuel") or 0.0)
+            if fuel_trip_count == total_trips
+            else None
+        ),
+        "fuelTripCount": fuel_trip_count,
+        "longestDistance": (
+            float(summary_row["longestDistance"])
+            if summary_row.get("longestDistance") is not None
+            else None
+        ),
+    }
+    return {
+        "filteredSummary": filtered_summary,
+        "frequentRoutes": [list(route) for route in frequent_routes],
+    }
+
+
+def _anchor_cache_key(query: dict[str, Any], sort_direction: int, revision: str) -> str:
+    digest = _datatable_cache_digest(query, sort_direction)
+    return f"{_DATATABLE_ANCHOR_PREFIX}:{revision}:{digest}"
+
+
+async def _load_page_anchor(
+    cache_key: str,
+    start: int,
+) -> tuple[int, datetime, PydanticObjectId] | None:
+    """
+    Nearest remembered keyset position at or before ``start``.
+
+    Anchors map a row offset to the (startTime, _id) of the row just before
+    it, so a page can seek on the index and skip only the remainder.
+    """
+    if start <= 0:
+        return None
+    try:
+        redis = await get_shared_redis()
+        anchors = await redis.hgetall(cache_key)
+    except Exception:
+        logger.debug("Trips datatable anchor read failed", exc_info=True)
+        return None
+
+    best: tuple[int, str] | None = None
+    for raw_offset, raw_value in (anchors or {}).items():
+        try:
+            offset = int(raw_offset)
+        except (TypeError, ValueError):
+            continue
+        if offset <= start and (best is None or offset > best[0]):
+            best = (offset, raw_value)
+    if best is None:
+        return None
+    try:
+        raw_time, raw_id = str(best[1]).split("|", 1)
+        return best[0], datetime.fromisoformat(raw_time), PydanticObjectId(raw_id)
+    except (ValueError, TypeError):
+        return None
+
+
+async def _store_page_anchor(
+    cache_key: str,
+    offset: int,
+    last_trip: Trip,
+) -> None:
+    if last_trip.startTime is None or last_trip.id is None:
+        return
+    try:
+        redis = await get_shared_redis()
+        await redis.hset(
+            cache_key,
+            str(offset),
+            f"{last_trip.startTime.isoformat()}|{last_trip.id}",
+        )
+        await redis.expire(cache_key, DATATABLE_ANCHOR_TTL_SECONDS)
+    except Exception:
+        logger.debug("Trips datatable anchor write failed", exc_info=True)
+
+
+def _keyset_after(
+    start_time: datetime,
+    trip_id: PydanticObjectId,
+    sort_direction: int,
+) -> dict[str, Any]:
+    """Rows strictly after (start_time, trip_id) in (startTime, _id) order."""
+    if sort_direction < 0:
+        # Missing start times sort last when descending.
+        return {
+            "$or": [
+                {"startTime": {"$lt": start_time}},
+                {"startTime": start_time, "_id": {"$lt": trip_id}},
+                {"startTime": None},
+            ],
+        }
+    return {
+        "$or": [
+            {"startTime": {"$gt": start_time}},
+            {"startTime": start_time, "_id": {"$gt": trip_id}},
+        ],
+    }
+
+
+async def _find_start_time_page(
+    query: dict[str, Any],
+    sort_direction: int,
+    start: int,
+    length: int,
+) -> list[Trip]:
+    """
+    Page through trips in (startTime, _id) order with keyset seeks.
+
+    The boundary after every served page is remembered per query and trip
+    revision, so following pages start from an index seek instead of skipping
+    every earlier row. Jumps land on the nearest remembered anchor and skip
+    only the distance from there.
+    """
+    revision = await get_trip_map_revision()
+    cache_key = _anchor_cache_key(query, sort_direction, revision)
+    anchor = await _load_page_anchor(cache_key, start)
+
+    page_query = query
+    skip = start
+    if anchor is not None:
+        anchor_offset, anchor_time, anchor_id = anchor
+        page_query = {
+            "$and": [query, _keyset_after(anchor_time, anchor_id, sort_direction)],
+        }
+        skip = start - anchor_offset
+
+    prefix = "-" if sort_direction < 0 else "+"
+    trips = (
+        await Trip.find(page_query)
+        .sort(f"{prefix}startTime", f"{prefix}_id")
+        .skip(skip)
+        .limit(length)
+        .to_list()
+    )
+    if trips:
+        await _store_page_anchor(cache_key, start + len(trips), trips[-1])
+    return trips
+
+
 class TripQueryService:
     """Service class for trip querying and filtering operations."""
 
@@ -229,188 +581,15 @@ class TripQueryService:
                 {"destination.formatted_address": search_regex},
             ]
 
-        # Optimize count queries: skip second count when no extra filters applied
-        if query == base_query:
-            total_count = await Trip.find(base_query).count()
-            filtered_count = total_count
-        else:
-            extra_filters = {k: v for k, v in query.items() if k not in base_query}
-            facet_result = await aggregate_to_list(
-                Trip,
-                [
-                    {"$match": base_query},
-                    {
-                        "$facet": {
-                            "total": [{"$count": "n"}],
-                            "filtered": [
-                                {"$match": extra_filters},
-                                {"$count": "n"},
-                            ],
-                        }
-                    },
-                ],
-                length=1,
-            )
-            row = facet_result[0] if facet_result else {}
-            total_count = (
-                row.get("total", [{}])[0].get("n", 0) if row.get("total") else 0
-            )
-            filtered_count = (
-                row.get("filtered", [{}])[0].get("n", 0) if row.get("filtered") else 0
-            )
+        counts = await _datatable_counts(base_query, query)
+        total_count = int(counts.get("total") or 0)
+        filtered_count = int(counts.get("filtered") or 0)
 
-        active_filtered_query = {
-            "$and": [query, {"inactive": {"$ne": True}}],
-        }
-        summary_results = await aggregate_to_list(
-            Trip,
-            [
-                {"$match": active_filtered_query},
-                build_trip_duration_fields_stage(include_day_key=False),
-                {
-                    "$addFields": {
-                        "routeStart": {
-                            "$ifNull": [
-                                "$startLocation.formatted_address",
-                                "$startLocation",
-                            ]
-                        },
-                        "routeEnd": {
-                            "$ifNull": [
-                                "$destination.formatted_address",
-                                "$destination",
-                            ]
-                        },
-                    }
-                },
-                {
-                    "$addFields": {
-                        "validDistance": {
-                            "$cond": [
-                                {"$gte": ["$distance", 0]},
-                                "$distance",
-                                None,
-                            ]
-                        },
-                        "validFuel": {
-                            "$cond": [
-                                {"$gte": ["$fuelConsumed", 0]},
-                                "$fuelConsumed",
-                                None,
-                            ]
-                        },
-                    }
-                },
-                {
-                    "$facet": {
-                        "summary": [
-                            {
-                                "$group": {
-                                    "_id": None,
-                                    "totalTrips": {"$sum": 1},
-                                    "totalDistance": {
-                                        "$sum": {"$ifNull": ["$validDistance", 0.0]}
-                                    },
-                                    "distanceTripCount": {
-                                        "$sum": {
-                                            "$cond": [
-                                                {"$ne": ["$validDistance", None]},
-                                                1,
-                                                0,
-                                            ]
-                                        }
-                                    },
-                                    "totalDurationSeconds": {
-                                        "$sum": {"$ifNull": ["$duration_seconds", 0.0]}
-                                    },
-                                    "durationTripCount": {
-                                        "$sum": {
-                                            "$cond": [
-                                                {"$ne": ["$duration_seconds", None]},
-                                                1,
-                                                0,
-                                            ]
-                                        }
-                                    },
-                                    "totalFuel": {
-                                        "$sum": {"$ifNull": ["$validFuel", 0.0]}
-                                    },
-                                    "fuelTripCount": {
-                                        "$sum": {
-                                            "$cond": [
-                                                {"$ne": ["$validFuel", None]},
-                                                1,
-                                                0,
-                                            ]
-                                        }
-                                    },
-                                    "longestDistance": {"$max": "$validDistance"},
-                                }
-                            }
-                        ],
-                        "frequentRoutes": [
-                            {
-                                "$group": {
-                                    "_id": {
-                                        "start": "$routeStart",
-                                        "end": "$routeEnd",
-                                    },
-                                    "count": {"$sum": 1},
-                                }
-                            },
-                            {"$match": {"count": {"$gt": 3}}},
-                        ],
-                    }
-                },
-            ],
-            length=1,
-        )
-        summary_result = summary_results[0] if summary_results else {}
-        summary_rows = summary_result.get("summary") or []
-        summary_row = summary_rows[0] if summary_rows else {}
+        summary = await _datatable_summary(query)
+        filtered_summary = summary["filteredSummary"]
         frequent_route_keys = {
             (start_label, end_label)
-            for route in summary_result.get("frequentRoutes") or []
-            if isinstance(route, dict)
-            for route_id in [route.get("_id")]
-            if isinstance(route_id, dict)
-            for start_label, end_label in [
-                (
-                    _location_label(route_id.get("start")),
-                    _location_label(route_id.get("end")),
-                )
-            ]
-            if start_label is not None and end_label is not None
-        }
-        total_trips = int(summary_row.get("totalTrips") or 0)
-        distance_trip_count = int(summary_row.get("distanceTripCount") or 0)
-        duration_trip_count = int(summary_row.get("durationTripCount") or 0)
-        fuel_trip_count = int(summary_row.get("fuelTripCount") or 0)
-        filtered_summary = {
-            "totalTrips": total_trips,
-            "totalDistance": (
-                float(summary_row.get("totalDistance") or 0.0)
-                if distance_trip_count == total_trips
-                else None
-            ),
-            "distanceTripCount": distance_trip_count,
-            "totalDurationSeconds": (
-                float(summary_row.get("totalDurationSeconds") or 0.0)
-                if duration_trip_count == total_trips
-                else None
-            ),
-            "durationTripCount": duration_trip_count,
-            "totalFuel": (
-                float(summary_row.get("totalFuel") or 0.0)
-                if fuel_trip_count == total_trips
-                else None
-            ),
-            "fuelTripCount": fuel_trip_count,
-            "longestDistance": (
-                float(summary_row["longestDistance"])
-                if summary_row.get("longestDistance") is not None
-                else None
-            ),
+            for start_label, end_label in summary["frequentRoutes"]
         }
 
         sort_column = None
@@ -763,6 +942,13 @@ class TripQueryService:
                 ],
             )
             trips_list = await aggregate_to_list(Trip, pipeline)
+        elif sort_column == "startTime":
+            trips_list = await _find_start_time_page(
+                query,
+                sort_direction,
+                start,
+                length,
+            )
         else:
             # Use Beanie query builder for standard sorts
             trips_query = Trip.find(query)
@@ -27,7 +27,13 @@ def extract_destination_coords(doc: dict[str, Any]) -> tuple[float, float] | Non
     if isinstance(gps, dict):
         gps_type = gps.get("type")
         coords = gps.get("coordinates")
-        if gps_type == "Point" and isinstance(coords, list) and len(coords) >= 2:
+        if (
+            gps_type == "Point"
+            and isinstance(coords, list)
+            and len(coords) >= 2
+            and isinstance(coords[0], int | float)
+            and isinstance(coords[1], int | float)
+        ):
             return float(coords[0]), float(coords[1])
         if gps_type == "LineString" and isinstance(coords, list) and len(coords) >= 2:
             last = coords[-1]
@@ -16,6 +16,7 @@ from visits.services.place_preview_service import (
     PlacePreviewService,
     generate_preview_best_effort,
 )
+from visits.services.visit_stats_service import invalidate_visit_suggestions_cache
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +112,7 @@ class PlaceService:
             updated_at=now,
         )
         await place.insert()
+        await invalidate_visit_suggestions_cache()
         await generate_preview_best_effort(place)
         preview = await PlacePreviewService.get_preview(str(place.id))
         return PlaceService._place_to_response(place, preview)
@@ -189,6 +191,7 @@ class PlaceService:
             },
         }
         result = await trip_collection.update_many(update_query, update_doc)
+        await invalidate_visit_suggestions_cache()
 
         await generate_preview_best_effort(place)
         preview = await PlacePreviewService.get_preview(str(place.id))
@@ -299,6 +302,7 @@ class PlaceService:
         )
         await place.delete()
         await PlacePreviewService.delete_preview(place_id)
+        await invalidate_visit_suggestions_cache()
 
         route_refresh = None
         if routes_updated:
@@ -357,6 +361,7 @@ class PlaceService:
 
         await place.save()
         if geometry is not None:
+            await invalidate_visit_suggestions_cache()
             await generate_preview_best_effort(place)
         preview = await PlacePreviewService.get_preview(str(place.id))
         return PlaceService._place_to_response(place, preview)
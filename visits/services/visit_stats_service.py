@@ -1,14 +1,20 @@
 """Business logic for visit statistics and suggestions."""
 
 import logging
-import math
-from collections import Counter, defaultdict, deque
+from collections import Counter
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import numpy as np
+from shapely import STRtree
 from shapely.geometry import MultiPoint, mapping
 
-from core.spatial import get_local_transformers
+from core.cache import TRIPS_CACHE_TAG, cached, invalidate_cache_prefixes
+from core.spatial import (
+    connected_component_roots,
+    dwithin_pairs,
+    get_local_transformers,
+)
 from core.trip_query_spec import apply_trip_record_filters
 from core.trip_source_policy import enforce_bouncie_source
 from db.aggregation import aggregate_to_list
@@ -52,10 +58,12 @@ def _resolve_timeframe_start(
     return datetime.now(UTC) - delta
 
 
+VISIT_SUGGESTIONS_CACHE_PREFIX = "visit_suggestions"
+
+
 def _build_existing_place_index(
     places: list[Place],
 ) -> tuple[list[Any], Any | None]:
-    from shapely import STRtree
     from shapely.geometry import shape as shp_shape
 
     polygons: list[Any] = []
@@ -119,132 +127,57 @@ def _build_candidates(
     return candidates
 
 
-def _grid_key(x: float, y: float, cell: float) -> tuple[int, int]:
-    return (math.floor(x / cell), math.floor(y / cell))
-
-
-def _neighbors_for_point(
-    *,
-    point_idx: int,
-    points: list[tuple[float, float]],
-    grid: dict[tuple[int, int], list[int]],
-    eps_sq: float,
-    cell: float,
-) -> list[int]:
-    x, y = points[point_idx]
-    gx, gy = _grid_key(x, y, cell)
-    result: list[int] = []
-    for dx in (-1, 0, 1):
-        for dy in (-1, 0, 1):
-            for j in grid.get((gx + dx, gy + dy), []):
-                dx_m = x - points[j][0]
-                dy_m = y - points[j][1]
-                if dx_m * dx_m + dy_m * dy_m <= eps_sq:
-                    result.append(j)
-    return result
-
-
 def _dbscan(
-    points: list[tuple[float, float]],
+    points: np.ndarray | list[tuple[float, float]],
     eps: float,
     min_samples: int,
 ) -> list[int]:
-    labels = [-1] * len(points)
-    if not points:
-        return labels
-
-    cell = max(eps, 1.0)
-    eps_sq = eps * eps
-    grid: dict[tuple[int, int], list[int]] = defaultdict(list)
-    for idx, (x, y) in enumerate(points):
-        grid[_grid_key(x, y, cell)].append(idx)
-
-    visited = [False] * len(points)
-    cluster_id = 0
-    for i in range(len(points)):
-        if visited[i]:
-            continue
-        visited[i] = True
-        neighbor_idxs = _neighbors_for_point(
-            point_idx=i,
-            points=points,
-            grid=grid,
-            eps_sq=eps_sq,
-            cell=cell,
-        )
-        if len(neighbor_idxs) < min_samples:
-            labels[i] = -1
-            continue
-        cluster_id += 1
-        labels[i] = cluster_id
-        _expand_cluster(
-            points=points,
-            grid=grid,
-            eps_sq=eps_sq,
-            cell=cell,
-            min_samples=min_samples,
-            visited=visited,
-            labels=labels,
-            cluster_id=cluster_id,
-            seed_neighbors=neighbor_idxs,
-        )
-    return labels
-
-
-def _expand_cluster(
-    *,
-    points: list[tuple[float, float]],
-    grid: dict[tuple[int, int], list[int]],
-    eps_sq: float,
-    cell: float,
-    min_samples: int,
-    visited: list[bool],
-    labels: list[int],
-    cluster_id: int,
-    seed_neighbors: list[int],
-) -> None:
-    seed_set = set(seed_neighbors)
-    seeds = deque(seed_neighbors)
-    while seeds:
-        j = seeds.popleft()
-        if not visited[j]:
-            visited[j] = True
-            neighbor_j = _neighbors_for_point(
-                point_idx=j,
-                points=points,
-                grid=grid,
-                eps_sq=eps_sq,
-                cell=cell,
-            )
-            if len(neighbor_j) >= min_samples:
-                for k in neighbor_j:
-                    if k not in seed_set:
-                        seed_set.add(k)
-                        seeds.append(k)
-        if labels[j] == -1:
-            labels[j] = cluster_id
-
-
-def _cluster_centroid_m(
-    points_m: list[tuple[float, float]],
-    indices: list[int],
-) -> tuple[float, float]:
-    xs = [points_m[i][0] for i in indices]
-    ys = [points_m[i][1] for i in indices]
-    return (sum(xs) / len(xs), sum(ys) / len(ys))
-
-
-def _cluster_max_radius_m(
-    points_m: list[tuple[float, float]],
-    indices: list[int],
-) -> float:
-    cx, cy = _cluster_centroid_m(points_m, indices)
-    return max(math.hypot(points_m[i][0] - cx, points_m[i][1] - cy) for i in indices)
+    """
+    Label points with DBSCAN cluster ids (1-based, ``-1`` for noise).
+
+    Core points are grouped with the shared ``dwithin`` pair query and
+    connected-component helper from ``core.spatial``. Labels match the classic
+    sequential expansion: clusters are numbered by their lowest core index and
+    border points join the lowest-numbered adjacent cluster.
+    """
+    coords = np.asarray(points, dtype=float).reshape(-1, 2)
+    count = len(coords)
+    if count == 0:
+        return []
+
+    src, dst = dwithin_pairs(coords, eps)
+    degree = np.bincount(src, minlength=count)
+    core = degree >= min_samples
+    labels = np.full(count, -1, dtype=np.int64)
+    if not core.any():
+        return labels.tolist()
+
+    core_edges = core[src] & core[dst]
+    roots = connected_component_roots(count, src[core_edges], dst[core_edges])
+
+    core_roots = roots[core]
+    unique_roots = np.unique(core_roots)
+    labels[core] = np.searchsorted(unique_roots, core_roots) + 1
+
+    border_edges = ~core[src] & core[dst]
+    if border_edges.any():
+        border_src = src[border_edges]
+        border_labels = np.full(count, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(border_labels, border_src, labels[dst[border_edges]])
+        assigned = np.unique(border_src)
+        labels[assigned] = border_labels[assigned]
+    return labels.tolist()
+
+
+def _cluster_max_radius_m(points_m: np.ndarray, indices: list[int]) -> float:
+    cluster = points_m[indices]
+    centroid = cluster.mean(axis=0)
+    return float(np.hypot(*(cluster - centroid).T).max())
 
 
 def _refine_cluster(
     *,
-    points_m: list[tuple[float, float]],
+    points_m: np.ndarray,
     indices: list[int],
     min_visits: int,
     cell_size_m: int,
@@ -257,8 +190,7 @@ def _refine_cluster(
         return [indices]
 
     refined_eps = max(35.0, min(cell_size_m * 0.35, max_dist * 0.3))
-    local_points = [points_m[i] for i in indices]
-    sub_labels = _dbscan(local_points, refined_eps, min_visits)
+    sub_labels = _dbscan(points_m[indices], refined_eps, min_visits)
 
     subclusters: dict[int, list[int]] = {}
     for local_idx, sub_label in enumerate(sub_labels):
@@ -333,7 +265,7 @@ def _collect_cluster_indices(labels: list[int]) -> dict[int, list[int]]:
 
 def _collect_refined_clusters(
     *,
-    points_m: list[tuple[float, float]],
+    points_m: np.ndarray,
     cluster_indices: dict[int, list[int]],
     min_visits: int,
     cell_size_m: int,
@@ -421,6 +353,122 @@ def _build_cluster_suggestion(
     )
 
 
+def _suggestion_pipeline(match_stage: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Project only the destination endpoint and label fields for clustering.
+
+    ``destinationGeoPoint`` is persisted at ingest; legacy trips without it get
+    their last GPS vertex derived server-side so the full trace never leaves
+    MongoDB. A MultiLineString contributes the last vertex of its last part;
+    other geometry types yield no vertex.
+    """
+    last_line = {"$arrayElemAt": ["$gps.coordinates", -1]}
+    last_gps_vertex = {
+        "$switch": {
+            "branches": [
+                {"case": {"$eq": ["$gps.type", "Point"]}, "then": "$gps.coordinates"},
+                {
+                    "case": {"$eq": ["$gps.type", "LineString"]},
+                    "then": last_line,
+                },
+                {
+                    "case": {"$eq": ["$gps.type", "MultiLineString"]},
+                    "then": {"$arrayElemAt": [last_line, -1]},
+                },
+            ],
+            "default": None,
+        },
+    }
+    return [
+        {"$match": match_stage},
+        {
+            "$project": {
+                "_id": 0,
+                "endTime": 1,
+                "destinationPlaceName": 1,
+                "destinationGeoPoint": 1,
+                "destination.formatted_address": 1,
+                "destination.address_components.street": 1,
+                "destination.coordinates": 1,
+                "gps": {
+                    "$cond": [
+                        {"$ifNull": ["$destinationGeoPoint", False]},
+                        "$$REMOVE",
+                        {"type": "Point", "coordinates": last_gps_vertex},
+                    ],
+                },
+            },
+        },
+    ]
+
+
+async def _compute_visit_suggestions(
+    min_visits: int,
+    cell_size_m: int,
+    timeframe: str | None,
+) -> list[VisitSuggestion]:
+    docs = await aggregate_to_list(
+        Trip,
+        _suggestion_pipeline(_suggestion_match_stage(timeframe)),
+    )
+    if not docs:
+        return []
+
+    existing_places = await Place.find_all().to_list()
+    existing_polygons, tree = _build_existing_place_index(existing_places)
+    candidates = _build_candidates(docs, tree=tree, polygons=existing_polygons)
+    if not candidates:
+        return []
+
+    lngs = np.fromiter((c["lng"] for c in candidates), dtype=float)
+    lats = np.fromiter((c["lat"] for c in candidates), dtype=float)
+    to_meters, _ = get_local_transformers(MultiPoint(np.column_stack((lngs, lats))))
+    xs, ys = to_meters(lngs, lats)
+    points_m = np.column_stack(
+        (np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+    )
+
+    labels = _dbscan(points_m, cell_size_m, min_visits)
+    cluster_indices = _collect_cluster_indices(labels)
+    refined_clusters = _collect_refined_clusters(
+        points_m=points_m,
+        cluster_indices=cluster_indices,
+        min_visits=min_visits,
+        cell_size_m=cell_size_m,
+    )
+
+    suggestions: list[VisitSuggestion] = []
+    for indices in refined_clusters:
+        suggestion = _build_cluster_suggestion(
+            indices=indices,
+            candidates=candidates,
+            min_visits=min_visits,
+            cell_size_m=cell_size_m,
+            tree=tree,
+            existing_polygons=existing_polygons,
+        )
+        if suggestion is not None:
+            suggestions.append(suggestion)
+
+    suggestions.sort(key=lambda s: s.totalVisits, reverse=True)
+    return suggestions
+
+
+@cached(VISIT_SUGGESTIONS_CACHE_PREFIX, ttl_seconds=600, tags=(TRIPS_CACHE_TAG,))
+async def _visit_suggestions_cached(
+    min_visits: int,
+    cell_size_m: int,
+    timeframe: str | None,
+) -> list[dict[str, Any]]:
+    suggestions = await _compute_visit_suggestions(min_visits, cell_size_m, timeframe)
+    return [suggestion.model_dump(mode="json") for suggestion in suggestions]
+
+
+async def invalidate_visit_suggestions_cache() -> int:
+    """Drop cached visit suggestions after custom places change."""
+    return await invalidate_cache_prefixes(VISIT_SUGGESTIONS_CACHE_PREFIX)
+
+
 class VisitStatsService:
     """Service class for visit statistics and suggestions."""
 
@@ -711,7 +759,8 @@ class VisitStatsService:
         This endpoint clusters trip destinations without destinationPlaceId
         using a distance-based approach (DBSCAN-style). It returns clusters
         with at least min_visits visits and generates a precise polygon
-        boundary around each cluster.
+        boundary around each cluster. Results are cached per trip revision and
+        dropped whenever custom places change.
 
         Args:
             min_visits: Minimum number of visits to suggest a place
@@ -724,59 +773,7 @@ class VisitStatsService:
         Raises:
             ValueError: If timeframe is invalid
         """
-        match_stage = _suggestion_match_stage(timeframe)
-
-        pipeline = [
-            {"$match": match_stage},
-            {
-                "$project": {
-                    "endTime": 1,
-                    "destinationPlaceName": 1,
-                    "destination": 1,
-                    "destinationGeoPoint": 1,
-                    "gps": 1,
-                },
-            },
-        ]
-
-        docs = await aggregate_to_list(Trip, pipeline)
-
-        if not docs:
-            return []
-
-        existing_places = await Place.find_all().to_list()
-        existing_polygons, tree = _build_existing_place_index(existing_places)
-        candidates = _build_candidates(docs, tree=tree, polygons=existing_polygons)
-
-        if not candidates:
-            return []
-
-        all_points = [(c["lng"], c["lat"]) for c in candidates]
-        all_points_geom = MultiPoint(all_points)
-        to_meters, _ = get_local_transformers(all_points_geom)
-        points_m = [to_meters(lng, lat) for lng, lat in all_points]
-
-        labels = _dbscan(points_m, cell_size_m, min_visits)
-        cluster_indices = _collect_cluster_indices(labels)
-        refined_clusters = _collect_refined_clusters(
-            points_m=points_m,
-            cluster_indices=cluster_indices,
-            min_visits=min_visits,
-            cell_size_m=cell_size_m,
-        )
-
-        suggestions: list[VisitSuggestion] = []
-        for indices in refined_clusters:
-            suggestion = _build_cluster_suggestion(
-                indices=indices,
-                candidates=candidates,
-                min_visits=min_visits,
-                cell_size_m=cell_size_m,
-                tree=tree,
-                existing_polygons=existing_polygons,
-            )
-            if suggestion is not None:
-                suggestions.append(suggestion)
-
-        suggestions.sort(key=lambda s: s.totalVisits, reverse=True)
-        return suggestions
+        # Validate the timeframe up front so bad input is never cached.
+        _suggestion_match_stage(timeframe)
+        rows = await _visit_suggestions_cached(min_visits, cell_size_m, timeframe)
+        return [VisitSuggestion.model_validate(row) for row in rows]